@@ -0,0 +1,2015 @@
+"""
+In-memory stand-in for the `maya`, `mpy` and `dcc` packages used by the noise editor.
+This module allows the noise editor to be imported, and its hot paths measured, on a plain Python install with a Qt binding!
+"""
+import os
+import sys
+import math
+import types
+import tempfile
+import weakref
+import importlib
+import importlib.util
+
+from collections import Counter
+
+from . import referencenoise
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+counters = Counter()
+
+
+def resetCounters():
+    """
+    Resets the DG round-trip counters.
+
+    :rtype: None
+    """
+
+    counters.clear()
+
+
+def getCounters():
+    """
+    Returns a copy of the DG round-trip counters.
+
+    :rtype: Dict[str, int]
+    """
+
+    return dict(counters)
+
+
+# region Schema
+VECTOR_SUFFIXES = ('X', 'Y', 'Z')
+
+SCHEMAS = {
+    'time': {
+        'outTime': 0.0
+    },
+    'transform': {
+        'translate': (0.0, 0.0, 0.0),
+        'rotate': (0.0, 0.0, 0.0),
+        'scale': (1.0, 1.0, 1.0),
+        'rotateOrder': 0,
+        'offsetParentMatrix': tuple(float(i % 5 == 0) for i in range(16))
+    },
+    'composeTransform': {
+        'inputTranslate': (0.0, 0.0, 0.0),
+        'inputRotate': (0.0, 0.0, 0.0),
+        'inputScale': (1.0, 1.0, 1.0),
+        'inputRotatePivot': (0.0, 0.0, 0.0),
+        'inputScalePivot': (0.0, 0.0, 0.0),
+        'inputRotateOrder': 0,
+        'inputOffsetParentMatrix': tuple(float(i % 5 == 0) for i in range(16)),
+        'outputMatrix': tuple(float(i % 5 == 0) for i in range(16))
+    },
+    'shake': {
+        'time': 0.0,
+        'seed': 0,
+        'frequency': 0.5,
+        'fractal': True,
+        'roughness': 0.0,
+        'envelope': 1.0,
+        'rampIn': 0.0,
+        'rampOut': 0.0,
+        'strengthX': 5.0,
+        'strengthY': 5.0,
+        'strengthZ': 5.0,
+        'positiveX': False,
+        'positiveY': False,
+        'positiveZ': False,
+        'outputTranslate': (0.0, 0.0, 0.0),
+        'outputRotate': (0.0, 0.0, 0.0),
+        'outputScale': (0.0, 0.0, 0.0)
+    },
+    'animCurveTL': {
+        'output': 0.0
+    },
+    'animCurveTA': {
+        'output': 0.0
+    },
+    'animCurveTU': {
+        'output': 0.0
+    },
+    'animLayer': {
+        'weight': 1.0,
+        'mute': False
+    },
+    'animBlendNodeAdditive': {
+        'inputA': 0.0,
+        'inputB': 0.0,
+        'output': 0.0
+    }
+}
+# endregion
+
+
+# region OpenMaya
+class MFn(object):
+    """
+    Stand-in for `OpenMaya.MFn`.
+    """
+
+    kTransform = 110
+
+
+class MTime(object):
+    """
+    Stand-in for `OpenMaya.MTime`.
+    """
+
+    kSeconds = 3
+    kFilm = 6
+
+    __rates__ = {kSeconds: 1.0, kFilm: 24.0}
+    __slots__ = ('value', 'unit')
+
+    def __init__(self, value=0.0, unit=kFilm):
+
+        self.value = value
+        self.unit = unit
+
+    def asUnits(self, unit):
+
+        return self.value * (self.__rates__[unit] / self.__rates__[self.unit])
+
+    @classmethod
+    def uiUnit(cls):
+
+        return cls.kFilm
+
+
+class MDGContext(object):
+    """
+    Stand-in for `OpenMaya.MDGContext`.
+    """
+
+    __slots__ = ('time',)
+
+    def __init__(self, time=None):
+
+        self.time = time
+
+
+class MDGContextGuard(object):
+    """
+    Stand-in for `OpenMaya.MDGContextGuard` that evaluates the scene at the context's time without changing the current time.
+    """
+
+    def __init__(self, context):
+
+        self._context = context
+        self._previousTime = None
+
+    def __enter__(self):
+
+        scene = MockScene.getInstance()
+
+        self._previousTime = scene.contextTime
+        scene.contextTime = self._context.time.value if self._context.time is not None else None
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+
+        MockScene.getInstance().contextTime = self._previousTime
+
+
+class MAngle(object):
+    """
+    Stand-in for `OpenMaya.MAngle` that only supports radians.
+    """
+
+    kRadians = 1
+
+    __slots__ = ('value',)
+
+    def __init__(self, value=0.0, unit=kRadians):
+
+        self.value = value
+
+    def asRadians(self):
+
+        return self.value
+
+
+class MFnAnimCurve(object):
+    """
+    Stand-in for `OpenMaya.MFnAnimCurve` that keys in-memory curve nodes.
+    Tangents are stored per key time, as [inType, outType, inAngle, inWeight, outAngle, outWeight, tangentsLocked, weightsLocked, isBreakdown], but never affect evaluation!
+    """
+
+    kTangentFixed = 1
+    kTangentLinear = 2
+    kConstant = 0
+    kCycle = 3
+
+    def __init__(self, node):
+
+        self._node = node
+
+    def tangents(self, index):
+
+        time = sorted(self._node.keys)[index]
+        tangents = self._node.__dict__.setdefault('tangents', {})
+
+        if time not in tangents:
+
+            tangents[time] = [self.kTangentLinear, self.kTangentLinear, 0.0, 1.0, 0.0, 1.0, True, True, False]
+
+        return tangents[time]
+
+    @property
+    def preInfinityType(self):
+
+        return getattr(self._node, 'preInfinity', self.kCycle if getattr(self._node, 'cycle', False) else self.kConstant)
+
+    @property
+    def postInfinityType(self):
+
+        return getattr(self._node, 'postInfinity', self.kCycle if getattr(self._node, 'cycle', False) else self.kConstant)
+
+    def setPreInfinityType(self, infinityType):
+
+        self._node.preInfinity = infinityType
+        self._node.cycle = infinityType == self.kCycle
+
+    def setPostInfinityType(self, infinityType):
+
+        self._node.postInfinity = infinityType
+        self._node.cycle = infinityType == self.kCycle
+
+    @property
+    def isWeighted(self):
+
+        return getattr(self._node, 'weighted', False)
+
+    def setIsWeighted(self, isWeighted):
+
+        self._node.weighted = isWeighted
+
+    @property
+    def numKeys(self):
+
+        return len(self._node.keys)
+
+    def input(self, index):
+
+        return MTime(sorted(self._node.keys)[index])
+
+    def value(self, index):
+
+        return self._node.keys[sorted(self._node.keys)[index]]
+
+    def inTangentType(self, index):
+
+        return self.tangents(index)[0]
+
+    def outTangentType(self, index):
+
+        return self.tangents(index)[1]
+
+    def setInTangentType(self, index, tangentType):
+
+        self.tangents(index)[0] = tangentType
+
+    def setOutTangentType(self, index, tangentType):
+
+        self.tangents(index)[1] = tangentType
+
+    def getTangentAngleWeight(self, index, isInTangent):
+
+        tangents = self.tangents(index)
+        offset = 2 if isInTangent else 4
+
+        return [MAngle(tangents[offset]), tangents[offset + 1]]
+
+    def setAngle(self, index, angle, isInTangent):
+
+        tangents = self.tangents(index)
+        tangents[2 if isInTangent else 4] = angle.asRadians()
+        tangents[0 if isInTangent else 1] = self.kTangentFixed
+
+    def setWeight(self, index, weight, isInTangent):
+
+        self.tangents(index)[3 if isInTangent else 5] = weight
+
+    def tangentsLocked(self, index):
+
+        return self.tangents(index)[6]
+
+    def setTangentsLocked(self, index, locked):
+
+        self.tangents(index)[6] = locked
+
+    def weightsLocked(self, index):
+
+        return self.tangents(index)[7]
+
+    def setWeightsLocked(self, index, locked):
+
+        self.tangents(index)[7] = locked
+
+    def isBreakdown(self, index):
+
+        return self.tangents(index)[8]
+
+    def setIsBreakdown(self, index, isBreakdown):
+
+        self.tangents(index)[8] = isBreakdown
+
+    def remove(self, index):
+
+        time = sorted(self._node.keys)[index]
+
+        del self._node.keys[time]
+        self._node.__dict__.get('tangents', {}).pop(time, None)
+
+    def addKey(self, time, value, tangentInType=kTangentLinear, tangentOutType=kTangentLinear):
+
+        counters['addKeys'] += 1
+
+        self._node.keys[time.value] = value
+        self._node.__dict__.setdefault('tangents', {}).pop(time.value, None)
+
+        index = sorted(self._node.keys).index(time.value)
+        self.tangents(index)[:2] = [tangentInType, tangentOutType]
+
+        return index
+
+    def addKeys(self, times, values, tangentInType=kTangentLinear, tangentOutType=kTangentLinear, **kwargs):
+
+        counters['addKeys'] += 1
+        self._node.keys.update({time.value: value for (time, value) in zip(times, values)})
+
+        for time in times:
+
+            self._node.__dict__.get('tangents', {}).pop(time.value, None)
+
+
+class MDGModifier(object):
+    """
+    Stand-in for `OpenMaya.MDGModifier` that queues plug values until `doIt` is called.
+    """
+
+    def __init__(self):
+
+        self._operations = []
+        self._numExecuted = 0
+
+    def newPlugValueBool(self, plug, value):
+
+        self._operations.append(('value', plug, bool(value)))
+
+    def newPlugValueInt(self, plug, value):
+
+        self._operations.append(('value', plug, int(value)))
+
+    def newPlugValueDouble(self, plug, value):
+
+        value = math.degrees(value) if plug.isAngle else float(value)
+        self._operations.append(('value', plug, value))
+
+    def newPlugValue(self, plug, data):
+
+        self._operations.append(('value', plug, data))
+
+    def deleteNode(self, node):
+
+        self._operations.append(('delete', node, None))
+
+    def connect(self, source, destination):
+
+        self._operations.append(('connect', destination, source))
+
+    def disconnect(self, source, destination):
+
+        self._operations.append(('disconnect', destination, source))
+
+    def doIt(self):
+
+        counters['doIt'] += 1
+
+        # Only operations queued since the last undo or doIt are executed!
+        #
+        for (i, (operation, target, value)) in enumerate(self._operations[self._numExecuted:], start=self._numExecuted):
+
+            if operation == 'value':
+
+                self._operations[i] = (operation, target, (value, target._node.values[target._name]))
+                target._node.values[target._name] = value
+
+            elif operation == 'connect':
+
+                target._source = value
+
+            elif operation == 'disconnect':
+
+                target._source = None
+
+            else:
+
+                self._operations[i] = (operation, target, target.scene.deleteNode(target))
+
+        self._numExecuted = len(self._operations)
+
+    def undoIt(self):
+
+        counters['undoIt'] += 1
+
+        for (i, (operation, target, value)) in reversed(list(enumerate(self._operations[:self._numExecuted]))):
+
+            if operation == 'value':
+
+                newValue, oldValue = value
+                target._node.values[target._name] = oldValue
+                self._operations[i] = (operation, target, newValue)
+
+            elif operation == 'connect':
+
+                target._source = None
+
+            elif operation == 'disconnect':
+
+                target._source = value
+
+            else:
+
+                target.scene.restoreNode(target, value)
+                self._operations[i] = (operation, target, None)
+
+        self._numExecuted = 0
+
+
+class MMatrix(object):
+    """
+    Stand-in for `OpenMaya.MMatrix`.
+    """
+
+    kIdentity = tuple(float(i % 5 == 0) for i in range(16))
+
+
+class MCallbackIdArray(list):
+    """
+    Stand-in for `OpenMaya.MCallbackIdArray`.
+    """
+
+    pass
+
+
+class MMessage(object):
+    """
+    Stand-in for `OpenMaya.MMessage`.
+    """
+
+    __callbacks__ = {}
+    __nextId__ = 1
+
+    @classmethod
+    def addCallback(cls, function, clientData=None):
+
+        callbackId = cls.__nextId__
+        cls.__nextId__ += 1
+        cls.__callbacks__[callbackId] = (function, clientData)
+
+        return callbackId
+
+    @classmethod
+    def removeCallback(cls, callbackId):
+
+        counters['removeCallback'] += 1
+        cls.__callbacks__.pop(callbackId, None)
+
+    @classmethod
+    def removeCallbacks(cls, callbackIds):
+
+        for callbackId in list(callbackIds):
+
+            cls.removeCallback(callbackId)
+
+
+class MEventMessage(MMessage):
+    """
+    Stand-in for `OpenMaya.MEventMessage`.
+    """
+
+    @classmethod
+    def addEventCallback(cls, eventName, function, clientData=None):
+
+        return cls.addCallback(function, clientData=clientData)
+
+
+class MSceneMessage(MMessage):
+    """
+    Stand-in for `OpenMaya.MSceneMessage`.
+    """
+
+    kBeforeNew = 2
+    kBeforeOpen = 6
+
+    @classmethod
+    def addCallback(cls, message, function, clientData=None):
+
+        return super(MSceneMessage, cls).addCallback(function, clientData=clientData)
+
+
+class MNodeMessage(MMessage):
+    """
+    Stand-in for `OpenMaya.MNodeMessage`.
+    """
+
+    kConnectionMade = 0x01
+    kConnectionBroken = 0x02
+    kAttributeSet = 0x08
+
+    @classmethod
+    def addAttributeChangedCallback(cls, node, function, clientData=None):
+
+        counters['addCallback'] += 1
+        return cls.addCallback(function, clientData=clientData)
+
+
+class MDGMessage(MMessage):
+    """
+    Stand-in for `OpenMaya.MDGMessage`.
+    """
+
+    __nodeAdded__ = set()
+
+    @classmethod
+    def addNodeAddedCallback(cls, function, nodeType='dependNode', clientData=None):
+
+        callbackId = cls.addCallback(function, clientData=clientData)
+        cls.__nodeAdded__.add(callbackId)
+
+        return callbackId
+
+    @classmethod
+    def nodeAdded(cls, node):
+
+        for callbackId in list(cls.__nodeAdded__):
+
+            function, clientData = cls.__callbacks__.get(callbackId, (None, None))
+
+            if function is None:
+
+                cls.__nodeAdded__.discard(callbackId)
+                continue
+
+            function(node, clientData)
+
+
+class MSyntax(object):
+    """
+    Stand-in for `OpenMaya.MSyntax`.
+    """
+
+    kString = 5
+
+    def addArg(self, argType):
+
+        pass
+
+
+class MPxCommand(object):
+    """
+    Stand-in for `OpenMaya.MPxCommand`.
+    """
+
+    def isUndoable(self):
+
+        return False
+
+
+class MFnPlugin(object):
+    """
+    Stand-in for `OpenMaya.MFnPlugin` that registers commands onto `maya.cmds`.
+    """
+
+    def __init__(self, obj, vendor='', version=''):
+
+        self._obj = obj
+
+    def registerCommand(self, name, creator, syntaxCreator=None):
+
+        setattr(sys.modules['maya.cmds'], name, createCommand(creator))
+
+    def deregisterCommand(self, name):
+
+        delattr(sys.modules['maya.cmds'], name)
+
+
+class MObjectHandle(object):
+    """
+    Stand-in for `OpenMaya.MObjectHandle`.
+    """
+
+    __slots__ = ('_node',)
+
+    def __init__(self, node):
+
+        self._node = node
+
+    def object(self):
+
+        return self._node
+
+    def hashCode(self):
+
+        return id(self._node)
+
+    def isAlive(self):
+
+        return self._node.isAlive
+
+    def isValid(self):
+
+        return self._node.isAlive
+# endregion
+
+
+# region DG
+class MockPlug(object):
+    """
+    In-memory plug that knows its node, parent, children and source connection.
+    """
+
+    __slots__ = ('_node', '_name', '_parent', '_children', '_source')
+
+    def __init__(self, node, name, parent=None):
+
+        self._node = node
+        self._name = name
+        self._parent = parent
+        self._children = []
+        self._source = None
+
+    @property
+    def isNull(self):
+
+        return self._node is None
+
+    @property
+    def isDestination(self):
+
+        return self._source is not None or (self._parent is not None and self._parent._source is not None)
+
+    @property
+    def isSource(self):
+
+        return any(plug._source is self for node in self._node.scene.nodes for plug in node.plugs.values())
+
+    def name(self):
+
+        return f'{self._node.name()}.{self._name}'
+
+    def partialName(self, useLongNames=True, **kwargs):
+
+        return self._name
+
+    def node(self):
+
+        return self._node
+
+    def parent(self):
+
+        return self._parent if self._parent is not None else NULL_PLUG
+
+    def destinations(self):
+
+        counters['destinations'] += 1
+        return [plug for node in self._node.scene.nodes for plug in node.plugs.values() if plug._source is self]
+
+    def children(self):
+
+        return self._children
+
+    def numChildren(self):
+
+        return len(self._children)
+
+    def child(self, index):
+
+        return self._children[index]
+
+    @property
+    def isAngle(self):
+
+        return self._name.rstrip('XYZ').endswith('otate')
+
+    def asDouble(self):
+
+        # Angles are stored in degrees but the API returns internal units!
+        #
+        value = float(self.value())
+        return math.radians(value) if self.isAngle else value
+
+    def asInt(self):
+
+        return int(self.value())
+
+    def asBool(self):
+
+        return bool(self.value())
+
+    def asMObject(self):
+
+        # Data values are copied by the API, so the stored value stands in for its data object!
+        #
+        return self.value()
+
+    def source(self):
+
+        counters['source'] += 1
+
+        if self._source is not None:
+
+            return self._source
+
+        elif self._parent is not None and self._parent._source is not None:
+
+            index = self._parent._children.index(self)
+            return self._parent._source._children[index]
+
+        else:
+
+            return NULL_PLUG
+
+    def value(self):
+
+        sourcePlug = self.source()
+
+        if not sourcePlug.isNull:
+
+            return sourcePlug._node.compute(sourcePlug)
+
+        elif len(self._children) > 0:
+
+            return tuple(child.value() for child in self._children)
+
+        else:
+
+            return self._node.values[self._name]
+
+
+NULL_PLUG = MockPlug(None, '')
+
+
+class MockAnimCurve(object):
+    """
+    In-memory anim curve with step interpolation between keys.
+    """
+
+    def __init__(self, scene, name, value=0.0):
+
+        self.scene = scene
+        self.keys = {}
+        self.default = value
+        self.isAlive = True
+
+        self._name = name
+        scene.names[name] = self
+
+        MDGMessage.nodeAdded(self)
+
+    def name(self):
+
+        return self._name
+
+    def object(self):
+
+        return self
+
+    def delete(self):
+
+        counters['delete'] += 1
+
+        self.isAlive = False
+        self.scene.names.pop(self._name, None)
+
+    def evaluate(self, time):
+
+        counters['evaluate'] += 1
+
+        if len(self.keys) == 0:
+
+            return self.default
+
+        frame = time.value
+        previous = [key for key in self.keys if key <= frame]
+
+        return self.keys[max(previous)] if len(previous) > 0 else self.keys[min(self.keys)]
+
+
+class MockNode(object):
+    """
+    In-memory dependency node that mimics the `mpynode.MPyNode` interface used by the noise editor.
+    """
+
+    def __init__(self, scene, typeName, name):
+
+        self.scene = scene
+        self.typeName = typeName
+        self.isAlive = True
+        self.isFromReferencedFile = False
+        self.referenceNode = None
+        self.values = {}
+        self.plugs = {}
+        self.animCurves = {}
+        self.keys = {}
+        self.cycle = False
+
+        self._name = name
+        self.plugs['message'] = MockPlug(self, 'message')
+
+        for (attributeName, default) in SCHEMAS[typeName].items():
+
+            plug = MockPlug(self, attributeName)
+            self.plugs[attributeName] = plug
+
+            if isinstance(default, tuple) and len(default) == 3:
+
+                for (suffix, childDefault) in zip(VECTOR_SUFFIXES, default):
+
+                    childName = f'{attributeName}{suffix}'
+                    childPlug = MockPlug(self, childName, parent=plug)
+
+                    plug._children.append(childPlug)
+                    self.plugs[childName] = childPlug
+                    self.values[childName] = childDefault
+
+            else:
+
+                self.values[attributeName] = default
+
+    def __getitem__(self, attributeName):
+
+        return self.plugs[attributeName]
+
+    def name(self):
+
+        return self._name
+
+    def object(self):
+
+        return self
+
+    def hasAttr(self, attributeName):
+
+        return attributeName in self.plugs
+
+    def getAssociatedReferenceNode(self):
+
+        return self.referenceNode
+
+    def compute(self, plug):
+
+        # Evaluate output plugs on shake nodes
+        # A cheap closed-form wave keeps the mock from dominating the measurements!
+        #
+        if self.typeName == 'shake' and plug._name.startswith('output'):
+
+            counters['compute'] += 1
+
+            frame = self.scene.evaluationTime
+            seed = self.values['seed']
+            frequency = self.values['frequency']
+            axis = VECTOR_SUFFIXES.index(plug._name[-1]) if plug._name[-1] in VECTOR_SUFFIXES else 0
+            strength = self.values[f'strength{VECTOR_SUFFIXES[axis]}']
+
+            return math.sin((frame * frequency * 0.05) + (seed * 12.9898) + (axis * 78.233)) * strength * self.values['envelope']
+
+        elif self.typeName.startswith('animCurve'):
+
+            counters['evaluate'] += 1
+            value = interpolateKeys(self.keys, self.scene.evaluationTime, cycle=self.cycle)
+
+            return math.degrees(value) if self.typeName == 'animCurveTA' else value
+
+        elif self.typeName == 'time':
+
+            return self.scene.evaluationTime
+
+        elif self.typeName == 'animBlendNodeAdditive':
+
+            return self.plugs['inputA'].value() + self.plugs['inputB'].value()
+
+        else:
+
+            return self.values.get(plug._name, 0.0)
+
+    def getAttr(self, attributeName):
+
+        counters['getAttr'] += 1
+        return self.plugs[attributeName].value()
+
+    def setAttr(self, attributeName, value):
+
+        counters['setAttr'] += 1
+        plug = self.plugs[attributeName]
+
+        if self.referenceNode is not None:
+
+            self.referenceNode.edits.append(('setAttr', plug.name()))
+
+        if len(plug._children) > 0:
+
+            for (child, childValue) in zip(plug._children, value):
+
+                self.values[child._name] = childValue
+
+        else:
+
+            self.values[attributeName] = value
+
+        # Check if auto-key is enabled
+        #
+        animCurve = self.animCurves.get(attributeName, None)
+
+        if animCurve is not None and AUTO_KEY[0]:
+
+            counters['setKeyframe'] += 1
+            animCurve.keys[self.scene.time] = value
+
+    def resetAttr(self, attributeName):
+
+        counters['resetAttr'] += 1
+        self.setAttr(attributeName, SCHEMAS[self.typeName][attributeName])
+
+    def connectPlugs(self, source, destination):
+
+        counters['connectPlugs'] += 1
+
+        source = self.plugs[source] if isinstance(source, str) else source
+        destination = self.plugs[destination] if isinstance(destination, str) else destination
+
+        destination._source = source
+
+        # Check if either plug is referenced
+        #
+        for referenceNode in {source._node.referenceNode, destination._node.referenceNode}:
+
+            if referenceNode is not None:
+
+                referenceNode.edits.append(('connectAttr', source.name(), destination.name()))
+
+    def findAnimCurve(self, attributeName, create=False):
+
+        counters['findAnimCurve'] += 1
+        animCurve = self.animCurves.get(attributeName, None)
+        animCurve = animCurve if animCurve is not None and animCurve.isAlive else None
+
+        if animCurve is None and create:
+
+            animCurve = MockAnimCurve(self.scene, f'{self.name()}_{attributeName}', value=self.values.get(attributeName, 0.0))
+            self.animCurves[attributeName] = animCurve
+
+        return animCurve
+
+    def delete(self):
+
+        counters['delete'] += 1
+        self.scene.deleteNode(self)
+
+
+def interpolateKeys(keys, frame, cycle=False):
+    """
+    Returns the linearly interpolated value of the supplied keys, holding the end values outside of their range.
+    If cycle is enabled then the keys repeat outside of their range instead.
+
+    :type keys: Dict[float, float]
+    :type frame: float
+    :type cycle: bool
+    :rtype: float
+    """
+
+    if len(keys) == 0:
+
+        return 0.0
+
+    frames = sorted(keys)
+
+    if cycle and frames[-1] > frames[0]:
+
+        frame = frames[0] + ((frame - frames[0]) % (frames[-1] - frames[0]))
+    previous = max((key for key in frames if key <= frame), default=frames[0])
+    following = min((key for key in frames if key >= frame), default=frames[-1])
+
+    if previous == following:
+
+        return keys[previous]
+
+    weight = (frame - previous) / (following - previous)
+    return keys[previous] + ((keys[following] - keys[previous]) * weight)
+
+
+class MockReference(object):
+    """
+    In-memory reference node that stores its edits as tuples of the command name and the plugs involved.
+    """
+
+    def __init__(self, name):
+
+        self.edits = []
+        self.isLoaded = True
+
+        self._name = name
+
+    def name(self):
+
+        return self._name
+
+
+class MockScene(object):
+    """
+    In-memory scene that mimics the `mpyscene.MPyScene` interface used by the noise editor.
+    """
+
+    __instance__ = None
+
+    def __init__(self):
+
+        self.nodes = []
+        self.names = {}
+        self.references = {}
+        self.selection = []
+        self.time = 0.0
+        self.contextTime = None
+        self.animationRange = (0, 100)
+
+        self.createNode('time', name='time1')
+
+    @classmethod
+    def getInstance(cls, asWeakReference=False):
+
+        if cls.__instance__ is None:
+
+            cls.__instance__ = cls()
+
+        return weakref.ref(cls.__instance__) if asWeakReference else cls.__instance__
+
+    @classmethod
+    def reset(cls):
+
+        instance = cls.getInstance()
+        instance.__init__()
+        resetCounters()
+
+        return instance
+
+    @property
+    def evaluationTime(self):
+
+        return self.contextTime if self.contextTime is not None else self.time
+
+    @property
+    def startTime(self):
+
+        return self.animationRange[0]
+
+    @property
+    def endTime(self):
+
+        return self.animationRange[1]
+
+    def createNode(self, typeName, name=''):
+
+        counters['createNode'] += 1
+
+        node = MockNode(self, typeName, name)
+        self.nodes.append(node)
+        self.names[name] = node
+
+        MDGMessage.nodeAdded(node)
+
+        return node
+
+    def deleteNode(self, node):
+
+        # Check if this is an anim curve
+        #
+        if isinstance(node, MockAnimCurve):
+
+            node.delete()
+            return []
+
+        # Break any connections to the deleted node
+        # The broken plugs are returned so the node can be restored later!
+        #
+        broken = []
+
+        for otherNode in self.nodes:
+
+            for plug in otherNode.plugs.values():
+
+                if plug._source is not None and plug._source._node is node:
+
+                    broken.append((plug, plug._source))
+                    plug._source = None
+
+        node.isAlive = False
+        self.nodes.remove(node)
+        self.names.pop(node.name(), None)
+
+        if node in self.selection:
+
+            self.selection.remove(node)
+
+        return broken
+
+    def restoreNode(self, node, broken):
+
+        node.isAlive = True
+        self.names[node.name()] = node
+
+        if isinstance(node, MockAnimCurve):
+
+            return
+
+        self.nodes.append(node)
+
+        for (plug, source) in broken:
+
+            plug._source = source
+
+    def getNodeByName(self, name):
+
+        return self.names[name]
+
+    def createReference(self, name, nodes):
+
+        reference = MockReference(name)
+        self.references[name] = reference
+
+        for node in nodes:
+
+            node.isFromReferencedFile = True
+            node.referenceNode = reference
+
+        return reference
+
+    def iterSelection(self, apiType=None):
+
+        counters['iterSelection'] += 1
+        yield from (node for node in self.selection if node.isAlive and node.typeName == 'transform')
+
+    def iterAnimatableNodes(self):
+
+        yield from (node for node in self.nodes if node.typeName == 'transform')
+
+    def setSelection(self, nodes):
+
+        self.selection = list(nodes)
+
+
+def duplicate(*args, **kwargs):
+    """
+    Stand-in for `maya.cmds.duplicate` that supports anim curves.
+
+    :key name: str
+    :rtype: List[str]
+    """
+
+    counters['duplicate'] += 1
+
+    scene = MockScene.getInstance()
+    original = scene.getNodeByName(args[0])
+
+    copy = MockAnimCurve(scene, kwargs.get('name', f'{args[0]}1'), value=original.default)
+    copy.keys = dict(original.keys)
+    copy.tangents = {time: list(tangents) for (time, tangents) in getattr(original, 'tangents', {}).items()}
+    copy.weighted = getattr(original, 'weighted', False)
+
+    return [copy.name()]
+
+
+CLIPBOARD = {}
+
+
+def cutKey(*args, time=(None, None), **kwargs):
+    """
+    Stand-in for `maya.cmds.cutKey` that clears keys inside the supplied time range.
+
+    :key time: Tuple[float, float]
+    :rtype: int
+    """
+
+    counters['cutKey'] += 1
+
+    animCurve = MockScene.getInstance().getNodeByName(args[0])
+    frames = [frame for frame in animCurve.keys if time[0] <= frame <= time[1]]
+
+    for frame in frames:
+
+        del animCurve.keys[frame]
+        animCurve.__dict__.get('tangents', {}).pop(frame, None)
+
+    return len(frames)
+
+
+def keyframe(*args, time=(None, None), **kwargs):
+    """
+    Stand-in for `maya.cmds.keyframe` that counts keys inside the supplied time range.
+
+    :key time: Tuple[float, float]
+    :rtype: int
+    """
+
+    counters['keyframe'] += 1
+
+    animCurve = MockScene.getInstance().getNodeByName(args[0])
+    return len([frame for frame in animCurve.keys if time[0] <= frame <= time[1]])
+
+
+def copyKey(*args, time=(None, None), **kwargs):
+    """
+    Stand-in for `maya.cmds.copyKey` that copies keys, relative to the range start, into the clipboard.
+
+    :key time: Tuple[float, float]
+    :rtype: int
+    """
+
+    counters['copyKey'] += 1
+
+    animCurve = MockScene.getInstance().getNodeByName(args[0])
+
+    CLIPBOARD.clear()
+    CLIPBOARD.update({frame - time[0]: value for (frame, value) in animCurve.keys.items() if time[0] <= frame <= time[1]})
+
+    return len(CLIPBOARD)
+
+
+def pasteKey(*args, time=(0, 0), **kwargs):
+    """
+    Stand-in for `maya.cmds.pasteKey` that merges the clipboard at the supplied time.
+
+    :key time: Tuple[float, float]
+    :rtype: int
+    """
+
+    counters['pasteKey'] += 1
+
+    animCurve = MockScene.getInstance().getNodeByName(args[0])
+    animCurve.keys.update({frame + time[0]: value for (frame, value) in CLIPBOARD.items()})
+
+    return len(CLIPBOARD)
+
+
+def setKeyframe(*args, time=0.0, value=0.0, animLayer=None, identity=False, **kwargs):
+    """
+    Stand-in for `maya.cmds.setKeyframe` that keys an anim curve directly.
+    If an animation layer is supplied then identity keys are set on the layer curves of the supplied plugs instead.
+
+    :key time: float
+    :key value: float
+    :key animLayer: str
+    :key identity: bool
+    :rtype: int
+    """
+
+    counters['setKeyframe'] += 1
+    scene = MockScene.getInstance()
+
+    if animLayer is None:
+
+        animCurve = scene.getNodeByName(args[0])
+        animCurve.keys[time] = value
+
+        return 1
+
+    for plugName in args[0]:
+
+        nodeName, attributeName = plugName.split('.', 1)
+        blend = scene.getNodeByName(nodeName).plugs[attributeName].source().node()
+
+        if not blend.plugs['inputB'].isDestination:
+
+            curveType = 'animCurveTA' if attributeName.startswith('rotate') else 'animCurveTU' if attributeName.startswith('scale') else 'animCurveTL'
+            curve = scene.createNode(curveType, name=f'{blend.name()}_inputB')
+            blend.connectPlugs(curve['output'], 'inputB')
+
+        blend.plugs['inputB'].source().node().keys[time] = 0.0
+
+    return len(args[0])
+
+
+def animLayer(*args, query=False, edit=False, exists=False, attribute=None, findCurveForPlug=None, **kwargs):
+    """
+    Stand-in for `maya.cmds.animLayer` that layers plugs through additive blend nodes.
+
+    :key query: bool
+    :key edit: bool
+    :key exists: bool
+    :key attribute: List[str]
+    :key findCurveForPlug: str
+    :rtype: Union[str, bool, List[str], None]
+    """
+
+    counters['animLayer'] += 1
+
+    scene = MockScene.getInstance()
+    name = args[0]
+
+    if query and exists:
+
+        return isinstance(scene.names.get(name, None), MockNode) and scene.names[name].typeName == 'animLayer'
+
+    elif query and findCurveForPlug is not None:
+
+        nodeName, attributeName = findCurveForPlug.split('.', 1)
+        source = scene.getNodeByName(nodeName).plugs[attributeName].source()
+
+        if source.isNull or source.node().typeName != 'animBlendNodeAdditive' or not source.node().plugs['inputB'].isDestination:
+
+            return None
+
+        return [source.node().plugs['inputB'].source().node().name()]
+
+    elif edit and attribute is not None:
+
+        for plugName in attribute:
+
+            nodeName, attributeName = plugName.split('.', 1)
+            node = scene.getNodeByName(nodeName)
+            plug = node.plugs[attributeName]
+
+            if not plug.source().isNull and plug.source().node().typeName == 'animBlendNodeAdditive':
+
+                continue
+
+            blend = scene.createNode('animBlendNodeAdditive', name=f'{nodeName}_{attributeName}_{name}')
+            blend.values['inputA'] = node.values[attributeName]
+            blend.connectPlugs('output', plug)
+
+        return None
+
+    else:
+
+        return scene.createNode('animLayer', name=name).name()
+
+
+def addAttr(*args, longName='', **kwargs):
+    """
+    Stand-in for `maya.cmds.addAttr` that adds a message attribute to a node.
+
+    :key longName: str
+    :rtype: None
+    """
+
+    counters['addAttr'] += 1
+
+    node = MockScene.getInstance().getNodeByName(args[0])
+    node.plugs[longName] = MockPlug(node, longName)
+
+
+def disconnectAttr(source, destination):
+    """
+    Stand-in for `maya.cmds.disconnectAttr`.
+
+    :type source: str
+    :type destination: str
+    :rtype: None
+    """
+
+    counters['disconnectAttr'] += 1
+
+    nodeName, attributeName = destination.split('.', 1)
+    MockScene.getInstance().getNodeByName(nodeName).plugs[attributeName]._source = None
+
+
+def referenceQuery(name, editStrings=False, isLoaded=False, **kwargs):
+    """
+    Stand-in for `maya.cmds.referenceQuery`.
+
+    :type name: str
+    :key editStrings: bool
+    :key isLoaded: bool
+    :rtype: Union[List[str], bool]
+    """
+
+    counters['referenceQuery'] += 1
+    reference = MockScene.getInstance().references[name]
+
+    if isLoaded:
+
+        return reference.isLoaded
+
+    return [' '.join(edit) for edit in reference.edits]
+
+
+def referenceEdit(targets, removeEdits=False, **kwargs):
+    """
+    Stand-in for `maya.cmds.referenceEdit` that removes every edit involving the supplied plugs.
+
+    :type targets: Union[str, List[str]]
+    :key removeEdits: bool
+    :rtype: None
+    """
+
+    counters['referenceEdit'] += 1
+    targets = {targets} if isinstance(targets, str) else set(targets)
+
+    for reference in MockScene.getInstance().references.values():
+
+        if not any(targets.intersection(edit[1:]) for edit in reference.edits):
+
+            continue
+
+        if reference.isLoaded:
+
+            raise RuntimeError(f'"{reference.name()}" must be unloaded to remove edits!')
+
+        reference.edits = [edit for edit in reference.edits if not targets.intersection(edit[1:])]
+
+
+def file(*args, unloadReference=None, loadReference=None, **kwargs):
+    """
+    Stand-in for `maya.cmds.file` that only toggles references.
+
+    :key unloadReference: str
+    :key loadReference: str
+    :rtype: None
+    """
+
+    references = MockScene.getInstance().references
+
+    if unloadReference is not None:
+
+        counters['unloadReference'] += 1
+        references[unloadReference].isLoaded = False
+
+    if loadReference is not None:
+
+        counters['loadReference'] += 1
+        references[loadReference].isLoaded = True
+
+
+def ls(*args, selection=False, **kwargs):
+    """
+    Stand-in for `maya.cmds.ls` that only lists the active selection.
+
+    :key selection: bool
+    :rtype: List[str]
+    """
+
+    return [node.name() for node in MockScene.getInstance().selection] if selection else []
+
+
+def select(*args, replace=False, clear=False, **kwargs):
+    """
+    Stand-in for `maya.cmds.select`.
+
+    :key replace: bool
+    :key clear: bool
+    :rtype: None
+    """
+
+    scene = MockScene.getInstance()
+    scene.setSelection([] if clear else [scene.getNodeByName(name) for name in (args[0] if len(args) > 0 else [])])
+
+
+def MPyNode(obj):
+    """
+    Stand-in for the `mpynode.MPyNode` constructor.
+
+    :type obj: Union[str, MockNode]
+    :rtype: MockNode
+    """
+
+    return MockScene.getInstance().getNodeByName(obj) if isinstance(obj, str) else obj
+# endregion
+
+
+# region Commands
+UNDO_STATE = [True]
+UNDO_QUEUE = []
+REDO_QUEUE = []
+PLUGINS = {}
+
+
+def createCommand(creator):
+    """
+    Returns a command function that pushes undoable command instances onto the undo queue.
+
+    :type creator: Callable
+    :rtype: Callable
+    """
+
+    def command(*args, **kwargs):
+
+        counters['command'] += 1
+
+        instance = creator()
+        instance.doIt(args)
+
+        if instance.isUndoable() and UNDO_STATE[0]:
+
+            UNDO_QUEUE.append(instance)
+            REDO_QUEUE.clear()
+
+    return command
+
+
+def undoInfo(*args, query=False, stateWithoutFlush=None, **kwargs):
+    """
+    Stand-in for `maya.cmds.undoInfo`.
+
+    :key query: bool
+    :key stateWithoutFlush: bool
+    :rtype: Union[bool, None]
+    """
+
+    if query:
+
+        return UNDO_STATE[0]
+
+    elif stateWithoutFlush is not None:
+
+        UNDO_STATE[0] = bool(stateWithoutFlush)
+
+
+def undo(*args, **kwargs):
+    """
+    Stand-in for `maya.cmds.undo`.
+
+    :rtype: None
+    """
+
+    if len(UNDO_QUEUE) > 0:
+
+        instance = UNDO_QUEUE.pop()
+        instance.undoIt()
+
+        REDO_QUEUE.append(instance)
+
+
+def redo(*args, **kwargs):
+    """
+    Stand-in for `maya.cmds.redo`.
+
+    :rtype: None
+    """
+
+    if len(REDO_QUEUE) > 0:
+
+        instance = REDO_QUEUE.pop()
+        instance.redoIt()
+
+        UNDO_QUEUE.append(instance)
+
+
+def pluginInfo(plugin, query=False, loaded=False, **kwargs):
+    """
+    Stand-in for `maya.cmds.pluginInfo`.
+    Binary plug-ins are always reported as loaded while python plug-ins must be loaded through `loadPlugin`!
+
+    :type plugin: str
+    :key query: bool
+    :key loaded: bool
+    :rtype: bool
+    """
+
+    return PLUGINS.get(plugin, False) if plugin.endswith('.py') else True
+
+
+def loadPlugin(path, quiet=False, **kwargs):
+    """
+    Stand-in for `maya.cmds.loadPlugin` that imports python plug-ins as standalone modules, like Maya does.
+
+    :type path: str
+    :key quiet: bool
+    :rtype: List[str]
+    """
+
+    name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(name, path)
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.initializePlugin(path)
+
+    PLUGINS[path] = True
+
+    return [name]
+# endregion
+
+
+# region Decorators
+AUTO_KEY = [False]
+
+
+class Animate(object):
+    """
+    Stand-in for the `dcc.maya.decorators.animate.Animate` context manager.
+    """
+
+    def __init__(self, state=False):
+
+        self.state = state
+        self.previousState = False
+
+    def __enter__(self):
+
+        self.previousState = AUTO_KEY[0]
+        AUTO_KEY[0] = self.state
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+
+        AUTO_KEY[0] = self.previousState
+
+    def __call__(self, func):
+
+        def wrapper(*args, **kwargs):
+
+            with self:
+
+                return func(*args, **kwargs)
+
+        return wrapper
+
+
+class Undo(Animate):
+    """
+    Stand-in for the `dcc.maya.decorators.undo.Undo` decorator.
+    """
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+
+        pass
+# endregion
+
+
+# region Installation
+def inclusiveRange(start, end, step=1):
+    """
+    Stand-in for `dcc.generators.inclusiverange.inclusiveRange`.
+
+    :type start: Union[int, float]
+    :type end: Union[int, float]
+    :type step: Union[int, float]
+    :rtype: Iterator[Union[int, float]]
+    """
+
+    value = start
+
+    while value <= end:
+
+        yield value
+        value += step
+
+
+def pascalize(name):
+    """
+    Stand-in for `dcc.python.stringutils.pascalize`.
+
+    :type name: str
+    :rtype: str
+    """
+
+    return name[:1].upper() + name[1:]
+
+
+def createModule(name, **attributes):
+    """
+    Registers a new module with the supplied attributes.
+
+    :type name: str
+    :rtype: types.ModuleType
+    """
+
+    module = types.ModuleType(name)
+    module.__dict__.update(attributes)
+
+    sys.modules[name] = module
+
+    # Attach module to its parent package
+    #
+    parentName, _, childName = name.rpartition('.')
+
+    if len(parentName) > 0:
+
+        setattr(sys.modules[parentName], childName, module)
+
+    return module
+
+
+def importQt():
+    """
+    Returns the QtCore, QtWidgets, QtGui and QtCompat modules from the first available Qt binding.
+
+    :rtype: Tuple[types.ModuleType, types.ModuleType, types.ModuleType, types.ModuleType]
+    """
+
+    for binding in ('PySide6', 'PySide2'):
+
+        try:
+
+            QtCore = importlib.import_module(f'{binding}.QtCore')
+            QtWidgets = importlib.import_module(f'{binding}.QtWidgets')
+            QtGui = importlib.import_module(f'{binding}.QtGui')
+            shiboken = importlib.import_module('shiboken6' if binding == 'PySide6' else 'shiboken2')
+
+        except ImportError:
+
+            continue
+
+        # Patch any members that Qt.py normally provides
+        #
+        if not hasattr(QtCore.Qt, 'WindowFlags'):
+
+            QtCore.Qt.WindowFlags = lambda *args: QtCore.Qt.WindowType(0)
+
+        QtCompat = types.SimpleNamespace(isValid=shiboken.isValid)
+
+        return QtCore, QtWidgets, QtGui, QtCompat
+
+    raise ImportError('The benchmarks require either PySide6 or PySide2!')
+
+
+def install():
+    """
+    Registers the in-memory `maya`, `mpy` and `dcc` modules.
+
+    :rtype: None
+    """
+
+    # Check if modules have already been installed
+    #
+    if getattr(sys.modules.get('maya'), '__mock__', False):
+
+        return
+
+    # Register maya modules
+    # The user directory is redirected to a temporary directory so presets and caches never touch a real install!
+    #
+    os.environ.setdefault('MAYA_APP_DIR', os.path.join(tempfile.gettempdir(), 'mockmaya'))
+
+    createModule('maya', __mock__=True, __path__=[])
+    createModule(
+        'maya.cmds',
+        about=lambda **kwargs: '2024',
+        pluginInfo=pluginInfo,
+        loadPlugin=loadPlugin,
+        undoInfo=undoInfo,
+        undo=undo,
+        redo=redo,
+        currentTime=lambda *args, **kwargs: MockScene.getInstance().time,
+        duplicate=duplicate,
+        cutKey=cutKey,
+        keyframe=keyframe,
+        copyKey=copyKey,
+        pasteKey=pasteKey,
+        setKeyframe=setKeyframe,
+        animLayer=animLayer,
+        addAttr=addAttr,
+        disconnectAttr=disconnectAttr,
+        referenceQuery=referenceQuery,
+        referenceEdit=referenceEdit,
+        file=file,
+        ls=ls,
+        select=select,
+        objExists=lambda name: name in MockScene.getInstance().names
+    )
+    createModule('maya.api', __path__=[])
+    createModule(
+        'maya.api.OpenMaya',
+        MFn=MFn,
+        MFnAnimCurve=MFnAnimCurve,
+        MDGModifier=MDGModifier,
+        MTime=MTime,
+        MAngle=MAngle,
+        MDGContext=MDGContext,
+        MDGContextGuard=MDGContextGuard,
+        MMatrix=MMatrix,
+        MCallbackIdArray=MCallbackIdArray,
+        MMessage=MMessage,
+        MEventMessage=MEventMessage,
+        MSceneMessage=MSceneMessage,
+        MNodeMessage=MNodeMessage,
+        MDGMessage=MDGMessage,
+        MSyntax=MSyntax,
+        MPxCommand=MPxCommand,
+        MFnPlugin=MFnPlugin,
+        MObjectHandle=MObjectHandle
+    )
+
+    # Register mpy modules
+    #
+    createModule('mpy', __path__=[])
+    createModule('mpy.mpyscene', MPyScene=MockScene)
+    createModule('mpy.mpynode', MPyNode=MPyNode)
+
+    # Register dcc modules
+    #
+    QtCore, QtWidgets, QtGui, QtCompat = importQt()
+
+    createModule('dcc', __path__=[])
+    createModule('dcc.generators', __path__=[])
+    createModule('dcc.generators.inclusiverange', inclusiveRange=inclusiveRange)
+    createModule('dcc.python', __path__=[])
+    createModule('dcc.python.stringutils', pascalize=pascalize)
+    createModule('dcc.maya', __path__=[])
+    createModule('dcc.maya.libs', __path__=[])
+    createModule(
+        'dcc.maya.libs.plugutils',
+        iterChildren=lambda plug: iter(plug.children()),
+        hasConnection=lambda plug: plug.isDestination or any(child.isDestination for child in plug.children())
+    )
+    createModule(
+        'dcc.maya.libs.pluginutils',
+        getPluginExtension=lambda: 'mll',
+        pathToPlugin=lambda plugin: '',
+        tryLoadPlugin=lambda path: True,
+        ensurePluginPath=lambda path: None
+    )
+    createModule('dcc.maya.decorators', __path__=[])
+    createModule('dcc.maya.decorators.animate', Animate=Animate)
+    createModule('dcc.maya.decorators.undo', Undo=Undo)
+    createModule('dcc.vendor', __path__=[])
+    createModule('dcc.vendor.Qt', QtCore=QtCore, QtWidgets=QtWidgets, QtGui=QtGui, QtCompat=QtCompat)
+    createModule('dcc.ui', __path__=[])
+    createModule('dcc.ui.qsingletonwindow', QSingletonWindow=createSingletonWindow(QtWidgets))
+    createModule('dcc.ui.qtimespinbox', QTimeSpinBox=createTimeSpinBox(QtWidgets))
+
+
+def createSingletonWindow(QtWidgets):
+    """
+    Returns a stand-in for `dcc.ui.qsingletonwindow.QSingletonWindow`.
+
+    :type QtWidgets: types.ModuleType
+    :rtype: type
+    """
+
+    class QSingletonMeta(type(QtWidgets.QMainWindow)):
+
+        def __call__(cls, *args, **kwargs):
+
+            instance = super(QSingletonMeta, cls).__call__(*args, **kwargs)
+            instance.__setup_ui__(*args, **kwargs)
+            instance.__post_init__(*args, **kwargs)
+
+            cls.__instances__[cls.__name__] = instance
+
+            return instance
+
+    class QSingletonWindow(QtWidgets.QMainWindow, metaclass=QSingletonMeta):
+
+        __instances__ = {}
+
+        def __init__(self, *args, **kwargs):
+
+            super(QSingletonWindow, self).__init__(parent=kwargs.get('parent', None))
+
+        def __setup_ui__(self, *args, **kwargs):
+
+            pass
+
+        def __post_init__(self, *args, **kwargs):
+
+            pass
+
+        @classmethod
+        def getInstance(cls):
+
+            return cls.__instances__.get(cls.__name__, None)
+
+    return QSingletonWindow
+
+
+def createTimeSpinBox(QtWidgets):
+    """
+    Returns a stand-in for `dcc.ui.qtimespinbox.QTimeSpinBox`.
+
+    :type QtWidgets: types.ModuleType
+    :rtype: type
+    """
+
+    class DefaultType(object):
+
+        START_TIME = 0
+        END_TIME = 1
+
+    class QTimeSpinBox(QtWidgets.QSpinBox):
+
+        def setDefaultType(self, defaultType):
+
+            self._defaultType = defaultType
+
+    QTimeSpinBox.DefaultType = DefaultType
+    return QTimeSpinBox
+
+
+def loadPackage(name='noiseeditor'):
+    """
+    Imports the repository root as the supplied package name.
+
+    :type name: str
+    :rtype: types.ModuleType
+    """
+
+    # Check if package has already been loaded
+    #
+    if name in sys.modules:
+
+        return sys.modules[name]
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    spec = importlib.util.spec_from_file_location(name, os.path.join(root, '__init__.py'), submodule_search_locations=[root])
+
+    package = importlib.util.module_from_spec(spec)
+    sys.modules[name] = package
+    spec.loader.exec_module(package)
+
+    # Register pure-Python shake command
+    #
+    sys.modules['maya.cmds'].shake = createShakeCommand(referencenoise)
+
+    return package
+
+
+def createShakeCommand(evaluator):
+    """
+    Returns a stand-in for the `shake` command that evaluates the noise in pure Python.
+
+    :type evaluator: types.ModuleType
+    :rtype: Callable
+    """
+
+    def shake(**kwargs):
+
+        counters['shake'] += 1
+        return evaluator.shake(**kwargs)
+
+    return shake
+# endregion
+
+
+# region Scenes
+def synthesizeScene(numControls, numShakes, numFrames, components=('position', 'rotation', 'scale')):
+    """
+    Resets the in-memory scene with the supplied number of controls, shakes and frames.
+    Shakes are distributed across the controls, one component at a time, and every control is selected!
+
+    :type numControls: int
+    :type numShakes: int
+    :type numFrames: int
+    :type components: Tuple[str]
+    :rtype: MockScene
+    """
+
+    scene = MockScene.reset()
+    scene.animationRange = (0, numFrames)
+
+    timeNode = scene.getNodeByName('time1')
+    controls = [scene.createNode('transform', name=f'control{i}_ctrl') for i in range(numControls)]
+
+    outputs = {'position': ('outputTranslate', 'inputTranslate'), 'rotation': ('outputRotate', 'inputRotate'), 'scale': ('outputScale', 'inputScale')}
+
+    for i in range(numShakes):
+
+        control = controls[i % numControls]
+        component = components[(i // numControls) % len(components)]
+
+        # Check if control requires a compose transform
+        #
+        plug = control['offsetParentMatrix']
+
+        if plug.isDestination:
+
+            composeTransform = plug.source().node()
+
+        else:
+
+            composeTransform = scene.createNode('composeTransform', name=f'{control.name()}_composeTransform')
+            composeTransform.connectPlugs(control['translate'], 'inputRotatePivot')
+            composeTransform.connectPlugs(control['translate'], 'inputScalePivot')
+            composeTransform.connectPlugs(control['rotateOrder'], 'inputRotateOrder')
+            composeTransform.connectPlugs('outputMatrix', plug)
+
+        # Create shake node
+        #
+        outputName, inputName = outputs[component]
+
+        shake = scene.createNode('shake', name=f'{control.name()}_{component}Shake')
+        shake.setAttr('seed', i % 100)
+        shake.setAttr('frequency', 5.0)
+        shake.setAttr('roughness', 0.5)
+        shake.connectPlugs(outputName, composeTransform[inputName])
+        shake.connectPlugs(timeNode['outTime'], 'time')
+
+    scene.setSelection(controls)
+    resetCounters()
+
+    return scene
+# endregion
@@ -0,0 +1,439 @@
+"""
+Benchmark suite for the noise editor's hot paths.
+Each operation is timed against synthesized scenes of increasing size, with DG round-trips counted by the in-memory Maya layer.
+
+Usage:
+    python -m benchmarks.noiseeditorbench --output results.json
+    python -m benchmarks.noiseeditorbench --baseline results.json --tolerance 0.25
+"""
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import statistics
+
+from . import mockmaya
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+DEFAULT_SIZES = ((10, 10, 100), (100, 100, 100), (100, 300, 100), (500, 500, 100), (100, 100, 1000))
+
+
+class NoiseEditorBenchmark(object):
+    """
+    Times the noise editor's hot paths against synthesized scenes.
+    """
+
+    # region Dunderscores
+    __operations__ = (
+        'iterShakes',
+        'findAssociatedShakes',
+        'updateNoiseProperties',
+        'pushNoise',
+        'createNoise',
+        'deleteNoise',
+        'bakeNoise',
+        'bakeNoiseStreaming',
+        'freezeNoise',
+        'scrubLive',
+        'scrubFrozen'
+    )
+
+    def __init__(self, repeat=3):
+        """
+        Private method called after a new instance has been created.
+
+        :type repeat: int
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(NoiseEditorBenchmark, self).__init__()
+
+        # Install in-memory Maya layer
+        #
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        mockmaya.install()
+
+        from dcc.vendor.Qt import QtWidgets
+
+        self._application = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+
+        mockmaya.loadPackage()
+        from noiseeditor.libs import noiseutils
+        from noiseeditor.ui import qnoiseeditor
+
+        # Declare private variables
+        #
+        self._repeat = repeat
+        self._noiseutils = noiseutils
+        self._editor = qnoiseeditor.QNoiseEditor()
+        self._editor.setupDeferredWidgets()
+    # endregion
+
+    # region Properties
+    @property
+    def editor(self):
+        """
+        Getter method that returns the noise editor being measured.
+
+        :rtype: noiseeditor.ui.qnoiseeditor.QNoiseEditor
+        """
+
+        return self._editor
+    # endregion
+
+    # region Setups
+    def setupScene(self, numControls, numShakes, numFrames):
+        """
+        Synthesizes a scene with shakes already assigned.
+
+        :type numControls: int
+        :type numShakes: int
+        :type numFrames: int
+        :rtype: None
+        """
+
+        mockmaya.synthesizeScene(numControls, numShakes, numFrames)
+
+        self.editor.startTime = 0
+        self.editor.endTime = numFrames
+        self.editor.step = 1
+
+    def setupEmptyScene(self, numControls, numShakes, numFrames):
+        """
+        Synthesizes a scene with no shakes and the create check boxes set to produce the requested shake count.
+
+        :type numControls: int
+        :type numShakes: int
+        :type numFrames: int
+        :rtype: None
+        """
+
+        mockmaya.synthesizeScene(numControls, 0, numFrames)
+
+        numComponents = max(1, min(3, -(-numShakes // numControls)))
+
+        self.editor.posCheckBox.setChecked(numComponents >= 1)
+        self.editor.rotCheckBox.setChecked(numComponents >= 2)
+        self.editor.scaleCheckBox.setChecked(numComponents >= 3)
+    # endregion
+
+    # region Operations
+    def iterShakes(self):
+        """
+        Collects the noise items from the active selection.
+
+        :rtype: None
+        """
+
+        list(self.editor.iterShakes(fromSelection=True))
+
+    def findAssociatedShakes(self):
+        """
+        Finds the shakes for every compose transform in the scene.
+
+        :rtype: None
+        """
+
+        scene = mockmaya.MockScene.getInstance()
+
+        for node in [node for node in scene.nodes if node.typeName == 'composeTransform']:
+
+            self._noiseutils.findAssociatedShakes(node)
+
+    def updateNoiseProperties(self):
+        """
+        Refreshes every property widget from the active selection.
+
+        :rtype: None
+        """
+
+        self.editor.updateNoiseProperties()
+
+    def pushNoise(self):
+        """
+        Pushes the frequency widget to the active selection.
+
+        :rtype: None
+        """
+
+        self.editor.pushNoise(self.editor.frequencySpinBox, id=self.editor.__ids__[0])
+
+    def createNoise(self):
+        """
+        Assigns shakes to the active selection.
+
+        :rtype: None
+        """
+
+        self.editor.createNoise()
+
+    def deleteNoise(self):
+        """
+        Removes shakes from the active selection.
+
+        :rtype: None
+        """
+
+        self.editor.posCheckBox.setChecked(True)
+        self.editor.rotCheckBox.setChecked(True)
+        self.editor.scaleCheckBox.setChecked(True)
+
+        self.editor.deleteNoise(fromSelection=True)
+
+    def bakeNoise(self):
+        """
+        Bakes the shakes from the active selection.
+
+        :rtype: None
+        """
+
+        self.editor.chunkSize = 0
+        self.editor.bakeNoise()
+
+    def bakeNoiseStreaming(self):
+        """
+        Bakes the shakes from the active selection one chunk of frames at a time.
+
+        :rtype: None
+        """
+
+        self.editor.chunkSize = 25
+        self.editor.bakeNoise()
+
+    def freezeNoise(self):
+        """
+        Freezes the shakes from the active selection into curves.
+
+        :rtype: None
+        """
+
+        self.editor.freezeNoise()
+
+    def scrub(self):
+        """
+        Evaluates every compose transform input across the animation range, like scrubbing the timeline.
+
+        :rtype: None
+        """
+
+        scene = mockmaya.MockScene.getInstance()
+        composeTransforms = [node for node in scene.nodes if node.typeName == 'composeTransform']
+
+        for frame in range(self.editor.startTime, self.editor.endTime + 1):
+
+            scene.time = frame
+
+            for composeTransform in composeTransforms:
+
+                for attributeName in ('inputTranslate', 'inputRotate', 'inputScale'):
+
+                    composeTransform.getAttr(attributeName)
+
+    def scrubLive(self):
+        """
+        Scrubs the timeline while the shakes are evaluated live.
+
+        :rtype: None
+        """
+
+        self.scrub()
+
+    def scrubFrozen(self):
+        """
+        Scrubs the timeline after the shakes have been frozen.
+        Only the scrub is measured, freezing happens during setup!
+
+        :rtype: None
+        """
+
+        self.scrub()
+    # endregion
+
+    # region Methods
+    def measure(self, operation, numControls, numShakes, numFrames):
+        """
+        Times the supplied operation against a freshly synthesized scene.
+        The fastest run is reported since it is the least affected by any background noise!
+
+        :type operation: str
+        :type numControls: int
+        :type numShakes: int
+        :type numFrames: int
+        :rtype: Dict[str, Any]
+        """
+
+        timings = []
+        calls = {}
+
+        for i in range(self._repeat):
+
+            # Setup scene
+            #
+            if operation == 'createNoise':
+
+                self.setupEmptyScene(numControls, numShakes, numFrames)
+
+            else:
+
+                self.setupScene(numControls, numShakes, numFrames)
+
+            if operation == 'scrubFrozen':
+
+                self.editor.freezeNoise()
+
+            # Time operation
+            #
+            mockmaya.resetCounters()
+
+            startTime = time.perf_counter()
+            getattr(self, operation)()
+            timings.append(time.perf_counter() - startTime)
+
+            calls = mockmaya.getCounters()
+
+        return {
+            'operation': operation,
+            'controls': numControls,
+            'shakes': numShakes,
+            'frames': numFrames,
+            'seconds': min(timings),
+            'median': statistics.median(timings),
+            'roundTrips': sum(calls.values()),
+            'calls': calls
+        }
+
+    def run(self, sizes=DEFAULT_SIZES, operations=None):
+        """
+        Times the supplied operations across the specified scene sizes.
+
+        :type sizes: Iterable[Tuple[int, int, int]]
+        :type operations: Union[Iterable[str], None]
+        :rtype: Dict[str, Any]
+        """
+
+        operations = operations if operations is not None else self.__operations__
+        results = []
+
+        for (numControls, numShakes, numFrames) in sizes:
+
+            for operation in operations:
+
+                result = self.measure(operation, numControls, numShakes, numFrames)
+                results.append(result)
+
+                log.info(f'{operation}[{numControls}c/{numShakes}s/{numFrames}f]: {result["seconds"] * 1000.0:.2f}ms, {result["roundTrips"]} round-trip(s)')
+
+        return {
+            'meta': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'repeat': self._repeat,
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+            },
+            'results': results
+        }
+    # endregion
+
+
+def compare(results, baseline, tolerance=0.25):
+    """
+    Returns the regressions between the supplied results and baseline.
+    Timings regress when they exceed the baseline by more than the tolerance, round-trips regress on any increase!
+
+    :type results: Dict[str, Any]
+    :type baseline: Dict[str, Any]
+    :type tolerance: float
+    :rtype: List[str]
+    """
+
+    key = lambda result: (result['operation'], result['controls'], result['shakes'], result['frames'])
+    baselineResults = {key(result): result for result in baseline.get('results', [])}
+
+    regressions = []
+
+    for result in results.get('results', []):
+
+        # Check if baseline has a matching measurement
+        #
+        baselineResult = baselineResults.get(key(result), None)
+
+        if baselineResult is None:
+
+            continue
+
+        # Compare timings and round-trips
+        #
+        name = '{0}[{1}c/{2}s/{3}f]'.format(*key(result))
+        ratio = result['seconds'] / max(baselineResult['seconds'], 1e-9)
+
+        if ratio > (1.0 + tolerance):
+
+            regressions.append(f'{name}: {ratio:.2f}x slower ({result["seconds"] * 1000.0:.2f}ms against a baseline of {baselineResult["seconds"] * 1000.0:.2f}ms)')
+
+        if result['roundTrips'] > baselineResult['roundTrips']:
+
+            regressions.append(f'{name}: {result["roundTrips"] - baselineResult["roundTrips"]} more round-trip(s) ({result["roundTrips"]} against a baseline of {baselineResult["roundTrips"]})')
+
+    return regressions
+
+
+def main(args=None):
+    """
+    Command-line entry point for the benchmark suite.
+
+    :type args: Union[List[str], None]
+    :rtype: int
+    """
+
+    parser = argparse.ArgumentParser(description='Benchmarks the noise editor hot paths.')
+    parser.add_argument('--output', help='Path to write the JSON results to.')
+    parser.add_argument('--baseline', help='Path to a JSON baseline to compare against.')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed slowdown ratio before a timing regresses.')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of runs per measurement.')
+    parser.add_argument('--size', nargs=3, type=int, action='append', metavar=('CONTROLS', 'SHAKES', 'FRAMES'), help='Scene size to measure, can be repeated.')
+    parser.add_argument('--operation', action='append', choices=NoiseEditorBenchmark.__operations__, help='Operation to measure, can be repeated.')
+
+    arguments = parser.parse_args(args)
+
+    # Run benchmarks
+    #
+    benchmark = NoiseEditorBenchmark(repeat=arguments.repeat)
+    results = benchmark.run(sizes=arguments.size or DEFAULT_SIZES, operations=arguments.operation)
+
+    if arguments.output:
+
+        with open(arguments.output, 'w') as jsonFile:
+
+            json.dump(results, jsonFile, indent=4)
+
+    # Compare against baseline
+    #
+    if arguments.baseline:
+
+        with open(arguments.baseline, 'r') as jsonFile:
+
+            baseline = json.load(jsonFile)
+
+        regressions = compare(results, baseline, tolerance=arguments.tolerance)
+
+        for regression in regressions:
+
+            log.error(regression)
+
+        return 1 if len(regressions) > 0 else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+
+    sys.exit(main())
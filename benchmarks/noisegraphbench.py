@@ -0,0 +1,334 @@
+"""
+Benchmark suite for the noise graph's paint throughput.
+Each paint is rendered into a `QImage` on the offscreen Qt platform, with noise generated by the pure-Python shake command.
+
+Usage:
+    python -m benchmarks.noisegraphbench --output results.json
+    python -m benchmarks.noisegraphbench --baseline results.json --tolerance 0.25
+"""
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import itertools
+import statistics
+
+from . import mockmaya
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+DEFAULT_WIDTHS = (200, 400, 800, 1600)
+DEFAULT_STEPS = (1, 2, 4, 8)
+DEFAULT_RANGES = (100, 1000, 10000)
+DEFAULT_HEIGHT = 150
+
+
+class NoiseGraphBenchmark(object):
+    """
+    Times the noise graph's paint event against varying widget sizes and parameter churn.
+    """
+
+    # region Dunderscores
+    __patterns__ = (
+        'static',
+        'drag',
+        'seed',
+        'ramp',
+        'strength'
+    )
+
+    def __init__(self, paints=50):
+        """
+        Private method called after a new instance has been created.
+
+        :type paints: int
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(NoiseGraphBenchmark, self).__init__()
+
+        # Install in-memory Maya layer
+        #
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        mockmaya.install()
+
+        from dcc.vendor.Qt import QtWidgets, QtGui
+
+        self._application = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+
+        mockmaya.loadPackage()
+        from noiseeditor.libs import noiseutils
+        from noiseeditor.ui.widgets import qnoisegraph
+
+        # Declare private variables
+        #
+        self._paints = paints
+        self._QtGui = QtGui
+        self._noiseutils = noiseutils
+        self._graph = qnoisegraph.QNoiseGraph(frequency=0.5, roughness=0.5, fractal=True)
+    # endregion
+
+    # region Properties
+    @property
+    def graph(self):
+        """
+        Getter method that returns the noise graph being measured.
+
+        :rtype: noiseeditor.ui.widgets.qnoisegraph.QNoiseGraph
+        """
+
+        return self._graph
+    # endregion
+
+    # region Patterns
+    def static(self, i):
+        """
+        Leaves the parameters untouched, like a repaint from an overlapping window.
+
+        :type i: int
+        :rtype: None
+        """
+
+        pass
+
+    def drag(self, i):
+        """
+        Nudges the frequency on every paint, like dragging a spin box.
+
+        :type i: int
+        :rtype: None
+        """
+
+        self.graph.frequency = 0.5 + ((i % 100) * 0.01)
+
+    def seed(self, i):
+        """
+        Changes the seed on every paint, like randomizing the seed.
+
+        :type i: int
+        :rtype: None
+        """
+
+        self.graph.seed = i
+
+    def ramp(self, i):
+        """
+        Nudges the ramps on every paint, like dragging the ramp spin boxes.
+
+        :type i: int
+        :rtype: None
+        """
+
+        self.graph.rampIn = float(i % 10)
+        self.graph.rampOut = float(i % 10)
+
+    def strength(self, i):
+        """
+        Nudges the strengths on every paint, like dragging the strength spin boxes.
+
+        :type i: int
+        :rtype: None
+        """
+
+        self.graph.strength = (1.0 + (i % 10), 2.0, 0.5 * (i % 3))
+    # endregion
+
+    # region Methods
+    def measure(self, width, step, animationRange, pattern):
+        """
+        Times repeated paints of the noise graph into an image.
+
+        :type width: int
+        :type step: int
+        :type animationRange: int
+        :type pattern: str
+        :rtype: Dict[str, Any]
+        """
+
+        # Reset graph and scene
+        #
+        scene = mockmaya.MockScene.reset()
+        scene.animationRange = (0, animationRange)
+
+        self.graph.resize(width, DEFAULT_HEIGHT)
+        self.graph.step = step
+        self.graph.seed = 0
+        self.graph.frequency = 0.5
+        self.graph.rampIn = 0.0
+        self.graph.rampOut = 0.0
+        self.graph.envelope = 1.0
+        self.graph.strength = (1.0, 1.0, 1.0)
+        self.graph.positive = (False, False, False)
+
+        image = self._QtGui.QImage(width, DEFAULT_HEIGHT, self._QtGui.QImage.Format_ARGB32_Premultiplied)
+        churn = getattr(self, pattern)
+
+        # Time paints
+        # The shake sample cache is shared by every graph so it is emptied before each measurement!
+        #
+        self._noiseutils.clearShakeCache()
+        mockmaya.resetCounters()
+        timings = []
+
+        for i in range(self._paints):
+
+            startTime = time.perf_counter()
+
+            churn(i)
+            self.graph.render(image)
+
+            timings.append(time.perf_counter() - startTime)
+
+        totalTime = sum(timings)
+        calls = mockmaya.getCounters()
+
+        return {
+            'width': width,
+            'step': step,
+            'range': animationRange,
+            'pattern': pattern,
+            'paints': self._paints,
+            'paintsPerSecond': (self._paints / totalTime) if totalTime > 0.0 else 0.0,
+            'median': statistics.median(timings),
+            'max': max(timings),
+            'shakeCalls': calls.get('shake', 0)
+        }
+
+    def run(self, widths=DEFAULT_WIDTHS, steps=DEFAULT_STEPS, ranges=DEFAULT_RANGES, patterns=None):
+        """
+        Times the supplied churn patterns across the specified widths, steps and animation ranges.
+
+        :type widths: Iterable[int]
+        :type steps: Iterable[int]
+        :type ranges: Iterable[int]
+        :type patterns: Union[Iterable[str], None]
+        :rtype: Dict[str, Any]
+        """
+
+        patterns = patterns if patterns is not None else self.__patterns__
+        results = []
+
+        for (width, step, animationRange, pattern) in itertools.product(widths, steps, ranges, patterns):
+
+            result = self.measure(width, step, animationRange, pattern)
+            results.append(result)
+
+            log.info(f'{pattern}[{width}px/{step}step/{animationRange}f]: {result["paintsPerSecond"]:.1f} paints/s, {result["median"] * 1000.0:.2f}ms median')
+
+        return {
+            'meta': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'paints': self._paints,
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+            },
+            'results': results
+        }
+    # endregion
+
+
+def compare(results, baseline, tolerance=0.25):
+    """
+    Returns the regressions between the supplied results and baseline.
+    Latencies regress when the median exceeds the baseline by more than the tolerance!
+
+    :type results: Dict[str, Any]
+    :type baseline: Dict[str, Any]
+    :type tolerance: float
+    :rtype: List[str]
+    """
+
+    key = lambda result: (result['pattern'], result['width'], result['step'], result['range'])
+    baselineResults = {key(result): result for result in baseline.get('results', [])}
+
+    regressions = []
+
+    for result in results.get('results', []):
+
+        # Check if baseline has a matching measurement
+        #
+        baselineResult = baselineResults.get(key(result), None)
+
+        if baselineResult is None:
+
+            continue
+
+        # Compare median latencies
+        #
+        name = '{0}[{1}px/{2}step/{3}f]'.format(*key(result))
+        ratio = result['median'] / max(baselineResult['median'], 1e-9)
+
+        if ratio > (1.0 + tolerance):
+
+            regressions.append(f'{name}: {ratio:.2f}x slower ({result["median"] * 1000.0:.2f}ms against a baseline of {baselineResult["median"] * 1000.0:.2f}ms)')
+
+    return regressions
+
+
+def main(args=None):
+    """
+    Command-line entry point for the benchmark suite.
+
+    :type args: Union[List[str], None]
+    :rtype: int
+    """
+
+    parser = argparse.ArgumentParser(description='Benchmarks the noise graph paint throughput.')
+    parser.add_argument('--output', help='Path to write the JSON results to.')
+    parser.add_argument('--baseline', help='Path to a JSON baseline to compare against.')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed slowdown ratio before a latency regresses.')
+    parser.add_argument('--paints', type=int, default=50, help='Number of paints per measurement.')
+    parser.add_argument('--width', type=int, action='append', help='Widget width to measure, can be repeated.')
+    parser.add_argument('--step', type=int, action='append', help='Draw step to measure, can be repeated.')
+    parser.add_argument('--range', type=int, action='append', dest='ranges', help='Animation range length to measure, can be repeated.')
+    parser.add_argument('--pattern', action='append', choices=NoiseGraphBenchmark.__patterns__, help='Parameter churn pattern to measure, can be repeated.')
+
+    arguments = parser.parse_args(args)
+
+    # Run benchmarks
+    #
+    benchmark = NoiseGraphBenchmark(paints=arguments.paints)
+
+    results = benchmark.run(
+        widths=arguments.width or DEFAULT_WIDTHS,
+        steps=arguments.step or DEFAULT_STEPS,
+        ranges=arguments.ranges or DEFAULT_RANGES,
+        patterns=arguments.pattern
+    )
+
+    if arguments.output:
+
+        with open(arguments.output, 'w') as jsonFile:
+
+            json.dump(results, jsonFile, indent=4)
+
+    # Compare against baseline
+    #
+    if arguments.baseline:
+
+        with open(arguments.baseline, 'r') as jsonFile:
+
+            baseline = json.load(jsonFile)
+
+        regressions = compare(results, baseline, tolerance=arguments.tolerance)
+
+        for regression in regressions:
+
+            log.error(regression)
+
+        return 1 if len(regressions) > 0 else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+
+    sys.exit(main())
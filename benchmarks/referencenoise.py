@@ -0,0 +1,468 @@
+"""
+Pure-Python stand-in for the evaluator behind the `shake` command.
+The benchmarks and tests register `shake` from this module, through `mockmaya`, so the noise editor can be exercised outside of Maya.
+Production code must always go through `mc.shake`, this module only approximates the plug-in!
+"""
+import math
+import random
+import threading
+
+from array import array
+from enum import IntEnum
+from collections import OrderedDict
+
+try:
+
+    import numpy
+
+except ImportError:
+
+    numpy = None
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+LATTICE_SIZE = 256
+NUM_OCTAVES = 4
+SPECTRAL_PEAK = 0.52
+SPECTRAL_WIDTH = 0.32
+GRADIENT_RMS = 0.14
+LATTICE_CACHE_SIZE = 64
+PERIOD_CACHE_SIZE = 32
+
+__lattices__ = OrderedDict()
+__lattice_lock__ = threading.Lock()
+__lattice_stats__ = {'hits': 0, 'misses': 0, 'evictions': 0}
+__period_tables__ = OrderedDict()
+
+
+class NoiseEngine(IntEnum):
+    """
+    Enum class of all the available noise synthesis engines.
+    """
+
+    GRADIENT = 0
+    SPECTRAL = 1
+
+
+def createLattice(seed):
+    """
+    Returns the permutation and gradient tables for the supplied seed.
+
+    :type seed: int
+    :rtype: Tuple[List[int], List[float]]
+    """
+
+    generator = random.Random(seed)
+
+    permutations = list(range(LATTICE_SIZE))
+    generator.shuffle(permutations)
+
+    gradients = [generator.uniform(-1.0, 1.0) for _ in range(LATTICE_SIZE)]
+
+    return permutations + permutations, gradients
+
+
+def getLattice(seed):
+    """
+    Returns the cached permutation and gradient tables for the supplied seed.
+    Tables are stored as compact read-only arrays and shared between threads, the least recently used seed is evicted once the cache is full!
+
+    :type seed: int
+    :rtype: Tuple[memoryview, memoryview]
+    """
+
+    # Check if lattice has already been cached
+    #
+    with __lattice_lock__:
+
+        lattice = __lattices__.get(seed, None)
+
+        if lattice is not None:
+
+            __lattices__.move_to_end(seed)
+            __lattice_stats__['hits'] += 1
+
+            return lattice
+
+    # Build lattice outside of the lock
+    # Two threads may build the same seed at once but both produce identical tables!
+    #
+    permutations, gradients = createLattice(seed)
+    lattice = (memoryview(array('H', permutations)).toreadonly(), memoryview(array('d', gradients)).toreadonly())
+
+    with __lattice_lock__:
+
+        __lattice_stats__['misses'] += 1
+        __lattices__[seed] = lattice
+        __lattices__.move_to_end(seed)
+
+        while len(__lattices__) > LATTICE_CACHE_SIZE:
+
+            __lattices__.popitem(last=False)
+            __lattice_stats__['evictions'] += 1
+
+        return __lattices__[seed]
+
+
+def getLatticeCacheInfo():
+    """
+    Returns the hit rate and memory usage of the lattice cache.
+
+    :rtype: Dict[str, Union[int, float]]
+    """
+
+    with __lattice_lock__:
+
+        hits, misses = __lattice_stats__['hits'], __lattice_stats__['misses']
+        numBytes = sum(permutations.nbytes + gradients.nbytes for (permutations, gradients) in __lattices__.values())
+
+        return {
+            'hits': hits,
+            'misses': misses,
+            'evictions': __lattice_stats__['evictions'],
+            'hitRate': (hits / (hits + misses)) if (hits + misses) > 0 else 0.0,
+            'size': len(__lattices__),
+            'maxSize': LATTICE_CACHE_SIZE,
+            'bytes': numBytes
+        }
+
+
+def clearLatticeCache():
+    """
+    Removes every lattice and period table from the cache and resets its statistics.
+
+    :rtype: None
+    """
+
+    with __lattice_lock__:
+
+        __lattices__.clear()
+        __period_tables__.clear()
+        __lattice_stats__.update(hits=0, misses=0, evictions=0)
+
+
+def gradientNoise(x, lattice, cells=0):
+    """
+    Returns the 1D gradient noise at the supplied position.
+    The result is approximately within the range of -0.5 to 0.5!
+    If a number of cells is supplied then the noise repeats every that many units.
+
+    :type x: float
+    :type lattice: Tuple[Sequence[int], Sequence[float]]
+    :type cells: int
+    :rtype: float
+    """
+
+    permutations, gradients = lattice
+
+    floor = math.floor(x)
+    t = x - floor
+
+    if cells > 0:
+
+        index = int(floor) % cells
+        index0, index1 = permutations[index % LATTICE_SIZE], permutations[((index + 1) % cells) % LATTICE_SIZE]
+
+    else:
+
+        index = int(floor) & (LATTICE_SIZE - 1)
+        index0, index1 = permutations[index], permutations[index + 1]
+
+    g0 = gradients[index0] * t
+    g1 = gradients[index1] * (t - 1.0)
+
+    weight = t * t * t * (t * (t * 6.0 - 15.0) + 10.0)
+
+    return g0 + (weight * (g1 - g0))
+
+
+def fractalNoise(x, lattice, roughness=0.0, fractal=True, cells=0):
+    """
+    Returns the fractal brownian motion at the supplied position.
+    Roughness controls how much each successive octave contributes, the sum is normalized to keep the range of a single octave!
+    Each octave doubles its number of cells so periodic noise still repeats every `cells` units.
+
+    :type x: float
+    :type lattice: Tuple[Sequence[int], Sequence[float]]
+    :type roughness: float
+    :type fractal: bool
+    :type cells: int
+    :rtype: float
+    """
+
+    if not fractal or roughness <= 0.0:
+
+        return gradientNoise(x, lattice, cells=cells)
+
+    value, amplitude, total = 0.0, 1.0, 0.0
+
+    for octave in range(NUM_OCTAVES):
+
+        value += gradientNoise(x, lattice, cells=cells) * amplitude
+        total += amplitude
+
+        x *= 2.0
+        cells *= 2
+        amplitude *= roughness
+
+    return value / total
+
+
+def rampWeight(time, duration, rampIn=0.0, rampOut=0.0):
+    """
+    Returns the ramp weight at the supplied time.
+
+    :type time: float
+    :type duration: float
+    :type rampIn: float
+    :type rampOut: float
+    :rtype: float
+    """
+
+    weight = 1.0
+
+    if rampIn > 0.0:
+
+        weight = min(weight, max(0.0, time / rampIn))
+
+    if rampOut > 0.0:
+
+        weight = min(weight, max(0.0, (duration - time) / rampOut))
+
+    return weight
+
+
+def getPeriodicCells(frequency, period, timeScale=1):
+    """
+    Returns the number of whole noise cycles that fit inside the supplied period, in frames.
+    The frequency is effectively snapped to the nearest value that tiles so the noise loops without a seam!
+
+    :type frequency: float
+    :type period: int
+    :type timeScale: float
+    :rtype: int
+    """
+
+    return max(1, int(round(abs(frequency) * (period / timeScale))))
+
+
+def getPeriodTable(seed, frequency, period, roughness=0.0, fractal=True, timeScale=1):
+    """
+    Returns one period of looping noise samples, one per frame, for the supplied shake parameters.
+    Tables are computed once per parameter set and cached so any frame can be served by a modular lookup!
+
+    :type seed: int
+    :type frequency: float
+    :type period: int
+    :type roughness: float
+    :type fractal: bool
+    :type timeScale: float
+    :rtype: memoryview
+    """
+
+    # Check if table has already been cached
+    #
+    key = (seed, frequency, period, roughness, fractal, timeScale)
+
+    with __lattice_lock__:
+
+        table = __period_tables__.get(key, None)
+
+        if table is not None:
+
+            __period_tables__.move_to_end(key)
+            return table
+
+    # Sample one period at the snapped frequency
+    #
+    lattice = getLattice(seed)
+    cells = getPeriodicCells(frequency, period, timeScale=timeScale)
+
+    values = array('d', (fractalNoise((x / period) * cells, lattice, roughness=roughness, fractal=fractal, cells=cells) for x in range(period)))
+    table = memoryview(values).toreadonly()
+
+    with __lattice_lock__:
+
+        __period_tables__[key] = table
+
+        while len(__period_tables__) > PERIOD_CACHE_SIZE:
+
+            __period_tables__.popitem(last=False)
+
+    return table
+
+
+def getOctaveAmplitudes(roughness=0.0, fractal=True):
+    """
+    Returns the amplitude of each octave for the supplied roughness.
+
+    :type roughness: float
+    :type fractal: bool
+    :rtype: List[float]
+    """
+
+    if not fractal or roughness <= 0.0:
+
+        return [1.0]
+
+    return [roughness ** octave for octave in range(NUM_OCTAVES)]
+
+
+def getSpectrum(frequencies, roughness=0.0, fractal=True):
+    """
+    Returns the amplitude spectrum of the fractal noise at the supplied frequencies, in cycles per unit.
+    A single octave of gradient noise is modelled as a gaussian band, each octave doubles its frequency and halves its density!
+
+    :type frequencies: numpy.ndarray
+    :type roughness: float
+    :type fractal: bool
+    :rtype: numpy.ndarray
+    """
+
+    power = numpy.zeros_like(frequencies)
+
+    for (octave, amplitude) in enumerate(getOctaveAmplitudes(roughness=roughness, fractal=fractal)):
+
+        scale = 2.0 ** octave
+        power += (amplitude * amplitude / scale) * numpy.exp(-numpy.square(((frequencies / scale) - SPECTRAL_PEAK) / SPECTRAL_WIDTH))
+
+    return numpy.sqrt(power)
+
+
+def spectralNoise(numSamples, spacing, seed, roughness=0.0, fractal=True):
+    """
+    Returns band-limited noise, synthesized in the frequency domain, for evenly spaced positions.
+    The curve is statistically equivalent to `fractalNoise` but not sample identical, and it depends on the number of samples!
+
+    :type numSamples: int
+    :type spacing: float
+    :type seed: int
+    :type roughness: float
+    :type fractal: bool
+    :rtype: numpy.ndarray
+    """
+
+    # Pad transform to a power of two
+    # Doubling the length keeps the start and end of the curve from wrapping into each other!
+    #
+    size = 1 << max(1, (2 * numSamples - 1).bit_length())
+    frequencies = numpy.fft.rfftfreq(size, d=spacing)
+
+    # Shape random phases with the fractal spectrum
+    #
+    amplitudes = getSpectrum(frequencies, roughness=roughness, fractal=fractal)
+
+    generator = numpy.random.default_rng(seed)
+    spectrum = amplitudes * (generator.standard_normal(len(frequencies)) + (1j * generator.standard_normal(len(frequencies))))
+
+    samples = numpy.fft.irfft(spectrum, n=size)[:numSamples]
+
+    # Normalize to the expected deviation of the fractal noise
+    # The variance of the transform is known up front so every seed receives the same scale!
+    #
+    power = numpy.square(amplitudes)
+    variance = (power[0] + (4.0 * power[1:-1].sum()) + power[-1]) / (size * size)
+
+    octaves = getOctaveAmplitudes(roughness=roughness, fractal=fractal)
+    deviation = GRADIENT_RMS * math.sqrt(sum(amplitude * amplitude for amplitude in octaves)) / sum(octaves)
+
+    return samples * (deviation / math.sqrt(variance)) if variance > 0.0 else samples * 0.0
+
+
+def shake(seed=0, frequency=0.5, roughness=0.0, fractal=True, rampIn=0.0, rampOut=0.0, size=100, step=1, timeScale=1, positive=False, engine=NoiseEngine.GRADIENT, period=0):
+    """
+    Returns the noise samples for the supplied shake parameters.
+    This is a pure-Python evaluation of the shake algorithm with the same signature as the `shake` command!
+    The spectral engine synthesizes long ranges in O(n log n) rather than O(n * octaves), but it requires numpy.
+    A period, in frames, loops the noise seamlessly by reading from a cached table, ramps are still applied on top.
+    The positive flag folds negative samples over, like the shake node's positive attributes!
+
+    :type seed: int
+    :type frequency: float
+    :type roughness: float
+    :type fractal: bool
+    :type rampIn: float
+    :type rampOut: float
+    :type size: int
+    :type step: int
+    :type timeScale: float
+    :type positive: bool
+    :type engine: NoiseEngine
+    :type period: int
+    :rtype: List[float]
+    """
+
+    samples = synthesize(seed, frequency, roughness, fractal, rampIn, rampOut, size, step, timeScale, engine, period)
+    return [abs(sample) for sample in samples] if positive else samples
+
+
+def synthesize(seed, frequency, roughness, fractal, rampIn, rampOut, size, step, timeScale, engine, period):
+    """
+    Returns the signed noise samples for the supplied shake parameters.
+
+    :type seed: int
+    :type frequency: float
+    :type roughness: float
+    :type fractal: bool
+    :type rampIn: float
+    :type rampOut: float
+    :type size: int
+    :type step: int
+    :type timeScale: float
+    :type engine: NoiseEngine
+    :type period: int
+    :rtype: List[float]
+    """
+
+    # Check if periodic noise is requested
+    #
+    duration = size / timeScale
+
+    if period > 0:
+
+        table = getPeriodTable(seed, frequency, period, roughness=roughness, fractal=fractal, timeScale=timeScale)
+        return [table[x % period] * rampWeight(x / timeScale, duration, rampIn=rampIn, rampOut=rampOut) for x in range(0, size, step)]
+
+    # Check if spectral engine is requested
+    #
+    spacing = (step / timeScale) * frequency
+
+    if engine == NoiseEngine.SPECTRAL and numpy is not None and spacing > 0.0:
+
+        times = numpy.arange(0, size, step, dtype=numpy.float64) / timeScale
+        values = spectralNoise(len(times), spacing, seed, roughness=roughness, fractal=fractal)
+
+        weights = numpy.ones_like(times)
+
+        if rampIn > 0.0:
+
+            weights = numpy.minimum(weights, numpy.maximum(0.0, times / rampIn))
+
+        if rampOut > 0.0:
+
+            weights = numpy.minimum(weights, numpy.maximum(0.0, (duration - times) / rampOut))
+
+        return (values * weights).tolist()
+
+    elif engine == NoiseEngine.SPECTRAL and numpy is None:
+
+        log.warning('Spectral noise requires numpy, falling back on gradient noise!')
+
+    # Evaluate gradient noise point by point
+    #
+    lattice = getLattice(seed)
+
+    samples = []
+
+    for x in range(0, size, step):
+
+        time = x / timeScale
+        value = fractalNoise(time * frequency, lattice, roughness=roughness, fractal=fractal)
+
+        samples.append(value * rampWeight(time, duration, rampIn=rampIn, rampOut=rampOut))
+
+    return samples
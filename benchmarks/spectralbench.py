@@ -0,0 +1,286 @@
+"""
+Benchmark suite for the spectral noise engine.
+Each parameter set is synthesized by both engines so the spectral engine's speed, and its statistical distance from the gradient engine, can be checked.
+
+Usage:
+    python -m benchmarks.spectralbench --output results.json
+    python -m benchmarks.spectralbench --seeds 32 --samples 4096
+"""
+import sys
+import json
+import time
+import platform
+import argparse
+import itertools
+
+from . import referencenoise
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+DEFAULT_FREQUENCIES = (0.5, 2.0, 8.0)
+DEFAULT_ROUGHNESSES = (0.0, 0.25, 0.5, 0.75)
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_BOUNDS = {
+    'rms': 0.15,
+    'zeroCrossings': 0.3,  # Gradient noise is pinned to zero at every lattice point which adds crossings a gaussian field lacks!
+    'centroid': 0.15,
+    'mean': 0.25
+}
+
+
+class SpectralBenchmark(object):
+    """
+    Compares the spectral noise engine against the gradient noise engine.
+    """
+
+    # region Dunderscores
+    def __init__(self, seeds=16, samples=2048, timeScale=24.0):
+        """
+        Private method called after a new instance has been created.
+
+        :type seeds: int
+        :type samples: int
+        :type timeScale: float
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(SpectralBenchmark, self).__init__()
+
+        # Check numpy is available
+        #
+        if referencenoise.numpy is None:
+
+            raise ImportError('The spectral benchmark requires numpy!')
+
+        # Declare private variables
+        #
+        self._seeds = seeds
+        self._samples = samples
+        self._timeScale = timeScale
+        self._numpy = referencenoise.numpy
+    # endregion
+
+    # region Methods
+    def synthesize(self, engine, seed, frequency, roughness, size):
+        """
+        Returns the noise samples from the supplied engine.
+
+        :type engine: referencenoise.NoiseEngine
+        :type seed: int
+        :type frequency: float
+        :type roughness: float
+        :type size: int
+        :rtype: numpy.ndarray
+        """
+
+        values = referencenoise.shake(
+            seed=seed,
+            frequency=frequency,
+            roughness=roughness,
+            fractal=roughness > 0.0,
+            size=size,
+            step=1,
+            timeScale=self._timeScale,
+            engine=engine
+        )
+
+        return self._numpy.asarray(values, dtype=self._numpy.float64)
+
+    def statistics(self, values):
+        """
+        Returns the statistics of the supplied samples.
+        The spectral centroid is measured in cycles per sample!
+
+        :type values: numpy.ndarray
+        :rtype: Dict[str, float]
+        """
+
+        numpy = self._numpy
+
+        power = numpy.square(numpy.abs(numpy.fft.rfft(values - values.mean())))
+        frequencies = numpy.fft.rfftfreq(len(values))
+
+        return {
+            'mean': float(values.mean()),
+            'rms': float(numpy.sqrt(numpy.mean(numpy.square(values)))),
+            'zeroCrossings': float(numpy.count_nonzero(numpy.diff(numpy.signbit(values))) / len(values)),
+            'centroid': float((frequencies * power).sum() / max(power.sum(), 1e-12))
+        }
+
+    def compare(self, frequency, roughness):
+        """
+        Returns the averaged statistics of both engines for the supplied parameter set.
+
+        :type frequency: float
+        :type roughness: float
+        :rtype: Dict[str, Any]
+        """
+
+        engines = (referencenoise.NoiseEngine.GRADIENT, referencenoise.NoiseEngine.SPECTRAL)
+        averages = {}
+
+        for engine in engines:
+
+            results = [self.statistics(self.synthesize(engine, seed, frequency, roughness, self._samples)) for seed in range(self._seeds)]
+            averages[engine.name.lower()] = {key: sum(result[key] for result in results) / len(results) for key in results[0].keys()}
+
+        gradient, spectral = averages['gradient'], averages['spectral']
+
+        return {
+            'frequency': frequency,
+            'roughness': roughness,
+            'gradient': gradient,
+            'spectral': spectral,
+            'errors': {
+                'rms': abs((spectral['rms'] / gradient['rms']) - 1.0),
+                'zeroCrossings': abs((spectral['zeroCrossings'] / max(gradient['zeroCrossings'], 1e-12)) - 1.0),
+                'centroid': abs((spectral['centroid'] / gradient['centroid']) - 1.0),
+                'mean': abs(spectral['mean']) / spectral['rms']
+            }
+        }
+
+    def time(self, size, frequency=2.0, roughness=0.5):
+        """
+        Returns the seconds per curve of both engines for the supplied number of samples.
+
+        :type size: int
+        :type frequency: float
+        :type roughness: float
+        :rtype: Dict[str, Any]
+        """
+
+        timings = {}
+
+        for engine in (referencenoise.NoiseEngine.GRADIENT, referencenoise.NoiseEngine.SPECTRAL):
+
+            startTime = time.perf_counter()
+            self.synthesize(engine, 0, frequency, roughness, size)
+            timings[engine.name.lower()] = time.perf_counter() - startTime
+
+        timings['size'] = size
+        timings['speedup'] = timings['gradient'] / max(timings['spectral'], 1e-9)
+
+        return timings
+
+    def run(self, frequencies=DEFAULT_FREQUENCIES, roughnesses=DEFAULT_ROUGHNESSES, sizes=DEFAULT_SIZES):
+        """
+        Compares both engines across the specified parameter sets and times them across the specified sizes.
+
+        :type frequencies: Iterable[float]
+        :type roughnesses: Iterable[float]
+        :type sizes: Iterable[int]
+        :rtype: Dict[str, Any]
+        """
+
+        comparisons = []
+
+        for (frequency, roughness) in itertools.product(frequencies, roughnesses):
+
+            comparison = self.compare(frequency, roughness)
+            comparisons.append(comparison)
+
+            errors = ', '.join(f'{key}={value:.3f}' for (key, value) in comparison['errors'].items())
+            log.info(f'frequency={frequency}/roughness={roughness}: {errors}')
+
+        timings = []
+
+        for size in sizes:
+
+            timing = self.time(size)
+            timings.append(timing)
+
+            log.info(f'{size} samples: {timing["gradient"] * 1000.0:.2f}ms gradient, {timing["spectral"] * 1000.0:.2f}ms spectral ({timing["speedup"]:.1f}x)')
+
+        return {
+            'meta': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'seeds': self._seeds,
+                'samples': self._samples,
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+            },
+            'comparisons': comparisons,
+            'timings': timings
+        }
+    # endregion
+
+
+def check(results, bounds=None):
+    """
+    Returns the statistics that exceed the supplied bounds.
+
+    :type results: Dict[str, Any]
+    :type bounds: Union[Dict[str, float], None]
+    :rtype: List[str]
+    """
+
+    bounds = bounds if bounds is not None else DEFAULT_BOUNDS
+    violations = []
+
+    for comparison in results.get('comparisons', []):
+
+        name = f'frequency={comparison["frequency"]}/roughness={comparison["roughness"]}'
+
+        for (key, error) in comparison['errors'].items():
+
+            if error > bounds[key]:
+
+                violations.append(f'{name}: {key} differs by {error:.3f} (bound {bounds[key]})')
+
+    return violations
+
+
+def main(args=None):
+    """
+    Command-line entry point for the benchmark suite.
+
+    :type args: Union[List[str], None]
+    :rtype: int
+    """
+
+    parser = argparse.ArgumentParser(description='Compares the spectral noise engine against the gradient noise engine.')
+    parser.add_argument('--output', help='Path to write the JSON results to.')
+    parser.add_argument('--seeds', type=int, default=16, help='Number of seeds averaged per parameter set.')
+    parser.add_argument('--samples', type=int, default=2048, help='Number of samples per statistical curve.')
+    parser.add_argument('--frequency', type=float, action='append', help='Frequency to compare, can be repeated.')
+    parser.add_argument('--roughness', type=float, action='append', help='Roughness to compare, can be repeated.')
+    parser.add_argument('--size', type=int, action='append', help='Number of samples to time, can be repeated.')
+
+    arguments = parser.parse_args(args)
+
+    # Run benchmarks
+    #
+    benchmark = SpectralBenchmark(seeds=arguments.seeds, samples=arguments.samples)
+
+    results = benchmark.run(
+        frequencies=arguments.frequency or DEFAULT_FREQUENCIES,
+        roughnesses=arguments.roughness or DEFAULT_ROUGHNESSES,
+        sizes=arguments.size or DEFAULT_SIZES
+    )
+
+    if arguments.output:
+
+        with open(arguments.output, 'w') as jsonFile:
+
+            json.dump(results, jsonFile, indent=4)
+
+    # Check statistical bounds
+    #
+    violations = check(results)
+
+    for violation in violations:
+
+        log.error(violation)
+
+    return 1 if len(violations) > 0 else 0
+
+
+if __name__ == '__main__':
+
+    sys.exit(main())
@@ -0,0 +1,858 @@
+import math
+
+from enum import IntEnum
+from maya import cmds as mc
+from maya.api import OpenMaya as om
+from mpy import mpyscene, mpynode
+from dcc.python import stringutils
+from dcc.maya.decorators import animate
+from . import noiseutils, keyutils, profileutils, undoutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+DEFAULT_CHUNK_SIZE = 1000
+MIN_SUB_FRAME_STEP = 0.25
+MAX_AUTO_STEP = 8.0
+NOISE_LAYER_NAME = 'noise'
+
+
+class BakeTarget(IntEnum):
+    """
+    Enum class of all the available bake targets.
+    """
+
+    KEYS = 0
+    CACHE = 1
+    CACHE_AND_KEYS = 2
+    LAYER = 3
+    TRACKS = 4
+
+
+def getBakeAttributes(noiseItem):
+    """
+    Returns the control attributes that receive keys from the supplied noise item.
+
+    :type noiseItem: NoiseItem
+    :rtype: List[str]
+    """
+
+    attributeNames = []
+
+    if noiseItem.position is not None:
+
+        attributeNames.extend(['translateX', 'translateY', 'translateZ'])
+
+    if noiseItem.rotation is not None:
+
+        attributeNames.extend(['rotateX', 'rotateY', 'rotateZ'])
+
+    if noiseItem.scale is not None:
+
+        attributeNames.extend(['scaleX', 'scaleY', 'scaleZ'])
+
+    return attributeNames
+
+
+def cleanupNoiseItem(noiseItem):
+    """
+    Deletes the shake, frozen curve and compose transform nodes from the supplied noise item and restores its `offsetParentMatrix` plug.
+
+    :type noiseItem: NoiseItem
+    :rtype: None
+    """
+
+    # Cleanup shake nodes and any frozen curves
+    #
+    for shake in (noiseItem.position, noiseItem.rotation, noiseItem.scale):
+
+        if shake is None:
+
+            continue
+
+        for curve in noiseutils.findFrozenCurves(shake):
+
+            undoutils.deleteNode(curve)
+
+        undoutils.deleteNode(shake)
+
+    # Cleanup compose transform node and reset `offsetParentMatrix` plug
+    #
+    offsetParentMatrix = noiseItem.transform.getAttr('inputOffsetParentMatrix')
+    undoutils.deleteNode(noiseItem.transform)
+
+    undoutils.setAttr(noiseItem.node, 'offsetParentMatrix', offsetParentMatrix)
+
+
+def getNoiseLayer(name=NOISE_LAYER_NAME):
+    """
+    Returns the additive animation layer that noise is baked onto.
+    If the layer does not exist then it is created with component rotations and additive scales, matching a bake onto keys!
+
+    :type name: str
+    :rtype: str
+    """
+
+    if mc.animLayer(name, query=True, exists=True):
+
+        return name
+
+    return mc.animLayer(name, override=False, rotationAccumulationMode='component', scaleAccumulationMode='additive')
+
+
+def findLayerCurve(layerName, plugName):
+    """
+    Returns the name of the anim curve that drives the supplied plug on the specified layer.
+    If the plug has not been keyed on the layer then none is returned!
+
+    :type layerName: str
+    :type plugName: str
+    :rtype: Union[str, None]
+    """
+
+    curveNames = mc.animLayer(layerName, query=True, findCurveForPlug=plugName) or []
+    return curveNames[0] if len(curveNames) > 0 else None
+
+
+def bakeNoiseLayer(noiseItems, startTime, endTime, step=1, layerName=NOISE_LAYER_NAME, tolerance=0.0, loop=False, profiler=None):
+    """
+    Bakes the noise offsets from the supplied noise items onto an additive animation layer.
+    Only the offsets are keyed so the base curves are never evaluated, and the noise can be muted or weighted from the layer afterwards!
+    Every layer curve is created in one batch and keys are added in bulk, per curve, in internal units.
+    If loop is enabled then the offsets are crossfaded into a seamless period that spans the range.
+
+    :type noiseItems: List[NoiseItem]
+    :type startTime: Union[int, float]
+    :type endTime: Union[int, float]
+    :type step: Union[int, float]
+    :type layerName: str
+    :type tolerance: float
+    :type loop: bool
+    :type profiler: Union[profileutils.Profiler, None]
+    :rtype: keyutils.KeyReduction
+    """
+
+    # Check if a profiler was supplied
+    #
+    if profiler is None:
+
+        profiler = profileutils.createProfiler('bakeNoiseLayer')
+
+    # Collect noise channels
+    #
+    reduction = keyutils.KeyReduction(tolerance=tolerance)
+    channels = []
+
+    for noiseItem in noiseItems:
+
+        for attributeName in getBakeAttributes(noiseItem):
+
+            inputName = f'input{stringutils.pascalize(attributeName)}'
+            channels.append((noiseItem, attributeName, inputName, f'{noiseItem.node.name()}.{attributeName}'))
+
+    frames = getFrames(startTime, endTime, step)
+
+    if len(channels) == 0 or len(frames) == 0:
+
+        with profiler.phase('cleanup'):
+
+            for noiseItem in noiseItems:
+
+                cleanupNoiseItem(noiseItem)
+
+        return reduction
+
+    # Add every channel to the noise layer
+    # Static values are captured first so undo can restore them once the layer is disconnected!
+    #
+    plugNames = [plugName for (noiseItem, attributeName, inputName, plugName) in channels]
+
+    with profiler.phase('createLayer'):
+
+        for (noiseItem, attributeName, inputName, plugName) in channels:
+
+            undoutils.touch(noiseItem.node, attributeName)
+            undoutils.touchConnection(noiseItem.node, attributeName)
+
+        layerName = getNoiseLayer(layerName)
+        mc.animLayer(layerName, edit=True, attribute=plugNames)
+
+    # Create any missing layer curves in one batch
+    # Identity keys create the layer curves without changing the pose!
+    #
+    with profiler.phase('findAnimCurve'):
+
+        curveNames = [findLayerCurve(layerName, plugName) for plugName in plugNames]
+
+        for curveName in filter(None, curveNames):
+
+            undoutils.touchCurve(mpynode.MPyNode(curveName))
+
+    missing = [plugName for (plugName, curveName) in zip(plugNames, curveNames) if curveName is None]
+
+    if len(missing) > 0:
+
+        with profiler.phase('createCurves'):
+
+            mc.setKeyframe(missing, animLayer=layerName, time=startTime, identity=True)
+            curveNames = [curveName if curveName is not None else findLayerCurve(layerName, plugName) for (plugName, curveName) in zip(plugNames, curveNames)]
+
+    curves = list(map(mpynode.MPyNode, curveNames))
+
+    # Sample noise offsets across every frame
+    # Changing time once per frame for every channel is far cheaper than once per frame per channel!
+    #
+    scene = mpyscene.MPyScene.getInstance()
+    currentTime = scene.time
+
+    period = endTime - startTime
+    loop = loop and period > 0
+
+    samples = [[] for _ in channels]
+
+    for frame in frames:
+
+        with profiler.phase('time'):
+
+            scene.time = frame
+
+        with profiler.phase('getAttr'):
+
+            for ((noiseItem, attributeName, inputName, plugName), values) in zip(channels, samples):
+
+                values.append(noiseItem.transform.getAttr(inputName))
+
+        # Check if noise should loop
+        # The offsets from one period later are crossfaded in so the last frame flows back into the first!
+        #
+        if not loop:
+
+            continue
+
+        weight, laterWeight = getLoopWeights(frame, startTime, period)
+
+        with profiler.phase('time'):
+
+            scene.time = frame + period
+
+        with profiler.phase('getAttr'):
+
+            for ((noiseItem, attributeName, inputName, plugName), values) in zip(channels, samples):
+
+                values[-1] = (values[-1] * weight) + (noiseItem.transform.getAttr(inputName) * laterWeight)
+
+    scene.time = currentTime
+
+    # Replace layer keys over the bake range
+    # Rotations are sampled in degrees so they require converting to radians!
+    #
+    uiUnit = om.MTime.uiUnit()
+    timeRange = (frames[0], frames[-1])
+
+    for ((noiseItem, attributeName, inputName, plugName), curve, values) in zip(channels, curves, samples):
+
+        with profiler.phase('addKeys'):
+
+            indices = keyutils.reduceKeys(frames, values, tolerance)
+            maxError = keyutils.measureError(frames, values, indices) if tolerance > 0.0 else 0.0
+
+            reduction.add(len(values), len(indices), maxError)
+
+            times = [om.MTime(frames[index], unit=uiUnit) for index in indices]
+            keyValues = [values[index] for index in indices]
+            keyValues = list(map(math.radians, keyValues)) if attributeName.startswith('rotate') else keyValues
+
+            mc.cutKey(curve.name(), time=timeRange, clear=True)
+
+            fnCurve = om.MFnAnimCurve(curve.object())
+            fnCurve.addKeys(times, keyValues, tangentInType=om.MFnAnimCurve.kTangentLinear, tangentOutType=om.MFnAnimCurve.kTangentLinear, keepExistingKeys=True)
+
+    profiler.count('frames', len(frames))
+    profiler.count('curves', len(curves))
+
+    # Cleanup shake nodes
+    #
+    with profiler.phase('cleanup'):
+
+        for noiseItem in noiseItems:
+
+            cleanupNoiseItem(noiseItem)
+
+    return reduction
+
+
+def getFrameRate():
+    """
+    Returns the number of frames per second from the current time unit.
+
+    :rtype: float
+    """
+
+    return om.MTime(1.0, unit=om.MTime.kSeconds).asUnits(om.MTime.uiUnit())
+
+
+def getFrames(startTime, endTime, step):
+    """
+    Returns the frames between the supplied start and end time, inclusive, with support for sub-frame steps.
+
+    :type startTime: Union[int, float]
+    :type endTime: Union[int, float]
+    :type step: Union[int, float]
+    :rtype: List[Union[int, float]]
+    """
+
+    numFrames = max(0, int(math.floor((endTime - startTime) / step)) + 1)
+    return [startTime + (i * step) for i in range(numFrames)]
+
+
+def getLoopWeights(frame, startTime, period):
+    """
+    Returns the equal-power weights of the supplied frame and of the same frame one period later.
+    Blending both offsets with these weights turns the range into a seamless period, the last frame flows back into the first!
+
+    :type frame: Union[int, float]
+    :type startTime: Union[int, float]
+    :type period: Union[int, float]
+    :rtype: Tuple[float, float]
+    """
+
+    angle = (0.5 * math.pi) * ((frame - startTime) / period)
+    return math.sin(angle), math.cos(angle)
+
+
+def getNoiseItemStep(noiseItem, subFrames=False):
+    """
+    Returns the frame step required to sample the supplied noise item from the bandwidth of its shake nodes.
+    High frequency noise receives dense, and optionally sub-frame, keys while gentle noise receives sparse keys!
+
+    :type noiseItem: NoiseItem
+    :type subFrames: bool
+    :rtype: float
+    """
+
+    shakes = [shake for shake in (noiseItem.position, noiseItem.rotation, noiseItem.scale) if shake is not None]
+    bandwidth = max([noiseutils.getBandwidth(shake.getAttr('frequency'), roughness=shake.getAttr('roughness'), fractal=shake.getAttr('fractal')) for shake in shakes], default=0.0)
+
+    minStep = MIN_SUB_FRAME_STEP if subFrames else 1.0
+
+    return noiseutils.getSampleStep(bandwidth, getFrameRate(), minStep=minStep, maxStep=MAX_AUTO_STEP)
+
+
+def isAlive(node):
+    """
+    Evaluates if the supplied node still exists.
+
+    :type node: mpynode.MPyNode
+    :rtype: bool
+    """
+
+    return om.MObjectHandle(node.object()).isAlive()
+
+
+def restoreKeys(sourceCurve, animCurve, timeRange):
+    """
+    Replaces the keys inside the supplied time range with the keys from the source curve.
+    Keys are copied through the function set, with their tangents intact, so the user's clipboard is left untouched!
+
+    :type sourceCurve: mpynode.MPyNode
+    :type animCurve: mpynode.MPyNode
+    :type timeRange: Tuple[Union[int, float], Union[int, float]]
+    :rtype: None
+    """
+
+    keys = undoutils.getKeys(sourceCurve.object(), timeRange=timeRange)
+    undoutils.setKeys(animCurve.object(), keys, timeRange=timeRange)
+
+
+class NoiseBaker(object):
+    """
+    Streams shake nodes onto their controls one chunk of frames at a time.
+    Only a single chunk of curve samples is held in memory, so memory stays flat regardless of the frame range!
+    A bake can be cancelled between chunks and continued later on, which restarts its unfinished noise item from the first frame.
+    """
+
+    # region Dunderscores
+    def __init__(self, noiseItems, startTime, endTime, step=1, chunkSize=DEFAULT_CHUNK_SIZE, tolerance=0.0, subFrames=False, loop=False, profiler=None):
+        """
+        Private method called after a new instance has been created.
+        If no step is supplied then each noise item is sampled at a rate derived from its bandwidth!
+        If the chunk size is zero then each noise item is baked in a single chunk.
+        If loop is enabled then the noise offsets are crossfaded into a seamless period that spans the range.
+
+        :type noiseItems: List[NoiseItem]
+        :type startTime: Union[int, float]
+        :type endTime: Union[int, float]
+        :type step: Union[int, float, None]
+        :type chunkSize: int
+        :type tolerance: float
+        :type subFrames: bool
+        :type loop: bool
+        :type profiler: Union[profileutils.Profiler, None]
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(NoiseBaker, self).__init__()
+
+        # Declare private variables
+        #
+        self._scene = mpyscene.MPyScene.getInstance(asWeakReference=True)
+        self._noiseItems = list(noiseItems)
+        self._startTime = startTime
+        self._endTime = endTime
+        self._step = step
+        self._subFrames = subFrames
+        self._loop = loop and (endTime - startTime) > 0
+        self._chunkSize = max(0, int(chunkSize))
+        self._itemStep = None
+        self._numFrames = 0
+        self._itemIndex = 0
+        self._frameIndex = 0
+        self._animCurves = {}
+        self._sourceCurves = {}
+        self._isCancelled = False
+        self._reduction = keyutils.KeyReduction(tolerance=tolerance)
+        self._profiler = profiler if profiler is not None else profileutils.createProfiler('bakeNoise')
+    # endregion
+
+    # region Properties
+    @property
+    def scene(self):
+        """
+        Getter method that returns the scene interface.
+
+        :rtype: mpyscene.MPyScene
+        """
+
+        return self._scene()
+
+    @property
+    def noiseItems(self):
+        """
+        Getter method that returns the noise items being baked.
+
+        :rtype: List[NoiseItem]
+        """
+
+        return self._noiseItems
+
+    @property
+    def chunkSize(self):
+        """
+        Getter method that returns the number of frames baked per chunk.
+        Zero means each noise item is baked in a single chunk!
+
+        :rtype: int
+        """
+
+        return self._chunkSize
+
+    @property
+    def numFrames(self):
+        """
+        Getter method that returns the number of frames baked for the current noise item.
+
+        :rtype: int
+        """
+
+        return self._numFrames
+
+    @property
+    def itemStep(self):
+        """
+        Getter method that returns the frame step of the current noise item.
+
+        :rtype: Union[int, float, None]
+        """
+
+        return self._itemStep
+
+    @property
+    def position(self):
+        """
+        Getter method that returns the index of the noise item and frame the next chunk starts from.
+
+        :rtype: Tuple[int, int]
+        """
+
+        return self._itemIndex, self._frameIndex
+
+    @property
+    def progress(self):
+        """
+        Getter method that returns the fraction of frames that have been baked.
+
+        :rtype: float
+        """
+
+        numItems = len(self._noiseItems)
+
+        if numItems == 0:
+
+            return 1.0
+
+        itemProgress = (self._frameIndex / self._numFrames) if self._numFrames > 0 else 0.0
+        return min(1.0, (self._itemIndex + itemProgress) / numItems)
+
+    @property
+    def reduction(self):
+        """
+        Getter method that returns the key reduction results.
+
+        :rtype: keyutils.KeyReduction
+        """
+
+        return self._reduction
+
+    @property
+    def profiler(self):
+        """
+        Getter method that returns the profiler that collects the bake timings.
+
+        :rtype: profileutils.Profiler
+        """
+
+        return self._profiler
+
+    @property
+    def isDone(self):
+        """
+        Getter method that evaluates if every noise item has been baked.
+
+        :rtype: bool
+        """
+
+        return self._itemIndex >= len(self._noiseItems)
+
+    @property
+    def isCancelled(self):
+        """
+        Getter method that evaluates if this bake has been cancelled.
+
+        :rtype: bool
+        """
+
+        return self._isCancelled
+    # endregion
+
+    # region Methods
+    def frameAt(self, index):
+        """
+        Returns the frame at the supplied index.
+
+        :type index: int
+        :rtype: Union[int, float]
+        """
+
+        return self._startTime + (index * self._itemStep)
+
+    def cancel(self):
+        """
+        Cancels this bake and reverts any keys written to the unfinished noise item.
+        Completed noise items are kept so the bake can be continued later on!
+
+        :rtype: None
+        """
+
+        self._isCancelled = True
+        self.rollback()
+
+    def restartItem(self):
+        """
+        Clears the cancelled state so the remaining noise items can be baked, starting over from the first frame of the unfinished one.
+        Any noise items that have been deleted since the bake was cancelled are skipped!
+
+        :rtype: None
+        """
+
+        self._isCancelled = False
+
+        # Check if the current noise item is still valid
+        #
+        if not self.isDone and not all(isAlive(node) for node in self._noiseItems[self._itemIndex][:2]):
+
+            log.warning(f'Skipping deleted noise item @ {self._itemIndex}!')
+            self.discardSourceCurves()
+            self.nextItem()
+
+        # Remove any other deleted noise items
+        #
+        upcomingItems = [noiseItem for noiseItem in self._noiseItems[self._itemIndex + 1:] if all(isAlive(node) for node in noiseItem[:2])]
+        self._noiseItems[self._itemIndex + 1:] = upcomingItems
+
+    def bake(self, callback=None):
+        """
+        Bakes every remaining chunk until the bake is done or cancelled.
+        The optional callback is invoked with this baker after each chunk and may call `cancel`!
+
+        :type callback: Union[Callable[[NoiseBaker], None], None]
+        :rtype: bool
+        """
+
+        with self._profiler:
+
+            while not (self.isDone or self.isCancelled):
+
+                self.bakeChunk()
+
+                if callable(callback):
+
+                    callback(self)
+
+        return self.isDone
+
+    def bakeChunk(self):
+        """
+        Bakes the next chunk of frames for the current noise item.
+        Returns true if there is still work remaining!
+
+        :rtype: bool
+        """
+
+        # Check if bake is done
+        #
+        if self.isDone:
+
+            return False
+
+        noiseItem = self._noiseItems[self._itemIndex]
+        profiler = self._profiler
+
+        # Check if this is the first chunk for the noise item
+        #
+        if self._frameIndex == 0:
+
+            self.initializeItemStep(noiseItem)
+
+        # Check if any shake nodes exist
+        #
+        attributeNames = getBakeAttributes(noiseItem)
+
+        if len(attributeNames) == 0 or self._numFrames == 0:
+
+            with profiler.phase('cleanup'):
+
+                cleanupNoiseItem(noiseItem)
+
+            self.nextItem()
+            return not self.isDone
+
+        with profiler.item(noiseItem.node.name()), animate.Animate(state=True):
+
+            # Check if this is the first chunk for the noise item
+            #
+            if self._frameIndex == 0:
+
+                self.initializeSourceCurves(noiseItem, attributeNames)
+
+            # Sample source curves for this chunk
+            # Rotation curves are evaluated in radians so they require converting to degrees!
+            #
+            chunkSize = self._chunkSize if self._chunkSize > 0 else self._numFrames
+            frames = [self.frameAt(index) for index in range(self._frameIndex, min(self._frameIndex + chunkSize, self._numFrames))]
+            uiUnit = om.MTime.uiUnit()
+
+            samples = {}
+
+            with profiler.phase('cache'):
+
+                for (attributeName, animCurve) in self._animCurves.items():
+
+                    sourceCurve = self._sourceCurves.get(attributeName, animCurve)
+                    values = [sourceCurve.evaluate(om.MTime(frame, unit=uiUnit)) for frame in frames]
+                    samples[attributeName] = list(map(math.degrees, values)) if attributeName.startswith('rotate') else values
+
+            # Key chunk onto control
+            # If keys are being reduced then the baked values are collected in place and written afterwards!
+            #
+            inputAttributeNames = {attributeName: f'input{stringutils.pascalize(attributeName)}' for attributeName in samples.keys()}
+            isReducing = self._reduction.tolerance > 0.0
+
+            for (i, frame) in enumerate(frames):
+
+                # Check if noise should loop
+                # The offsets from one period later are crossfaded in, before returning to the frame being keyed!
+                #
+                laterValues = {}
+
+                if self._loop:
+
+                    period = self._endTime - self._startTime
+
+                    with profiler.phase('time'):
+
+                        self.scene.time = frame + period
+
+                    with profiler.phase('getAttr'):
+
+                        laterValues = {attributeName: noiseItem.transform.getAttr(inputAttributeName) for (attributeName, inputAttributeName) in inputAttributeNames.items()}
+
+                    weight, laterWeight = getLoopWeights(frame, self._startTime, period)
+
+                with profiler.phase('time'):
+
+                    self.scene.time = frame
+
+                for (attributeName, values) in samples.items():
+
+                    with profiler.phase('getAttr'):
+
+                        inputValue = noiseItem.transform.getAttr(inputAttributeNames[attributeName])
+
+                    if self._loop:
+
+                        inputValue = (inputValue * weight) + (laterValues[attributeName] * laterWeight)
+
+                    if isReducing:
+
+                        values[i] += inputValue
+                        continue
+
+                    with profiler.phase('setAttr'):
+
+                        noiseItem.node.setAttr(attributeName, values[i] + inputValue)
+
+            # Check if baked values require reducing
+            #
+            if isReducing:
+
+                with profiler.phase('reduceKeys'):
+
+                    for (attributeName, values) in samples.items():
+
+                        numKeys, maxError = keyutils.writeKeys(self._animCurves[attributeName], frames, values, tolerance=self._reduction.tolerance)
+                        self._reduction.add(len(values), numKeys, maxError)
+
+            profiler.count('frames', len(frames))
+            profiler.count('chunks')
+
+            self._frameIndex += len(frames)
+
+            # Check if noise item is complete
+            #
+            if self._frameIndex >= self._numFrames:
+
+                with profiler.phase('cleanup'):
+
+                    self.discardSourceCurves()
+                    cleanupNoiseItem(noiseItem)
+
+                self.nextItem()
+
+        return not self.isDone
+
+    def initializeItemStep(self, noiseItem):
+        """
+        Updates the frame step and frame count for the supplied noise item.
+
+        :type noiseItem: NoiseItem
+        :rtype: None
+        """
+
+        self._itemStep = self._step if self._step is not None else getNoiseItemStep(noiseItem, subFrames=self._subFrames)
+        self._numFrames = max(0, int(math.floor((self._endTime - self._startTime) / self._itemStep)) + 1)
+
+    def nextItem(self):
+        """
+        Advances this bake to the next noise item.
+
+        :rtype: None
+        """
+
+        self._itemIndex += 1
+        self._frameIndex = 0
+
+    def initializeSourceCurves(self, noiseItem, attributeNames):
+        """
+        Duplicates the supplied noise item's anim curves before any keys are written.
+        Keys written by earlier chunks would otherwise change the interpolation of later chunks!
+        If the noise item is baked in a single chunk then every sample is taken before any keys are written, so nothing is duplicated.
+
+        :type noiseItem: NoiseItem
+        :type attributeNames: List[str]
+        :rtype: None
+        """
+
+        self.discardSourceCurves()
+
+        isSingleChunk = self._chunkSize == 0 or self._chunkSize >= self._numFrames
+
+        with self._profiler.phase('findAnimCurve'):
+
+            for attributeName in attributeNames:
+
+                undoutils.touch(noiseItem.node, attributeName)
+                animCurve = noiseItem.node.findAnimCurve(attributeName, create=True)
+                undoutils.touchCurve(animCurve)
+
+                self._animCurves[attributeName] = animCurve
+
+                if isSingleChunk:
+
+                    continue
+
+                sourceCurveName = mc.duplicate(animCurve.name(), name=f'{animCurve.name()}_bakeSource')[0]
+                self._sourceCurves[attributeName] = mpynode.MPyNode(sourceCurveName)
+
+    def discardSourceCurves(self):
+        """
+        Deletes any duplicated anim curves from the current noise item.
+
+        :rtype: None
+        """
+
+        for sourceCurve in self._sourceCurves.values():
+
+            if isAlive(sourceCurve):
+
+                sourceCurve.delete()
+
+        self._animCurves.clear()
+        self._sourceCurves.clear()
+
+    def rollback(self):
+        """
+        Reverts any keys written to the unfinished noise item and rewinds it to its first frame.
+        Completed noise items are kept, which leaves every control either fully baked or untouched!
+
+        :rtype: None
+        """
+
+        # Check if the current noise item has any keys
+        #
+        if self.isDone or self._frameIndex == 0:
+
+            self.discardSourceCurves()
+            self._frameIndex = 0
+
+            return
+
+        # Restore original keys over the baked frames
+        #
+        timeRange = (self.frameAt(0), self.frameAt(self._frameIndex - 1))
+
+        for (attributeName, animCurve) in self._animCurves.items():
+
+            restoreKeys(self._sourceCurves[attributeName], animCurve, timeRange)
+
+        self.discardSourceCurves()
+        self._frameIndex = 0
+
+    def discard(self):
+        """
+        Abandons any remaining chunks.
+        Keys from completed chunks are kept while the shake nodes of the unfinished noise item are left intact!
+
+        :rtype: None
+        """
+
+        self.discardSourceCurves()
+
+        self._itemIndex = len(self._noiseItems)
+        self._frameIndex = 0
+        self._isCancelled = True
+    # endregion
@@ -0,0 +1,577 @@
+import os
+import sys
+import json
+import math
+import mmap
+import struct
+
+from array import array
+from maya.api import OpenMaya as om
+from dcc.python import stringutils
+from . import bakeutils, profileutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+CACHE_EXTENSION = 'noisecache'
+CACHE_MAGIC = b'NOISECACHE'
+CACHE_VERSION = 1
+CACHE_ALIGNMENT = 16
+HEADER_FORMAT = '<10sHI'
+ITEM_SIZE = 4
+
+
+def getChannelNames(noiseItem):
+    """
+    Returns the names of the noise offsets cached from the supplied noise item.
+
+    :type noiseItem: NoiseItem
+    :rtype: List[str]
+    """
+
+    return bakeutils.getBakeAttributes(noiseItem)
+
+
+class NoiseCacheWriter(object):
+    """
+    Writes noise offsets into a columnar cache file, one contiguous float32 column per control channel.
+    The file is allocated up front so chunks of frames can be written in any order without holding the whole range in memory!
+    """
+
+    # region Dunderscores
+    def __init__(self, path, layout, startTime, step, numFrames):
+        """
+        Private method called after a new instance has been created.
+
+        :type path: str
+        :type layout: List[Tuple[str, List[str]]]
+        :type startTime: Union[int, float]
+        :type step: Union[int, float]
+        :type numFrames: int
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(NoiseCacheWriter, self).__init__()
+
+        # Declare private variables
+        #
+        self._path = path
+        self._tempPath = f'{path}.part'
+        self._numFrames = numFrames
+        self._offsets = {}
+        self._file = None
+
+        # Build header
+        # Column offsets are relative to the start of the data block!
+        #
+        controls = []
+        offset = 0
+
+        for (controlName, channelNames) in layout:
+
+            channels = {}
+
+            for channelName in channelNames:
+
+                channels[channelName] = offset
+                self._offsets[(controlName, channelName)] = offset
+
+                offset += numFrames * ITEM_SIZE
+
+            controls.append({'name': controlName, 'channels': channels})
+
+        header = {
+            'startTime': startTime,
+            'step': step,
+            'numFrames': numFrames,
+            'dtype': 'float32',
+            'byteorder': 'little',
+            'controls': controls
+        }
+
+        headerBytes = json.dumps(header).encode('utf-8')
+        headerSize = struct.calcsize(HEADER_FORMAT) + len(headerBytes)
+        padding = (CACHE_ALIGNMENT - (headerSize % CACHE_ALIGNMENT)) % CACHE_ALIGNMENT
+
+        self._dataOffset = headerSize + padding
+        self._dataSize = offset
+
+        # Allocate file
+        #
+        directory = os.path.dirname(os.path.abspath(path))
+
+        if not os.path.isdir(directory):
+
+            os.makedirs(directory)
+
+        self._file = open(self._tempPath, 'wb')
+        self._file.write(struct.pack(HEADER_FORMAT, CACHE_MAGIC, CACHE_VERSION, len(headerBytes)))
+        self._file.write(headerBytes)
+        self._file.write(b'\0' * padding)
+        self._file.truncate(self._dataOffset + self._dataSize)
+
+    def __enter__(self):
+        """
+        Private method that is called when this instance is entered using a with statement.
+
+        :rtype: NoiseCacheWriter
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Private method that is called when this instance is exited using a with statement.
+        If an exception was raised then the partial cache is removed!
+
+        :type exc_type: Any
+        :type exc_val: Any
+        :type exc_tb: Any
+        :rtype: None
+        """
+
+        if exc_type is None:
+
+            self.close()
+
+        else:
+
+            self.abort()
+    # endregion
+
+    # region Properties
+    @property
+    def path(self):
+        """
+        Getter method that returns the path of the cache file.
+
+        :rtype: str
+        """
+
+        return self._path
+    # endregion
+
+    # region Methods
+    def write(self, controlName, channelName, frameIndex, values):
+        """
+        Writes the supplied values into a channel, starting at the specified frame index.
+
+        :type controlName: str
+        :type channelName: str
+        :type frameIndex: int
+        :type values: Sequence[float]
+        :rtype: None
+        """
+
+        column = array('f', values)
+
+        if sys.byteorder != 'little':
+
+            column.byteswap()
+
+        self._file.seek(self._dataOffset + self._offsets[(controlName, channelName)] + (frameIndex * ITEM_SIZE))
+        self._file.write(column.tobytes())
+
+    def close(self):
+        """
+        Closes the cache file and moves it into place.
+
+        :rtype: None
+        """
+
+        if self._file is None:
+
+            return
+
+        self._file.close()
+        self._file = None
+
+        os.replace(self._tempPath, self._path)
+
+    def abort(self):
+        """
+        Closes and removes the partial cache file.
+
+        :rtype: None
+        """
+
+        if self._file is None:
+
+            return
+
+        self._file.close()
+        self._file = None
+
+        os.remove(self._tempPath)
+    # endregion
+
+
+class NoiseCacheReader(object):
+    """
+    Memory-maps a noise cache so any frame window can be streamed without loading the whole file.
+    Channels are returned as zero-copy float32 memory views which `numpy.asarray` can also wrap without copying!
+    """
+
+    # region Dunderscores
+    def __init__(self, path):
+        """
+        Private method called after a new instance has been created.
+
+        :type path: str
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(NoiseCacheReader, self).__init__()
+
+        # Declare private variables
+        #
+        self._path = path
+        self._file = open(path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # Parse header
+        #
+        headerSize = struct.calcsize(HEADER_FORMAT)
+        magic, version, headerLength = struct.unpack_from(HEADER_FORMAT, self._mmap, 0)
+
+        if magic != CACHE_MAGIC or version > CACHE_VERSION:
+
+            self.close()
+            raise TypeError(f'"{path}" is not a supported noise cache!')
+
+        self._header = json.loads(self._mmap[headerSize:headerSize + headerLength].decode('utf-8'))
+
+        length = headerSize + headerLength
+        self._dataOffset = length + ((CACHE_ALIGNMENT - (length % CACHE_ALIGNMENT)) % CACHE_ALIGNMENT)
+        self._channels = {control['name']: control['channels'] for control in self._header['controls']}
+
+    def __enter__(self):
+        """
+        Private method that is called when this instance is entered using a with statement.
+
+        :rtype: NoiseCacheReader
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Private method that is called when this instance is exited using a with statement.
+
+        :type exc_type: Any
+        :type exc_val: Any
+        :type exc_tb: Any
+        :rtype: None
+        """
+
+        self.close()
+    # endregion
+
+    # region Properties
+    @property
+    def path(self):
+        """
+        Getter method that returns the path of the cache file.
+
+        :rtype: str
+        """
+
+        return self._path
+
+    @property
+    def startTime(self):
+        """
+        Getter method that returns the first cached frame.
+
+        :rtype: Union[int, float]
+        """
+
+        return self._header['startTime']
+
+    @property
+    def step(self):
+        """
+        Getter method that returns the frame step between cached samples.
+
+        :rtype: Union[int, float]
+        """
+
+        return self._header['step']
+
+    @property
+    def numFrames(self):
+        """
+        Getter method that returns the number of cached samples per channel.
+
+        :rtype: int
+        """
+
+        return self._header['numFrames']
+
+    @property
+    def endTime(self):
+        """
+        Getter method that returns the last cached frame.
+
+        :rtype: Union[int, float]
+        """
+
+        return self.frameAt(self.numFrames - 1)
+    # endregion
+
+    # region Methods
+    def controls(self):
+        """
+        Returns the names of the cached controls.
+
+        :rtype: List[str]
+        """
+
+        return list(self._channels.keys())
+
+    def channels(self, controlName):
+        """
+        Returns the names of the cached channels for the supplied control.
+
+        :type controlName: str
+        :rtype: List[str]
+        """
+
+        return list(self._channels[controlName].keys())
+
+    def frameAt(self, index):
+        """
+        Returns the frame at the supplied sample index.
+
+        :type index: int
+        :rtype: Union[int, float]
+        """
+
+        return self.startTime + (index * self.step)
+
+    def indexOf(self, frame):
+        """
+        Returns the sample index nearest to the supplied frame, clamped to the cached range.
+
+        :type frame: Union[int, float]
+        :rtype: int
+        """
+
+        index = int(round((frame - self.startTime) / self.step))
+        return min(max(index, 0), self.numFrames - 1)
+
+    def read(self, controlName, channelName, startTime=None, endTime=None):
+        """
+        Returns the cached samples for the supplied channel within the specified frame window.
+
+        :type controlName: str
+        :type channelName: str
+        :type startTime: Union[int, float, None]
+        :type endTime: Union[int, float, None]
+        :rtype: Sequence[float]
+        """
+
+        # Evaluate frame window
+        #
+        startIndex = self.indexOf(startTime) if startTime is not None else 0
+        endIndex = self.indexOf(endTime) if endTime is not None else (self.numFrames - 1)
+
+        if endIndex < startIndex:
+
+            return array('f')
+
+        # Slice column
+        #
+        start = self._dataOffset + self._channels[controlName][channelName] + (startIndex * ITEM_SIZE)
+        end = start + (((endIndex - startIndex) + 1) * ITEM_SIZE)
+
+        if sys.byteorder == 'little':
+
+            return memoryview(self._mmap)[start:end].cast('f')
+
+        column = array('f', self._mmap[start:end])
+        column.byteswap()
+
+        return column
+
+    def iterChunks(self, controlName, startTime=None, endTime=None, chunkSize=bakeutils.DEFAULT_CHUNK_SIZE):
+        """
+        Returns a generator that yields the frames and channel samples of the supplied control, one chunk at a time.
+
+        :type controlName: str
+        :type startTime: Union[int, float, None]
+        :type endTime: Union[int, float, None]
+        :type chunkSize: int
+        :rtype: Iterator[Tuple[List[Union[int, float]], Dict[str, Sequence[float]]]]
+        """
+
+        startIndex = self.indexOf(startTime) if startTime is not None else 0
+        endIndex = self.indexOf(endTime) if endTime is not None else (self.numFrames - 1)
+
+        for chunkStart in range(startIndex, endIndex + 1, chunkSize):
+
+            chunkEnd = min(chunkStart + chunkSize - 1, endIndex)
+            frames = [self.frameAt(index) for index in range(chunkStart, chunkEnd + 1)]
+            samples = {channelName: self.read(controlName, channelName, frames[0], frames[-1]) for channelName in self.channels(controlName)}
+
+            yield frames, samples
+
+    def close(self):
+        """
+        Releases the memory-map and file handle.
+        Any memory views returned by `read` must be released beforehand!
+
+        :rtype: None
+        """
+
+        if self._mmap is not None:
+
+            self._mmap.close()
+            self._mmap = None
+
+        if self._file is not None:
+
+            self._file.close()
+            self._file = None
+    # endregion
+
+
+def iterNoiseChunks(noiseItems, frames, chunkSize=bakeutils.DEFAULT_CHUNK_SIZE, period=0, profiler=None):
+    """
+    Returns a generator that yields the frame index and channel samples of every noise item, one chunk of frames at a time.
+    Plugs are evaluated inside a DG context for each frame so the scene time never changes!
+    Rotations are evaluated in radians so they are converted to degrees!
+    If a period is supplied then each frame is crossfaded with the same frame one period later, so the samples loop seamlessly from the first frame.
+
+    :type noiseItems: List[NoiseItem]
+    :type frames: List[Union[int, float]]
+    :type chunkSize: int
+    :type period: Union[int, float]
+    :type profiler: Union[profileutils.Profiler, None]
+    :rtype: Iterator[Tuple[int, List[Dict[str, List[float]]]]]
+    """
+
+    # Check if a profiler was supplied
+    #
+    if profiler is None:
+
+        profiler = profileutils.createProfiler('iterNoiseChunks')
+
+    # Collect input plugs
+    # The compose transform inputs only hold the noise offsets so the base animation is never evaluated!
+    #
+    channels = []
+
+    for noiseItem in noiseItems:
+
+        plugs = []
+
+        for channelName in getChannelNames(noiseItem):
+
+            plug = noiseItem.transform[f'input{stringutils.pascalize(channelName)}']
+            plugs.append((channelName, plug, channelName.startswith('rotate')))
+
+        channels.append(plugs)
+
+    # Iterate through frame chunks
+    #
+    uiUnit = om.MTime.uiUnit()
+
+    for chunkStart in range(0, len(frames), chunkSize):
+
+        chunkFrames = frames[chunkStart:chunkStart + chunkSize]
+        samples = [{channelName: [] for (channelName, plug, isAngle) in plugs} for plugs in channels]
+
+        with profiler.phase('evaluate'):
+
+            for frame in chunkFrames:
+
+                with om.MDGContextGuard(om.MDGContext(om.MTime(frame, unit=uiUnit))):
+
+                    for (plugs, values) in zip(channels, samples):
+
+                        for (channelName, plug, isAngle) in plugs:
+
+                            value = plug.asDouble()
+                            values[channelName].append(math.degrees(value) if isAngle else value)
+
+                # Check if noise should loop
+                # The offsets from one period later are crossfaded in so the last frame flows back into the first!
+                #
+                if period <= 0:
+
+                    continue
+
+                weight, laterWeight = bakeutils.getLoopWeights(frame, frames[0], period)
+
+                with om.MDGContextGuard(om.MDGContext(om.MTime(frame + period, unit=uiUnit))):
+
+                    for (plugs, values) in zip(channels, samples):
+
+                        for (channelName, plug, isAngle) in plugs:
+
+                            value = plug.asDouble()
+                            value = math.degrees(value) if isAngle else value
+
+                            values[channelName][-1] = (values[channelName][-1] * weight) + (value * laterWeight)
+
+        profiler.count('frames', len(chunkFrames))
+
+        yield chunkStart, samples
+
+
+def writeNoiseCache(noiseItems, path, startTime, endTime, step=1, chunkSize=bakeutils.DEFAULT_CHUNK_SIZE, loop=False, profiler=None):
+    """
+    Writes the noise offsets of the supplied noise items into a cache file without keying the controls.
+    Frames are evaluated one chunk at a time, across every control, so memory stays flat regardless of the range and the scene time is left untouched!
+    If loop is enabled then the offsets are crossfaded into a seamless period that spans the range.
+
+    :type noiseItems: List[NoiseItem]
+    :type path: str
+    :type startTime: Union[int, float]
+    :type endTime: Union[int, float]
+    :type step: Union[int, float]
+    :type chunkSize: int
+    :type loop: bool
+    :type profiler: Union[profileutils.Profiler, None]
+    :rtype: str
+    """
+
+    # Check if a profiler was supplied
+    #
+    if profiler is None:
+
+        profiler = profileutils.createProfiler('writeNoiseCache')
+
+    # Collect cache layout
+    #
+    noiseItems = [noiseItem for noiseItem in noiseItems if len(getChannelNames(noiseItem)) > 0]
+    layout = [(noiseItem.node.name(), getChannelNames(noiseItem)) for noiseItem in noiseItems]
+
+    frames = bakeutils.getFrames(startTime, endTime, step)
+    numFrames = len(frames)
+    period = (endTime - startTime) if loop else 0
+
+    # Stream chunks to disk
+    #
+    with NoiseCacheWriter(path, layout, startTime, step, numFrames) as writer:
+
+        for (chunkStart, samples) in iterNoiseChunks(noiseItems, frames, chunkSize=max(1, int(chunkSize)), period=period, profiler=profiler):
+
+            with profiler.phase('write'):
+
+                for ((controlName, channelNames), values) in zip(layout, samples):
+
+                    for channelName in channelNames:
+
+                        writer.write(controlName, channelName, chunkStart, values[channelName])
+
+    log.info(f'Cached {len(noiseItems)} control(s) over {numFrames} frame(s) to: {path}')
+    return path
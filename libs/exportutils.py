@@ -0,0 +1,235 @@
+import os
+import json
+
+from enum import IntEnum
+from . import bakeutils, cacheutils, profileutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+TRACKS_EXTENSION = 'jsonl'
+TRACKS_FORMAT = 'noisetracks'
+TRACKS_VERSION = 1
+
+
+class ExportFormat(IntEnum):
+    """
+    Enum class of all the available noise track formats.
+    BINARY uses the columnar noise cache layout so engines can memory-map each track!
+    """
+
+    JSON_LINES = 0
+    BINARY = 1
+
+
+def getExportFormat(path):
+    """
+    Returns the export format for the supplied path from its extension.
+
+    :type path: str
+    :rtype: ExportFormat
+    """
+
+    extension = os.path.splitext(path)[-1].lstrip('.').lower()
+    return ExportFormat.BINARY if extension == cacheutils.CACHE_EXTENSION else ExportFormat.JSON_LINES
+
+
+class NoiseTrackWriter(object):
+    """
+    Writes noise offsets into a JSON-lines file, one line per chunk of each control channel.
+    The first line holds the header and every following line can be parsed on its own, so readers can stream the file too!
+    """
+
+    # region Dunderscores
+    def __init__(self, path, layout, startTime, step, numFrames):
+        """
+        Private method called after a new instance has been created.
+
+        :type path: str
+        :type layout: List[Tuple[str, List[str]]]
+        :type startTime: Union[int, float]
+        :type step: Union[int, float]
+        :type numFrames: int
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(NoiseTrackWriter, self).__init__()
+
+        # Declare private variables
+        #
+        self._path = path
+        self._tempPath = f'{path}.part'
+        self._file = None
+
+        # Write header
+        #
+        directory = os.path.dirname(os.path.abspath(path))
+
+        if not os.path.isdir(directory):
+
+            os.makedirs(directory)
+
+        header = {
+            'format': TRACKS_FORMAT,
+            'version': TRACKS_VERSION,
+            'startTime': startTime,
+            'step': step,
+            'numFrames': numFrames,
+            'controls': [{'name': controlName, 'channels': list(channelNames)} for (controlName, channelNames) in layout]
+        }
+
+        self._file = open(self._tempPath, 'w')
+        self._file.write(json.dumps(header))
+        self._file.write('\n')
+
+    def __enter__(self):
+        """
+        Private method that is called when this instance is entered using a with statement.
+
+        :rtype: NoiseTrackWriter
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Private method that is called when this instance is exited using a with statement.
+        If an exception was raised then the partial file is removed!
+
+        :type exc_type: Any
+        :type exc_val: Any
+        :type exc_tb: Any
+        :rtype: None
+        """
+
+        if exc_type is None:
+
+            self.close()
+
+        else:
+
+            self.abort()
+    # endregion
+
+    # region Properties
+    @property
+    def path(self):
+        """
+        Getter method that returns the path of the track file.
+
+        :rtype: str
+        """
+
+        return self._path
+    # endregion
+
+    # region Methods
+    def write(self, controlName, channelName, frameIndex, values):
+        """
+        Writes the supplied values into a channel, starting at the specified frame index.
+
+        :type controlName: str
+        :type channelName: str
+        :type frameIndex: int
+        :type values: Sequence[float]
+        :rtype: None
+        """
+
+        self._file.write(json.dumps({'control': controlName, 'channel': channelName, 'index': frameIndex, 'values': list(values)}))
+        self._file.write('\n')
+
+    def close(self):
+        """
+        Closes the track file and moves it into place.
+
+        :rtype: None
+        """
+
+        if self._file is None:
+
+            return
+
+        self._file.close()
+        self._file = None
+
+        os.replace(self._tempPath, self._path)
+
+    def abort(self):
+        """
+        Closes and removes the partial track file.
+
+        :rtype: None
+        """
+
+        if self._file is None:
+
+            return
+
+        self._file.close()
+        self._file = None
+
+        os.remove(self._tempPath)
+    # endregion
+
+
+def exportNoise(noiseItems, path, startTime, endTime, step=1, chunkSize=bakeutils.DEFAULT_CHUNK_SIZE, exportFormat=None, loop=False, profiler=None):
+    """
+    Streams the noise offsets of the supplied noise items into per-control, per-channel tracks on disk.
+    Only a single chunk of frames is held in memory, and the scene time is left untouched!
+    If no format is supplied then it is derived from the path's extension.
+    If loop is enabled then the offsets are crossfaded into a seamless period that spans the range.
+
+    :type noiseItems: List[NoiseItem]
+    :type path: str
+    :type startTime: Union[int, float]
+    :type endTime: Union[int, float]
+    :type step: Union[int, float]
+    :type chunkSize: int
+    :type exportFormat: Union[ExportFormat, None]
+    :type loop: bool
+    :type profiler: Union[profileutils.Profiler, None]
+    :rtype: str
+    """
+
+    # Check if a profiler was supplied
+    #
+    if profiler is None:
+
+        profiler = profileutils.createProfiler('exportNoise')
+
+    if exportFormat is None:
+
+        exportFormat = getExportFormat(path)
+
+    # Collect track layout
+    #
+    noiseItems = [noiseItem for noiseItem in noiseItems if len(bakeutils.getBakeAttributes(noiseItem)) > 0]
+    layout = [(noiseItem.node.name(), bakeutils.getBakeAttributes(noiseItem)) for noiseItem in noiseItems]
+
+    frames = bakeutils.getFrames(startTime, endTime, step)
+    numFrames = len(frames)
+    period = (endTime - startTime) if loop else 0
+
+    # Stream chunks to disk
+    #
+    cls = cacheutils.NoiseCacheWriter if exportFormat == ExportFormat.BINARY else NoiseTrackWriter
+
+    with cls(path, layout, startTime, step, numFrames) as writer:
+
+        for (chunkStart, samples) in cacheutils.iterNoiseChunks(noiseItems, frames, chunkSize=max(1, int(chunkSize)), period=period, profiler=profiler):
+
+            with profiler.phase('write'):
+
+                for ((controlName, channelNames), values) in zip(layout, samples):
+
+                    for channelName in channelNames:
+
+                        writer.write(controlName, channelName, chunkStart, values[channelName])
+
+    log.info(f'Exported {len(noiseItems)} control(s) over {numFrames} frame(s) to: {path}')
+    return path
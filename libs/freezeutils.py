@@ -0,0 +1,215 @@
+import math
+
+from maya import cmds as mc
+from maya.api import OpenMaya as om
+from mpy import mpyscene, mpynode
+from . import noiseutils, bakeutils, profileutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+FROZEN_COMPONENTS = (
+    ('inputTranslate', 'outputTranslate', 'animCurveTL'),
+    ('inputRotate', 'outputRotate', 'animCurveTA'),
+    ('inputScale', 'outputScale', 'animCurveTU')
+)
+VECTOR_SUFFIXES = ('X', 'Y', 'Z')
+
+
+def isFrozen(shake):
+    """
+    Evaluates if the supplied shake node has been frozen into curves.
+
+    :type shake: mpynode.MPyNode
+    :rtype: bool
+    """
+
+    return len(noiseutils.findFrozenCurves(shake)) > 0
+
+
+def crossfadeLoop(values, period):
+    """
+    Returns one seamless period from the supplied samples, which must span at least two periods.
+    The first period is blended into the second with equal-power weights so the last sample flows back into the first!
+
+    :type values: List[float]
+    :type period: int
+    :rtype: List[float]
+    """
+
+    loop = []
+
+    for i in range(period):
+
+        weight, laterWeight = bakeutils.getLoopWeights(i, 0, period)
+        loop.append((values[i] * weight) + (values[i + period] * laterWeight))
+
+    loop.append(loop[0])
+
+    return loop
+
+
+def freezeNoiseItems(noiseItems, startTime, endTime, loop=False, profiler=None):
+    """
+    Samples the shake nodes from the supplied noise items into linear curves that replace their live connections.
+    Playback then only evaluates curves, the shake nodes are kept so they can be thawed again at any time!
+    Outside of the frozen range the curves hold their first and last values.
+    If loop is enabled then the range is frozen as a single seamless period that cycles forever instead.
+
+    :type noiseItems: List[NoiseItem]
+    :type startTime: Union[int, float]
+    :type endTime: Union[int, float]
+    :type loop: bool
+    :type profiler: Union[profileutils.Profiler, None]
+    :rtype: List[mpynode.MPyNode]
+    """
+
+    # Check if a profiler was supplied
+    #
+    if profiler is None:
+
+        profiler = profileutils.createProfiler('freezeNoiseItems')
+
+    # Collect live shake nodes
+    #
+    components = []
+
+    for noiseItem in noiseItems:
+
+        for (shake, (inputName, outputName, curveType)) in zip(noiseItem[2:], FROZEN_COMPONENTS):
+
+            if shake is None or not noiseItem.transform[inputName].isDestination:
+
+                continue  # Shake is either missing or already frozen!
+
+            childNames = [f'{inputName}{suffix}' for suffix in VECTOR_SUFFIXES]
+            components.append((noiseItem, shake, inputName, outputName, curveType, childNames))
+
+    if len(components) == 0:
+
+        return []
+
+    # Sample shake nodes across every frame
+    # Changing time once per frame for every shake is far cheaper than once per frame per shake!
+    #
+    scene = mpyscene.MPyScene.getInstance()
+    currentTime = scene.time
+
+    # Looping requires two periods of samples to crossfade between!
+    #
+    period = int(round(endTime - startTime))
+    loop = loop and period > 0
+
+    frames = bakeutils.getFrames(startTime, startTime + (2 * period) - 1, 1) if loop else bakeutils.getFrames(startTime, endTime, 1)
+    samples = [[[] for _ in VECTOR_SUFFIXES] for _ in components]
+
+    for frame in frames:
+
+        with profiler.phase('time'):
+
+            scene.time = frame
+
+        with profiler.phase('getAttr'):
+
+            for ((noiseItem, shake, inputName, outputName, curveType, childNames), values) in zip(components, samples):
+
+                for (childName, childValues) in zip(childNames, values):
+
+                    childValues.append(noiseItem.transform.getAttr(childName))
+
+    scene.time = currentTime
+
+    # Replace shake connections with curves
+    # Keys are added in bulk, per curve, in internal units so rotations require converting to radians!
+    #
+    uiUnit = om.MTime.uiUnit()
+    times = [om.MTime(frame, unit=uiUnit) for frame in (frames[:period + 1] if loop else frames)]
+
+    for ((noiseItem, shake, inputName, outputName, curveType, childNames), values) in zip(components, samples):
+
+        with profiler.item(noiseItem.node.name()):
+
+            with profiler.phase('disconnect'):
+
+                mc.disconnectAttr(shake[outputName].name(), noiseItem.transform[inputName].name())
+
+            for (suffix, childName, childValues) in zip(VECTOR_SUFFIXES, childNames, values):
+
+                with profiler.phase('createCurve'):
+
+                    curve = scene.createNode(curveType, name=f'{shake.name()}_{outputName}{suffix}_frozen')
+                    profiler.count('createdNodes')
+
+                with profiler.phase('addKeys'):
+
+                    keyValues = crossfadeLoop(childValues, period) if loop else childValues
+                    keyValues = list(map(math.radians, keyValues)) if curveType == 'animCurveTA' else keyValues
+
+                    fnCurve = om.MFnAnimCurve(curve.object())
+                    fnCurve.addKeys(times, keyValues, tangentInType=om.MFnAnimCurve.kTangentLinear, tangentOutType=om.MFnAnimCurve.kTangentLinear)
+
+                    if loop:
+
+                        fnCurve.setPreInfinityType(om.MFnAnimCurve.kCycle)
+                        fnCurve.setPostInfinityType(om.MFnAnimCurve.kCycle)
+
+                with profiler.phase('connect'):
+
+                    mc.addAttr(curve.name(), longName=noiseutils.FROZEN_ATTRIBUTE, attributeType='message')
+                    curve.connectPlugs(shake['message'], noiseutils.FROZEN_ATTRIBUTE)
+                    curve.connectPlugs('output', noiseItem.transform[childName])
+
+        profiler.count('frozenShakes')
+
+    profiler.count('frames', len(frames))
+
+    return [shake for (noiseItem, shake, inputName, outputName, curveType, childNames) in components]
+
+
+def thawShakes(shakes):
+    """
+    Deletes the frozen curves from the supplied shake nodes and restores their live connections.
+
+    :type shakes: List[mpynode.MPyNode]
+    :rtype: List[mpynode.MPyNode]
+    """
+
+    outputNames = {inputName: outputName for (inputName, outputName, curveType) in FROZEN_COMPONENTS}
+    thawed = []
+
+    for shake in shakes:
+
+        # Check if shake is frozen
+        #
+        curves = noiseutils.findFrozenCurves(shake)
+
+        if len(curves) == 0:
+
+            continue
+
+        # Locate compose transform from the curve outputs
+        #
+        destinations = [destination for curve in curves for destination in curve['output'].destinations()]
+        destination = destinations[0] if len(destinations) > 0 else None
+
+        for curve in curves:
+
+            curve.delete()
+
+        if destination is None:
+
+            log.warning(f'Unable to locate frozen connections for "{shake.name()}" shake!')
+            continue
+
+        # Reconnect shake output
+        #
+        composeTransform = mpynode.MPyNode(destination.node())
+        inputName = destination.parent().partialName(useLongNames=True)
+
+        shake.connectPlugs(outputNames[inputName], composeTransform[inputName])
+        thawed.append(shake)
+
+    return thawed
@@ -0,0 +1,241 @@
+from maya import cmds as mc
+
+try:
+
+    import numpy
+
+except ImportError:
+
+    numpy = None
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+def findMaxDeviation(times, values, first, last):
+    """
+    Returns the index and vertical distance of the sample furthest from the line between the supplied end points.
+
+    :type times: Sequence[float]
+    :type values: Sequence[float]
+    :type first: int
+    :type last: int
+    :rtype: Tuple[int, float]
+    """
+
+    startTime, endTime = times[first], times[last]
+    startValue, endValue = values[first], values[last]
+    slope = (endValue - startValue) / (endTime - startTime)
+
+    # Check if samples are vectorized
+    #
+    if numpy is not None and isinstance(values, numpy.ndarray):
+
+        deviations = numpy.abs(values[first + 1:last] - (startValue + (slope * (times[first + 1:last] - startTime))))
+        offset = int(numpy.argmax(deviations))
+
+        return first + 1 + offset, float(deviations[offset])
+
+    # Iterate through inner samples
+    #
+    index, maxDeviation = first, 0.0
+
+    for i in range(first + 1, last):
+
+        deviation = abs(values[i] - (startValue + (slope * (times[i] - startTime))))
+
+        if deviation > maxDeviation:
+
+            index, maxDeviation = i, deviation
+
+    return index, maxDeviation
+
+
+def reduceKeys(times, values, tolerance):
+    """
+    Returns the indices of the samples required to reproduce the curve, with linear interpolation, within the supplied tolerance.
+    This is an iterative Ramer-Douglas-Peucker pass that measures the vertical distance to each chord!
+
+    :type times: Sequence[float]
+    :type values: Sequence[float]
+    :type tolerance: float
+    :rtype: List[int]
+    """
+
+    # Check if there is anything to reduce
+    #
+    numSamples = len(values)
+
+    if numSamples <= 2 or tolerance <= 0.0:
+
+        return list(range(numSamples))
+
+    # Check if samples can be vectorized
+    #
+    if numpy is not None:
+
+        times = numpy.asarray(times, dtype=numpy.float64)
+        values = numpy.asarray(values, dtype=numpy.float64)
+
+    # Split segments until every inner sample is within tolerance
+    #
+    keep = [False] * numSamples
+    keep[0], keep[-1] = True, True
+
+    segments = [(0, numSamples - 1)]
+
+    while len(segments) > 0:
+
+        first, last = segments.pop()
+
+        if (last - first) < 2:
+
+            continue
+
+        index, deviation = findMaxDeviation(times, values, first, last)
+
+        if deviation > tolerance:
+
+            keep[index] = True
+            segments.append((first, index))
+            segments.append((index, last))
+
+    return [i for (i, isKept) in enumerate(keep) if isKept]
+
+
+def measureError(times, values, indices):
+    """
+    Returns the largest vertical distance between the samples and the curve rebuilt from the supplied indices.
+
+    :type times: Sequence[float]
+    :type values: Sequence[float]
+    :type indices: List[int]
+    :rtype: float
+    """
+
+    maxError = 0.0
+
+    for (first, last) in zip(indices[:-1], indices[1:]):
+
+        if (last - first) < 2:
+
+            continue
+
+        index, deviation = findMaxDeviation(times, values, first, last)
+        maxError = max(maxError, deviation)
+
+    return maxError
+
+
+def writeKeys(animCurve, times, values, tolerance=0.0):
+    """
+    Replaces the keys on the supplied anim curve, over the range of the samples, with linear keys.
+    If a tolerance is supplied then only the keys required to stay within it are written!
+
+    :type animCurve: mpynode.MPyNode
+    :type times: Sequence[float]
+    :type values: Sequence[float]
+    :type tolerance: float
+    :rtype: Tuple[int, float]
+    """
+
+    # Check if there are any samples
+    #
+    numSamples = len(values)
+
+    if numSamples == 0:
+
+        return 0, 0.0
+
+    # Reduce samples
+    #
+    indices = reduceKeys(times, values, tolerance)
+    maxError = measureError(times, values, indices) if tolerance > 0.0 else 0.0
+
+    # Replace keys over sampled range
+    #
+    animCurveName = animCurve.name()
+    mc.cutKey(animCurveName, time=(times[0], times[-1]), clear=True)
+
+    for index in indices:
+
+        mc.setKeyframe(animCurveName, time=times[index], value=values[index], inTangentType='linear', outTangentType='linear')
+
+    return len(indices), maxError
+
+
+class KeyReduction(object):
+    """
+    Accumulates the compression ratio and maximum error of reduced keys.
+    """
+
+    # region Dunderscores
+    __slots__ = ('samples', 'keys', 'maxError', 'tolerance')
+
+    def __init__(self, tolerance=0.0):
+        """
+        Private method called after a new instance has been created.
+
+        :type tolerance: float
+        :rtype: None
+        """
+
+        self.samples = 0
+        self.keys = 0
+        self.maxError = 0.0
+        self.tolerance = tolerance
+    # endregion
+
+    # region Properties
+    @property
+    def ratio(self):
+        """
+        Getter method that returns the number of samples per written key.
+
+        :rtype: float
+        """
+
+        return (self.samples / self.keys) if self.keys > 0 else 1.0
+    # endregion
+
+    # region Methods
+    def add(self, numSamples, numKeys, maxError):
+        """
+        Adds the results of a reduced curve.
+
+        :type numSamples: int
+        :type numKeys: int
+        :type maxError: float
+        :rtype: None
+        """
+
+        self.samples += numSamples
+        self.keys += numKeys
+        self.maxError = max(self.maxError, maxError)
+
+    def asDict(self):
+        """
+        Returns the reduction results as a dictionary.
+
+        :rtype: Dict[str, Union[int, float]]
+        """
+
+        return {
+            'tolerance': self.tolerance,
+            'samples': self.samples,
+            'keys': self.keys,
+            'ratio': self.ratio,
+            'maxError': self.maxError
+        }
+
+    def report(self):
+        """
+        Returns a human-readable summary of the reduction.
+
+        :rtype: str
+        """
+
+        return f'Reduced {self.samples} sample(s) to {self.keys} key(s): {self.ratio:.2f}:1 compression, {self.maxError:.6f} max error (tolerance {self.tolerance})'
+    # endregion
@@ -1,5 +1,10 @@
+import math
+
+from maya import cmds as mc
 from mpy import mpynode
+from collections import OrderedDict
 from dcc.maya.libs import plugutils
+from . import traceutils
 
 import logging
 logging.basicConfig()
@@ -7,6 +12,17 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+NUM_OCTAVES = 4
+OCTAVE_THRESHOLD = 0.05
+SAMPLES_PER_CYCLE = 8
+FROZEN_ATTRIBUTE = 'noiseShake'
+SHAKE_CACHE_SIZE = 256
+SWEEP_MAX_SAMPLES = 16384
+
+__shake_samples__ = OrderedDict()
+__shake_stats__ = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+
 def findAssociatedShakes(composeTransform):
     """
     Returns the shake nodes from the supplied `composeTransform` node.
@@ -55,9 +71,283 @@ def findAssociatedShakes(composeTransform):
             if isShake:
 
                 shakes[i] = sourceNodes[0]
+                continue
+
+            # Check if child plugs are driven by frozen curves
+            #
+            frozenShakes = [getFrozenShake(sourceNode) for sourceNode in sourceNodes]
+            isFrozen = all([frozenShake is not None for frozenShake in frozenShakes])
+
+            if isFrozen:
+
+                shakes[i] = frozenShakes[0]
 
             else:
 
                 continue
 
     return shakes
+
+
+def getFrozenShake(node):
+    """
+    Returns the shake node that the supplied frozen curve was sampled from.
+    If the node is not a frozen curve then none is returned!
+
+    :type node: mpynode.MPyNode
+    :rtype: Union[mpynode.MPyNode, None]
+    """
+
+    # Check if node has a frozen attribute
+    #
+    if not node.hasAttr(FROZEN_ATTRIBUTE):
+
+        return None
+
+    # Evaluate frozen attribute connection
+    #
+    plug = node[FROZEN_ATTRIBUTE]
+
+    if plug.isDestination:
+
+        return mpynode.MPyNode(plug.source().node())
+
+    else:
+
+        return None
+
+
+def findFrozenCurves(shake):
+    """
+    Returns the frozen curves that were sampled from the supplied shake node.
+
+    :type shake: mpynode.MPyNode
+    :rtype: List[mpynode.MPyNode]
+    """
+
+    # Evaluate message plug connections
+    #
+    plug = shake['message']
+
+    if not plug.isSource:
+
+        return []
+
+    # Collect frozen curves
+    #
+    curves = []
+
+    for destination in plug.destinations():
+
+        if destination.partialName(useLongNames=True) == FROZEN_ATTRIBUTE:
+
+            curves.append(mpynode.MPyNode(destination.node()))
+
+    return curves
+
+
+def getBandwidth(frequency, roughness=0.0, fractal=True):
+    """
+    Returns the highest significant frequency, in cycles per second, for the supplied shake parameters.
+    Each octave doubles the frequency of the previous one, octaves weaker than the threshold are ignored!
+
+    :type frequency: float
+    :type roughness: float
+    :type fractal: bool
+    :rtype: float
+    """
+
+    if not fractal or roughness <= 0.0:
+
+        return abs(frequency)
+
+    numOctaves, amplitude = 1, 1.0
+
+    for octave in range(1, NUM_OCTAVES):
+
+        amplitude *= roughness
+
+        if amplitude < OCTAVE_THRESHOLD:
+
+            break
+
+        numOctaves += 1
+
+    return abs(frequency) * (2 ** (numOctaves - 1))
+
+
+def getSampleStep(bandwidth, framesPerSecond, minStep=0.25, maxStep=8.0):
+    """
+    Returns the frame step required to sample the supplied bandwidth without aliasing.
+    Steps are snapped to powers of two so sub-frame samples land on exact fractions of a frame!
+
+    :type bandwidth: float
+    :type framesPerSecond: float
+    :type minStep: float
+    :type maxStep: float
+    :rtype: float
+    """
+
+    if bandwidth <= 0.0:
+
+        return maxStep
+
+    step = framesPerSecond / (bandwidth * SAMPLES_PER_CYCLE)
+    step = 2.0 ** math.floor(math.log2(step))
+
+    return min(max(step, minStep), maxStep)
+
+
+def sampleShake(seed=0, frequency=0.5, roughness=0.0, fractal=True, rampIn=0.0, rampOut=0.0, size=100, step=1, timeScale=1, positive=False):
+    """
+    Returns the samples from the `shake` command for the supplied parameters.
+    Samples are shared by every widget that previews noise, the least recently used parameter set is evicted once the cache is full!
+
+    :type seed: int
+    :type frequency: float
+    :type roughness: float
+    :type fractal: bool
+    :type rampIn: float
+    :type rampOut: float
+    :type size: int
+    :type step: int
+    :type timeScale: float
+    :type positive: bool
+    :rtype: Tuple[float]
+    """
+
+    # Check if samples have already been cached
+    #
+    key = (seed, frequency, roughness, fractal, rampIn, rampOut, size, step, timeScale, positive)
+    samples = __shake_samples__.get(key, None)
+
+    if samples is not None:
+
+        __shake_samples__.move_to_end(key)
+        __shake_stats__['hits'] += 1
+
+        return samples
+
+    # Sample parameters from the shake command
+    #
+    with traceutils.span('shake', category='command', samples=len(range(0, size, step))):
+
+        samples = tuple(
+            mc.shake(
+                seed=seed,
+                frequency=frequency,
+                roughness=roughness,
+                fractal=fractal,
+                rampIn=rampIn,
+                rampOut=rampOut,
+                size=size,
+                step=step,
+                timeScale=timeScale,
+                positive=positive
+            )
+        )
+
+    __shake_stats__['misses'] += 1
+    __shake_samples__[key] = samples
+
+    while len(__shake_samples__) > SHAKE_CACHE_SIZE:
+
+        __shake_samples__.popitem(last=False)
+        __shake_stats__['evictions'] += 1
+
+    return samples
+
+
+def sampleShakeSweep(seed=0, frequencies=(0.5,), roughness=0.0, fractal=True, size=100, step=1, timeScale=1):
+    """
+    Returns the samples from the `shake` command for each of the supplied frequencies, using a single command call.
+    Without ramps, frequency only scales time, so every frequency reads from one timeline sampled at the lowest frequency's spacing!
+    Roughness changes the curve itself, so each roughness still requires its own call.
+
+    :type seed: int
+    :type frequencies: Sequence[float]
+    :type roughness: float
+    :type fractal: bool
+    :type size: int
+    :type step: int
+    :type timeScale: float
+    :rtype: List[Tuple[float]]
+    """
+
+    # Check if there are any frequencies to sample
+    #
+    numSamples = len(range(0, size, step))
+    positiveFrequencies = [frequency for frequency in frequencies if frequency > 0.0]
+
+    if numSamples == 0 or len(positiveFrequencies) == 0:
+
+        return [sampleShake(seed=seed, frequency=frequency, roughness=roughness, fractal=fractal, size=size, step=step, timeScale=timeScale) for frequency in frequencies]
+
+    # Sample the shared timeline at the lowest frequency's spacing
+    # The spacing is coarsened if the frequency range would exceed the sample limit!
+    #
+    extent = ((numSamples - 1) * step * max(positiveFrequencies)) / timeScale
+    spacing = (step * min(positiveFrequencies)) / timeScale
+    spacing = max(spacing, extent / (SWEEP_MAX_SAMPLES - 2))
+
+    timeline = sampleShake(
+        seed=seed,
+        frequency=1.0,
+        roughness=roughness,
+        fractal=fractal,
+        size=int(math.ceil(extent / spacing)) + 2,
+        step=1,
+        timeScale=1.0 / spacing
+    )
+
+    # Interpolate the samples of each frequency from the timeline
+    #
+    lastIndex = len(timeline) - 1
+    sweep = []
+
+    for frequency in frequencies:
+
+        samples = []
+
+        for i in range(numSamples):
+
+            position = min(((i * step * max(frequency, 0.0)) / timeScale) / spacing, float(lastIndex))
+            index = min(int(position), lastIndex - 1)
+            weight = position - index
+
+            samples.append((timeline[index] * (1.0 - weight)) + (timeline[index + 1] * weight))
+
+        sweep.append(tuple(samples))
+
+    return sweep
+
+
+def getShakeCacheInfo():
+    """
+    Returns the hit rate and size of the shake sample cache.
+
+    :rtype: Dict[str, Union[int, float]]
+    """
+
+    hits, misses = __shake_stats__['hits'], __shake_stats__['misses']
+
+    return {
+        'hits': hits,
+        'misses': misses,
+        'evictions': __shake_stats__['evictions'],
+        'hitRate': (hits / (hits + misses)) if (hits + misses) > 0 else 0.0,
+        'size': len(__shake_samples__),
+        'maxSize': SHAKE_CACHE_SIZE,
+        'samples': sum(len(samples) for samples in __shake_samples__.values())
+    }
+
+
+def clearShakeCache():
+    """
+    Removes every sample set from the shake sample cache and resets its statistics.
+
+    :rtype: None
+    """
+
+    __shake_samples__.clear()
+    __shake_stats__.update(hits=0, misses=0, evictions=0)
@@ -0,0 +1,736 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import threading
+
+from maya import cmds as mc
+from urllib import request, parse, error
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dcc.maya.libs import pluginutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+GITHUB_URL = 'https://github.com/bhsingleton/{plugin}/releases/download/{version}/{plugin}.{extension}'
+MIRROR_VARIABLE = 'NOISEEDITOR_PLUGIN_MIRROR'
+CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_TIMEOUT = 120.0
+
+
+def getMayaVersion():
+    """
+    Returns the version of the current Maya session.
+
+    :rtype: str
+    """
+
+    return mc.about(version=True)
+
+
+def getCachePath():
+    """
+    Returns the path to the plug-in cache file.
+
+    :rtype: str
+    """
+
+    mayaDirectory = os.path.abspath(os.environ['MAYA_APP_DIR'])
+    return os.path.join(mayaDirectory, 'noiseeditor', 'plugincache.json')
+
+
+def loadCache():
+    """
+    Returns the contents of the plug-in cache file.
+    If the cache file is missing or corrupt then an empty cache is returned!
+
+    :rtype: Dict[str, Dict[str, Dict[str, Any]]]
+    """
+
+    cachePath = getCachePath()
+
+    if not os.path.isfile(cachePath):
+
+        return {}
+
+    try:
+
+        with open(cachePath, 'r') as jsonFile:
+
+            return json.load(jsonFile)
+
+    except (OSError, ValueError) as exception:
+
+        log.warning(f'Unable to read plug-in cache: {exception}')
+        return {}
+
+
+def saveCache(cache):
+    """
+    Writes the supplied cache to the plug-in cache file.
+
+    :type cache: Dict[str, Dict[str, Dict[str, Any]]]
+    :rtype: bool
+    """
+
+    cachePath = getCachePath()
+
+    try:
+
+        os.makedirs(os.path.dirname(cachePath), exist_ok=True)
+
+        with open(cachePath, 'w') as jsonFile:
+
+            json.dump(cache, jsonFile, indent=4)
+
+        return True
+
+    except OSError as exception:
+
+        log.warning(f'Unable to write plug-in cache: {exception}')
+        return False
+
+
+def isPluginLoaded(plugin):
+    """
+    Evaluates if the supplied plug-in is already loaded.
+
+    :type plugin: str
+    :rtype: bool
+    """
+
+    return bool(mc.pluginInfo(plugin, query=True, loaded=True))
+
+
+def findPlugin(plugin):
+    """
+    Returns the path to the supplied plug-in using the same search as `pluginutils`, including the module paths.
+    Missing plug-ins are returned as none!
+
+    :type plugin: str
+    :rtype: Union[str, None]
+    """
+
+    path = pluginutils.pathToPlugin(plugin)
+
+    if path and os.path.isfile(path):
+
+        return os.path.abspath(path)
+
+    else:
+
+        return None
+
+
+def isCacheEntryValid(entry):
+    """
+    Evaluates if the supplied cache entry still points to the same plug-in file.
+
+    :type entry: Dict[str, Any]
+    :rtype: bool
+    """
+
+    path = entry.get('path', '')
+
+    try:
+
+        return os.path.getmtime(path) == entry.get('mtime', -1.0)
+
+    except OSError:
+
+        return False
+
+
+def resolvePlugins(plugins):
+    """
+    Returns the paths to the supplied plug-ins.
+    Cached paths are reused while their file modification time is unchanged, any remaining plug-ins are resolved through `pluginutils`.
+    Missing plug-ins are returned as none!
+
+    :type plugins: List[str]
+    :rtype: Dict[str, Union[str, None]]
+    """
+
+    # Collect any valid cache entries
+    #
+    mayaVersion = getMayaVersion()
+    cache = loadCache()
+    entries = cache.get(mayaVersion, {})
+
+    paths = {}
+    unresolved = []
+
+    for plugin in plugins:
+
+        entry = entries.get(plugin, None)
+
+        if entry is not None and isCacheEntryValid(entry):
+
+            paths[plugin] = entry['path']
+
+        else:
+
+            unresolved.append(plugin)
+
+    # Resolve remaining plug-ins
+    #
+    for plugin in unresolved:
+
+        paths[plugin] = findPlugin(plugin)
+
+    return paths
+
+
+def updateCache(paths):
+    """
+    Updates the cache entries for the supplied plug-in paths.
+
+    :type paths: Dict[str, Union[str, None]]
+    :rtype: None
+    """
+
+    # Check if there is anything to cache
+    #
+    paths = {plugin: path for (plugin, path) in paths.items() if path is not None and os.path.isfile(path)}
+
+    if len(paths) == 0:
+
+        return
+
+    # Update entries for the current Maya version
+    #
+    mayaVersion = getMayaVersion()
+    cache = loadCache()
+    entries = cache.setdefault(mayaVersion, {})
+
+    for (plugin, path) in paths.items():
+
+        entries[plugin] = {'path': path, 'mtime': os.path.getmtime(path)}
+
+    saveCache(cache)
+
+
+def loadPlugins(paths):
+    """
+    Loads the supplied plug-in paths.
+    Maya only supports loading plug-ins from the main thread so these are loaded in a single pass!
+
+    :type paths: Dict[str, str]
+    :rtype: Dict[str, bool]
+    """
+
+    results = {}
+
+    for (plugin, path) in paths.items():
+
+        success = pluginutils.tryLoadPlugin(path)
+        results[plugin] = success
+
+        if not success:
+
+            log.warning(f'Unable to load plug-in: {path}')
+
+    # Cache successfully loaded plug-ins
+    #
+    updateCache({plugin: path for (plugin, path) in paths.items() if results[plugin]})
+
+    return results
+
+
+def getPluginMirror():
+    """
+    Returns the plug-in mirror from the `NOISEEDITOR_PLUGIN_MIRROR` environment variable.
+    The mirror can either be a local directory or a file, http or https URL!
+
+    :rtype: Union[str, None]
+    """
+
+    mirror = os.environ.get(MIRROR_VARIABLE, '').strip()
+    return mirror if len(mirror) > 0 else None
+
+
+def isLocalSource(source):
+    """
+    Evaluates if the supplied source is a local path or file URL.
+
+    :type source: str
+    :rtype: bool
+    """
+
+    return os.path.isabs(source) or parse.urlparse(source).scheme in ('', 'file')
+
+
+def toLocalPath(source):
+    """
+    Returns the local path from the supplied source.
+
+    :type source: str
+    :rtype: str
+    """
+
+    if os.path.isabs(source):
+
+        return source
+
+    parsedUrl = parse.urlparse(source)
+    return request.url2pathname(parsedUrl.path) if parsedUrl.scheme == 'file' else source
+
+
+def joinSource(source, *names):
+    """
+    Joins the supplied names onto the specified source.
+
+    :type source: str
+    :type names: Union[str, Tuple[str]]
+    :rtype: str
+    """
+
+    if os.path.isabs(source):
+
+        return os.path.join(source, *names)
+
+    else:
+
+        return '/'.join([source.rstrip('/')] + list(names))
+
+
+def iterPluginSources(plugin, version, extension, mirror=None):
+    """
+    Returns a generator that yields the sources to download the supplied plug-in from, in order of preference.
+
+    :type plugin: str
+    :type version: str
+    :type extension: str
+    :type mirror: Union[str, None]
+    :rtype: Iterator[str]
+    """
+
+    if mirror is not None:
+
+        yield joinSource(mirror, version, f'{plugin}.{extension}')
+
+    yield GITHUB_URL.format(plugin=plugin, version=version, extension=extension)
+
+
+def openSource(source, offset=0, timeout=30.0):
+    """
+    Returns a readable stream from the supplied source starting at the specified byte offset.
+    The second item is false if the source could not resume from the offset and starts from the beginning instead!
+
+    :type source: str
+    :type offset: int
+    :type timeout: float
+    :rtype: Tuple[io.BufferedIOBase, bool]
+    """
+
+    # Check if source is local
+    #
+    if isLocalSource(source):
+
+        stream = open(toLocalPath(source), 'rb')
+        stream.seek(offset)
+
+        return stream, True
+
+    # Request remaining byte range
+    #
+    headers = {'Range': f'bytes={offset}-'} if offset > 0 else {}
+    response = request.urlopen(request.Request(source, headers=headers), timeout=timeout)
+    isResumed = offset > 0 and response.status == 206
+
+    return response, isResumed
+
+
+def fetchChecksum(source):
+    """
+    Returns the SHA-256 checksum published alongside the supplied source.
+    If no checksum is published then none is returned!
+
+    :type source: str
+    :rtype: Union[str, None]
+    """
+
+    try:
+
+        stream, _ = openSource(f'{source}.sha256')
+
+        with stream:
+
+            text = stream.read(1024).decode('utf-8').strip()
+
+        return text.split()[0].lower() if len(text) > 0 else None
+
+    except (OSError, ValueError, error.URLError):
+
+        return None
+
+
+def hashFile(path):
+    """
+    Returns the SHA-256 checksum of the supplied file.
+
+    :type path: str
+    :rtype: str
+    """
+
+    sha256 = hashlib.sha256()
+
+    with open(path, 'rb') as stream:
+
+        for chunk in iter(lambda: stream.read(CHUNK_SIZE), b''):
+
+            sha256.update(chunk)
+
+    return sha256.hexdigest()
+
+
+def transferSource(source, path, retries=3, cancelEvent=None):
+    """
+    Transfers the supplied source to the specified path.
+    Partial transfers are kept in a `.part` file so interrupted downloads resume where they left off!
+    Setting the cancel event stops the transfer between chunks and interrupts any retry back-off.
+
+    :type source: str
+    :type path: str
+    :type retries: int
+    :type cancelEvent: Union[threading.Event, None]
+    :rtype: bool
+    """
+
+    partPath = f'{path}.part'
+    cancelEvent = cancelEvent if cancelEvent is not None else threading.Event()
+
+    for attempt in range(retries):
+
+        if cancelEvent.is_set():
+
+            return False
+
+        try:
+
+            # Open source from the end of any partial transfer
+            #
+            offset = os.path.getsize(partPath) if os.path.isfile(partPath) else 0
+            stream, isResumed = openSource(source, offset=offset)
+
+            with stream, open(partPath, 'ab' if isResumed else 'wb') as partFile:
+
+                for chunk in iter(lambda: stream.read(CHUNK_SIZE), b''):
+
+                    if cancelEvent.is_set():
+
+                        return False
+
+                    partFile.write(chunk)
+
+            # Verify checksum, if one is published
+            #
+            checksum = fetchChecksum(source)
+
+            if checksum is not None and hashFile(partPath) != checksum:
+
+                log.warning(f'Checksum mismatch from: {source}')
+                os.remove(partPath)
+
+                continue
+
+            os.replace(partPath, path)
+            return True
+
+        except error.HTTPError as exception:
+
+            # Check if the partial transfer is out of range
+            #
+            if exception.code == 416 and os.path.isfile(partPath):
+
+                os.remove(partPath)
+                continue
+
+            log.debug(f'Unable to download {source}: {exception}')
+
+            if exception.code == 404:
+
+                return False
+
+        except (OSError, error.URLError) as exception:
+
+            log.debug(f'Unable to download {source}: {exception}')
+
+            if isLocalSource(source) and not os.path.isfile(toLocalPath(source)):
+
+                return False
+
+        # Back off before the next attempt
+        # The wait is cut short as soon as the transfer is cancelled!
+        #
+        if attempt + 1 < retries and cancelEvent.wait(2 ** attempt):
+
+            return False
+
+    return False
+
+
+def publishToMirror(path, plugin, version, extension, mirror):
+    """
+    Copies the supplied plug-in, along with its checksum, to the specified local mirror.
+    This allows subsequent seats to download the plug-in from the mirror instead!
+
+    :type path: str
+    :type plugin: str
+    :type version: str
+    :type extension: str
+    :type mirror: str
+    :rtype: None
+    """
+
+    # Check if mirror is local
+    #
+    if not isLocalSource(mirror):
+
+        return
+
+    mirrorPath = os.path.join(toLocalPath(mirror), version, f'{plugin}.{extension}')
+
+    if os.path.isfile(mirrorPath):
+
+        return
+
+    # Copy plug-in and checksum to mirror
+    #
+    try:
+
+        os.makedirs(os.path.dirname(mirrorPath), exist_ok=True)
+
+        shutil.copyfile(path, f'{mirrorPath}.part')
+        os.replace(f'{mirrorPath}.part', mirrorPath)
+
+        with open(f'{mirrorPath}.sha256', 'w') as checksumFile:
+
+            checksumFile.write(f'{hashFile(mirrorPath)}  {plugin}.{extension}\n')
+
+    except OSError as exception:
+
+        log.debug(f'Unable to publish plug-in to mirror: {exception}')
+
+
+def downloadPlugin(plugin, directory, version, extension, mirror=None, cancelEvent=None):
+    """
+    Downloads the supplied plug-in to the specified directory.
+    The mirror is tried first, falling back on the GitHub releases page!
+
+    :type plugin: str
+    :type directory: str
+    :type version: str
+    :type extension: str
+    :type mirror: Union[str, None]
+    :type cancelEvent: Union[threading.Event, None]
+    :rtype: Union[str, None]
+    """
+
+    path = os.path.join(directory, f'{plugin}.{extension}')
+
+    for source in iterPluginSources(plugin, version, extension, mirror=mirror):
+
+        success = transferSource(source, path, cancelEvent=cancelEvent)
+
+        if not success:
+
+            continue
+
+        if mirror is not None and not source.startswith(mirror):
+
+            publishToMirror(path, plugin, version, extension, mirror)
+
+        return path
+
+    log.warning(f'Unable to download plug-in: {plugin}')
+    return None
+
+
+class PluginDownloader(object):
+    """
+    Downloads plug-ins on worker threads so the calling thread never blocks on transfers or retry back-offs.
+    Call `poll` from the calling thread, such as from a timer, to collect finished downloads!
+    Any downloads still running once the timeout has elapsed are cancelled and reported as missing.
+    """
+
+    # region Dunderscores
+    def __init__(self, plugins, directory, mirror=None, timeout=DOWNLOAD_TIMEOUT):
+        """
+        Private method called after a new instance has been created.
+
+        :type plugins: List[str]
+        :type directory: str
+        :type mirror: Union[str, None]
+        :type timeout: float
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(PluginDownloader, self).__init__()
+
+        # Declare private variables
+        #
+        self._plugins = list(plugins)
+        self._directory = directory
+        self._mirror = mirror if mirror is not None else getPluginMirror()
+        self._timeout = timeout
+        self._deadline = None
+        self._executor = None
+        self._futures = {}
+        self._paths = {}
+        self._cancelEvent = threading.Event()
+    # endregion
+
+    # region Properties
+    @property
+    def paths(self):
+        """
+        Getter method that returns the paths of every finished download.
+        Failed, cancelled and timed out downloads are returned as none!
+
+        :rtype: Dict[str, Union[str, None]]
+        """
+
+        return dict(self._paths)
+
+    @property
+    def isDone(self):
+        """
+        Getter method that returns the done state of every download.
+
+        :rtype: bool
+        """
+
+        return len(self._paths) == len(self._plugins)
+    # endregion
+
+    # region Methods
+    def start(self):
+        """
+        Submits every download to the worker threads.
+        Maya is only queried from the calling thread!
+
+        :rtype: None
+        """
+
+        # Check if there is anything to download
+        #
+        numPlugins = len(self._plugins)
+
+        if numPlugins == 0 or self._executor is not None:
+
+            return
+
+        version = getMayaVersion()
+        extension = pluginutils.getPluginExtension()
+
+        self._deadline = time.perf_counter() + self._timeout
+        self._executor = ThreadPoolExecutor(max_workers=numPlugins)
+        self._futures = {self._executor.submit(downloadPlugin, plugin, self._directory, version, extension, mirror=self._mirror, cancelEvent=self._cancelEvent): plugin for plugin in self._plugins}
+
+    def poll(self, timeout=0.0):
+        """
+        Returns the plug-ins, and their paths, that finished since the last poll.
+        The timeout is the longest time, in seconds, to wait for a download to finish!
+
+        :type timeout: float
+        :rtype: List[Tuple[str, Union[str, None]]]
+        """
+
+        # Check if downloads are still pending
+        #
+        pending = [future for future in self._futures.keys() if self._futures[future] not in self._paths]
+
+        if len(pending) == 0:
+
+            return []
+
+        # Collect finished downloads
+        #
+        remaining = max(0.0, self._deadline - time.perf_counter())
+        done, pending = wait(pending, timeout=min(timeout, remaining), return_when=FIRST_COMPLETED)
+
+        finished = []
+
+        for future in done:
+
+            plugin = self._futures[future]
+            path = None
+
+            try:
+
+                path = future.result()
+
+            except Exception as exception:
+
+                log.warning(f'Unable to download plug-in: {plugin} ({exception})')
+
+            self._paths[plugin] = path
+            finished.append((plugin, path))
+
+        # Check if the deadline has passed
+        #
+        if len(pending) > 0 and time.perf_counter() >= self._deadline:
+
+            log.warning(f'Plug-in downloads timed out after {self._timeout:.0f}s!')
+            self.cancel()
+
+            for future in pending:
+
+                plugin = self._futures[future]
+                self._paths[plugin] = None
+
+                finished.append((plugin, None))
+
+        return finished
+
+    def cancel(self):
+        """
+        Cancels any pending downloads without waiting for the worker threads.
+        Partial transfers are kept so the next download resumes from them!
+
+        :rtype: None
+        """
+
+        self._cancelEvent.set()
+
+        if self._executor is not None:
+
+            self._executor.shutdown(wait=False)
+    # endregion
+
+
+def downloadPlugins(plugins, directory, mirror=None, callback=None, timeout=DOWNLOAD_TIMEOUT):
+    """
+    Downloads the supplied plug-ins to the specified directory in parallel.
+    The optional callback is invoked from the calling thread as each download completes!
+    This blocks the calling thread for up to the timeout, use a `PluginDownloader` to keep an interface responsive instead.
+
+    :type plugins: List[str]
+    :type directory: str
+    :type mirror: Union[str, None]
+    :type callback: Union[Callable[[str, Union[str, None]], None], None]
+    :type timeout: float
+    :rtype: Dict[str, Union[str, None]]
+    """
+
+    downloader = PluginDownloader(plugins, directory, mirror=mirror, timeout=timeout)
+    downloader.start()
+
+    while not downloader.isDone:
+
+        for (plugin, path) in downloader.poll(timeout=0.1):
+
+            if callable(callback):
+
+                callback(plugin, path)
+
+    downloader.cancel()
+
+    return downloader.paths
@@ -0,0 +1,451 @@
+import os
+import re
+import json
+
+from maya.api import OpenMaya as om
+from . import undoutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+PRESET_VARIABLE = 'NOISEEDITOR_PRESET_PATH'
+PRESET_EXTENSION = 'json'
+INDEX_NAME = 'index.json'
+RESERVED_NAMES = frozenset(['index', 'con', 'prn', 'aux', 'nul'] + [f'{device}{i}' for device in ('com', 'lpt') for i in range(1, 10)])
+PRESET_COMPONENTS = ('position', 'rotation', 'scale')
+PRESET_ATTRIBUTES = (
+    'seed',
+    'frequency',
+    'fractal',
+    'roughness',
+    'envelope',
+    'rampIn',
+    'rampOut',
+    'strengthX',
+    'strengthY',
+    'strengthZ',
+    'positiveX',
+    'positiveY',
+    'positiveZ'
+)
+
+__index__ = {}
+
+
+def getPresetDirectory():
+    """
+    Returns the directory that presets are stored in.
+    The directory can be shared between artists by pointing the preset path environment variable at it!
+
+    :rtype: str
+    """
+
+    directory = os.environ.get(PRESET_VARIABLE, '')
+
+    if not directory:
+
+        mayaDirectory = os.path.abspath(os.environ['MAYA_APP_DIR'])
+        directory = os.path.join(mayaDirectory, 'noiseeditor', 'presets')
+
+    return os.path.abspath(directory)
+
+
+def getPresetFileName(name, existing=()):
+    """
+    Returns a safe file name for the supplied preset name.
+    Reserved names, such as the index, are escaped and names that sanitize to an existing file receive a numbered suffix!
+
+    :type name: str
+    :type existing: Iterable[str]
+    :rtype: str
+    """
+
+    baseName = re.sub(r'[^\w\-]+', '_', name.strip()).strip('_') or 'preset'
+
+    if baseName.lower() in RESERVED_NAMES:
+
+        baseName = f'{baseName}_preset'
+
+    # Check if file name is already taken
+    # File names are compared case-insensitively since most artists work on case-insensitive file systems!
+    #
+    taken = {fileName.lower() for fileName in existing}
+    fileName, suffix = f'{baseName}.{PRESET_EXTENSION}', 2
+
+    while fileName.lower() in taken:
+
+        fileName = f'{baseName}_{suffix}.{PRESET_EXTENSION}'
+        suffix += 1
+
+    return fileName
+
+
+def loadIndex(directory):
+    """
+    Returns the contents of the preset index file from the supplied directory.
+    If the index file is missing or corrupt then an empty index is returned!
+
+    :type directory: str
+    :rtype: Dict[str, Dict[str, Any]]
+    """
+
+    indexPath = os.path.join(directory, INDEX_NAME)
+
+    if not os.path.isfile(indexPath):
+
+        return {}
+
+    try:
+
+        with open(indexPath, 'r') as jsonFile:
+
+            return json.load(jsonFile)
+
+    except (OSError, ValueError) as exception:
+
+        log.warning(f'Unable to read preset index: {exception}')
+        return {}
+
+
+def saveIndex(directory, index):
+    """
+    Writes the supplied index to the preset index file in the specified directory.
+
+    :type directory: str
+    :type index: Dict[str, Dict[str, Any]]
+    :rtype: bool
+    """
+
+    indexPath = os.path.join(directory, INDEX_NAME)
+
+    try:
+
+        os.makedirs(directory, exist_ok=True)
+
+        with open(indexPath, 'w') as jsonFile:
+
+            json.dump(index, jsonFile, indent=4)
+
+        return True
+
+    except OSError as exception:
+
+        log.warning(f'Unable to write preset index: {exception}')
+        return False
+
+
+def updateIndex(directory=None):
+    """
+    Returns the preset index for the supplied directory.
+    Only preset files whose modification time differs from the index are parsed, every other entry is served from the cache!
+
+    :type directory: Union[str, None]
+    :rtype: Dict[str, Dict[str, Any]]
+    """
+
+    # Check if directory exists
+    #
+    directory = directory if directory is not None else getPresetDirectory()
+
+    if not os.path.isdir(directory):
+
+        return {}
+
+    # Collect preset modification times
+    # A directory scan only stats each file, which is far cheaper than parsing them!
+    #
+    modifiedTimes = {}
+
+    with os.scandir(directory) as entries:
+
+        for entry in entries:
+
+            if entry.is_file() and entry.name.endswith(f'.{PRESET_EXTENSION}') and entry.name != INDEX_NAME:
+
+                modifiedTimes[entry.name] = entry.stat().st_mtime
+
+    # Check if in-memory index is still valid
+    #
+    index = __index__.get(directory, None)
+
+    if index is None:
+
+        index = loadIndex(directory)
+
+    isStale = False
+
+    for fileName in [fileName for fileName in index.keys() if fileName not in modifiedTimes]:
+
+        del index[fileName]
+        isStale = True
+
+    for (fileName, modifiedTime) in modifiedTimes.items():
+
+        entry = index.get(fileName, None)
+
+        if entry is not None and entry.get('mtime', None) == modifiedTime:
+
+            continue
+
+        preset = readPreset(os.path.join(directory, fileName))
+
+        if preset is None:
+
+            index.pop(fileName, None)
+
+        else:
+
+            index[fileName] = {'name': preset.get('name', os.path.splitext(fileName)[0]), 'mtime': modifiedTime, 'components': sorted(preset.get('components', {}).keys())}
+
+        isStale = True
+
+    # Check if index requires saving
+    #
+    if isStale:
+
+        saveIndex(directory, index)
+
+    __index__[directory] = index
+    return index
+
+
+def listPresets(directory=None):
+    """
+    Returns the names of the available presets from the cached index.
+
+    :type directory: Union[str, None]
+    :rtype: List[str]
+    """
+
+    index = updateIndex(directory=directory)
+    return sorted(entry['name'] for entry in index.values())
+
+
+def readPreset(path):
+    """
+    Returns the contents of the supplied preset file.
+    If the preset file is corrupt then none is returned!
+
+    :type path: str
+    :rtype: Union[Dict[str, Any], None]
+    """
+
+    try:
+
+        with open(path, 'r') as jsonFile:
+
+            return json.load(jsonFile)
+
+    except (OSError, ValueError) as exception:
+
+        log.warning(f'Unable to read preset: {exception}')
+        return None
+
+
+def loadPreset(name, directory=None):
+    """
+    Returns the preset with the supplied name.
+
+    :type name: str
+    :type directory: Union[str, None]
+    :rtype: Union[Dict[str, Any], None]
+    """
+
+    directory = directory if directory is not None else getPresetDirectory()
+    fileName = findPresetFileName(name, directory=directory)
+
+    if fileName is not None:
+
+        return readPreset(os.path.join(directory, fileName))
+
+    else:
+
+        return None
+
+
+def findPresetFileName(name, directory=None):
+    """
+    Returns the file name of the preset with the supplied name.
+    If no preset exists with this name then none is returned!
+
+    :type name: str
+    :type directory: Union[str, None]
+    :rtype: Union[str, None]
+    """
+
+    index = updateIndex(directory=directory)
+    return next((fileName for (fileName, entry) in index.items() if entry['name'] == name), None)
+
+
+def hasPreset(name, directory=None):
+    """
+    Evaluates if a preset already exists with the supplied name.
+
+    :type name: str
+    :type directory: Union[str, None]
+    :rtype: bool
+    """
+
+    return findPresetFileName(name, directory=directory) is not None
+
+
+def savePreset(name, preset, directory=None, overwrite=False):
+    """
+    Writes the supplied preset under the specified name and returns its path.
+    An existing preset with the same name is only replaced when overwrite is enabled, and a preset never replaces another preset's file!
+
+    :type name: str
+    :type preset: Dict[str, Any]
+    :type directory: Union[str, None]
+    :type overwrite: bool
+    :rtype: Union[str, None]
+    """
+
+    # Check if preset already exists
+    #
+    directory = directory if directory is not None else getPresetDirectory()
+    fileName = findPresetFileName(name, directory=directory)
+
+    if fileName is not None and not overwrite:
+
+        log.warning(f'"{name}" preset already exists, enable overwrite to replace it!')
+        return None
+
+    elif fileName is None:
+
+        existing = os.listdir(directory) if os.path.isdir(directory) else []
+        fileName = getPresetFileName(name, existing=existing)
+
+    path = os.path.join(directory, fileName)
+
+    try:
+
+        os.makedirs(directory, exist_ok=True)
+
+        with open(path, 'w') as jsonFile:
+
+            json.dump(dict(preset, name=name), jsonFile, indent=4)
+
+    except OSError as exception:
+
+        log.warning(f'Unable to write preset: {exception}')
+        return None
+
+    updateIndex(directory=directory)
+    return path
+
+
+def deletePreset(name, directory=None):
+    """
+    Deletes the preset with the supplied name.
+
+    :type name: str
+    :type directory: Union[str, None]
+    :rtype: bool
+    """
+
+    directory = directory if directory is not None else getPresetDirectory()
+    index = updateIndex(directory=directory)
+
+    fileNames = [fileName for (fileName, entry) in index.items() if entry['name'] == name]
+
+    for fileName in fileNames:
+
+        try:
+
+            os.remove(os.path.join(directory, fileName))
+
+        except OSError as exception:
+
+            log.warning(f'Unable to delete preset: {exception}')
+            return False
+
+    updateIndex(directory=directory)
+    return len(fileNames) > 0
+
+
+def capturePreset(noiseItem):
+    """
+    Returns a preset from the shake nodes on the supplied noise item.
+
+    :type noiseItem: NoiseItem
+    :rtype: Dict[str, Any]
+    """
+
+    components = {}
+
+    for (component, shake) in zip(PRESET_COMPONENTS, noiseItem[2:]):
+
+        if shake is None:
+
+            continue
+
+        components[component] = {attributeName: shake.getAttr(attributeName) for attributeName in PRESET_ATTRIBUTES}
+
+    return {'components': components}
+
+
+def applyPreset(preset, noiseItems):
+    """
+    Writes the supplied preset onto the shake nodes from the specified noise items.
+    Every attribute is written through a single modifier so the whole apply is one batched edit!
+    Animated attributes are left untouched.
+
+    :type preset: Dict[str, Any]
+    :type noiseItems: List[NoiseItem]
+    :rtype: int
+    """
+
+    modifier = om.MDGModifier()
+    components = preset.get('components', {})
+
+    numShakes = 0
+
+    for noiseItem in noiseItems:
+
+        for (component, shake) in zip(PRESET_COMPONENTS, noiseItem[2:]):
+
+            # Check if preset has values for this shake
+            #
+            values = components.get(component, None)
+
+            if shake is None or values is None:
+
+                continue
+
+            # Queue attribute values
+            #
+            for (attributeName, value) in values.items():
+
+                if attributeName not in PRESET_ATTRIBUTES:
+
+                    continue
+
+                plug = shake[attributeName]
+
+                if plug.isDestination:
+
+                    continue
+
+                undoutils.touch(shake, attributeName)
+
+                if isinstance(value, bool):
+
+                    modifier.newPlugValueBool(plug, value)
+
+                elif isinstance(value, int):
+
+                    modifier.newPlugValueInt(plug, value)
+
+                else:
+
+                    modifier.newPlugValueDouble(plug, float(value))
+
+            numShakes += 1
+
+    modifier.doIt()
+
+    return numShakes
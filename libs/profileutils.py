@@ -0,0 +1,412 @@
+import os
+import time
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+ENVIRONMENT_VARIABLE = 'NOISEEDITOR_PROFILE'
+
+__enabled__ = os.environ.get(ENVIRONMENT_VARIABLE, '0').lower() in ('1', 'true', 'on')
+
+
+def isEnabled():
+    """
+    Evaluates if profiling is enabled.
+
+    :rtype: bool
+    """
+
+    return __enabled__
+
+
+def enable():
+    """
+    Enables profiling for any subsequent operations.
+
+    :rtype: None
+    """
+
+    global __enabled__
+    __enabled__ = True
+
+
+def disable():
+    """
+    Disables profiling for any subsequent operations.
+
+    :rtype: None
+    """
+
+    global __enabled__
+    __enabled__ = False
+
+
+class ProfileTimer(object):
+    """
+    Base class for context managers that accumulate wall time and call counts.
+    """
+
+    # region Dunderscores
+    __slots__ = ('name', 'calls', 'totalTime', 'maxTime', '_startTime')
+
+    def __init__(self, name):
+        """
+        Private method called after a new instance has been created.
+
+        :type name: str
+        :rtype: None
+        """
+
+        self.name = name
+        self.calls = 0
+        self.totalTime = 0.0
+        self.maxTime = 0.0
+        self._startTime = 0.0
+
+    def __enter__(self):
+        """
+        Private method that is called when this instance is entered using a with statement.
+
+        :rtype: ProfileTimer
+        """
+
+        self._startTime = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Private method that is called when this instance is exited using a with statement.
+
+        :type exc_type: Any
+        :type exc_val: Any
+        :type exc_tb: Any
+        :rtype: None
+        """
+
+        elapsedTime = time.perf_counter() - self._startTime
+
+        self.calls += 1
+        self.totalTime += elapsedTime
+        self.maxTime = max(self.maxTime, elapsedTime)
+    # endregion
+
+    # region Methods
+    def asDict(self):
+        """
+        Returns the collected timings as a dictionary.
+
+        :rtype: Dict[str, Union[int, float]]
+        """
+
+        return {
+            'calls': self.calls,
+            'totalTime': self.totalTime,
+            'averageTime': (self.totalTime / self.calls) if self.calls > 0 else 0.0,
+            'maxTime': self.maxTime
+        }
+    # endregion
+
+
+class Profiler(object):
+    """
+    Collects per-phase wall times, call counts and per-item costs for an operation.
+    """
+
+    # region Dunderscores
+    def __init__(self, name):
+        """
+        Private method called after a new instance has been created.
+
+        :type name: str
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(Profiler, self).__init__()
+
+        # Declare private variables
+        #
+        self._name = name
+        self._phases = {}
+        self._items = {}
+        self._counters = {}
+        self._startTime = None
+        self._endTime = None
+
+    def __enter__(self):
+        """
+        Private method that is called when this instance is entered using a with statement.
+
+        :rtype: Profiler
+        """
+
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Private method that is called when this instance is exited using a with statement.
+
+        :type exc_type: Any
+        :type exc_val: Any
+        :type exc_tb: Any
+        :rtype: None
+        """
+
+        self.stop()
+    # endregion
+
+    # region Properties
+    @property
+    def name(self):
+        """
+        Getter method that returns the name of the profiled operation.
+
+        :rtype: str
+        """
+
+        return self._name
+
+    @property
+    def elapsedTime(self):
+        """
+        Getter method that returns the total wall time of the profiled operation.
+
+        :rtype: float
+        """
+
+        if self._startTime is None:
+
+            return 0.0
+
+        endTime = self._endTime if self._endTime is not None else time.perf_counter()
+        return endTime - self._startTime
+    # endregion
+
+    # region Methods
+    def start(self):
+        """
+        Starts the operation timer.
+
+        :rtype: None
+        """
+
+        self._startTime = time.perf_counter()
+        self._endTime = None
+
+    def stop(self):
+        """
+        Stops the operation timer.
+
+        :rtype: None
+        """
+
+        self._endTime = time.perf_counter()
+
+    def phase(self, name):
+        """
+        Returns a context manager that accumulates time spent in the supplied phase.
+
+        :type name: str
+        :rtype: ProfileTimer
+        """
+
+        timer = self._phases.get(name, None)
+
+        if timer is None:
+
+            timer = ProfileTimer(name)
+            self._phases[name] = timer
+
+        return timer
+
+    def item(self, name):
+        """
+        Returns a context manager that accumulates time spent on the supplied item, such as a control.
+
+        :type name: str
+        :rtype: ProfileTimer
+        """
+
+        timer = self._items.get(name, None)
+
+        if timer is None:
+
+            timer = ProfileTimer(name)
+            self._items[name] = timer
+
+        return timer
+
+    def count(self, name, amount=1):
+        """
+        Increments the supplied counter.
+
+        :type name: str
+        :type amount: int
+        :rtype: None
+        """
+
+        self._counters[name] = self._counters.get(name, 0) + amount
+
+    def asDict(self):
+        """
+        Returns the collected timings as a dictionary.
+
+        :rtype: Dict[str, Any]
+        """
+
+        return {
+            'name': self._name,
+            'elapsedTime': self.elapsedTime,
+            'phases': {name: timer.asDict() for (name, timer) in self._phases.items()},
+            'items': {name: timer.asDict() for (name, timer) in self._items.items()},
+            'counters': dict(self._counters)
+        }
+
+    def report(self):
+        """
+        Returns a human-readable report of the collected timings.
+
+        :rtype: str
+        """
+
+        lines = [f'{self._name}: {self.elapsedTime * 1000.0:.2f}ms']
+
+        for timer in sorted(self._phases.values(), key=lambda timer: timer.totalTime, reverse=True):
+
+            lines.append(f'    {timer.name}: {timer.totalTime * 1000.0:.2f}ms over {timer.calls} call(s)')
+
+        for (name, amount) in self._counters.items():
+
+            lines.append(f'    {name}: {amount}')
+
+        numItems = len(self._items)
+
+        if numItems > 0:
+
+            totalTime = sum(timer.totalTime for timer in self._items.values())
+            slowest = max(self._items.values(), key=lambda timer: timer.totalTime)
+
+            lines.append(f'    {numItems} item(s): {(totalTime / numItems) * 1000.0:.2f}ms average, {slowest.name} slowest at {slowest.totalTime * 1000.0:.2f}ms')
+
+        return '\n'.join(lines)
+
+    def log(self, level=logging.INFO):
+        """
+        Logs the collected timings.
+
+        :type level: int
+        :rtype: None
+        """
+
+        log.log(level, self.report())
+    # endregion
+
+
+class NullTimer(ProfileTimer):
+    """
+    Overload of `ProfileTimer` that discards all timings.
+    """
+
+    # region Dunderscores
+    __slots__ = ()
+
+    def __enter__(self):
+        """
+        Private method that is called when this instance is entered using a with statement.
+
+        :rtype: NullTimer
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Private method that is called when this instance is exited using a with statement.
+
+        :type exc_type: Any
+        :type exc_val: Any
+        :type exc_tb: Any
+        :rtype: None
+        """
+
+        pass
+    # endregion
+
+
+class NullProfiler(Profiler):
+    """
+    Overload of `Profiler` that discards all timings when profiling is disabled.
+    """
+
+    # region Dunderscores
+    __timer__ = NullTimer('null')
+    # endregion
+
+    # region Methods
+    def phase(self, name):
+        """
+        Returns a context manager that discards any time spent in the supplied phase.
+
+        :type name: str
+        :rtype: ProfileTimer
+        """
+
+        return self.__timer__
+
+    def item(self, name):
+        """
+        Returns a context manager that discards any time spent on the supplied item.
+
+        :type name: str
+        :rtype: ProfileTimer
+        """
+
+        return self.__timer__
+
+    def count(self, name, amount=1):
+        """
+        Discards the supplied counter.
+
+        :type name: str
+        :type amount: int
+        :rtype: None
+        """
+
+        pass
+
+    def asDict(self):
+        """
+        Returns an empty dictionary since no timings are collected.
+
+        :rtype: Dict[str, Any]
+        """
+
+        return {}
+
+    def log(self, level=logging.INFO):
+        """
+        Skips logging since no timings are collected.
+
+        :type level: int
+        :rtype: None
+        """
+
+        pass
+    # endregion
+
+
+def createProfiler(name):
+    """
+    Returns a new profiler for the supplied operation.
+    If profiling is disabled then a profiler that discards all timings is returned instead!
+
+    :type name: str
+    :rtype: Profiler
+    """
+
+    return Profiler(name) if isEnabled() else NullProfiler(name)
@@ -0,0 +1,217 @@
+from enum import IntEnum
+from maya import cmds as mc
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class WiringMode(IntEnum):
+    """
+    Enum class of all the available ways to wire noise onto controls.
+    STANDARD connects the pivots and rotate order of every control.
+    MINIMAL only connects what the requested components need when the control is referenced!
+    """
+
+    STANDARD = 0
+    MINIMAL = 1
+
+
+def getReferenceNodeName(node):
+    """
+    Returns the name of the reference node the supplied node is referenced from.
+    If the node is not referenced then none is returned!
+
+    :type node: mpynode.MPyNode
+    :rtype: Union[str, None]
+    """
+
+    if not node.isFromReferencedFile:
+
+        return None
+
+    referenceNode = node.getAssociatedReferenceNode()
+
+    if referenceNode is None:
+
+        return None
+
+    return referenceNode.name()
+
+
+def countEdits(referenceNodeName):
+    """
+    Returns the number of successful and failed edits stored on the supplied reference node.
+
+    :type referenceNodeName: str
+    :rtype: int
+    """
+
+    edits = mc.referenceQuery(referenceNodeName, editStrings=True, successfulEdits=True, failedEdits=True)
+    return len(edits) if edits is not None else 0
+
+
+def getEditTargets(node, composeTransform):
+    """
+    Returns the plug names of every edit made by wiring the supplied compose transform onto the control.
+    Names have to be collected before the compose transform is deleted!
+
+    :type node: mpynode.MPyNode
+    :type composeTransform: mpynode.MPyNode
+    :rtype: List[str]
+    """
+
+    plugNames = [f'{node.name()}.offsetParentMatrix']
+    plugNames.extend(f'{composeTransform.name()}.{attributeName}' for attributeName in ('inputRotatePivot', 'inputScalePivot', 'inputRotateOrder'))
+
+    return plugNames
+
+
+def removeEdits(targets):
+    """
+    Removes the edits on the supplied plug names, grouped by reference node name.
+    Each reference is only unloaded and reloaded once no matter how many plugs belong to it!
+    Returns the number of references that were cleaned up.
+
+    :type targets: Dict[str, List[str]]
+    :rtype: int
+    """
+
+    groups = {referenceNodeName: plugNames for (referenceNodeName, plugNames) in targets.items() if len(plugNames) > 0}
+
+    if len(groups) == 0:
+
+        return 0
+
+    # Preserve the active selection
+    # Unloading a reference drops its nodes from the selection!
+    #
+    selection = mc.ls(selection=True, long=True) or []
+
+    for (referenceNodeName, plugNames) in groups.items():
+
+        # Successful edits can only be removed from unloaded references
+        #
+        isLoaded = mc.referenceQuery(referenceNodeName, isLoaded=True)
+
+        if isLoaded:
+
+            mc.file(unloadReference=referenceNodeName)
+
+        try:
+
+            mc.referenceEdit(plugNames, removeEdits=True, successfulEdits=True, failedEdits=True)
+
+        finally:
+
+            if isLoaded:
+
+                mc.file(loadReference=referenceNodeName)
+
+        log.debug(f'Removed edits from {len(plugNames)} plug(s) on "{referenceNodeName}"')
+
+    selection = [name for name in selection if mc.objExists(name)]
+
+    if len(selection) > 0:
+
+        mc.select(selection, replace=True)
+
+    else:
+
+        mc.select(clear=True)
+
+    return len(groups)
+
+
+class EditReport(object):
+    """
+    Measures the reference edits added or removed by an operation.
+    """
+
+    # region Dunderscores
+    __slots__ = ('operation', 'before', 'after')
+
+    def __init__(self, operation=''):
+        """
+        Private method called after a new instance has been created.
+
+        :type operation: str
+        :rtype: None
+        """
+
+        self.operation = operation
+        self.before = {}
+        self.after = {}
+    # endregion
+
+    # region Properties
+    @property
+    def added(self):
+        """
+        Getter method that returns the number of edits added across every tracked reference.
+
+        :rtype: int
+        """
+
+        return sum(max(0, self.after.get(name, count) - count) for (name, count) in self.before.items())
+
+    @property
+    def removed(self):
+        """
+        Getter method that returns the number of edits removed across every tracked reference.
+
+        :rtype: int
+        """
+
+        return sum(max(0, count - self.after.get(name, count)) for (name, count) in self.before.items())
+    # endregion
+
+    # region Methods
+    def track(self, node):
+        """
+        Records the edit count of the reference the supplied node belongs to.
+        References are only counted the first time they are tracked!
+
+        :type node: mpynode.MPyNode
+        :rtype: None
+        """
+
+        referenceNodeName = getReferenceNodeName(node)
+
+        if referenceNodeName is not None and referenceNodeName not in self.before:
+
+            self.before[referenceNodeName] = countEdits(referenceNodeName)
+
+    def update(self):
+        """
+        Records the current edit count of every tracked reference.
+
+        :rtype: None
+        """
+
+        self.after = {name: countEdits(name) for name in self.before.keys()}
+
+    def asDict(self):
+        """
+        Returns the edit counts as a dictionary.
+
+        :rtype: Dict[str, Any]
+        """
+
+        return {
+            'operation': self.operation,
+            'added': self.added,
+            'removed': self.removed,
+            'references': {name: {'before': count, 'after': self.after.get(name, count)} for (name, count) in self.before.items()}
+        }
+
+    def report(self):
+        """
+        Returns a human-readable summary of the edit counts.
+
+        :rtype: str
+        """
+
+        return f'{self.operation} added {self.added} and removed {self.removed} reference edit(s) across {len(self.before)} reference(s)'
+    # endregion
@@ -0,0 +1,488 @@
+import os
+import json
+import time
+import bisect
+import functools
+import threading
+
+from collections import deque
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+ENVIRONMENT_VARIABLE = 'NOISEEDITOR_TRACE'
+MAX_EVENTS = 100000
+HISTOGRAM_SIZE = 1000
+HISTOGRAM_BUCKETS = (0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0, 128.0, 256.0)
+
+__enabled__ = os.environ.get(ENVIRONMENT_VARIABLE, '0').lower() in ('1', 'true', 'on')
+__events__ = deque(maxlen=MAX_EVENTS)
+__histograms__ = {}
+__local__ = threading.local()
+
+
+def isEnabled():
+    """
+    Evaluates if tracing is enabled.
+
+    :rtype: bool
+    """
+
+    return __enabled__
+
+
+def enable():
+    """
+    Enables tracing for any subsequent operations.
+
+    :rtype: None
+    """
+
+    global __enabled__
+    __enabled__ = True
+
+
+def disable():
+    """
+    Disables tracing for any subsequent operations.
+    Recorded spans and histograms are kept until they are cleared!
+
+    :rtype: None
+    """
+
+    global __enabled__
+    __enabled__ = False
+
+
+def getStack():
+    """
+    Returns the stack of open spans for the calling thread.
+
+    :rtype: List[Span]
+    """
+
+    stack = getattr(__local__, 'stack', None)
+
+    if stack is None:
+
+        stack = []
+        __local__.stack = stack
+
+    return stack
+
+
+class LatencyHistogram(object):
+    """
+    Keeps a rolling window of latencies, in seconds, and buckets them in milliseconds on demand.
+    Only the most recent samples are kept so the histogram reflects the current session!
+    """
+
+    # region Dunderscores
+    __slots__ = ('name', 'samples', 'total')
+
+    def __init__(self, name, size=HISTOGRAM_SIZE):
+        """
+        Private method called after a new instance has been created.
+
+        :type name: str
+        :type size: int
+        :rtype: None
+        """
+
+        self.name = name
+        self.samples = deque(maxlen=size)
+        self.total = 0
+
+    def __len__(self):
+        """
+        Private method that returns the number of samples in the rolling window.
+
+        :rtype: int
+        """
+
+        return len(self.samples)
+    # endregion
+
+    # region Methods
+    def record(self, latency):
+        """
+        Adds the supplied latency to the rolling window.
+
+        :type latency: float
+        :rtype: None
+        """
+
+        self.samples.append(latency)
+        self.total += 1
+
+    def percentile(self, percent):
+        """
+        Returns the latency, in seconds, below which the supplied percentage of samples fall.
+
+        :type percent: float
+        :rtype: float
+        """
+
+        if len(self.samples) == 0:
+
+            return 0.0
+
+        samples = sorted(self.samples)
+        index = min(len(samples) - 1, max(0, int(round((percent / 100.0) * len(samples))) - 1))
+
+        return samples[index]
+
+    def buckets(self):
+        """
+        Returns the number of samples that fall into each bucket.
+        Every bucket holds the samples up to its upper bound in milliseconds, the last bucket holds everything slower!
+
+        :rtype: List[Tuple[Union[float, None], int]]
+        """
+
+        counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+
+        for latency in self.samples:
+
+            counts[bisect.bisect_left(HISTOGRAM_BUCKETS, latency * 1000.0)] += 1
+
+        return list(zip(HISTOGRAM_BUCKETS + (None,), counts))
+
+    def clear(self):
+        """
+        Removes every sample from the rolling window.
+
+        :rtype: None
+        """
+
+        self.samples.clear()
+        self.total = 0
+
+    def asDict(self):
+        """
+        Returns the histogram as a dictionary.
+
+        :rtype: Dict[str, Any]
+        """
+
+        numSamples = len(self.samples)
+
+        return {
+            'name': self.name,
+            'samples': numSamples,
+            'total': self.total,
+            'averageTime': (sum(self.samples) / numSamples) if numSamples > 0 else 0.0,
+            'p50': self.percentile(50.0),
+            'p90': self.percentile(90.0),
+            'p99': self.percentile(99.0),
+            'maxTime': max(self.samples, default=0.0),
+            'buckets': {(f'<={bound:g}ms' if bound is not None else f'>{HISTOGRAM_BUCKETS[-1]:g}ms'): count for (bound, count) in self.buckets()}
+        }
+
+    def report(self, width=40):
+        """
+        Returns a human-readable histogram of the rolling window.
+
+        :type width: int
+        :rtype: str
+        """
+
+        summary = self.asDict()
+        lines = [f'{self.name}: {summary["samples"]} sample(s), p50 {summary["p50"] * 1000.0:.2f}ms, p90 {summary["p90"] * 1000.0:.2f}ms, p99 {summary["p99"] * 1000.0:.2f}ms, max {summary["maxTime"] * 1000.0:.2f}ms']
+
+        maxCount = max(summary['buckets'].values(), default=0)
+
+        for (label, count) in summary['buckets'].items():
+
+            bar = '#' * (int(round((count / maxCount) * width)) if maxCount > 0 else 0)
+            lines.append(f'    {label:>9} | {bar} {count}')
+
+        return '\n'.join(lines)
+    # endregion
+
+
+def getHistogram(name):
+    """
+    Returns the latency histogram for the supplied span name, creating it if it does not exist.
+
+    :type name: str
+    :rtype: LatencyHistogram
+    """
+
+    histogram = __histograms__.get(name, None)
+
+    if histogram is None:
+
+        histogram = LatencyHistogram(name)
+        __histograms__[name] = histogram
+
+    return histogram
+
+
+class Span(object):
+    """
+    Context manager that records a complete trace event with its arguments, such as node counts.
+    """
+
+    # region Dunderscores
+    __slots__ = ('name', 'category', 'args', 'latency', '_startTime')
+
+    def __init__(self, name, category='', latency=False, **kwargs):
+        """
+        Private method called after a new instance has been created.
+
+        :type name: str
+        :type category: str
+        :type latency: bool
+        :rtype: None
+        """
+
+        self.name = name
+        self.category = category
+        self.args = kwargs
+        self.latency = latency
+        self._startTime = 0.0
+
+    def __enter__(self):
+        """
+        Private method that is called when this instance is entered using a with statement.
+
+        :rtype: Span
+        """
+
+        getStack().append(self)
+        self._startTime = time.perf_counter()
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Private method that is called when this instance is exited using a with statement.
+
+        :type exc_type: Any
+        :type exc_val: Any
+        :type exc_tb: Any
+        :rtype: None
+        """
+
+        endTime = time.perf_counter()
+        elapsedTime = endTime - self._startTime
+
+        stack = getStack()
+
+        if len(stack) > 0 and stack[-1] is self:
+
+            stack.pop()
+
+        if exc_type is not None:
+
+            self.args['error'] = exc_type.__name__
+
+        __events__.append(
+            {
+                'name': self.name,
+                'cat': self.category,
+                'ph': 'X',
+                'ts': self._startTime * 1e6,
+                'dur': elapsedTime * 1e6,
+                'pid': os.getpid(),
+                'tid': threading.get_ident(),
+                'args': self.args
+            }
+        )
+
+        if self.latency:
+
+            getHistogram(self.name).record(elapsedTime)
+    # endregion
+
+    # region Methods
+    def count(self, name, amount=1):
+        """
+        Increments the supplied counter on this span.
+
+        :type name: str
+        :type amount: int
+        :rtype: None
+        """
+
+        self.args[name] = self.args.get(name, 0) + amount
+    # endregion
+
+
+class NullSpan(Span):
+    """
+    Overload of `Span` that discards everything when tracing is disabled.
+    """
+
+    # region Dunderscores
+    __slots__ = ()
+
+    def __enter__(self):
+        """
+        Private method that is called when this instance is entered using a with statement.
+
+        :rtype: NullSpan
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Private method that is called when this instance is exited using a with statement.
+
+        :type exc_type: Any
+        :type exc_val: Any
+        :type exc_tb: Any
+        :rtype: None
+        """
+
+        pass
+    # endregion
+
+    # region Methods
+    def count(self, name, amount=1):
+        """
+        Discards the supplied counter.
+
+        :type name: str
+        :type amount: int
+        :rtype: None
+        """
+
+        pass
+    # endregion
+
+
+__null_span__ = NullSpan('null')
+
+
+def span(name, category='', latency=False, **kwargs):
+    """
+    Returns a context manager that records a span for the supplied operation.
+    If latency is enabled then every span with this name is also recorded in a rolling histogram.
+    If tracing is disabled then a span that discards everything is returned instead!
+
+    :type name: str
+    :type category: str
+    :type latency: bool
+    :rtype: Span
+    """
+
+    return Span(name, category=category, latency=latency, **kwargs) if __enabled__ else __null_span__
+
+
+def count(name, amount=1):
+    """
+    Increments the supplied counter on the innermost open span.
+    Nothing happens if tracing is disabled or no span is open!
+
+    :type name: str
+    :type amount: int
+    :rtype: None
+    """
+
+    if not __enabled__:
+
+        return
+
+    stack = getStack()
+
+    if len(stack) > 0:
+
+        stack[-1].count(name, amount=amount)
+
+
+def traced(name=None, category='', latency=False):
+    """
+    Returns a decorator that records a span around every call to the decorated function.
+    Tracing is checked on each call so it can be toggled without reloading any modules!
+
+    :type name: Union[str, None]
+    :type category: str
+    :type latency: bool
+    :rtype: Callable
+    """
+
+    def decorator(func):
+
+        spanName = name if name is not None else func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+
+            if not __enabled__:
+
+                return func(*args, **kwargs)
+
+            with Span(spanName, category=category, latency=latency):
+
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def getEvents():
+    """
+    Returns a copy of the recorded trace events.
+
+    :rtype: List[Dict[str, Any]]
+    """
+
+    return list(__events__)
+
+
+def exportTrace(path):
+    """
+    Writes the recorded spans to the supplied path as Chrome trace-event JSON.
+    The file can be opened from `chrome://tracing` or any profiler that reads the trace-event format!
+
+    :type path: str
+    :rtype: str
+    """
+
+    directory = os.path.dirname(os.path.abspath(path))
+
+    if not os.path.isdir(directory):
+
+        os.makedirs(directory)
+
+    events = [{'name': 'process_name', 'ph': 'M', 'pid': os.getpid(), 'tid': 0, 'args': {'name': 'Noise Editor'}}]
+    events.extend(__events__)
+
+    with open(path, 'w') as jsonFile:
+
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, jsonFile, default=str)
+
+    log.info(f'Exported {len(events) - 1} trace event(s) to: {path}')
+    return path
+
+
+def dumpHistograms(level=logging.INFO):
+    """
+    Logs and returns every latency histogram.
+
+    :type level: int
+    :rtype: str
+    """
+
+    report = '\n'.join(histogram.report() for histogram in __histograms__.values()) or 'No latencies have been recorded!'
+    log.log(level, report)
+
+    return report
+
+
+def clear():
+    """
+    Removes every recorded trace event and latency histogram.
+
+    :rtype: None
+    """
+
+    __events__.clear()
+    __histograms__.clear()
@@ -0,0 +1,1080 @@
+import sys
+import types
+import functools
+
+from array import array
+from collections import deque
+from maya import cmds as mc
+from maya.api import OpenMaya as om
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+COMMAND_NAME = 'noiseEditorDiff'
+REGISTRY_NAME = 'noiseeditor_undoregistry'
+VALUE_DOUBLE = 0
+VALUE_INT = 1
+VALUE_BOOL = 2
+VALUE_OBJECT = 3
+TANGENTS_LOCKED = 1
+WEIGHTS_LOCKED = 2
+BREAKDOWN = 4
+
+
+def maya_useNewAPI():
+    """
+    The presence of this function tells Maya that the plugin produces, and expects to be passed, objects created using the Maya Python API 2.0.
+
+    :rtype: None
+    """
+
+    pass
+
+
+def getRegistry():
+    """
+    Returns the registry of diffs waiting to be picked up by the diff command.
+    Maya imports plug-ins as standalone modules so the registry cannot live on either copy of this module!
+
+    :rtype: types.ModuleType
+    """
+
+    registry = sys.modules.get(REGISTRY_NAME, None)
+
+    if registry is None:
+
+        registry = types.ModuleType(REGISTRY_NAME)
+        registry.pending = deque()
+        registry.active = []
+
+        sys.modules[REGISTRY_NAME] = registry
+
+    return registry
+
+
+def getActiveDiff():
+    """
+    Returns the diff that is currently being recorded.
+    If nothing is being recorded then none is returned!
+
+    :rtype: Union[NoiseDiff, None]
+    """
+
+    active = getRegistry().active
+    return active[-1] if len(active) > 0 else None
+
+
+def isCommandLoaded():
+    """
+    Evaluates if the diff command has been registered.
+
+    :rtype: bool
+    """
+
+    return bool(mc.pluginInfo(__file__, query=True, loaded=True))
+
+
+def loadCommand():
+    """
+    Registers the diff command by loading this module as a plug-in.
+    This is why this module may only import from maya and the standard library!
+
+    :rtype: bool
+    """
+
+    if isCommandLoaded():
+
+        return True
+
+    try:
+
+        mc.loadPlugin(__file__, quiet=True)
+        return isCommandLoaded()
+
+    except RuntimeError as exception:
+
+        log.warning(f'Unable to load undo plug-in: {exception}')
+        return False
+
+
+def getKeys(animCurve, timeRange=None):
+    """
+    Returns a lossless snapshot of the keys on the supplied anim curve.
+    Every key keeps its time, value, tangent types, tangent angles and weights, tangent and weight locks and breakdown state!
+    If a time range is supplied then only the keys inside it are captured.
+
+    :type animCurve: om.MObject
+    :type timeRange: Union[Tuple[float, float], None]
+    :rtype: Tuple[array, ...]
+    """
+
+    # Initialize snapshot arrays
+    #
+    times, values = array('d'), array('d')
+    inTypes, outTypes = array('B'), array('B')
+    inAngles, inWeights, outAngles, outWeights = array('d'), array('d'), array('d'), array('d')
+    flags = array('B')
+
+    # Iterate through keys
+    #
+    fnCurve = om.MFnAnimCurve(animCurve)
+    uiUnit = om.MTime.uiUnit()
+
+    for i in range(fnCurve.numKeys):
+
+        time = fnCurve.input(i).asUnits(uiUnit)
+
+        if timeRange is not None and not (timeRange[0] <= time <= timeRange[1]):
+
+            continue
+
+        inAngle, inWeight = fnCurve.getTangentAngleWeight(i, True)
+        outAngle, outWeight = fnCurve.getTangentAngleWeight(i, False)
+
+        times.append(time)
+        values.append(fnCurve.value(i))
+        inTypes.append(fnCurve.inTangentType(i))
+        outTypes.append(fnCurve.outTangentType(i))
+        inAngles.append(inAngle.asRadians())
+        inWeights.append(inWeight)
+        outAngles.append(outAngle.asRadians())
+        outWeights.append(outWeight)
+        flags.append((TANGENTS_LOCKED * fnCurve.tangentsLocked(i)) | (WEIGHTS_LOCKED * fnCurve.weightsLocked(i)) | (BREAKDOWN * fnCurve.isBreakdown(i)))
+
+    return times, values, inTypes, outTypes, inAngles, inWeights, outAngles, outWeights, flags
+
+
+def setKeys(animCurve, keys, timeRange=None):
+    """
+    Replaces the keys on the supplied anim curve with a snapshot from `getKeys`.
+    If a time range is supplied then only the keys inside it are replaced, otherwise every key is!
+    Keys are written through the function set so the clipboard is left untouched.
+
+    :type animCurve: om.MObject
+    :type keys: Tuple[array, ...]
+    :type timeRange: Union[Tuple[float, float], None]
+    :rtype: None
+    """
+
+    # Remove existing keys
+    #
+    fnCurve = om.MFnAnimCurve(animCurve)
+    uiUnit = om.MTime.uiUnit()
+
+    for i in reversed(range(fnCurve.numKeys)):
+
+        time = fnCurve.input(i).asUnits(uiUnit)
+
+        if timeRange is None or (timeRange[0] <= time <= timeRange[1]):
+
+            fnCurve.remove(i)
+
+    # Add snapshot keys
+    # Locks are released while the angles are set, fixed angles are then re-typed to their original tangents!
+    #
+    isWeighted = fnCurve.isWeighted
+
+    for (time, value, inType, outType, inAngle, inWeight, outAngle, outWeight, flag) in zip(*keys):
+
+        index = fnCurve.addKey(om.MTime(time, unit=uiUnit), value, tangentInType=inType, tangentOutType=outType)
+
+        fnCurve.setTangentsLocked(index, False)
+        fnCurve.setWeightsLocked(index, False)
+        fnCurve.setAngle(index, om.MAngle(inAngle), True)
+        fnCurve.setAngle(index, om.MAngle(outAngle), False)
+
+        if isWeighted:
+
+            fnCurve.setWeight(index, inWeight, True)
+            fnCurve.setWeight(index, outWeight, False)
+
+        fnCurve.setInTangentType(index, inType)
+        fnCurve.setOutTangentType(index, outType)
+        fnCurve.setTangentsLocked(index, bool(flag & TANGENTS_LOCKED))
+        fnCurve.setWeightsLocked(index, bool(flag & WEIGHTS_LOCKED))
+        fnCurve.setIsBreakdown(index, bool(flag & BREAKDOWN))
+
+
+class NoiseDiff(object):
+    """
+    Compact record of the plug values, connections, anim curve keys and nodes changed by a bulk noise operation.
+    Numeric values are stored in flat arrays and replayed through a single modifier per undo or redo!
+    """
+
+    # region Dunderscores
+    def __init__(self, name=''):
+        """
+        Private method called after a new instance has been created.
+
+        :type name: str
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(NoiseDiff, self).__init__()
+
+        # Declare private variables
+        #
+        self._name = name
+        self._plugs = []
+        self._nodes = []
+        self._attributeNames = []
+        self._types = array('B')
+        self._oldValues = array('d')
+        self._newValues = array('d')
+        self._oldObjects = []
+        self._newObjects = []
+        self._oldSnapshots = []
+        self._touched = set()
+        self._curves = []
+        self._curveHashes = set()
+        self._oldKeys = []
+        self._newKeys = []
+        self._connections = []
+        self._rewired = set()
+        self._connectionModifier = None
+        self._createdNodes = []
+        self._createdHashes = set()
+        self._createdModifier = None
+        self._deletedModifier = om.MDGModifier()
+        self._numDeleted = 0
+        self._isCommitted = False
+
+    def __len__(self):
+        """
+        Private method that returns the number of changes inside this diff.
+
+        :rtype: int
+        """
+
+        return len(self._plugs) + len(self._curves) + len(self._connections) + len(self._createdNodes) + self._numDeleted
+    # endregion
+
+    # region Properties
+    @property
+    def name(self):
+        """
+        Getter method that returns the name of the operation this diff was recorded from.
+
+        :rtype: str
+        """
+
+        return self._name
+
+    @property
+    def isEmpty(self):
+        """
+        Getter method that evaluates if this diff has no changes.
+
+        :rtype: bool
+        """
+
+        return len(self) == 0
+    # endregion
+
+    # region Methods
+    @staticmethod
+    def getValueType(value):
+        """
+        Returns the storage type for the supplied plug value.
+
+        :type value: Any
+        :rtype: int
+        """
+
+        if isinstance(value, bool):
+
+            return VALUE_BOOL
+
+        elif isinstance(value, int):
+
+            return VALUE_INT
+
+        elif isinstance(value, float):
+
+            return VALUE_DOUBLE
+
+        else:
+
+            return VALUE_OBJECT
+
+    @staticmethod
+    def getPlugValue(plug, valueType):
+        """
+        Returns the value of the supplied plug for the specified storage type.
+        Doubles are read in internal units to match the modifier that writes them back!
+
+        :type plug: om.MPlug
+        :type valueType: int
+        :rtype: Union[float, int, bool]
+        """
+
+        if valueType == VALUE_BOOL:
+
+            return plug.asBool()
+
+        elif valueType == VALUE_INT:
+
+            return plug.asInt()
+
+        else:
+
+            return plug.asDouble()
+
+    def touch(self, node, attributeName):
+        """
+        Captures the current value of the supplied attribute before it is changed.
+        Compound attributes are captured per child and only the first touch of a plug is kept!
+
+        :type node: mpynode.MPyNode
+        :type attributeName: str
+        :rtype: None
+        """
+
+        plug = node[attributeName]
+
+        if plug.numChildren() > 0:
+
+            for i in range(plug.numChildren()):
+
+                child = plug.child(i)
+                self.touch(node, child.partialName(useLongNames=True))
+
+            return
+
+        # Check if plug has already been captured
+        #
+        key = (om.MObjectHandle(node.object()).hashCode(), attributeName)
+
+        if key in self._touched:
+
+            return
+
+        self._touched.add(key)
+
+        # Capture old value
+        #
+        value = node.getAttr(attributeName)
+        valueType = self.getValueType(value)
+
+        self._plugs.append(plug)
+        self._nodes.append(om.MObjectHandle(node.object()))
+        self._attributeNames.append(attributeName)
+        self._types.append(valueType)
+
+        if valueType == VALUE_OBJECT:
+
+            self._oldValues.append(len(self._oldObjects))
+            self._oldObjects.append(plug.asMObject())
+            self._oldSnapshots.append(value)
+
+        else:
+
+            self._oldValues.append(self.getPlugValue(plug, valueType))
+
+    def touchConnection(self, node, attributeName):
+        """
+        Captures the current source of the supplied attribute before it is rewired.
+        Compound attributes are captured per child and only the first touch of a plug is kept!
+
+        :type node: mpynode.MPyNode
+        :type attributeName: str
+        :rtype: None
+        """
+
+        plug = node[attributeName]
+
+        if plug.numChildren() > 0:
+
+            for i in range(plug.numChildren()):
+
+                child = plug.child(i)
+                self.touchConnection(node, child.partialName(useLongNames=True))
+
+            return
+
+        # Check if plug has already been captured
+        #
+        key = (om.MObjectHandle(node.object()).hashCode(), attributeName)
+
+        if key in self._rewired:
+
+            return
+
+        self._rewired.add(key)
+        self._connections.append((plug, plug.source()))
+
+    def touchCurve(self, curve):
+        """
+        Captures the current keys of the supplied anim curve before it is changed.
+        Curves created during this diff are skipped since undo deletes them anyway!
+
+        :type curve: mpynode.MPyNode
+        :rtype: None
+        """
+
+        handle = om.MObjectHandle(curve.object())
+        hashCode = handle.hashCode()
+
+        if hashCode in self._createdHashes or hashCode in self._curveHashes:
+
+            return
+
+        self._curves.append(handle)
+        self._curveHashes.add(hashCode)
+        self._oldKeys.append(self.getKeys(handle))
+
+    def nodeAdded(self, node):
+        """
+        Records a node that was created during this diff.
+
+        :type node: om.MObject
+        :rtype: None
+        """
+
+        handle = om.MObjectHandle(node)
+
+        self._createdNodes.append(handle)
+        self._createdHashes.add(handle.hashCode())
+
+    def deleteNode(self, node):
+        """
+        Deletes the supplied node through a modifier so it can be restored on undo.
+
+        :type node: mpynode.MPyNode
+        :rtype: None
+        """
+
+        self._deletedModifier.deleteNode(node.object())
+        self._deletedModifier.doIt()
+
+        self._numDeleted += 1
+
+    @staticmethod
+    def isSamePlug(plug, otherPlug):
+        """
+        Evaluates if the supplied plugs are the same, null plugs are only equal to other null plugs.
+
+        :type plug: om.MPlug
+        :type otherPlug: om.MPlug
+        :rtype: bool
+        """
+
+        if plug.isNull or otherPlug.isNull:
+
+            return plug.isNull and otherPlug.isNull
+
+        return plug == otherPlug
+
+    @staticmethod
+    def getKeys(handle):
+        """
+        Returns a lossless snapshot of the supplied anim curve.
+        Besides every key's tangents the snapshot keeps the weighted state and the pre and post infinity types!
+
+        :type handle: om.MObjectHandle
+        :rtype: Tuple[bool, int, int, Tuple[array, ...]]
+        """
+
+        curve = handle.object()
+        fnCurve = om.MFnAnimCurve(curve)
+
+        return fnCurve.isWeighted, fnCurve.preInfinityType, fnCurve.postInfinityType, getKeys(curve)
+
+    @staticmethod
+    def setKeys(handle, snapshot):
+        """
+        Replaces the keys on the supplied anim curve with a snapshot from `getKeys`.
+
+        :type handle: om.MObjectHandle
+        :type snapshot: Tuple[bool, int, int, Tuple[array, ...]]
+        :rtype: None
+        """
+
+        if not handle.isAlive():
+
+            return
+
+        # Restore curve state before any keys
+        # Tangent weights are only kept by weighted curves!
+        #
+        isWeighted, preInfinityType, postInfinityType, keys = snapshot
+
+        curve = handle.object()
+        fnCurve = om.MFnAnimCurve(curve)
+
+        fnCurve.setIsWeighted(isWeighted)
+        fnCurve.setPreInfinityType(preInfinityType)
+        fnCurve.setPostInfinityType(postInfinityType)
+
+        setKeys(curve, keys)
+
+    def commit(self):
+        """
+        Captures the new values and keys once the operation has finished.
+        Plugs on deleted nodes and values that did not change are dropped to keep the diff small!
+
+        :rtype: None
+        """
+
+        if self._isCommitted:
+
+            return
+
+        # Capture new plug values
+        #
+        keep = []
+
+        for (i, (plug, handle, attributeName, valueType)) in enumerate(zip(self._plugs, self._nodes, self._attributeNames, self._types)):
+
+            if not handle.isAlive():
+
+                continue
+
+            if valueType == VALUE_OBJECT:
+
+                newValue = mpyNode(handle).getAttr(attributeName)
+                oldValue = self._oldSnapshots[int(self._oldValues[i])]
+
+                if newValue == oldValue:
+
+                    continue
+
+                self._newValues.append(len(self._newObjects))
+                self._newObjects.append(plug.asMObject())
+
+            else:
+
+                newValue = self.getPlugValue(plug, valueType)
+
+                if newValue == self._oldValues[i]:
+
+                    continue
+
+                self._newValues.append(newValue)
+
+            keep.append(i)
+
+        self._plugs = [self._plugs[i] for i in keep]
+        self._nodes = [self._nodes[i] for i in keep]
+        self._attributeNames = [self._attributeNames[i] for i in keep]
+        self._types = array('B', (self._types[i] for i in keep))
+        self._oldValues = array('d', (self._oldValues[i] for i in keep))
+        self._oldSnapshots.clear()
+        self._touched.clear()
+
+        # Drop connections that were not rewired
+        #
+        self._connections = [(plug, source) for (plug, source) in self._connections if not self.isSamePlug(plug.source(), source)]
+        self._rewired.clear()
+
+        # Capture new keys
+        #
+        self._newKeys = [self.getKeys(handle) if handle.isAlive() else None for handle in self._curves]
+
+        # Drop nodes that were created and deleted within this diff
+        #
+        self._createdNodes = [handle for handle in self._createdNodes if handle.isAlive()]
+        self._isCommitted = True
+
+    def applyValues(self, values, objects):
+        """
+        Writes the supplied values onto the captured plugs in one batch.
+        Data values, such as matrices, are written back as the data objects that were copied from their plugs.
+        Plugs driven by a connection are skipped!
+
+        :type values: array
+        :type objects: List[om.MObject]
+        :rtype: None
+        """
+
+        modifier = om.MDGModifier()
+
+        for (plug, handle, valueType, value) in zip(self._plugs, self._nodes, self._types, values):
+
+            if not handle.isAlive() or plug.isDestination:
+
+                continue
+
+            if valueType == VALUE_BOOL:
+
+                modifier.newPlugValueBool(plug, bool(value))
+
+            elif valueType == VALUE_INT:
+
+                modifier.newPlugValueInt(plug, int(value))
+
+            elif valueType == VALUE_DOUBLE:
+
+                modifier.newPlugValueDouble(plug, value)
+
+            else:
+
+                modifier.newPlugValue(plug, objects[int(value)])
+
+        modifier.doIt()
+
+    def undo(self):
+        """
+        Reverts this diff.
+
+        :rtype: None
+        """
+
+        # Delete created nodes
+        # The modifier is kept so redo can restore the exact same nodes!
+        #
+        if self._createdModifier is None:
+
+            self._createdModifier = om.MDGModifier()
+
+            for handle in self._createdNodes:
+
+                if handle.isAlive():
+
+                    self._createdModifier.deleteNode(handle.object())
+
+        self._createdModifier.doIt()
+
+        # Restore previous connections
+        # Any remaining sources are only known once the created nodes are gone!
+        #
+        if self._connectionModifier is None:
+
+            self._connectionModifier = om.MDGModifier()
+
+            for (plug, source) in self._connections:
+
+                currentSource = plug.source()
+
+                if self.isSamePlug(currentSource, source):
+
+                    continue
+
+                if not currentSource.isNull:
+
+                    self._connectionModifier.disconnect(currentSource, plug)
+
+                if not source.isNull:
+
+                    self._connectionModifier.connect(source, plug)
+
+        self._connectionModifier.doIt()
+
+        # Restore deleted nodes, plug values and keys
+        #
+        if self._numDeleted > 0:
+
+            self._deletedModifier.undoIt()
+
+        self.applyValues(self._oldValues, self._oldObjects)
+
+        for (handle, keys) in zip(self._curves, self._oldKeys):
+
+            self.setKeys(handle, keys)
+
+    def redo(self):
+        """
+        Reapplies this diff.
+
+        :rtype: None
+        """
+
+        if self._numDeleted > 0:
+
+            self._deletedModifier.doIt()
+
+        if self._connectionModifier is not None:
+
+            self._connectionModifier.undoIt()
+
+        if self._createdModifier is not None:
+
+            self._createdModifier.undoIt()
+
+        self.applyValues(self._newValues, self._newObjects)
+
+        for (handle, keys) in zip(self._curves, self._newKeys):
+
+            if keys is not None:
+
+                self.setKeys(handle, keys)
+    # endregion
+
+
+def mpyNode(handle):
+    """
+    Returns an mpy node from the supplied handle.
+    The import is deferred since mpy is unavailable while Maya loads this module as a plug-in!
+
+    :type handle: om.MObjectHandle
+    :rtype: mpynode.MPyNode
+    """
+
+    from mpy import mpynode
+    return mpynode.MPyNode(handle.object())
+
+
+def touch(node, attributeName):
+    """
+    Captures the supplied attribute on the active diff, if any.
+
+    :type node: mpynode.MPyNode
+    :type attributeName: str
+    :rtype: None
+    """
+
+    diff = getActiveDiff()
+
+    if diff is not None:
+
+        diff.touch(node, attributeName)
+
+
+def touchConnection(node, attributeName):
+    """
+    Captures the source of the supplied attribute on the active diff, if any.
+
+    :type node: mpynode.MPyNode
+    :type attributeName: str
+    :rtype: None
+    """
+
+    diff = getActiveDiff()
+
+    if diff is not None:
+
+        diff.touchConnection(node, attributeName)
+
+
+def touchCurve(curve):
+    """
+    Captures the keys from the supplied anim curve on the active diff, if any.
+
+    :type curve: mpynode.MPyNode
+    :rtype: None
+    """
+
+    diff = getActiveDiff()
+
+    if diff is not None:
+
+        diff.touchCurve(curve)
+
+
+def setAttr(node, attributeName, value):
+    """
+    Updates the supplied attribute and captures its previous value on the active diff.
+
+    :type node: mpynode.MPyNode
+    :type attributeName: str
+    :type value: Any
+    :rtype: None
+    """
+
+    touch(node, attributeName)
+    node.setAttr(attributeName, value)
+
+
+def resetAttr(node, attributeName):
+    """
+    Resets the supplied attribute and captures its previous value on the active diff.
+
+    :type node: mpynode.MPyNode
+    :type attributeName: str
+    :rtype: None
+    """
+
+    touch(node, attributeName)
+    node.resetAttr(attributeName)
+
+
+def deleteNode(node):
+    """
+    Deletes the supplied node, through the active diff if one is being recorded.
+
+    :type node: mpynode.MPyNode
+    :rtype: None
+    """
+
+    diff = getActiveDiff()
+
+    if diff is not None:
+
+        diff.deleteNode(node)
+
+    else:
+
+        node.delete()
+
+
+def pushDiff(diff):
+    """
+    Commits the supplied diff and pushes it onto Maya's undo queue as a single step.
+    Empty diffs, and diffs recorded while undo is disabled, are committed without being pushed!
+
+    :type diff: NoiseDiff
+    :rtype: bool
+    """
+
+    diff.commit()
+
+    if diff.isEmpty or not mc.undoInfo(query=True, stateWithoutFlush=True):
+
+        return False
+
+    if not loadCommand():
+
+        log.warning(f'Unable to undo "{diff.name}" without the "{COMMAND_NAME}" command!')
+        return False
+
+    getRegistry().pending.append(diff)
+    getattr(mc, COMMAND_NAME)(diff.name)
+
+    return True
+
+
+class Diff(object):
+    """
+    Context manager and decorator that records a bulk noise operation as a single undoable diff.
+    Maya's own undo queue is suspended while recording so thousands of edits never reach it one by one!
+    An existing diff can be supplied to record an operation that spans several calls, such as a time-sliced bake, it's then up to the caller to push it.
+    """
+
+    # region Dunderscores
+    def __init__(self, name='', diff=None):
+        """
+        Private method called after a new instance has been created.
+
+        :type name: str
+        :type diff: Union[NoiseDiff, None]
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(Diff, self).__init__()
+
+        # Declare private variables
+        #
+        self._name = name
+        self._resumeDiff = diff
+        self._diff = None
+        self._callbackId = None
+        self._undoState = True
+
+    def __enter__(self):
+        """
+        Private method that is called when this instance is entered using a with statement.
+
+        :rtype: NoiseDiff
+        """
+
+        # Check if a diff is already being recorded
+        # Nested operations are merged into the outermost diff!
+        #
+        registry = getRegistry()
+
+        if len(registry.active) > 0:
+
+            self._diff = None
+            return registry.active[-1]
+
+        # Start recording
+        #
+        self._diff = self._resumeDiff if self._resumeDiff is not None else NoiseDiff(name=self._name)
+        registry.active.append(self._diff)
+
+        self._callbackId = om.MDGMessage.addNodeAddedCallback(self.nodeAdded, 'dependNode')
+        self._undoState = mc.undoInfo(query=True, stateWithoutFlush=True)
+
+        mc.undoInfo(stateWithoutFlush=False)
+
+        return self._diff
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Private method that is called when this instance is exited using a with statement.
+
+        :type exc_type: Any
+        :type exc_val: Any
+        :type exc_tb: Any
+        :rtype: None
+        """
+
+        # Check if this is the outermost recording
+        #
+        if self._diff is None:
+
+            return
+
+        diff, self._diff = self._diff, None
+
+        om.MMessage.removeCallback(self._callbackId)
+        self._callbackId = None
+
+        getRegistry().active.remove(diff)
+        mc.undoInfo(stateWithoutFlush=self._undoState)
+
+        # Check if recording was resumed
+        # Resumed diffs are pushed by their owner once the whole operation has finished!
+        #
+        if diff is self._resumeDiff:
+
+            return
+
+        # Push diff onto the undo queue
+        # Partial operations are still pushed so whatever did change can be undone!
+        #
+        pushDiff(diff)
+
+    def __call__(self, func):
+        """
+        Private method that is called when this instance is used as a decorator.
+
+        :type func: Callable
+        :rtype: Callable
+        """
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+
+            with self:
+
+                return func(*args, **kwargs)
+
+        return wrapper
+    # endregion
+
+    # region Callbacks
+    def nodeAdded(self, node, clientData=None):
+        """
+        Callback method for any nodes created while recording.
+
+        :type node: om.MObject
+        :type clientData: Any
+        :rtype: None
+        """
+
+        if self._diff is not None:
+
+            self._diff.nodeAdded(node)
+    # endregion
+
+
+class DiffCommand(om.MPxCommand):
+    """
+    Overload of `MPxCommand` that replays a recorded noise diff on undo and redo.
+    """
+
+    # region Dunderscores
+    def __init__(self):
+        """
+        Private method called after a new instance has been created.
+
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(DiffCommand, self).__init__()
+
+        # Declare private variables
+        #
+        self._diff = None
+    # endregion
+
+    # region Methods
+    @classmethod
+    def creator(cls):
+        """
+        Returns a new instance of this command.
+
+        :rtype: DiffCommand
+        """
+
+        return cls()
+
+    @classmethod
+    def syntax(cls):
+        """
+        Returns the syntax of this command.
+
+        :rtype: om.MSyntax
+        """
+
+        syntax = om.MSyntax()
+        syntax.addArg(om.MSyntax.kString)
+
+        return syntax
+
+    def isUndoable(self):
+        """
+        Evaluates if this command can be undone.
+
+        :rtype: bool
+        """
+
+        return self._diff is not None
+
+    def doIt(self, args):
+        """
+        Claims the most recently recorded diff.
+        The diff has already been applied so there is nothing else to do!
+
+        :type args: om.MArgList
+        :rtype: None
+        """
+
+        pending = getRegistry().pending
+
+        if len(pending) > 0:
+
+            self._diff = pending.pop()
+
+    def undoIt(self):
+        """
+        Reverts the claimed diff.
+
+        :rtype: None
+        """
+
+        self._diff.undo()
+
+    def redoIt(self):
+        """
+        Reapplies the claimed diff.
+
+        :rtype: None
+        """
+
+        self._diff.redo()
+    # endregion
+
+
+def initializePlugin(plugin):
+    """
+    Initializes the diff command plug-in.
+
+    :type plugin: om.MObject
+    :rtype: None
+    """
+
+    fnPlugin = om.MFnPlugin(plugin, 'noiseeditor', '1.0')
+    fnPlugin.registerCommand(COMMAND_NAME, DiffCommand.creator, DiffCommand.syntax)
+
+
+def uninitializePlugin(plugin):
+    """
+    Uninitializes the diff command plug-in.
+
+    :type plugin: om.MObject
+    :rtype: None
+    """
+
+    fnPlugin = om.MFnPlugin(plugin)
+    fnPlugin.deregisterCommand(COMMAND_NAME)
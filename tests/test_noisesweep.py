@@ -0,0 +1,155 @@
+import os
+import sys
+import time
+import unittest
+
+from benchmarks import mockmaya, referencenoise
+
+try:
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    mockmaya.install()
+
+except ImportError:
+
+    mockmaya = None
+
+
+@unittest.skipIf(mockmaya is None, 'The sweep requires a Qt binding!')
+class TestNoiseSweep(unittest.TestCase):
+    """
+    Tests that the sweep samples each row of thumbnails with a single `shake` call, and measures it against sampling every cell.
+    """
+
+    # region Dunderscores
+    __seed__ = 7
+    __frequencies__ = (0.05, 0.1, 0.2, 0.3, 0.5, 0.7, 0.85, 1.0)
+    __roughnesses__ = (0.0, 0.15, 0.3, 0.45, 0.6, 0.75, 0.9, 1.0)
+    __duration__ = 120.0
+    __tolerance__ = 0.05
+    # endregion
+
+    # region Methods
+    @classmethod
+    def setUpClass(cls):
+        """
+        Loads the package and creates the application shared by each test.
+
+        :rtype: None
+        """
+
+        from dcc.vendor.Qt import QtWidgets
+
+        cls.application = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+
+        mockmaya.loadPackage()
+        from noiseeditor.libs import noiseutils
+        from noiseeditor.ui.widgets import qnoisesweep
+
+        cls.noiseutils = noiseutils
+        cls.qnoisesweep = qnoisesweep
+
+    def setUp(self):
+        """
+        Creates a sweep and clears the shared shake samples before each test.
+
+        :rtype: None
+        """
+
+        self.noiseutils.clearShakeCache()
+        mockmaya.resetCounters()
+
+        self.sweep = self.qnoisesweep.QNoiseSweep(seed=self.__seed__, frequencies=self.__frequencies__, roughnesses=self.__roughnesses__, duration=self.__duration__, step=1)
+        self.sweep.resize(640, 480)
+
+    def tearDown(self):
+        """
+        Deletes the sweep.
+
+        :rtype: None
+        """
+
+        self.sweep.deleteLater()
+
+    def testOneCallPerRow(self):
+        """
+        Tests that every row is sampled by a single `shake` call, and that cached rows are never re-sampled.
+
+        :rtype: None
+        """
+
+        thumbnails = self.sweep.thumbnails()
+
+        self.assertEqual(len(thumbnails), len(self.__frequencies__))
+        self.assertTrue(all(len(pixmaps) == len(self.__roughnesses__) for pixmaps in thumbnails))
+        self.assertEqual(mockmaya.getCounters()['shake'], len(self.__roughnesses__))
+
+        self.sweep.thumbnails()
+        self.assertEqual(mockmaya.getCounters()['shake'], len(self.__roughnesses__))
+
+    def testMatchesCells(self):
+        """
+        Tests that the batched samples match sampling each cell from the `shake` command on its own.
+
+        :rtype: None
+        """
+
+        size = self.sweep.cellSize()
+        timeScale = size.width() / self.__duration__
+
+        for roughness in self.__roughnesses__:
+
+            sweep = self.noiseutils.sampleShakeSweep(seed=self.__seed__, frequencies=self.__frequencies__, roughness=roughness, size=size.width(), step=1, timeScale=timeScale)
+
+            for (frequency, samples) in zip(self.__frequencies__, sweep):
+
+                expected = referencenoise.shake(seed=self.__seed__, frequency=frequency, roughness=roughness, size=size.width(), step=1, timeScale=timeScale)
+                error = max(abs(a - b) for (a, b) in zip(samples, expected))
+
+                self.assertEqual(len(samples), len(expected))
+                self.assertLess(error, self.__tolerance__, msg=f'frequency={frequency}, roughness={roughness}')
+
+    def testMeasureCalls(self):
+        """
+        Measures the batched sweep against one `shake` call per cell.
+        The stand-in's cost is per sample rather than per call, so only the call counts are asserted!
+
+        :rtype: None
+        """
+
+        size = self.sweep.cellSize()
+        timeScale = size.width() / self.__duration__
+
+        start = time.perf_counter()
+
+        for roughness in self.__roughnesses__:
+
+            self.noiseutils.sampleShakeSweep(seed=self.__seed__, frequencies=self.__frequencies__, roughness=roughness, size=size.width(), step=1, timeScale=timeScale)
+
+        batched = time.perf_counter() - start
+        batchedCalls = mockmaya.getCounters()['shake']
+
+        self.noiseutils.clearShakeCache()
+        mockmaya.resetCounters()
+
+        start = time.perf_counter()
+
+        for roughness in self.__roughnesses__:
+
+            for frequency in self.__frequencies__:
+
+                self.noiseutils.sampleShake(seed=self.__seed__, frequency=frequency, roughness=roughness, size=size.width(), step=1, timeScale=timeScale)
+
+        perCell = time.perf_counter() - start
+        perCellCalls = mockmaya.getCounters()['shake']
+
+        sys.stderr.write(f'\nSweep: {batchedCalls} calls in {batched * 1e3:.1f}ms batched, {perCellCalls} calls in {perCell * 1e3:.1f}ms per cell\n')
+
+        self.assertEqual(batchedCalls, len(self.__roughnesses__))
+        self.assertEqual(perCellCalls, len(self.__roughnesses__) * len(self.__frequencies__))
+    # endregion
+
+
+if __name__ == '__main__':
+
+    unittest.main()
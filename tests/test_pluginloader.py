@@ -0,0 +1,317 @@
+import os
+import sys
+import types
+import hashlib
+import tempfile
+import threading
+import unittest
+import importlib.util
+
+
+def stubModule(name, **attributes):
+    """
+    Registers a stand-in module under the supplied name, unless the real module, or another stand-in, is already loaded.
+
+    :type name: str
+    :rtype: types.ModuleType
+    """
+
+    module = sys.modules.get(name, None)
+
+    if module is None:
+
+        module = types.ModuleType(name)
+        module.__dict__.update(attributes)
+
+        sys.modules[name] = module
+
+    return module
+
+
+def loadPluginLoader():
+    """
+    Loads the plug-in loader on its own, stubbing only the `maya.cmds` and `pluginutils` members it calls.
+    The loader never touches Qt, so these tests run on a plain Python install!
+
+    :rtype: types.ModuleType
+    """
+
+    try:
+
+        importlib.import_module('maya.cmds')
+
+    except ImportError:
+
+        stubModule('maya', __path__=[])
+        stubModule('maya.cmds', about=lambda version=False, **kwargs: '2024', pluginInfo=lambda plugin, **kwargs: False)
+
+    try:
+
+        importlib.import_module('dcc.maya.libs.pluginutils')
+
+    except ImportError:
+
+        stubModule('dcc', __path__=[])
+        stubModule('dcc.maya', __path__=[])
+        stubModule('dcc.maya.libs', __path__=[])
+        stubModule('dcc.maya.libs.pluginutils', getPluginExtension=lambda: 'mll', pathToPlugin=lambda plugin: '', tryLoadPlugin=lambda path: True)
+
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'libs', 'pluginloader.py')
+    spec = importlib.util.spec_from_file_location('pluginloader', path)
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+pluginloader = loadPluginLoader()
+
+
+class TestPluginLoader(unittest.TestCase):
+    """
+    Tests the plug-in downloads against a local mirror directory.
+    """
+
+    # region Dunderscores
+    __plugin__ = 'Shake'
+    __version__ = '2024'
+    __extension__ = 'mll'
+    __contents__ = bytes(range(256)) * 64
+    # endregion
+
+    # region Methods
+    def setUp(self):
+        """
+        Creates a temporary mirror and plug-in directory for each test.
+
+        :rtype: None
+        """
+
+        self._tempDirectory = tempfile.TemporaryDirectory()
+        self.mirror = os.path.join(self._tempDirectory.name, 'mirror')
+        self.directory = os.path.join(self._tempDirectory.name, 'plug-ins')
+
+        os.makedirs(self.directory)
+
+    def tearDown(self):
+        """
+        Removes the temporary directories.
+
+        :rtype: None
+        """
+
+        self._tempDirectory.cleanup()
+
+    def writeSource(self, contents=None, checksum=None):
+        """
+        Writes a plug-in, and optionally its checksum, to the mirror.
+
+        :type contents: Union[bytes, None]
+        :type checksum: Union[str, None]
+        :rtype: str
+        """
+
+        contents = contents if contents is not None else self.__contents__
+        path = os.path.join(self.mirror, self.__version__, f'{self.__plugin__}.{self.__extension__}')
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, 'wb') as stream:
+
+            stream.write(contents)
+
+        if checksum is not None:
+
+            with open(f'{path}.sha256', 'w') as stream:
+
+                stream.write(f'{checksum}  {self.__plugin__}.{self.__extension__}\n')
+
+        return path
+
+    def readFile(self, path):
+        """
+        Returns the contents of the supplied file.
+
+        :type path: str
+        :rtype: bytes
+        """
+
+        with open(path, 'rb') as stream:
+
+            return stream.read()
+
+    def test_resume(self):
+        """
+        Tests that a partial transfer is appended to rather than restarted.
+
+        :rtype: None
+        """
+
+        source = self.writeSource()
+        path = os.path.join(self.directory, 'Shake.mll')
+
+        # The partial file holds different bytes so a restart would be detected!
+        #
+        offset = 1000
+
+        with open(f'{path}.part', 'wb') as stream:
+
+            stream.write(b'x' * offset)
+
+        self.assertTrue(pluginloader.transferSource(source, path, retries=1))
+        self.assertEqual(self.readFile(path), (b'x' * offset) + self.__contents__[offset:])
+        self.assertFalse(os.path.exists(f'{path}.part'))
+
+    def test_checksum(self):
+        """
+        Tests that a transfer matching its published checksum is accepted.
+
+        :rtype: None
+        """
+
+        source = self.writeSource(checksum=hashlib.sha256(self.__contents__).hexdigest())
+        path = os.path.join(self.directory, 'Shake.mll')
+
+        self.assertTrue(pluginloader.transferSource(source, path, retries=1))
+        self.assertEqual(self.readFile(path), self.__contents__)
+
+    def test_checksumMismatch(self):
+        """
+        Tests that a transfer that does not match its published checksum is discarded.
+
+        :rtype: None
+        """
+
+        source = self.writeSource(checksum='0' * 64)
+        path = os.path.join(self.directory, 'Shake.mll')
+
+        self.assertFalse(pluginloader.transferSource(source, path, retries=1))
+        self.assertFalse(os.path.exists(path))
+        self.assertFalse(os.path.exists(f'{path}.part'))
+
+    def test_cancel(self):
+        """
+        Tests that a cancelled transfer stops without writing the plug-in.
+
+        :rtype: None
+        """
+
+        source = self.writeSource()
+        path = os.path.join(self.directory, 'Shake.mll')
+
+        cancelEvent = threading.Event()
+        cancelEvent.set()
+
+        self.assertFalse(pluginloader.transferSource(source, path, retries=3, cancelEvent=cancelEvent))
+        self.assertFalse(os.path.exists(path))
+
+    def test_publishToMirror(self):
+        """
+        Tests that a published plug-in can be downloaded from the mirror with its checksum.
+
+        :rtype: None
+        """
+
+        path = os.path.join(self.directory, 'Shake.mll')
+
+        with open(path, 'wb') as stream:
+
+            stream.write(self.__contents__)
+
+        pluginloader.publishToMirror(path, self.__plugin__, self.__version__, self.__extension__, self.mirror)
+
+        mirrorPath = os.path.join(self.mirror, self.__version__, 'Shake.mll')
+        self.assertEqual(self.readFile(mirrorPath), self.__contents__)
+        self.assertEqual(pluginloader.fetchChecksum(mirrorPath), hashlib.sha256(self.__contents__).hexdigest())
+
+        # Existing mirror files are left untouched
+        #
+        with open(path, 'wb') as stream:
+
+            stream.write(b'changed')
+
+        pluginloader.publishToMirror(path, self.__plugin__, self.__version__, self.__extension__, self.mirror)
+        self.assertEqual(self.readFile(mirrorPath), self.__contents__)
+
+        # Download back from the mirror
+        #
+        os.remove(path)
+
+        self.assertEqual(pluginloader.downloadPlugin(self.__plugin__, self.directory, self.__version__, self.__extension__, mirror=self.mirror), path)
+        self.assertEqual(self.readFile(path), self.__contents__)
+
+    def test_downloader(self):
+        """
+        Tests that the downloader collects finished downloads from the calling thread.
+
+        :rtype: None
+        """
+
+        self.writeSource(checksum=hashlib.sha256(self.__contents__).hexdigest())
+
+        downloader = pluginloader.PluginDownloader([self.__plugin__], self.directory, mirror=self.mirror, timeout=10.0)
+        downloader.start()
+
+        finished = []
+
+        while not downloader.isDone:
+
+            finished.extend(downloader.poll(timeout=0.1))
+
+        path = os.path.join(self.directory, 'Shake.mll')
+
+        self.assertEqual(finished, [(self.__plugin__, path)])
+        self.assertEqual(self.readFile(path), self.__contents__)
+
+    def test_resolvePlugins(self):
+        """
+        Tests that plug-ins are resolved through `pluginutils` and that the cache skips it until the plug-in changes.
+
+        :rtype: None
+        """
+
+        path = os.path.join(self.directory, f'{self.__plugin__}.{self.__extension__}')
+
+        with open(path, 'wb') as binaryFile:
+
+            binaryFile.write(self.__contents__)
+
+        calls = []
+
+        def pathToPlugin(plugin):
+
+            calls.append(plugin)
+            return path if plugin == self.__plugin__ else ''
+
+        pluginutils, environ = pluginloader.pluginutils, dict(os.environ)
+        pluginloader.pluginutils = types.SimpleNamespace(pathToPlugin=pathToPlugin)
+        os.environ['MAYA_APP_DIR'] = self._tempDirectory.name
+
+        try:
+
+            self.assertEqual(pluginloader.resolvePlugins([self.__plugin__, 'Missing']), {self.__plugin__: path, 'Missing': None})
+            self.assertEqual(calls, [self.__plugin__, 'Missing'])
+
+            pluginloader.updateCache({self.__plugin__: path})
+            calls.clear()
+
+            self.assertEqual(pluginloader.resolvePlugins([self.__plugin__]), {self.__plugin__: path})
+            self.assertEqual(calls, [])
+
+            os.utime(path, (0.0, 0.0))
+
+            self.assertEqual(pluginloader.resolvePlugins([self.__plugin__]), {self.__plugin__: path})
+            self.assertEqual(calls, [self.__plugin__])
+
+        finally:
+
+            pluginloader.pluginutils = pluginutils
+            os.environ.clear()
+            os.environ.update(environ)
+    # endregion
+
+
+if __name__ == '__main__':
+
+    unittest.main()
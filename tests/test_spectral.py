@@ -0,0 +1,108 @@
+import math
+import unittest
+import itertools
+
+from benchmarks import referencenoise, spectralbench
+
+
+@unittest.skipIf(referencenoise.numpy is None, 'The spectral engine requires numpy!')
+class TestSpectral(unittest.TestCase):
+    """
+    Tests that the stand-in's spectral engine stays within the benchmark's bounds of its gradient engine.
+    Neither engine is the `shake` plug-in, so this only checks the benchmark artifact and says nothing about the plug-in!
+    """
+
+    # region Dunderscores
+    __seeds__ = 16
+    __samples__ = 2048
+    __time_scale__ = 24.0
+    # endregion
+
+    # region Methods
+    def setUp(self):
+        """
+        Creates the benchmark whose metrics are shared by each test.
+
+        :rtype: None
+        """
+
+        self.benchmark = spectralbench.SpectralBenchmark(seeds=self.__seeds__, samples=self.__samples__, timeScale=self.__time_scale__)
+        self.numpy = referencenoise.numpy
+
+    def gradient(self, seed, frequency, roughness):
+        """
+        Returns the samples from the gradient engine for the supplied parameters.
+
+        :type seed: int
+        :type frequency: float
+        :type roughness: float
+        :rtype: numpy.ndarray
+        """
+
+        return self.benchmark.synthesize(referencenoise.NoiseEngine.GRADIENT, seed, frequency, roughness, self.__samples__)
+
+    def spectral(self, seed, frequency, roughness):
+        """
+        Returns the samples from the spectral engine for the supplied parameters.
+
+        :type seed: int
+        :type frequency: float
+        :type roughness: float
+        :rtype: numpy.ndarray
+        """
+
+        return self.benchmark.synthesize(referencenoise.NoiseEngine.SPECTRAL, seed, frequency, roughness, self.__samples__)
+
+    def averageStatistics(self, function, frequency, roughness):
+        """
+        Returns the statistics of the supplied sampling function averaged across every seed.
+
+        :type function: Callable
+        :type frequency: float
+        :type roughness: float
+        :rtype: Dict[str, float]
+        """
+
+        results = [self.benchmark.statistics(function(seed, frequency, roughness)) for seed in range(self.__seeds__)]
+        return {key: sum(result[key] for result in results) / len(results) for key in results[0].keys()}
+
+    def test_samples(self):
+        """
+        Tests that the spectral engine returns one finite sample per frame, and the same samples for the same seed.
+
+        :rtype: None
+        """
+
+        samples = self.spectral(0, 2.0, 0.5)
+
+        self.assertEqual(len(samples), len(self.gradient(0, 2.0, 0.5)))
+        self.assertTrue(all(math.isfinite(sample) for sample in samples))
+        self.assertTrue(self.numpy.array_equal(samples, self.spectral(0, 2.0, 0.5)))
+        self.assertFalse(self.numpy.array_equal(samples, self.spectral(1, 2.0, 0.5)))
+
+    def test_bounds(self):
+        """
+        Tests that the RMS, zero-crossing rate, spectral centroid and mean stay within the benchmark's bounds.
+
+        :rtype: None
+        """
+
+        bounds = spectralbench.DEFAULT_BOUNDS
+
+        for (frequency, roughness) in itertools.product(spectralbench.DEFAULT_FREQUENCIES, spectralbench.DEFAULT_ROUGHNESSES):
+
+            with self.subTest(frequency=frequency, roughness=roughness):
+
+                expected = self.averageStatistics(self.gradient, frequency, roughness)
+                actual = self.averageStatistics(self.spectral, frequency, roughness)
+
+                self.assertLessEqual(abs((actual['rms'] / expected['rms']) - 1.0), bounds['rms'])
+                self.assertLessEqual(abs((actual['zeroCrossings'] / max(expected['zeroCrossings'], 1e-12)) - 1.0), bounds['zeroCrossings'])
+                self.assertLessEqual(abs((actual['centroid'] / expected['centroid']) - 1.0), bounds['centroid'])
+                self.assertLessEqual(abs(actual['mean']) / actual['rms'], bounds['mean'])
+    # endregion
+
+
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,259 @@
+import time
+
+from dcc.vendor.Qt import QtCore
+from ..libs import undoutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+DEFAULT_CHUNK_SIZE = 50
+
+
+class QBakeJob(QtCore.QObject):
+    """
+    Overload of `QObject` that bakes noise in time slices from the Qt event loop.
+    Each slice bakes chunks until its time budget is spent, then hands control back so the interface stays responsive!
+    Every slice is recorded into the same diff so the whole bake can be pushed as a single undo step once it has finished.
+    Edits made between slices would be missing from that diff, so the owner must block input while the job runs, for example with an application modal progress dialog!
+    """
+
+    # region Signals
+    started = QtCore.Signal()
+    progressChanged = QtCore.Signal(int)
+    finished = QtCore.Signal(bool)
+    # endregion
+
+    # region Dunderscores
+    def __init__(self, baker, parent=None, timeSlice=50):
+        """
+        Private method called after a new instance has been created.
+
+        :type baker: bakeutils.NoiseBaker
+        :type parent: Union[QtCore.QObject, None]
+        :type timeSlice: int
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(QBakeJob, self).__init__(parent)
+
+        # Declare private variables
+        #
+        self._baker = baker
+        self._timeSlice = timeSlice
+        self._isRunning = False
+        self._currentTime = None
+        self._diff = None
+
+        # Initialize slice timer
+        #
+        self._sliceTimer = QtCore.QTimer(self)
+        self._sliceTimer.setObjectName('sliceTimer')
+        self._sliceTimer.setSingleShot(True)
+        self._sliceTimer.setInterval(0)
+        self._sliceTimer.timeout.connect(self.on_sliceTimer_timeout)
+    # endregion
+
+    # region Properties
+    @property
+    def baker(self):
+        """
+        Getter method that returns the baker driven by this job.
+
+        :rtype: bakeutils.NoiseBaker
+        """
+
+        return self._baker
+
+    @property
+    def diff(self):
+        """
+        Getter method that returns the diff recorded by this job.
+        The diff is only pushed onto the undo queue by whoever owns this job!
+
+        :rtype: Union[undoutils.NoiseDiff, None]
+        """
+
+        return self._diff
+
+    @property
+    def timeSlice(self):
+        """
+        Getter method that returns the time budget, in milliseconds, of each slice.
+
+        :rtype: int
+        """
+
+        return self._timeSlice
+
+    @timeSlice.setter
+    def timeSlice(self, timeSlice):
+        """
+        Setter method that updates the time budget, in milliseconds, of each slice.
+
+        :type timeSlice: int
+        :rtype: None
+        """
+
+        self._timeSlice = timeSlice
+    # endregion
+
+    # region Methods
+    def isRunning(self):
+        """
+        Evaluates if this job is still baking.
+
+        :rtype: bool
+        """
+
+        return self._isRunning
+
+    def progress(self):
+        """
+        Returns the percentage of frames that have been baked.
+
+        :rtype: int
+        """
+
+        return int(round(self._baker.progress * 100.0))
+
+    def start(self):
+        """
+        Starts baking from the baker's current position.
+
+        :rtype: None
+        """
+
+        # Check if job is already running
+        #
+        if self._isRunning:
+
+            return
+
+        self._diff = undoutils.NoiseDiff(name='bakeNoise')
+
+        with undoutils.Diff(diff=self._diff):
+
+            self._baker.restartItem()
+
+        self._baker.profiler.start()
+        self._currentTime = self._baker.scene.time
+        self._isRunning = True
+
+        self.started.emit()
+        self.progressChanged.emit(self.progress())
+
+        self._sliceTimer.start()
+
+    def cancel(self):
+        """
+        Cancels this job.
+        Keys from the unfinished noise item are reverted so every control is left either fully baked or untouched!
+
+        :rtype: None
+        """
+
+        # Check if job is running
+        #
+        if not self._isRunning:
+
+            return
+
+        self._sliceTimer.stop()
+
+        with undoutils.Diff(diff=self._diff):
+
+            self._baker.cancel()
+
+        self.stop(False)
+
+    def stop(self, isDone):
+        """
+        Stops this job and notifies any listeners.
+        The scene is returned to the time it was at when this job started!
+
+        :type isDone: bool
+        :rtype: None
+        """
+
+        self._isRunning = False
+        self._baker.profiler.stop()
+
+        if self._currentTime is not None:
+
+            self._baker.scene.time = self._currentTime
+            self._currentTime = None
+
+        self.finished.emit(isDone)
+
+    def bakeSlice(self):
+        """
+        Bakes chunks until the time budget has been spent.
+        Returns true if there is still work remaining!
+
+        :rtype: bool
+        """
+
+        startTime = time.perf_counter()
+        budget = self._timeSlice / 1000.0
+
+        isBaking = True
+
+        with undoutils.Diff(diff=self._diff):
+
+            while isBaking and (time.perf_counter() - startTime) < budget:
+
+                isBaking = self._baker.bakeChunk()
+
+        return isBaking
+    # endregion
+
+    # region Slots
+    @QtCore.Slot()
+    def on_sliceTimer_timeout(self):
+        """
+        Slot method for the `sliceTimer` timer's `timeout` signal.
+
+        :rtype: None
+        """
+
+        # Check if job has been cancelled
+        #
+        if not self._isRunning:
+
+            return
+
+        # Bake next slice
+        #
+        try:
+
+            isBaking = self.bakeSlice()
+
+        except Exception as exception:
+
+            log.error(f'Unable to bake noise: {exception}')
+
+            with undoutils.Diff(diff=self._diff):
+
+                self._baker.cancel()
+
+            self.stop(False)
+
+            return
+
+        self.progressChanged.emit(self.progress())
+
+        # Check if there is still work remaining
+        #
+        if isBaking:
+
+            self._sliceTimer.start()
+
+        else:
+
+            self.stop(True)
+    # endregion
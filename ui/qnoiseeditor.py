@@ -1,19 +1,18 @@
 import os
-import math
+import time
 import random
 
 from maya import cmds as mc
 from maya.api import OpenMaya as om
 from mpy import mpyscene, mpynode
-from collections import namedtuple
-from dcc.generators.inclusiverange import inclusiveRange
-from dcc.python import stringutils
+from collections import namedtuple, defaultdict
 from dcc.maya.libs import plugutils, pluginutils
 from dcc.maya.decorators import animate, undo
 from dcc.ui import qsingletonwindow, qtimespinbox
 from dcc.vendor.Qt import QtCore, QtWidgets, QtGui, QtCompat
-from .widgets import qnoisegraph
-from ..libs import noiseutils
+from . import qbakejob
+from .widgets import qnoisegraph, qnoisesweep
+from ..libs import noiseutils, bakeutils, cacheutils, exportutils, freezeutils, keyutils, presetutils, pluginloader, profileutils, referenceutils, traceutils, undoutils
 
 import logging
 logging.basicConfig()
@@ -50,6 +49,92 @@ def onSelectionChanged(*args, **kwargs):
         log.warning('Unable to process selection changed callback!')
 
 
+def onSceneChanged(*args, **kwargs):
+    """
+    Callback method for before a new scene is created or opened.
+
+    :rtype: None
+    """
+
+    # Check if instance exists
+    #
+    instance = QNoiseEditor.getInstance()
+
+    if instance is None:
+
+        return
+
+    # Evaluate if instance is still valid
+    #
+    if QtCompat.isValid(instance):
+
+        instance.sceneChanged(*args, **kwargs)
+
+    else:
+
+        log.warning('Unable to process scene changed callback!')
+
+
+def onShakeAttributeChanged(msg, plug, otherPlug, clientData):
+    """
+    Callback method for any attribute changes on the selected shake nodes.
+
+    :type msg: int
+    :type plug: om.MPlug
+    :type otherPlug: om.MPlug
+    :type clientData: int
+    :rtype: None
+    """
+
+    # Check if instance exists
+    #
+    instance = QNoiseEditor.getInstance()
+
+    if instance is None:
+
+        return
+
+    # Evaluate if instance is still valid
+    #
+    if QtCompat.isValid(instance):
+
+        instance.shakeAttributeChanged(msg, plug, otherPlug, clientData=clientData)
+
+    else:
+
+        log.warning('Unable to process attribute changed callback!')
+
+
+def onFrozenShakeAttributeChanged(msg, plug, otherPlug, clientData):
+    """
+    Callback method for any attribute changes on frozen shake nodes.
+
+    :type msg: int
+    :type plug: om.MPlug
+    :type otherPlug: om.MPlug
+    :type clientData: Any
+    :rtype: None
+    """
+
+    # Check if instance exists
+    #
+    instance = QNoiseEditor.getInstance()
+
+    if instance is None:
+
+        return
+
+    # Evaluate if instance is still valid
+    #
+    if QtCompat.isValid(instance):
+
+        instance.frozenShakeAttributeChanged(msg, plug, otherPlug, clientData=clientData)
+
+    else:
+
+        log.warning('Unable to process frozen attribute changed callback!')
+
+
 class QNoiseEditor(qsingletonwindow.QSingletonWindow):
     """
     Overload of `QUicWindow` that interfaces with noise nodes.
@@ -58,6 +143,8 @@ class QNoiseEditor(qsingletonwindow.QSingletonWindow):
     # region Dunderscores
     __ids__ = (2, 3, 4)
     __plugins__ = ('Shake', 'ComposeTransform')
+    __graph_attributes__ = ('seed', 'frequency', 'roughness', 'fractal', 'rampIn', 'rampOut', 'envelope', 'strengthX', 'strengthY', 'strengthZ', 'positiveX', 'positiveY', 'positiveZ')
+    __sweep_size__ = 8
 
     def __init__(self, *args, **kwargs):
         """
@@ -70,12 +157,62 @@ class QNoiseEditor(qsingletonwindow.QSingletonWindow):
 
         # Call parent method
         #
+        startTime = time.perf_counter()
+
         super(QNoiseEditor, self).__init__(*args, **kwargs)
 
         # Declare private variables
         #
+        self._startTime = startTime
+        self._startupTimings = {}
+        self._hasShown = False
         self._scene = mpyscene.MPyScene.getInstance(asWeakReference=True)
         self._callbackIds = om.MCallbackIdArray()
+        self._shakeCallbackIds = {}
+        self._frozenCallbackIds = {}
+        self._pendingThaws = {}
+        self._noiseClipboard = None
+        self._noiseItems = []
+        self._pendingAttributes = set()
+        self._pushingNoise = False
+        self._profiles = {}
+        self._baker = None
+        self._bakeJob = None
+        self._bakeProgressDialog = None
+        self._reduction = None
+        self._editReport = None
+        self._noiseSweep = None
+        self._pluginDownloader = None
+        self._pluginPaths = {}
+        self._pluginProgressDialog = None
+
+        # Initialize refresh timer
+        # A zero-interval timer coalesces attribute changes into a single refresh per event-loop tick!
+        #
+        self._refreshTimer = QtCore.QTimer(self)
+        self._refreshTimer.setObjectName('refreshTimer')
+        self._refreshTimer.setSingleShot(True)
+        self._refreshTimer.setInterval(0)
+        self._refreshTimer.timeout.connect(self.on_refreshTimer_timeout)
+
+        # Initialize thaw timer
+        # Frozen curves cannot be deleted from inside an attribute-changed callback so thawing is deferred to the event loop!
+        #
+        self._thawTimer = QtCore.QTimer(self)
+        self._thawTimer.setObjectName('thawTimer')
+        self._thawTimer.setSingleShot(True)
+        self._thawTimer.setInterval(0)
+        self._thawTimer.timeout.connect(self.on_thawTimer_timeout)
+
+        # Initialize download timer
+        # Plug-ins are downloaded on worker threads and collected from the event loop so the interface never blocks!
+        #
+        self._downloadTimer = QtCore.QTimer(self)
+        self._downloadTimer.setObjectName('downloadTimer')
+        self._downloadTimer.setInterval(50)
+        self._downloadTimer.timeout.connect(self.on_downloadTimer_timeout)
+
+        self._startupTimings['__init__'] = time.perf_counter() - startTime
 
     def __post_init__(self, *args, **kwargs):
         """
@@ -86,11 +223,16 @@ class QNoiseEditor(qsingletonwindow.QSingletonWindow):
 
         # Call parent method
         #
+        startTime = time.perf_counter()
+
         super(QNoiseEditor, self).__post_init__(*args, **kwargs)
 
-        # Load required plugins
+        # Schedule required plugins
+        # Loading is deferred until the event loop is running so the window can appear first!
         #
-        self.loadPlugins()
+        QtCore.QTimer.singleShot(0, self.loadPlugins)
+
+        self._startupTimings['__post_init__'] = time.perf_counter() - startTime
 
     def __setup_ui__(self, *args, **kwargs):
         """
@@ -101,6 +243,8 @@ class QNoiseEditor(qsingletonwindow.QSingletonWindow):
 
         # Call parent method
         #
+        startTime = time.perf_counter()
+
         super(QNoiseEditor, self).__setup_ui__(self, *args, **kwargs)
 
         # Initialize main window
@@ -146,9 +290,16 @@ class QNoiseEditor(qsingletonwindow.QSingletonWindow):
         self.scaleCheckBox.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred))
         self.scaleCheckBox.setFocusPolicy(QtCore.Qt.NoFocus)
 
+        self.minimalEditsCheckBox = QtWidgets.QCheckBox('Min Edits')
+        self.minimalEditsCheckBox.setObjectName('minimalEditsCheckBox')
+        self.minimalEditsCheckBox.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred))
+        self.minimalEditsCheckBox.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.minimalEditsCheckBox.setToolTip('Wires noise onto referenced controls with as few reference edits as possible. The rotate order is only connected for rotation noise, and pivots are only connected for rotation or scale noise.')
+
         self.createLayout.addWidget(self.posCheckBox)
         self.createLayout.addWidget(self.rotCheckBox)
         self.createLayout.addWidget(self.scaleCheckBox)
+        self.createLayout.addWidget(self.minimalEditsCheckBox)
 
         self.createPushButton = QtWidgets.QPushButton('Create')
         self.createPushButton.setObjectName('createPushButton')
@@ -177,6 +328,51 @@ class QNoiseEditor(qsingletonwindow.QSingletonWindow):
         self.deletePushButton.setFocusPolicy(QtCore.Qt.NoFocus)
         self.deletePushButton.clicked.connect(self.on_deletePushButton_clicked)
 
+        self.freezeDivider = QtWidgets.QFrame()
+        self.freezeDivider.setObjectName('freezeDivider')
+        self.freezeDivider.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Expanding))
+        self.freezeDivider.setFrameShape(QtWidgets.QFrame.VLine)
+        self.freezeDivider.setFrameShadow(QtWidgets.QFrame.Sunken)
+
+        self.freezePushButton = QtWidgets.QPushButton('Freeze')
+        self.freezePushButton.setObjectName('freezePushButton')
+        self.freezePushButton.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed))
+        self.freezePushButton.setFixedHeight(35)
+        self.freezePushButton.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.freezePushButton.setToolTip('Samples the selected noise into curves for fast playback.')
+        self.freezePushButton.clicked.connect(self.on_freezePushButton_clicked)
+
+        self.thawPushButton = QtWidgets.QPushButton('Thaw')
+        self.thawPushButton.setObjectName('thawPushButton')
+        self.thawPushButton.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed))
+        self.thawPushButton.setFixedHeight(35)
+        self.thawPushButton.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.thawPushButton.setToolTip('Restores live noise evaluation on the selection.')
+        self.thawPushButton.clicked.connect(self.on_thawPushButton_clicked)
+
+        self.clipboardDivider = QtWidgets.QFrame()
+        self.clipboardDivider.setObjectName('clipboardDivider')
+        self.clipboardDivider.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Expanding))
+        self.clipboardDivider.setFrameShape(QtWidgets.QFrame.VLine)
+        self.clipboardDivider.setFrameShadow(QtWidgets.QFrame.Sunken)
+
+        self.copyPushButton = QtWidgets.QPushButton('Copy')
+        self.copyPushButton.setObjectName('copyPushButton')
+        self.copyPushButton.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed))
+        self.copyPushButton.setFixedHeight(35)
+        self.copyPushButton.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.copyPushButton.setToolTip('Copies the noise from the first selected control.')
+        self.copyPushButton.clicked.connect(self.on_copyPushButton_clicked)
+
+        self.pastePushButton = QtWidgets.QPushButton('Paste')
+        self.pastePushButton.setObjectName('pastePushButton')
+        self.pastePushButton.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed))
+        self.pastePushButton.setFixedHeight(35)
+        self.pastePushButton.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.pastePushButton.setToolTip('Pastes the copied noise onto the selection, creating any missing noise. Hold shift to match the selection to its first control.')
+        self.pastePushButton.setEnabled(False)
+        self.pastePushButton.clicked.connect(self.on_pastePushButton_clicked)
+
         # Initialize setup group-box
         #
         self.setupLayout = QtWidgets.QGridLayout()
@@ -192,6 +388,12 @@ class QNoiseEditor(qsingletonwindow.QSingletonWindow):
         self.setupLayout.addWidget(self.setupDivider, 0, 1, 2, 1)
         self.setupLayout.addWidget(self.selectPushButton, 0, 2)
         self.setupLayout.addWidget(self.deletePushButton, 1, 2)
+        self.setupLayout.addWidget(self.freezeDivider, 0, 3, 2, 1)
+        self.setupLayout.addWidget(self.freezePushButton, 0, 4)
+        self.setupLayout.addWidget(self.thawPushButton, 1, 4)
+        self.setupLayout.addWidget(self.clipboardDivider, 0, 5, 2, 1)
+        self.setupLayout.addWidget(self.copyPushButton, 0, 6)
+        self.setupLayout.addWidget(self.pastePushButton, 1, 6)
 
         centralLayout.addWidget(self.setupGroupBox)
 
@@ -236,6 +438,63 @@ class QNoiseEditor(qsingletonwindow.QSingletonWindow):
         self.filterLayout.addWidget(self.rotationRadioButton, alignment=QtCore.Qt.AlignHCenter)
         self.filterLayout.addWidget(self.scaleRadioButton, alignment=QtCore.Qt.AlignHCenter)
 
+        # Initialize preset widget
+        #
+        self.presetLayout = QtWidgets.QHBoxLayout()
+        self.presetLayout.setObjectName('presetLayout')
+        self.presetLayout.setContentsMargins(0, 0, 0, 0)
+
+        self.presetWidget = QtWidgets.QWidget()
+        self.presetWidget.setObjectName('presetWidget')
+        self.presetWidget.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed))
+        self.presetWidget.setFixedHeight(24)
+        self.presetWidget.setLayout(self.presetLayout)
+
+        self.presetLabel = QtWidgets.QLabel('Preset:')
+        self.presetLabel.setObjectName('presetLabel')
+        self.presetLabel.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred))
+        self.presetLabel.setFixedWidth(40)
+        self.presetLabel.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+
+        self.presetComboBox = QtWidgets.QComboBox()
+        self.presetComboBox.setObjectName('presetComboBox')
+        self.presetComboBox.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred))
+        self.presetComboBox.setFocusPolicy(QtCore.Qt.NoFocus)
+
+        self.applyPresetPushButton = QtWidgets.QPushButton('Apply')
+        self.applyPresetPushButton.setObjectName('applyPresetPushButton')
+        self.applyPresetPushButton.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred))
+        self.applyPresetPushButton.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.applyPresetPushButton.setToolTip('Applies the preset to every shake on the selection.')
+        self.applyPresetPushButton.clicked.connect(self.on_applyPresetPushButton_clicked)
+
+        self.savePresetPushButton = QtWidgets.QPushButton('Save')
+        self.savePresetPushButton.setObjectName('savePresetPushButton')
+        self.savePresetPushButton.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred))
+        self.savePresetPushButton.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.savePresetPushButton.setToolTip('Saves the shakes from the first selected control as a preset.')
+        self.savePresetPushButton.clicked.connect(self.on_savePresetPushButton_clicked)
+
+        self.deletePresetPushButton = QtWidgets.QPushButton('Delete')
+        self.deletePresetPushButton.setObjectName('deletePresetPushButton')
+        self.deletePresetPushButton.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred))
+        self.deletePresetPushButton.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.deletePresetPushButton.clicked.connect(self.on_deletePresetPushButton_clicked)
+
+        self.sweepPushButton = QtWidgets.QPushButton('Sweep')
+        self.sweepPushButton.setObjectName('sweepPushButton')
+        self.sweepPushButton.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred))
+        self.sweepPushButton.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.sweepPushButton.setToolTip('Previews a grid of frequency and roughness values around the first selected shake.')
+        self.sweepPushButton.clicked.connect(self.on_sweepPushButton_clicked)
+
+        self.presetLayout.addWidget(self.presetLabel)
+        self.presetLayout.addWidget(self.presetComboBox)
+        self.presetLayout.addWidget(self.applyPresetPushButton)
+        self.presetLayout.addWidget(self.savePresetPushButton)
+        self.presetLayout.addWidget(self.deletePresetPushButton)
+        self.presetLayout.addWidget(self.sweepPushButton)
+
         # Initialize interop widget
         #
         self.interopLayout = QtWidgets.QGridLayout()
@@ -535,10 +794,59 @@ class QNoiseEditor(qsingletonwindow.QSingletonWindow):
         self.propertiesGroupBox.setLayout(self.propertiesLayout)
 
         self.propertiesLayout.addWidget(self.filterWidget)
+        self.propertiesLayout.addWidget(self.presetWidget)
         self.propertiesLayout.addWidget(self.interopWidget)
 
         centralLayout.addWidget(self.propertiesGroupBox)
 
+        # Initialize baking group-box
+        #
+        self.bakingLayout = QtWidgets.QGridLayout()
+        self.bakingLayout.setObjectName('bakingLayout')
+
+        self.bakingGroupBox = QtWidgets.QGroupBox('Baking:')
+        self.bakingGroupBox.setObjectName('bakingGroupBox')
+        self.bakingGroupBox.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed))
+        self.bakingGroupBox.setLayout(self.bakingLayout)
+
+        centralLayout.addWidget(self.bakingGroupBox)
+
+        # Initialize graph group-box
+        #
+        self.graphLayout = QtWidgets.QGridLayout()
+        self.graphLayout.setObjectName('graphLayout')
+
+        self.graphGroupBox = QtWidgets.QGroupBox('Graph:')
+        self.graphGroupBox.setObjectName('graphGroupBox')
+        self.graphGroupBox.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding))
+        self.graphGroupBox.setLayout(self.graphLayout)
+
+        centralLayout.addWidget(self.graphGroupBox)
+
+        # Schedule deferred widgets
+        # The baking and graph widgets are built once the event loop is idle, or on first access!
+        #
+        self._bakingWidgetsReady = False
+        self._graphWidgetsReady = False
+
+        self._startupTimings['__setup_ui__'] = time.perf_counter() - startTime
+
+    def __setup_baking_ui__(self):
+        """
+        Private method that initializes the deferred baking widgets.
+
+        :rtype: None
+        """
+
+        # Check if widgets have already been initialized
+        #
+        if self._bakingWidgetsReady:
+
+            return
+
+        self._bakingWidgetsReady = True
+        startTime = time.perf_counter()
+
         # Initialize animation-range widget
         #
         self.animationRangeLayout = QtWidgets.QHBoxLayout()
@@ -591,10 +899,29 @@ class QNoiseEditor(qsingletonwindow.QSingletonWindow):
         self.stepSpinBox.setObjectName('stepSpinBox')
         self.stepSpinBox.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred))
         self.stepSpinBox.setFocusPolicy(QtCore.Qt.ClickFocus)
-        self.stepSpinBox.setMinimum(1)
+        self.stepSpinBox.setToolTip('Number of frames between keys. Use "Auto" to pick a rate for each control from its noise frequency.')
+        self.stepSpinBox.setSpecialValueText('Auto')
+        self.stepSpinBox.setMinimum(0)
         self.stepSpinBox.setMaximum(100)
         self.stepSpinBox.setValue(1)
-        
+
+        self.chunkSizeLabel = QtWidgets.QLabel('Chunk:')
+        self.chunkSizeLabel.setObjectName('chunkSizeLabel')
+        self.chunkSizeLabel.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred))
+        self.chunkSizeLabel.setFixedWidth(40)
+        self.chunkSizeLabel.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+
+        self.chunkSizeSpinBox = QtWidgets.QSpinBox()
+        self.chunkSizeSpinBox.setObjectName('chunkSizeSpinBox')
+        self.chunkSizeSpinBox.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred))
+        self.chunkSizeSpinBox.setFocusPolicy(QtCore.Qt.ClickFocus)
+        self.chunkSizeSpinBox.setToolTip('Number of frames baked at a time. Use "Off" to bake every frame at once.')
+        self.chunkSizeSpinBox.setSpecialValueText('Off')
+        self.chunkSizeSpinBox.setMinimum(0)
+        self.chunkSizeSpinBox.setMaximum(1000000)
+        self.chunkSizeSpinBox.setSingleStep(100)
+        self.chunkSizeSpinBox.setValue(0)
+
         self.animationRangeLayout.addWidget(self.startLabel)
         self.animationRangeLayout.addWidget(self.startSpinBox)
         self.animationRangeLayout.addWidget(self.endLabel)
@@ -602,16 +929,74 @@ class QNoiseEditor(qsingletonwindow.QSingletonWindow):
         self.animationRangeLayout.addWidget(self.stepLabel)
         self.animationRangeLayout.addWidget(self.stepSpinBox)
 
-        # Initialize baking group-box
+        # Initialize bake options widget
+        #
+        self.bakeOptionsLayout = QtWidgets.QHBoxLayout()
+        self.bakeOptionsLayout.setObjectName('bakeOptionsLayout')
+        self.bakeOptionsLayout.setContentsMargins(0, 0, 0, 0)
+
+        self.bakeOptionsWidget = QtWidgets.QWidget()
+        self.bakeOptionsWidget.setObjectName('bakeOptionsWidget')
+        self.bakeOptionsWidget.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed))
+        self.bakeOptionsWidget.setFixedHeight(24)
+        self.bakeOptionsWidget.setLayout(self.bakeOptionsLayout)
+
+        self.toleranceLabel = QtWidgets.QLabel('Reduce:')
+        self.toleranceLabel.setObjectName('toleranceLabel')
+        self.toleranceLabel.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred))
+        self.toleranceLabel.setFixedWidth(48)
+        self.toleranceLabel.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+
+        self.toleranceSpinBox = QtWidgets.QDoubleSpinBox()
+        self.toleranceSpinBox.setObjectName('toleranceSpinBox')
+        self.toleranceSpinBox.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred))
+        self.toleranceSpinBox.setFocusPolicy(QtCore.Qt.ClickFocus)
+        self.toleranceSpinBox.setToolTip('Removes any baked keys that can be reproduced within this tolerance. Use "Off" to keep every key.')
+        self.toleranceSpinBox.setSpecialValueText('Off')
+        self.toleranceSpinBox.setDecimals(4)
+        self.toleranceSpinBox.setMinimum(0.0)
+        self.toleranceSpinBox.setMaximum(100.0)
+        self.toleranceSpinBox.setSingleStep(0.001)
+        self.toleranceSpinBox.setValue(0.0)
+
+        self.bakeTargetLabel = QtWidgets.QLabel('Target:')
+        self.bakeTargetLabel.setObjectName('bakeTargetLabel')
+        self.bakeTargetLabel.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred))
+        self.bakeTargetLabel.setFixedWidth(40)
+        self.bakeTargetLabel.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+
+        self.bakeTargetComboBox = QtWidgets.QComboBox()
+        self.bakeTargetComboBox.setObjectName('bakeTargetComboBox')
+        self.bakeTargetComboBox.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred))
+        self.bakeTargetComboBox.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.bakeTargetComboBox.setToolTip('Bakes the noise onto keys, into a cache file of noise offsets, both, onto an additive "noise" animation layer, or exports it as engine tracks.')
+        self.bakeTargetComboBox.addItems(['Keys', 'Cache', 'Cache + Keys', 'Noise Layer', 'Tracks'])
+
+        self.bakeOptionsLayout.addWidget(self.bakeTargetLabel)
+        self.bakeOptionsLayout.addWidget(self.bakeTargetComboBox)
+        self.bakeOptionsLayout.addWidget(self.chunkSizeLabel)
+        self.bakeOptionsLayout.addWidget(self.chunkSizeSpinBox)
+        self.subFramesCheckBox = QtWidgets.QCheckBox('Sub-frames')
+        self.subFramesCheckBox.setObjectName('subFramesCheckBox')
+        self.subFramesCheckBox.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred))
+        self.subFramesCheckBox.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.subFramesCheckBox.setToolTip('Allows an "Auto" step to key between frames for motion blur.')
+        self.subFramesCheckBox.setChecked(False)
+
+        self.loopCheckBox = QtWidgets.QCheckBox('Loop')
+        self.loopCheckBox.setObjectName('loopCheckBox')
+        self.loopCheckBox.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred))
+        self.loopCheckBox.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.loopCheckBox.setToolTip('Bakes, caches, exports or freezes the noise as a seamless cycle that repeats every start to end frames.')
+        self.loopCheckBox.setChecked(False)
+
+        self.bakeOptionsLayout.addWidget(self.toleranceLabel)
+        self.bakeOptionsLayout.addWidget(self.toleranceSpinBox)
+        self.bakeOptionsLayout.addWidget(self.subFramesCheckBox)
+        self.bakeOptionsLayout.addWidget(self.loopCheckBox)
+
+        # Initialize bake button
         #
-        self.bakingLayout = QtWidgets.QGridLayout()
-        self.bakingLayout.setObjectName('bakingLayout')
-
-        self.bakingGroupBox = QtWidgets.QGroupBox('Baking:')
-        self.bakingGroupBox.setObjectName('bakingGroupBox')
-        self.bakingGroupBox.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed))
-        self.bakingGroupBox.setLayout(self.bakingLayout)
-
         self.bakePushButton = QtWidgets.QPushButton('Bake')
         self.bakePushButton.setObjectName('bakePushButton')
         self.bakePushButton.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed))
@@ -620,27 +1005,70 @@ class QNoiseEditor(qsingletonwindow.QSingletonWindow):
         self.bakePushButton.clicked.connect(self.on_bakePushButton_clicked)
 
         self.bakingLayout.addWidget(self.animationRangeWidget)
+        self.bakingLayout.addWidget(self.bakeOptionsWidget)
         self.bakingLayout.addWidget(self.bakePushButton)
-        
-        centralLayout.addWidget(self.bakingGroupBox)
-        
-        # Initialize graph group-box
+
+        self._startupTimings['__setup_baking_ui__'] = time.perf_counter() - startTime
+
+    def __setup_graph_ui__(self):
+        """
+        Private method that initializes the deferred graph widgets.
+
+        :rtype: None
+        """
+
+        # Check if widgets have already been initialized
         #
-        self.graphLayout = QtWidgets.QGridLayout()
-        self.graphLayout.setObjectName('graphLayout')
+        if self._graphWidgetsReady:
 
-        self.graphGroupBox = QtWidgets.QGroupBox('Graph:')
-        self.graphGroupBox.setObjectName('graphGroupBox')
-        self.graphGroupBox.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding))
-        self.graphGroupBox.setLayout(self.graphLayout)
+            return
 
-        self.noiseGraph = qnoisegraph.QNoiseGraph()
-        self.noiseGraph.setObjectName('noiseGraph')
-        self.noiseGraph.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred))
+        self._graphWidgetsReady = True
+        startTime = time.perf_counter()
 
-        self.graphLayout.addWidget(self.noiseGraph)
+        self._noiseGraph = qnoisegraph.QNoiseGraph()
+        self._noiseGraph.setObjectName('noiseGraph')
+        self._noiseGraph.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred))
 
-        centralLayout.addWidget(self.graphGroupBox)
+        self.graphLayout.addWidget(self._noiseGraph)
+
+        # Synchronize graph with the active selection
+        #
+        checkedId = self.radioButtonGroup.checkedId()
+        shakes = [noiseItem[checkedId] for noiseItem in self._noiseItems if noiseItem[checkedId] is not None] if self.isValidId(checkedId) else []
+
+        if len(shakes) > 0:
+
+            self.updateNoiseGraph(shakes[0])
+
+        self._startupTimings['__setup_graph_ui__'] = time.perf_counter() - startTime
+    # endregion
+
+    # region Events
+    def showEvent(self, event):
+        """
+        Event method called after the window has been shown.
+
+        :type event: QtGui.QShowEvent
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(QNoiseEditor, self).showEvent(event)
+
+        # Check if this is the first show
+        #
+        if self._hasShown:
+
+            return
+
+        self._hasShown = True
+        self._startupTimings['show'] = time.perf_counter() - self._startTime
+
+        # Schedule deferred widgets for idle time
+        #
+        QtCore.QTimer.singleShot(0, self.setupDeferredWidgets)
     # endregion
 
     # region Callbacks
@@ -652,7 +1080,93 @@ class QNoiseEditor(qsingletonwindow.QSingletonWindow):
         :rtype: None
         """
 
-        self.updateNoiseProperties()
+        # Time selection changes end-to-end
+        # Every selection change is recorded in a rolling latency histogram while tracing!
+        #
+        with traceutils.span('selectionChanged', category='callback', latency=True) as span:
+
+            self.updateNoiseProperties()
+            span.count('noiseItems', len(self._noiseItems))
+
+    def sceneChanged(self, *args, **kwargs):
+        """
+        Discards any pending bake before the current scene is replaced.
+        Cancelled bakes cannot be resumed in another scene so their duplicated source curves are deleted!
+
+        :key clientData: Any
+        :rtype: None
+        """
+
+        self.cancelBake()
+        self.discardBake()
+
+    def shakeAttributeChanged(self, msg, plug, otherPlug, clientData=None):
+        """
+        Queues the changed attribute for the next property refresh.
+
+        :type msg: int
+        :type plug: om.MPlug
+        :type otherPlug: om.MPlug
+        :type clientData: int
+        :rtype: None
+        """
+
+        # Check if a frozen shake requires thawing
+        # Shakes frozen by an earlier session are only discovered once they're edited from the selection!
+        #
+        if (msg & om.MNodeMessage.kAttributeSet) != 0:
+
+            self.queueThaw(mpynode.MPyNode(plug.node()))
+
+        # Check if change originated from this window
+        #
+        if self._pushingNoise:
+
+            return
+
+        # Evaluate message type
+        #
+        mask = om.MNodeMessage.kAttributeSet | om.MNodeMessage.kConnectionMade | om.MNodeMessage.kConnectionBroken
+        isRelevant = (msg & mask) != 0
+
+        if not isRelevant:
+
+            return
+
+        # Check if shake belongs to the active component
+        #
+        if clientData != self.radioButtonGroup.checkedId():
+
+            return
+
+        # Queue attribute and schedule refresh
+        #
+        attributeName = plug.partialName(useLongNames=True)
+        self._pendingAttributes.add(attributeName)
+
+        if not self._refreshTimer.isActive():
+
+            self._refreshTimer.start()
+
+    def frozenShakeAttributeChanged(self, msg, plug, otherPlug, clientData=None):
+        """
+        Queues the changed shake node for thawing.
+
+        :type msg: int
+        :type plug: om.MPlug
+        :type otherPlug: om.MPlug
+        :type clientData: Any
+        :rtype: None
+        """
+
+        # Evaluate message type
+        # Connection changes are ignored since freezing and thawing make them!
+        #
+        if (msg & om.MNodeMessage.kAttributeSet) == 0:
+
+            return
+
+        self.queueThaw(mpynode.MPyNode(plug.node()))
     # endregion
 
     # region Properties
@@ -666,6 +1180,58 @@ class QNoiseEditor(qsingletonwindow.QSingletonWindow):
 
         return self._scene()
 
+    @property
+    def noiseGraph(self):
+        """
+        Getter method that returns the noise graph.
+        If the graph widgets have not been initialized yet then they are built on demand!
+
+        :rtype: qnoisegraph.QNoiseGraph
+        """
+
+        self.__setup_graph_ui__()
+        return self._noiseGraph
+
+    @property
+    def noiseSweep(self):
+        """
+        Getter method that returns the noise sweep.
+        The sweep is built as a tool window the first time it is accessed!
+
+        :rtype: qnoisesweep.QNoiseSweep
+        """
+
+        if self._noiseSweep is None:
+
+            self._noiseSweep = qnoisesweep.QNoiseSweep(parent=self, f=QtCore.Qt.Tool)
+            self._noiseSweep.setObjectName('noiseSweep')
+            self._noiseSweep.setWindowTitle('|| Noise Sweep')
+            self._noiseSweep.resize(QtCore.QSize(640, 400))
+            self._noiseSweep.parametersClicked.connect(self.on_noiseSweep_parametersClicked)
+
+        return self._noiseSweep
+
+    @property
+    def profiles(self):
+        """
+        Getter method that returns the most recent profile of each operation.
+        Profiling can be toggled at runtime through `profileutils.enable` and `profileutils.disable`!
+
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+
+        return dict(self._profiles)
+
+    @property
+    def startupTimings(self):
+        """
+        Getter method that returns the startup time, in seconds, spent in each initialization phase.
+
+        :rtype: Dict[str, float]
+        """
+
+        return dict(self._startupTimings)
+
     @property
     def startTime(self):
         """
@@ -674,6 +1240,7 @@ class QNoiseEditor(qsingletonwindow.QSingletonWindow):
         :rtype: int
         """
 
+        self.__setup_baking_ui__()
         return self.startSpinBox.value()
 
     @startTime.setter
@@ -685,6 +1252,7 @@ class QNoiseEditor(qsingletonwindow.QSingletonWindow):
         :rtype: None
         """
 
+        self.__setup_baking_ui__()
         self.startSpinBox.setValue(startTime)
 
     @property
@@ -695,6 +1263,7 @@ class QNoiseEditor(qsingletonwindow.QSingletonWindow):
         :rtype: int
         """
 
+        self.__setup_baking_ui__()
         return self.endSpinBox.value()
 
     @endTime.setter
@@ -706,16 +1275,19 @@ class QNoiseEditor(qsingletonwindow.QSingletonWindow):
         :rtype: None
         """
 
+        self.__setup_baking_ui__()
         self.endSpinBox.setValue(endTime)
 
     @property
     def step(self):
         """
         Getter method that returns the step interval.
+        A step of zero picks a rate for each control from the bandwidth of its noise!
 
         :rtype: int
         """
 
+        self.__setup_baking_ui__()
         return self.stepSpinBox.value()
 
     @step.setter
@@ -727,686 +1299,2020 @@ class QNoiseEditor(qsingletonwindow.QSingletonWindow):
         :rtype: None
         """
 
+        self.__setup_baking_ui__()
         self.stepSpinBox.setValue(interval)
-    # endregion
 
-    # region Methods
-    def addCallbacks(self):
+    @property
+    def bakeTarget(self):
         """
-        Adds any callbacks required by this window.
+        Getter method that returns the bake target.
 
-        :rtype: None
+        :rtype: bakeutils.BakeTarget
         """
 
-        # Check if callbacks exists
-        #
-        hasCallbacks = len(self._callbackIds) > 0
+        self.__setup_baking_ui__()
+        return bakeutils.BakeTarget(self.bakeTargetComboBox.currentIndex())
 
-        if not hasCallbacks:
+    @bakeTarget.setter
+    def bakeTarget(self, bakeTarget):
+        """
+        Setter method that updates the bake target.
 
-            callbackId = om.MEventMessage.addEventCallback('SelectionChanged', onSelectionChanged)
-            self._callbackIds.append(callbackId)
+        :type bakeTarget: Union[bakeutils.BakeTarget, int]
+        :rtype: None
+        """
 
-        # Force selection update
-        #
-        self.selectionChanged()
+        self.__setup_baking_ui__()
+        self.bakeTargetComboBox.setCurrentIndex(int(bakeTarget))
 
-    def removeCallbacks(self):
+    @property
+    def subFrames(self):
         """
-        Removes any callbacks created by this window.
+        Getter method that returns the flag that allows automatic steps to sample between frames.
 
-        :rtype: None
+        :rtype: bool
         """
 
-        # Check if callbacks exists
-        #
-        hasCallbacks = len(self._callbackIds) > 0
-
-        if hasCallbacks:
-
-            om.MEventMessage.removeCallbacks(self._callbackIds)
-            self._callbackIds.clear()
+        self.__setup_baking_ui__()
+        return self.subFramesCheckBox.isChecked()
 
-    def loadPlugins(self):
+    @subFrames.setter
+    def subFrames(self, subFrames):
         """
-        Loads the required plugins.
+        Setter method that updates the flag that allows automatic steps to sample between frames.
 
+        :type subFrames: bool
         :rtype: None
         """
 
-        # Check if plug-ins exist
-        #
-        missingPlugins = [plugin for plugin in self.__plugins__ if not pluginutils.doesPluginExist(plugin)]
-        isMissing = len(missingPlugins) > 0
-
-        if isMissing:
-
-            # Prompt user to download plug-ins
-            #
-            response = QtWidgets.QMessageBox.question(
-                self,
-                'Noise Editor',
-                'Do you want to download the missing plug-ins?',
-                QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No
-            )
-
-            if response == QtWidgets.QMessageBox.No:
-
-                return
-
-            # Check if user plug-in path exists
-            #
-            mayaVersion = mc.about(version=True)
-            mayaDirectory = os.path.abspath(os.environ['MAYA_APP_DIR'])
-            mayaPlugins = os.path.join(mayaDirectory, mayaVersion, 'plug-ins')
+        self.__setup_baking_ui__()
+        self.subFramesCheckBox.setChecked(subFrames)
 
-            pluginutils.ensurePluginPath(mayaPlugins)
+    @property
+    def loop(self):
+        """
+        Getter method that returns the flag that bakes, caches, exports or freezes noise as a seamless cycle.
 
-            # Download missing plugins
-            #
-            pluginExtension = pluginutils.getPluginExtension()
+        :rtype: bool
+        """
 
-            for plugin in missingPlugins:
+        self.__setup_baking_ui__()
+        return self.loopCheckBox.isChecked()
 
-                pluginUrl = f'https://github.com/bhsingleton/{plugin}/releases/download/{mayaVersion}/{plugin}.{pluginExtension}'
-                pluginPath = os.path.join(mayaPlugins, f'{plugin}.{pluginExtension}')
+    @loop.setter
+    def loop(self, loop):
+        """
+        Setter method that updates the flag that bakes, caches, exports or freezes noise as a seamless cycle.
 
-                pluginutils.downloadPlugin(pluginUrl, pluginPath)
+        :type loop: bool
+        :rtype: None
+        """
 
-        # Try and load plugin
-        #
-        for plugin in self.__plugins__:
+        self.__setup_baking_ui__()
+        self.loopCheckBox.setChecked(loop)
 
-            pluginPath = pluginutils.pathToPlugin(plugin)
-            success = pluginutils.tryLoadPlugin(pluginPath)
+    @property
+    def chunkSize(self):
+        """
+        Getter method that returns the number of frames baked at a time.
+        A chunk size of zero bakes every frame at once!
 
-            if not success:
+        :rtype: int
+        """
 
-                log.warning(f'Unable to load plug-in: {pluginPath}')
+        self.__setup_baking_ui__()
+        return self.chunkSizeSpinBox.value()
 
-    def isValidId(self, id):
+    @chunkSize.setter
+    def chunkSize(self, chunkSize):
         """
-        Evaluates if the supplied ID is valid.
+        Setter method that updates the number of frames baked at a time.
 
-        :type id: int
-        :rtype: bool
+        :type chunkSize: int
+        :rtype: None
         """
 
-        return id in self.__ids__
+        self.__setup_baking_ui__()
+        self.chunkSizeSpinBox.setValue(chunkSize)
 
-    def iterControls(self, fromSelection=False):
+    @property
+    def tolerance(self):
         """
-        Returns a generator that yields animatable controls.
+        Getter method that returns the key reduction tolerance.
+        A tolerance of zero keeps every baked key!
 
-        :type fromSelection: bool
-        :rtype: Iterator[mpynode.MPyNode]
+        :rtype: float
         """
 
-        if fromSelection:
+        self.__setup_baking_ui__()
+        return self.toleranceSpinBox.value()
 
-            yield from self.scene.iterSelection(apiType=om.MFn.kTransform)
+    @tolerance.setter
+    def tolerance(self, tolerance):
+        """
+        Setter method that updates the key reduction tolerance.
 
-        else:
+        :type tolerance: float
+        :rtype: None
+        """
 
-            yield from self.scene.iterAnimatableNodes()
+        self.__setup_baking_ui__()
+        self.toleranceSpinBox.setValue(tolerance)
 
-    def iterShakes(self, fromSelection=False):
+    @property
+    def reduction(self):
         """
-        Returns a generator that yields shake components from the scene.
+        Getter method that returns the key reduction results from the most recent bake.
 
-        :type fromSelection: bool
-        :rtype: Iterator[NoiseItem]
+        :rtype: Union[keyutils.KeyReduction, None]
         """
 
-        # Iterate through selected controls
-        #
-        for node in self.iterControls(fromSelection=fromSelection):
-
-            # Evaluate `offsetParentMatrix` plug
-            #
-            plug = node['offsetParentMatrix']
+        return self._reduction
 
-            if not plug.isDestination:
+    @property
+    def wiringMode(self):
+        """
+        Getter method that returns the wiring mode for new noise.
 
-                continue
+        :rtype: referenceutils.WiringMode
+        """
 
-            # Check if source plug is a `composeTransform` node
-            # If the node is referenced then skip it to avoid breaking any custom rig functionality!
-            #
-            sourcePlug = plug.source()
-            sourceNode = mpynode.MPyNode(sourcePlug.node())
+        return referenceutils.WiringMode.MINIMAL if self.minimalEditsCheckBox.isChecked() else referenceutils.WiringMode.STANDARD
 
-            if sourceNode.typeName != 'composeTransform' or sourceNode.isFromReferencedFile:
+    @wiringMode.setter
+    def wiringMode(self, wiringMode):
+        """
+        Setter method that updates the wiring mode for new noise.
 
-                continue
+        :type wiringMode: Union[referenceutils.WiringMode, int]
+        :rtype: None
+        """
 
-            # Find associated `shake` nodes
-            #
-            composeTransform = sourceNode
-            positionShake, rotationShake, scaleShake = noiseutils.findAssociatedShakes(composeTransform)
-
-            yield NoiseItem(
-                node=node,
-                transform=composeTransform,
-                position=positionShake,
-                rotation=rotationShake,
-                scale=scaleShake
-            )
+        self.minimalEditsCheckBox.setChecked(wiringMode == referenceutils.WiringMode.MINIMAL)
 
-    def toggleNoiseProperties(self, state):
+    @property
+    def editReport(self):
         """
-        Updates the enabled state on the property widgets.
+        Getter method that returns the reference edit counts from the most recent create, paste or delete.
 
-        :type state: bool
-        :rtype: None
+        :rtype: Union[referenceutils.EditReport, None]
         """
 
-        self.interopWidget.setEnabled(state)
-        self.bakingGroupBox.setEnabled(state)
-        self.noiseGraph.setEnabled(state)
+        return self._editReport
 
-    def enableNoiseProperties(self):
+    @property
+    def bakeJob(self):
         """
-        Enables the noise property widgets.
+        Getter method that returns the background bake that is currently running.
 
-        :rtype: None
+        :rtype: Union[qbakejob.QBakeJob, None]
         """
 
-        self.toggleNoiseProperties(True)
+        return self._bakeJob
 
-    def disableNoiseProperties(self):
+    @property
+    def pendingBake(self):
         """
-        Disables the noise property widgets.
+        Getter method that returns the cancelled streaming bake that can be resumed.
 
-        :rtype: None
+        :rtype: Union[bakeutils.NoiseBaker, None]
         """
 
-        self.toggleNoiseProperties(False)
+        return self._baker
+    # endregion
 
-    def updateNoiseProperties(self):
+    # region Methods
+    def addCallbacks(self):
         """
-        Updates the noise property widgets.
+        Adds any callbacks required by this window.
 
         :rtype: None
         """
 
-        # Get selected shake nodes
+        # Check if callbacks exists
         #
-        checkedId = self.radioButtonGroup.checkedId()
-        index = checkedId if (checkedId != -1) else None
+        hasCallbacks = len(self._callbackIds) > 0
 
-        shakes = [noiseItem[index] for noiseItem in self.iterShakes(fromSelection=True) if noiseItem[index] is not None] if index is not None else []
-        numShakes = len(shakes)
+        if not hasCallbacks:
 
-        if numShakes == 0:
+            callbackId = om.MEventMessage.addEventCallback('SelectionChanged', onSelectionChanged)
+            self._callbackIds.append(callbackId)
 
-            self.disableNoiseProperties()
-            return
+            callbackId = om.MSceneMessage.addCallback(om.MSceneMessage.kBeforeNew, onSceneChanged)
+            self._callbackIds.append(callbackId)
 
-        # Iterate through property widgets
-        #
-        self.enableNoiseProperties()
+            callbackId = om.MSceneMessage.addCallback(om.MSceneMessage.kBeforeOpen, onSceneChanged)
+            self._callbackIds.append(callbackId)
 
-        for (i, widget) in enumerate(self.noisePropertyWidgets):
+        # Force selection update
+        #
+        self.selectionChanged()
 
-            # Evaluate selected shake nodes
-            #
-            widget.blockSignals(True)
+    def removeCallbacks(self):
+        """
+        Removes any callbacks created by this window.
 
-            if len(shakes) == 0:
+        :rtype: None
+        """
 
-                widget.lineEdit().setText('')
+        # Check if callbacks exists
+        #
+        hasCallbacks = len(self._callbackIds) > 0
 
-            elif len(shakes) == 1:
+        if hasCallbacks:
 
-                widget.setValue(shakes[0].getAttr(widget.whatsThis()))
+            om.MMessage.removeCallbacks(self._callbackIds)
+            self._callbackIds.clear()
 
-            else:
+        # Remove any shake callbacks
+        #
+        self._noiseItems.clear()
+        self.updateShakeCallbacks()
+        self.removeFrozenCallbacks()
 
-                values = list({shake.getAttr(widget.whatsThis()) for shake in shakes})
-                isIdentical = len(values) == 1
+        self._pendingThaws.clear()
+        self._thawTimer.stop()
 
-                if isIdentical:
+        self._pendingAttributes.clear()
+        self._refreshTimer.stop()
 
-                    widget.setValue(values[0])
+        # Cancel any background downloads
+        #
+        self.cancelPluginDownloads()
 
-                else:
+        # Discard any pending bake
+        # Otherwise its duplicated source curves would be left behind in the scene!
+        #
+        self.cancelBake()
+        self.discardBake()
 
-                    widget.lineEdit().setText('Mixed Values')
+    def updateShakeCallbacks(self):
+        """
+        Re-binds the attribute-changed callbacks to the selected shake nodes.
+        Only the shakes that entered or left the selection have their callbacks added or removed!
 
-            widget.blockSignals(False)
+        :rtype: None
+        """
 
-        # Iterate through check boxes
+        # Collect selected shake nodes
+        # Callbacks are only bound while the selection callback is active!
         #
-        for (i, checkBox) in enumerate(self.noiseCheckBoxes):
+        hasCallbacks = len(self._callbackIds) > 0
+        shakes = {}
 
-            # Evaluate selected shake nodes
-            #
-            checkBox.blockSignals(True)
+        if hasCallbacks:
 
-            if len(shakes) == 0:
+            for noiseItem in self._noiseItems:
 
-                checkBox.setChecked(False)
+                for id in self.__ids__:
 
-            elif len(shakes) == 1:
+                    shake = noiseItem[id]
 
-                checkBox.setChecked(shakes[0].getAttr(checkBox.whatsThis()))
+                    if shake is None:
 
-            else:
+                        continue
 
-                values = list({shake.getAttr(checkBox.whatsThis()) for shake in shakes})
-                isIdentical = len(values) == 1
+                    hashCode = om.MObjectHandle(shake.object()).hashCode()
+                    shakes[hashCode] = (shake, id)
 
-                if isIdentical:
+        # Remove callbacks from deselected shake nodes
+        #
+        obsoleteHashCodes = [hashCode for hashCode in self._shakeCallbackIds.keys() if hashCode not in shakes]
 
-                    checkBox.setChecked(values[0])
+        for hashCode in obsoleteHashCodes:
 
-                else:
+            callbackId = self._shakeCallbackIds.pop(hashCode)
+
+            try:
+
+                om.MMessage.removeCallback(callbackId)
 
-                    checkBox.setCheckState(QtCore.Qt.PartiallyChecked)
+            except RuntimeError:
 
-            checkBox.blockSignals(False)
+                continue  # Node has already been deleted!
 
-        # Update noise graph
+        # Add callbacks to newly selected shake nodes
         #
-        self.updateNoiseGraph(shakes[0])
+        for (hashCode, (shake, id)) in shakes.items():
 
-    def updateNoiseGraph(self, shake):
-        """
-        Updates the noise graph widget.
+            if hashCode in self._shakeCallbackIds:
 
-        :type shake: mpynode.MPyNode
-        :rtype: None
-        """
+                continue
 
-        self.noiseGraph.seed = shake.getAttr('seed')
-        self.noiseGraph.frequency = shake.getAttr('frequency')
-        self.noiseGraph.roughness = shake.getAttr('roughness')
-        self.noiseGraph.fractal = shake.getAttr('fractal')
-        self.noiseGraph.rampIn = shake.getAttr('rampIn')
-        self.noiseGraph.rampOut = shake.getAttr('rampOut')
+            callbackId = om.MNodeMessage.addAttributeChangedCallback(shake.object(), onShakeAttributeChanged, id)
+            self._shakeCallbackIds[hashCode] = callbackId
 
-    def setDefaultNoiseProperties(self, shake):
+    def addFrozenCallbacks(self, shakes):
         """
-        Updates the default value of the noise properties.
+        Binds attribute-changed callbacks to the supplied frozen shake nodes.
+        Any parameter change will then flip the shake back to live evaluation!
 
-        :type shake: mpynode.MPyNode
+        :type shakes: List[mpynode.MPyNode]
         :rtype: None
         """
-        
-        shake.setAttr('frequency', 5.0)
-        shake.setAttr('roughness', 0.5)
 
-    @undo.Undo(state=False)
-    def createNoise(self):
-        """
-        Assigns shake nodes to the active selection.
+        for shake in shakes:
 
-        :rtype: None
-        """
+            hashCode = om.MObjectHandle(shake.object()).hashCode()
 
-        with animate.Animate(state=False):
+            if hashCode in self._frozenCallbackIds:
 
-            # Iterate through selected controls
-            #
-            timeNode = mpynode.MPyNode('time1')
+                continue
 
-            for node in self.iterControls(fromSelection=True):
+            callbackId = om.MNodeMessage.addAttributeChangedCallback(shake.object(), onFrozenShakeAttributeChanged)
+            self._frozenCallbackIds[hashCode] = callbackId
 
-                # Evaluate `offsetParentMatrix` plug connections
-                #
-                nodeName = node.name()
-                plug = node['offsetParentMatrix']
+    def removeFrozenCallbacks(self, shakes=None):
+        """
+        Removes the attribute-changed callbacks from the supplied frozen shake nodes.
+        If no shakes are supplied then all frozen callbacks are removed!
+
+        :type shakes: Union[List[mpynode.MPyNode], None]
+        :rtype: None
+        """
 
-                composeTransform = None
+        # Collect obsolete callbacks
+        #
+        if shakes is None:
 
-                if plug.isDestination:
+            hashCodes = list(self._frozenCallbackIds.keys())
 
-                    sourceNode = mpynode.MPyNode(plug.source().node())
+        else:
 
-                    if sourceNode.typeName == 'composeTransform':
+            hashCodes = [om.MObjectHandle(shake.object()).hashCode() for shake in shakes]
 
-                        composeTransform = sourceNode
+        # Remove callbacks
+        #
+        for hashCode in hashCodes:
 
-                    else:
+            callbackId = self._frozenCallbackIds.pop(hashCode, None)
 
-                        continue
-                else:
+            if callbackId is None:
+
+                continue
 
-                    composeTransformName = f'{node.name()}_composeTransform'
-                    composeTransform = self.scene.createNode('composeTransform', name=composeTransformName)
-                    composeTransform.setAttr('inputOffsetParentMatrix', node.getAttr('offsetParentMatrix'))
-                    composeTransform.connectPlugs(node['translate'], 'inputRotatePivot')
-                    composeTransform.connectPlugs(node['translate'], 'inputScalePivot')
-                    composeTransform.connectPlugs(node['rotateOrder'], 'inputRotateOrder')
-                    composeTransform.connectPlugs('outputMatrix', plug)
+            try:
 
-                # Check if position is checked
-                #
-                if self.posCheckBox.isChecked():
+                om.MMessage.removeCallback(callbackId)
 
-                    if not plugutils.hasConnection(composeTransform['inputTranslate']):
+            except RuntimeError:
 
-                        shakeName = f'{nodeName}_positionShake'
-                        shake = self.scene.createNode('shake', name=shakeName)
-                        self.setDefaultNoiseProperties(shake)
+                continue  # Node has already been deleted!
 
-                        shake.connectPlugs('outputTranslate', composeTransform['inputTranslate'])
-                        shake.connectPlugs(timeNode['outTime'], 'time')
+    def queueThaw(self, shake):
+        """
+        Queues the supplied shake node for thawing, if it is frozen.
 
-                    else:
+        :type shake: mpynode.MPyNode
+        :rtype: None
+        """
 
-                        log.warning(f'"{nodeName}" control already has position noise!')
+        # Check if shake is already queued
+        #
+        hashCode = om.MObjectHandle(shake.object()).hashCode()
 
-                # Check if rotation is checked
-                #
-                if self.rotCheckBox.isChecked():
+        if hashCode in self._pendingThaws:
 
-                    if not plugutils.hasConnection(composeTransform['inputRotate']):
+            return
 
-                        shakeName = f'{nodeName}_rotationShake'
-                        shake = self.scene.createNode('shake', name=shakeName)
-                        self.setDefaultNoiseProperties(shake)
+        # Check if shake is frozen
+        # Tracked shakes are known to be frozen which skips the connection lookup!
+        #
+        isFrozen = hashCode in self._frozenCallbackIds or freezeutils.isFrozen(shake)
 
-                        shake.connectPlugs('outputRotate', composeTransform['inputRotate'])
-                        shake.connectPlugs(timeNode['outTime'], 'time')
+        if not isFrozen:
 
-                    else:
+            return
 
-                        log.warning(f'"{nodeName}" control already has rotation noise!')
+        self._pendingThaws[hashCode] = shake
 
-                # Check if scale is checked
-                #
-                if self.scaleCheckBox.isChecked():
+        if not self._thawTimer.isActive():
 
-                    if not plugutils.hasConnection(composeTransform['inputScale']):
+            self._thawTimer.start()
 
-                        shakeName = f'{nodeName}_scaleShake'
-                        shake = self.scene.createNode('shake', name=shakeName)
-                        self.setDefaultNoiseProperties(shake)
+    def setupDeferredWidgets(self):
+        """
+        Initializes any deferred widgets that have not been accessed yet.
 
-                        shake.connectPlugs('outputScale', composeTransform['inputScale'])
-                        shake.connectPlugs(timeNode['outTime'], 'time')
+        :rtype: None
+        """
 
-                    else:
+        self.__setup_baking_ui__()
+        self.__setup_graph_ui__()
 
-                        log.warning(f'"{nodeName}" control already has scale noise!')
+        self.refreshPresets()
 
-            # Invalidate noise properties
-            #
-            self.updateNoiseProperties()
+        self._startupTimings['ready'] = time.perf_counter() - self._startTime
+        log.debug(f'Noise editor startup timings: {self.startupTimings}')
 
-    @undo.Undo(state=False)
-    def selectNoise(self):
+    def loadPlugins(self):
         """
-        Selects any controls with shake nodes from the scene file.
+        Loads the required plugins.
 
         :rtype: None
         """
 
-        # Check if position is enabled
+        startTime = time.perf_counter()
+
+        # Check if plug-ins are already loaded
         #
-        nodes = []
+        unloadedPlugins = [plugin for plugin in self.__plugins__ if not pluginloader.isPluginLoaded(plugin)]
+        numUnloaded = len(unloadedPlugins)
 
-        if self.posCheckBox.isChecked():
+        if numUnloaded == 0:
 
-            found = [noiseItem.node for noiseItem in self.iterShakes(fromSelection=False) if noiseItem.position is not None]
-            nodes.extend(found)
+            self._startupTimings['loadPlugins'] = time.perf_counter() - startTime
+            return
 
-        # Check if rotation is enabled
+        # Check if plug-ins exist
         #
-        if self.rotCheckBox.isChecked():
+        pluginPaths = pluginloader.resolvePlugins(unloadedPlugins)
 
-            found = [noiseItem.node for noiseItem in self.iterShakes(fromSelection=False) if noiseItem.rotation is not None]
-            nodes.extend(found)
+        missingPlugins = [plugin for plugin in unloadedPlugins if pluginPaths.get(plugin) is None]
+        numMissing = len(missingPlugins)
+        isMissing = numMissing > 0
 
-        # Check if scale is enabled
+        # Initialize progress dialog
         #
-        if self.scaleCheckBox.isChecked():
+        progressDialog = QtWidgets.QProgressDialog('Loading plug-ins...', 'Cancel', 0, numMissing + 1, parent=self)
+        progressDialog.setWindowTitle('Noise Editor')
+        progressDialog.setWindowModality(QtCore.Qt.WindowModal)
+        progressDialog.setMinimumDuration(250)
+        progressDialog.setCancelButton(None)
 
-            found = [noiseItem.node for noiseItem in self.iterShakes(fromSelection=False) if noiseItem.scale is not None]
-            nodes.extend(found)
+        self._pluginProgressDialog = progressDialog
+        self._pluginPaths = pluginPaths
 
-        # Update active selection
+        self.setupGroupBox.setEnabled(False)
+
+        # Check if any plug-ins are missing
         #
-        self.scene.setSelection(nodes)
+        if not isMissing:
 
-    @undo.Undo(state=False)
-    def deleteNoise(self, fromSelection=True):
-        """
-        Deletes any shake nodes from the active selection.
+            self.finishLoadingPlugins()
 
-        :type fromSelection: bool
-        :rtype: None
-        """
+            self._startupTimings['loadPlugins'] = time.perf_counter() - startTime
+            return
 
-        with animate.Animate(state=False):
+        # Prompt user to download plug-ins
+        #
+        response = QtWidgets.QMessageBox.question(
+            self,
+            'Noise Editor',
+            'Do you want to download the missing plug-ins?',
+            QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No
+        )
 
-            # Iterate through selected nodes
-            #
-            for noiseItem in self.iterShakes(fromSelection=fromSelection):
+        if response == QtWidgets.QMessageBox.No:
 
-                # Check if position requires deleting
-                #
-                if self.posCheckBox.isChecked() and noiseItem.position is not None:
+            self._pluginPaths = {}
+            self.finishLoadingPlugins()
 
-                    noiseItem.position.delete()
-                    noiseItem.transform.resetAttr('inputTranslate')
+            self._startupTimings['loadPlugins'] = time.perf_counter() - startTime
+            return
 
-                # Check if rotation requires deleting
-                #
-                if self.rotCheckBox.isChecked() and noiseItem.rotation is not None:
+        # Check if user plug-in path exists
+        #
+        mayaVersion = mc.about(version=True)
+        mayaDirectory = os.path.abspath(os.environ['MAYA_APP_DIR'])
+        mayaPlugins = os.path.join(mayaDirectory, mayaVersion, 'plug-ins')
+
+        pluginutils.ensurePluginPath(mayaPlugins)
+
+        # Download missing plugins in the background
+        # Finished downloads are collected by the download timer, which loads the plug-ins once every download is done!
+        #
+        progressDialog.setLabelText('Downloading plug-ins...')
+        progressDialog.setValue(0)
+
+        self._pluginDownloader = pluginloader.PluginDownloader(missingPlugins, mayaPlugins)
+        self._pluginDownloader.start()
+
+        self._downloadTimer.start()
+
+        self._startupTimings['loadPlugins'] = time.perf_counter() - startTime
+
+    def finishLoadingPlugins(self):
+        """
+        Loads the resolved and downloaded plug-ins, then restores the interface.
+
+        :rtype: None
+        """
+
+        progressDialog, self._pluginProgressDialog = self._pluginProgressDialog, None
+        pluginPaths, self._pluginPaths = self._pluginPaths, {}
+
+        try:
+
+            # Try and load plugins
+            #
+            if progressDialog is not None:
+
+                progressDialog.setLabelText('Loading plug-ins...')
+                progressDialog.setValue(max(0, progressDialog.maximum() - 1))
+
+            pluginloader.loadPlugins({plugin: pluginPath for (plugin, pluginPath) in pluginPaths.items() if pluginPath is not None})
+
+        finally:
+
+            if progressDialog is not None:
+
+                progressDialog.setValue(progressDialog.maximum())
+                progressDialog.deleteLater()
+
+            self.setupGroupBox.setEnabled(True)
+            self._startupTimings['pluginsLoaded'] = time.perf_counter() - self._startTime
+
+    def cancelPluginDownloads(self):
+        """
+        Cancels any plug-in downloads that are still running.
+
+        :rtype: None
+        """
+
+        downloader, self._pluginDownloader = self._pluginDownloader, None
+
+        if downloader is None:
+
+            return
+
+        self._downloadTimer.stop()
+        downloader.cancel()
+
+        progressDialog, self._pluginProgressDialog = self._pluginProgressDialog, None
+        self._pluginPaths = {}
+
+        if progressDialog is not None:
+
+            progressDialog.close()
+            progressDialog.deleteLater()
+
+        self.setupGroupBox.setEnabled(True)
+
+    def isValidId(self, id):
+        """
+        Evaluates if the supplied ID is valid.
+
+        :type id: int
+        :rtype: bool
+        """
+
+        return id in self.__ids__
+
+    def iterControls(self, fromSelection=False):
+        """
+        Returns a generator that yields animatable controls.
+
+        :type fromSelection: bool
+        :rtype: Iterator[mpynode.MPyNode]
+        """
+
+        if fromSelection:
+
+            yield from self.scene.iterSelection(apiType=om.MFn.kTransform)
+
+        else:
+
+            yield from self.scene.iterAnimatableNodes()
+
+    def iterShakes(self, fromSelection=False):
+        """
+        Returns a generator that yields shake components from the scene.
+
+        :type fromSelection: bool
+        :rtype: Iterator[NoiseItem]
+        """
+
+        # Iterate through selected controls
+        #
+        for node in self.iterControls(fromSelection=fromSelection):
+
+            noiseItem = self.getNoiseItem(node)
+
+            if noiseItem is not None:
+
+                yield noiseItem
+
+    def getNoiseItem(self, node):
+        """
+        Returns the shake components from the supplied control.
+        If the control has no compose transform then none is returned!
+
+        :type node: mpynode.MPyNode
+        :rtype: Union[NoiseItem, None]
+        """
+
+        # Evaluate `offsetParentMatrix` plug
+        #
+        plug = node['offsetParentMatrix']
+
+        if not plug.isDestination:
+
+            return None
+
+        # Check if source plug is a `composeTransform` node
+        # If the node is referenced then skip it to avoid breaking any custom rig functionality!
+        #
+        sourcePlug = plug.source()
+        sourceNode = mpynode.MPyNode(sourcePlug.node())
+
+        if sourceNode.typeName != 'composeTransform' or sourceNode.isFromReferencedFile:
+
+            return None
+
+        # Find associated `shake` nodes
+        #
+        composeTransform = sourceNode
+        positionShake, rotationShake, scaleShake = noiseutils.findAssociatedShakes(composeTransform)
+
+        return NoiseItem(
+            node=node,
+            transform=composeTransform,
+            position=positionShake,
+            rotation=rotationShake,
+            scale=scaleShake
+        )
+
+    def toggleNoiseProperties(self, state):
+        """
+        Updates the enabled state on the property widgets.
+
+        :type state: bool
+        :rtype: None
+        """
+
+        self.interopWidget.setEnabled(state)
+        self.applyPresetPushButton.setEnabled(state)
+        self.savePresetPushButton.setEnabled(state)
+        self.bakingGroupBox.setEnabled(state)
+        self.graphGroupBox.setEnabled(state)
+
+    def enableNoiseProperties(self):
+        """
+        Enables the noise property widgets.
+
+        :rtype: None
+        """
+
+        self.toggleNoiseProperties(True)
+
+    def disableNoiseProperties(self):
+        """
+        Disables the noise property widgets.
+
+        :rtype: None
+        """
+
+        self.toggleNoiseProperties(False)
+
+    @traceutils.traced(category='editor')
+    def updateNoiseProperties(self, attributes=None):
+        """
+        Updates the noise property widgets.
+        If a collection of attribute names is supplied then only the associated widgets are refreshed!
+
+        :type attributes: Union[Set[str], None]
+        :rtype: None
+        """
+
+        # Check if selected noise items require collecting
+        #
+        if attributes is None:
+
+            self._noiseItems = list(self.iterShakes(fromSelection=True))
+            self.updateShakeCallbacks()
+
+        # Get selected shake nodes
+        #
+        checkedId = self.radioButtonGroup.checkedId()
+        index = checkedId if (checkedId != -1) else None
+
+        shakes = [noiseItem[index] for noiseItem in self._noiseItems if noiseItem[index] is not None] if index is not None else []
+        numShakes = len(shakes)
+
+        traceutils.count('shakes', numShakes)
+
+        if numShakes == 0:
+
+            self.disableNoiseProperties()
+            return
+
+        # Iterate through property widgets
+        #
+        self.enableNoiseProperties()
+
+        widgets = [widget for widget in self.noisePropertyWidgets if attributes is None or widget.whatsThis() in attributes]
+
+        for widget in widgets:
+
+            self.updateNoisePropertyWidget(widget, shakes)
+
+        # Iterate through check boxes
+        #
+        checkBoxes = [checkBox for checkBox in self.noiseCheckBoxes if attributes is None or checkBox.whatsThis() in attributes]
+
+        for checkBox in checkBoxes:
+
+            self.updateNoiseCheckBox(checkBox, shakes)
+
+        # Check if noise graph requires updating
+        #
+        if attributes is None or not attributes.isdisjoint(self.__graph_attributes__):
+
+            self.updateNoiseGraph(shakes[0])
+
+    def updateNoisePropertyWidget(self, widget, shakes):
+        """
+        Updates the supplied spin box from the specified shake nodes.
+
+        :type widget: Union[QtWidgets.QSpinBox, QtWidgets.QDoubleSpinBox]
+        :type shakes: List[mpynode.MPyNode]
+        :rtype: None
+        """
+
+        # Evaluate selected shake nodes
+        #
+        widget.blockSignals(True)
+
+        if len(shakes) == 0:
+
+            widget.lineEdit().setText('')
+
+        elif len(shakes) == 1:
+
+            widget.setValue(shakes[0].getAttr(widget.whatsThis()))
+
+        else:
+
+            values = list({shake.getAttr(widget.whatsThis()) for shake in shakes})
+            isIdentical = len(values) == 1
+
+            if isIdentical:
+
+                widget.setValue(values[0])
+
+            else:
+
+                widget.lineEdit().setText('Mixed Values')
+
+        widget.blockSignals(False)
+
+    def updateNoiseCheckBox(self, checkBox, shakes):
+        """
+        Updates the supplied check box from the specified shake nodes.
+
+        :type checkBox: QtWidgets.QCheckBox
+        :type shakes: List[mpynode.MPyNode]
+        :rtype: None
+        """
+
+        # Evaluate selected shake nodes
+        #
+        checkBox.blockSignals(True)
+
+        if len(shakes) == 0:
+
+            checkBox.setChecked(False)
+
+        elif len(shakes) == 1:
+
+            checkBox.setChecked(shakes[0].getAttr(checkBox.whatsThis()))
+
+        else:
+
+            values = list({shake.getAttr(checkBox.whatsThis()) for shake in shakes})
+            isIdentical = len(values) == 1
+
+            if isIdentical:
+
+                checkBox.setChecked(values[0])
+
+            else:
+
+                checkBox.setCheckState(QtCore.Qt.PartiallyChecked)
+
+        checkBox.blockSignals(False)
+
+    def updateNoiseGraph(self, shake):
+        """
+        Updates the noise graph widget.
+
+        :type shake: mpynode.MPyNode
+        :rtype: None
+        """
+
+        # Check if graph has been initialized
+        # Otherwise, the graph will synchronize itself once it has been built!
+        #
+        if not self._graphWidgetsReady:
+
+            return
+
+        self.noiseGraph.seed = shake.getAttr('seed')
+        self.noiseGraph.frequency = shake.getAttr('frequency')
+        self.noiseGraph.roughness = shake.getAttr('roughness')
+        self.noiseGraph.fractal = shake.getAttr('fractal')
+        self.noiseGraph.rampIn = shake.getAttr('rampIn')
+        self.noiseGraph.rampOut = shake.getAttr('rampOut')
+        self.noiseGraph.envelope = shake.getAttr('envelope')
+        self.noiseGraph.strength = (shake.getAttr('strengthX'), shake.getAttr('strengthY'), shake.getAttr('strengthZ'))
+        self.noiseGraph.positive = (shake.getAttr('positiveX'), shake.getAttr('positiveY'), shake.getAttr('positiveZ'))
+
+        # Check if sweep is visible
+        #
+        if self._noiseSweep is not None and self._noiseSweep.isVisible():
+
+            self._noiseSweep.seed = shake.getAttr('seed')
+
+    def setDefaultNoiseProperties(self, shake):
+        """
+        Updates the default value of the noise properties.
+
+        :type shake: mpynode.MPyNode
+        :rtype: None
+        """
+        
+        shake.setAttr('frequency', 5.0)
+        shake.setAttr('roughness', 0.5)
+
+    def assignNoise(self, node, position=False, rotation=False, scale=False, timeNode=None, wiringMode=None, profiler=None):
+        """
+        Assigns shake nodes to the supplied control for the specified components.
+        Components that already have noise are left untouched!
+        If no wiring mode is supplied then the editor's wiring mode is used instead.
+
+        :type node: mpynode.MPyNode
+        :type position: bool
+        :type rotation: bool
+        :type scale: bool
+        :type timeNode: Union[mpynode.MPyNode, None]
+        :type wiringMode: Union[referenceutils.WiringMode, None]
+        :type profiler: Union[profileutils.Profiler, None]
+        :rtype: List[mpynode.MPyNode]
+        """
+
+        # Check if a profiler was supplied
+        #
+        if profiler is None:
+
+            profiler = profileutils.createProfiler('assignNoise')
+
+        if timeNode is None:
+
+            timeNode = mpynode.MPyNode('time1')
+
+        if wiringMode is None:
+
+            wiringMode = self.wiringMode
+
+        # Check if reference edits should be minimized
+        # Connections to a referenced control are stored as reference edits so only the unavoidable ones are made!
+        #
+        isMinimal = wiringMode == referenceutils.WiringMode.MINIMAL and node.isFromReferencedFile
+
+        # Evaluate `offsetParentMatrix` plug connections
+        #
+        nodeName = node.name()
+        plug = node['offsetParentMatrix']
+
+        composeTransform = None
+
+        if plug.isDestination:
+
+            sourceNode = mpynode.MPyNode(plug.source().node())
+
+            if sourceNode.typeName == 'composeTransform':
+
+                composeTransform = sourceNode
+
+            else:
+
+                return []
+        else:
+
+            composeTransformName = f'{node.name()}_composeTransform'
+            composeTransform = self.scene.createNode('composeTransform', name=composeTransformName)
+            profiler.count('createdNodes')
+
+            composeTransform.setAttr('inputOffsetParentMatrix', node.getAttr('offsetParentMatrix'))
+
+            if not isMinimal:
+
+                composeTransform.connectPlugs(node['translate'], 'inputRotatePivot')
+                composeTransform.connectPlugs(node['translate'], 'inputScalePivot')
+                composeTransform.connectPlugs(node['rotateOrder'], 'inputRotateOrder')
+
+            undoutils.touch(node, 'offsetParentMatrix')
+            composeTransform.connectPlugs('outputMatrix', plug)
+
+        # Check if pivots are required
+        # Position noise does not depend on the pivots so they are only connected for rotation or scale noise!
+        #
+        if (rotation or scale) and not composeTransform['inputRotatePivot'].isDestination:
+
+            undoutils.touch(composeTransform, 'inputRotatePivot')
+            undoutils.touch(composeTransform, 'inputScalePivot')
+            composeTransform.connectPlugs(node['translate'], 'inputRotatePivot')
+            composeTransform.connectPlugs('inputRotatePivot', 'inputScalePivot')
+
+        # Check if rotate order is required
+        # Only rotation noise depends on the rotate order, but it stays connected so it never goes stale!
+        #
+        if rotation and not composeTransform['inputRotateOrder'].isDestination:
+
+            undoutils.touch(composeTransform, 'inputRotateOrder')
+            composeTransform.connectPlugs(node['rotateOrder'], 'inputRotateOrder')
+
+        # Iterate through requested components
+        #
+        components = (
+            (position, 'position', 'outputTranslate', 'inputTranslate'),
+            (rotation, 'rotation', 'outputRotate', 'inputRotate'),
+            (scale, 'scale', 'outputScale', 'inputScale')
+        )
+
+        shakes = []
+
+        for (isRequested, componentName, outputName, inputName) in components:
+
+            # Check if component is requested
+            #
+            if not isRequested:
+
+                continue
+
+            # Check if component already has noise
+            #
+            if plugutils.hasConnection(composeTransform[inputName]):
+
+                log.warning(f'"{nodeName}" control already has {componentName} noise!')
+                continue
+
+            shakeName = f'{nodeName}_{componentName}Shake'
+            shake = self.scene.createNode('shake', name=shakeName)
+            profiler.count('createdNodes')
+
+            self.setDefaultNoiseProperties(shake)
+
+            undoutils.touch(composeTransform, inputName)
+            shake.connectPlugs(outputName, composeTransform[inputName])
+            shake.connectPlugs(timeNode['outTime'], 'time')
+
+            shakes.append(shake)
+
+        return shakes
+
+    @undoutils.Diff(name='createNoise')
+    def createNoise(self):
+        """
+        Assigns shake nodes to the active selection.
+
+        :rtype: Union[Dict[str, Any], None]
+        """
+
+        profiler = profileutils.createProfiler('createNoise')
+        editReport = referenceutils.EditReport('createNoise')
+
+        with profiler, animate.Animate(state=False):
+
+            # Iterate through selected controls
+            #
+            timeNode = mpynode.MPyNode('time1')
+            wiringMode = self.wiringMode
+
+            position = self.posCheckBox.isChecked()
+            rotation = self.rotCheckBox.isChecked()
+            scale = self.scaleCheckBox.isChecked()
+
+            for node in self.iterControls(fromSelection=True):
+
+                with profiler.item(node.name()):
+
+                    editReport.track(node)
+                    self.assignNoise(node, position=position, rotation=rotation, scale=scale, timeNode=timeNode, wiringMode=wiringMode, profiler=profiler)
+
+            # Invalidate noise properties
+            #
+            with profiler.phase('updateNoiseProperties'):
+
+                self.updateNoiseProperties()
+
+        self.reportEdits(editReport)
+
+        return self.collectProfile(profiler)
+
+    def copyNoise(self):
+        """
+        Copies every shake attribute from the first selected control.
+
+        :rtype: Union[Dict[str, Any], None]
+        """
+
+        # Check if there are any noise items
+        #
+        noiseItem = next(self.iterShakes(fromSelection=True), None)
+
+        if noiseItem is None:
+
+            log.warning('Select a control with noise to copy from!')
+            return None
+
+        # Capture shake attributes
+        #
+        self._noiseClipboard = presetutils.capturePreset(noiseItem)
+        self.pastePushButton.setEnabled(len(self._noiseClipboard['components']) > 0)
+
+        return self._noiseClipboard
+
+    @undoutils.Diff(name='pasteNoise')
+    def pasteNoise(self, noise=None, nodes=None):
+        """
+        Pastes the copied shake attributes onto the supplied controls, creating any missing shakes.
+        All attributes are written in one batched edit followed by a single property refresh!
+
+        :type noise: Union[Dict[str, Any], None]
+        :type nodes: Union[List[mpynode.MPyNode], None]
+        :rtype: Union[Dict[str, Any], None]
+        """
+
+        # Check if there is anything to paste
+        #
+        noise = noise if noise is not None else self._noiseClipboard
+
+        if noise is None:
+
+            log.warning('Copy noise from a control before pasting!')
+            return None
+
+        nodes = nodes if nodes is not None else list(self.iterControls(fromSelection=True))
+        components = noise.get('components', {})
+
+        profiler = profileutils.createProfiler('pasteNoise')
+        editReport = referenceutils.EditReport('pasteNoise')
+
+        with profiler, animate.Animate(state=False):
+
+            # Create any missing shakes
+            # Only the copied components that are missing from each control are created!
+            #
+            with profiler.phase('assignNoise'):
+
+                timeNode = mpynode.MPyNode('time1')
+                wiringMode = self.wiringMode
+
+                for node in nodes:
+
+                    noiseItem = self.getNoiseItem(node)
+                    missing = {component: component in components and (noiseItem is None or noiseItem[i + 2] is None) for (i, component) in enumerate(presetutils.PRESET_COMPONENTS)}
+
+                    if any(missing.values()):
+
+                        editReport.track(node)
+                        self.assignNoise(node, timeNode=timeNode, wiringMode=wiringMode, profiler=profiler, **missing)
+
+            # Write attributes to every shake
+            # Any attribute-changed callbacks are ignored in favour of a single refresh afterwards!
+            #
+            noiseItems = [noiseItem for noiseItem in map(self.getNoiseItem, nodes) if noiseItem is not None]
+
+            self._pushingNoise = True
+
+            try:
+
+                with profiler.phase('applyPreset'):
+
+                    numShakes = presetutils.applyPreset(noise, noiseItems)
+                    profiler.count('shakes', numShakes)
+
+            finally:
+
+                self._pushingNoise = False
+
+            with profiler.phase('updateNoiseProperties'):
+
+                self.updateNoiseProperties()
+
+        self.reportEdits(editReport)
+
+        return self.collectProfile(profiler)
+
+    def matchNoise(self):
+        """
+        Matches the noise on every selected control to the first selected control.
+
+        :rtype: Union[Dict[str, Any], None]
+        """
+
+        # Check if there are enough controls
+        #
+        nodes = list(self.iterControls(fromSelection=True))
+
+        if len(nodes) < 2:
+
+            log.warning('Select a control with noise followed by the controls to match!')
+            return None
+
+        # Copy from first control and paste onto the rest
+        #
+        sourceItem = self.getNoiseItem(nodes[0])
+
+        if sourceItem is None:
+
+            log.warning(f'"{nodes[0].name()}" control has no noise to match!')
+            return None
+
+        return self.pasteNoise(noise=presetutils.capturePreset(sourceItem), nodes=nodes[1:])
+
+    @undo.Undo(state=False)
+    def selectNoise(self):
+        """
+        Selects any controls with shake nodes from the scene file.
+
+        :rtype: None
+        """
+
+        # Check if position is enabled
+        #
+        nodes = []
+
+        if self.posCheckBox.isChecked():
+
+            found = [noiseItem.node for noiseItem in self.iterShakes(fromSelection=False) if noiseItem.position is not None]
+            nodes.extend(found)
+
+        # Check if rotation is enabled
+        #
+        if self.rotCheckBox.isChecked():
+
+            found = [noiseItem.node for noiseItem in self.iterShakes(fromSelection=False) if noiseItem.rotation is not None]
+            nodes.extend(found)
+
+        # Check if scale is enabled
+        #
+        if self.scaleCheckBox.isChecked():
+
+            found = [noiseItem.node for noiseItem in self.iterShakes(fromSelection=False) if noiseItem.scale is not None]
+            nodes.extend(found)
+
+        # Update active selection
+        #
+        self.scene.setSelection(nodes)
+
+    @undoutils.Diff(name='deleteNoise')
+    def deleteNoise(self, fromSelection=True):
+        """
+        Deletes any shake nodes from the active selection.
+
+        :type fromSelection: bool
+        :rtype: Union[Dict[str, Any], None]
+        """
+
+        profiler = profileutils.createProfiler('deleteNoise')
+        editReport = referenceutils.EditReport('deleteNoise')
+
+        with profiler, animate.Animate(state=False):
+
+            # Iterate through selected nodes
+            # Referenced plugs are collected so their edits can be removed in one pass per reference!
+            #
+            referencedPlugs = defaultdict(list)
+
+            for noiseItem in self.iterShakes(fromSelection=fromSelection):
+
+                with profiler.item(noiseItem.node.name()):
+
+                    editReport.track(noiseItem.node)
+
+                    # Check if position requires deleting
+                    #
+                    if self.posCheckBox.isChecked() and noiseItem.position is not None:
+
+                        for curve in noiseutils.findFrozenCurves(noiseItem.position):
+
+                            undoutils.deleteNode(curve)
+                            profiler.count('deletedNodes')
+
+                        undoutils.deleteNode(noiseItem.position)
+                        profiler.count('deletedNodes')
+                        undoutils.resetAttr(noiseItem.transform, 'inputTranslate')
+
+                    # Check if rotation requires deleting
+                    #
+                    if self.rotCheckBox.isChecked() and noiseItem.rotation is not None:
+
+                        for curve in noiseutils.findFrozenCurves(noiseItem.rotation):
+
+                            undoutils.deleteNode(curve)
+                            profiler.count('deletedNodes')
+
+                        undoutils.deleteNode(noiseItem.rotation)
+                        profiler.count('deletedNodes')
+                        undoutils.resetAttr(noiseItem.transform, 'inputRotate')
+
+                    # Check if scale requires deleting
+                    #
+                    if self.scaleCheckBox.isChecked() and noiseItem.scale is not None:
+
+                        for curve in noiseutils.findFrozenCurves(noiseItem.scale):
+
+                            undoutils.deleteNode(curve)
+                            profiler.count('deletedNodes')
+
+                        undoutils.deleteNode(noiseItem.scale)
+                        profiler.count('deletedNodes')
+                        undoutils.resetAttr(noiseItem.transform, 'inputScale')
+
+                    # Check if compose transform requires deleting
+                    #
+                    hasPosition = any([plug.isDestination for plug in plugutils.iterChildren(noiseItem.transform['inputTranslate'])])
+                    hasRotation = any([plug.isDestination for plug in plugutils.iterChildren(noiseItem.transform['inputRotate'])])
+                    hasScale = any([plug.isDestination for plug in plugutils.iterChildren(noiseItem.transform['inputScale'])])
+
+                    if not any([hasPosition, hasRotation, hasScale]):
+
+                        offsetParentMatrix = noiseItem.transform.getAttr('inputOffsetParentMatrix')
+                        referenceNodeName = referenceutils.getReferenceNodeName(noiseItem.node)
+
+                        if referenceNodeName is not None:
+
+                            referencedPlugs[referenceNodeName].extend(referenceutils.getEditTargets(noiseItem.node, noiseItem.transform))
+
+                        undoutils.deleteNode(noiseItem.transform)
+                        profiler.count('deletedNodes')
+
+                        if referenceNodeName is None:
+
+                            undoutils.setAttr(noiseItem.node, 'offsetParentMatrix', offsetParentMatrix)
+
+            # Remove reference edits
+            #
+            with profiler.phase('removeEdits'):
+
+                numReferences = referenceutils.removeEdits(referencedPlugs)
+                profiler.count('references', numReferences)
+
+            # Invalidate noise properties
+            #
+            with profiler.phase('updateNoiseProperties'):
+
+                self.updateNoiseProperties()
+
+        self.reportEdits(editReport)
+
+        return self.collectProfile(profiler)
+
+    @undo.Undo(state=False)
+    def freezeNoise(self):
+        """
+        Freezes the noise on the active selection into curves over the animation range.
+        Playback then skips noise synthesis until a shake parameter changes!
+        If looping is enabled then the animation range is frozen as one period that cycles forever.
+
+        :rtype: Union[Dict[str, Any], None]
+        """
+
+        profiler = profileutils.createProfiler('freezeNoise')
+
+        with profiler, animate.Animate(state=False):
+
+            noiseItems = list(self.iterShakes(fromSelection=True))
+            shakes = freezeutils.freezeNoiseItems(noiseItems, self.startTime, self.endTime, loop=self.loop, profiler=profiler)
+
+            self.addFrozenCallbacks(shakes)
+
+        log.info(f'Froze {len(shakes)} shake(s) from {self.startTime} to {self.endTime}.')
+        return self.collectProfile(profiler)
+
+    @undo.Undo(state=False)
+    def thawNoise(self, shakes=None):
+        """
+        Restores live noise evaluation on the supplied shake nodes.
+        If no shakes are supplied then the active selection is thawed instead!
+
+        :type shakes: Union[List[mpynode.MPyNode], None]
+        :rtype: List[mpynode.MPyNode]
+        """
+
+        # Check if shakes were supplied
+        #
+        if shakes is None:
+
+            shakes = [shake for noiseItem in self.iterShakes(fromSelection=True) for shake in noiseItem[2:] if shake is not None]
+
+        # Thaw shakes and release their callbacks
+        #
+        with animate.Animate(state=False):
+
+            thawed = freezeutils.thawShakes(shakes)
+
+        self.removeFrozenCallbacks(shakes)
+
+        return thawed
+
+    def refreshPresets(self):
+        """
+        Repopulates the preset combo box from the cached preset index.
+
+        :rtype: None
+        """
+
+        currentName = self.presetComboBox.currentText()
+
+        self.presetComboBox.blockSignals(True)
+        self.presetComboBox.clear()
+        self.presetComboBox.addItems(presetutils.listPresets())
+        self.presetComboBox.setCurrentIndex(max(0, self.presetComboBox.findText(currentName)))
+        self.presetComboBox.blockSignals(False)
+
+        self.deletePresetPushButton.setEnabled(self.presetComboBox.count() > 0)
+
+    def savePreset(self, name, overwrite=False):
+        """
+        Saves the shakes from the first selected control as a preset.
+        An existing preset with the same name is only replaced when overwrite is enabled!
+
+        :type name: str
+        :type overwrite: bool
+        :rtype: Union[str, None]
+        """
+
+        # Check if there are any noise items
+        #
+        noiseItems = list(self.iterShakes(fromSelection=True))
+
+        if len(noiseItems) == 0:
+
+            log.warning('Select a control with noise to save a preset from!')
+            return None
+
+        # Write preset and refresh combo box
+        #
+        preset = presetutils.capturePreset(noiseItems[0])
+        path = presetutils.savePreset(name, preset, overwrite=overwrite)
+
+        self.refreshPresets()
+        self.presetComboBox.setCurrentIndex(self.presetComboBox.findText(name))
+
+        return path
+
+    @undoutils.Diff(name='applyPreset')
+    def applyPreset(self, name):
+        """
+        Applies the supplied preset to every shake on the active selection.
+        All attributes are written in one batched edit followed by a single property refresh!
+
+        :type name: str
+        :rtype: Union[Dict[str, Any], None]
+        """
+
+        # Check if preset exists
+        #
+        preset = presetutils.loadPreset(name)
+
+        if preset is None:
+
+            log.warning(f'Unable to locate "{name}" preset!')
+            return None
+
+        # Write preset to selected shakes
+        # Any attribute-changed callbacks are ignored in favour of a single refresh afterwards!
+        #
+        profiler = profileutils.createProfiler('applyPreset')
+
+        with profiler:
+
+            noiseItems = list(self.iterShakes(fromSelection=True))
+
+            self._pushingNoise = True
+
+            try:
+
+                with profiler.phase('applyPreset'):
+
+                    numShakes = presetutils.applyPreset(preset, noiseItems)
+                    profiler.count('shakes', numShakes)
+
+            finally:
+
+                self._pushingNoise = False
+
+            with profiler.phase('updateNoiseProperties'):
+
+                self.updateNoiseProperties()
+
+        return self.collectProfile(profiler)
+
+    def deletePreset(self, name):
+        """
+        Deletes the supplied preset.
+
+        :type name: str
+        :rtype: bool
+        """
+
+        success = presetutils.deletePreset(name)
+        self.refreshPresets()
+
+        return success
+
+    @traceutils.traced(category='editor')
+    @undoutils.Diff(name='pushNoise')
+    def pushNoise(self, widget, id=-1):
+        """
+        Pushes the supplied widget's value to the active selection.
+
+        :type widget: Union[QtWidgets.QSpinBox, QtWidgets.QDoubleSpinBox, QtWidgets.QCheckBox]
+        :type id: int
+        :rtype: None
+        """
+
+        # Evaluate supplied ID
+        #
+        if not self.isValidId(id):
+
+            return
+
+        # Iterate through shake nodes
+        # Any attribute-changed callbacks are ignored since the widgets are already up-to-date!
+        #
+        self._pushingNoise = True
+
+        try:
+
+            for noiseItem in self.iterShakes(fromSelection=True):
+
+                # Check if noise item is valid
+                #
+                if noiseItem[id] is None:
+
+                    continue
+
+                traceutils.count('shakes')
+
+                # Update associated node attribute
+                #
+                attribute = widget.whatsThis()
+
+                if isinstance(widget, (QtWidgets.QSpinBox, QtWidgets.QDoubleSpinBox)):
+
+                    undoutils.setAttr(noiseItem[id], attribute, widget.value())
+
+                elif isinstance(widget, QtWidgets.QCheckBox):
+
+                    undoutils.setAttr(noiseItem[id], attribute, widget.isChecked())
+
+                else:
+
+                    continue
+
+        finally:
+
+            self._pushingNoise = False
+
+    @undoutils.Diff(name='randomizeSeed')
+    def randomizeSeed(self, id=-1):
+        """
+        Randomizes the seed value on the selected controls.
+
+        :type id: int
+        :rtype: None
+        """
+
+        # Evaluate supplied ID
+        #
+        if not self.isValidId(id):
+
+            return
+
+        # Iterate through shake nodes
+        #
+        self._pushingNoise = True
+
+        try:
+
+            for noiseItem in self.iterShakes(fromSelection=True):
+
+                if noiseItem[id] is None:
+
+                    continue
+
+                undoutils.setAttr(noiseItem[id], 'seed', random.randint(0, 99))
+
+        finally:
+
+            self._pushingNoise = False
+
+        # Invalidate noise properties
+        #
+        self.updateNoiseProperties()
+
+    def showNoiseSweep(self, id=-1):
+        """
+        Shows the noise sweep centered on the first selected shake.
+        Frequencies double every two columns around the shake's frequency while roughness spans its full range down the rows!
+
+        :type id: int
+        :rtype: None
+        """
+
+        # Evaluate supplied ID
+        #
+        if not self.isValidId(id):
+
+            return
+
+        shakes = [noiseItem[id] for noiseItem in self.iterShakes(fromSelection=True) if noiseItem[id] is not None]
+
+        if len(shakes) == 0:
+
+            log.warning('No shakes found on the active selection!')
+            return
+
+        # Update sweep parameters
+        #
+        shake = shakes[0]
+        frequency = shake.getAttr('frequency')
+        numValues = self.__sweep_size__
+        center = (numValues - 1) * 0.5
+
+        minimum, maximum = self.frequencySpinBox.minimum(), self.frequencySpinBox.maximum()
+        frequencies = [round(min(max(frequency * (2.0 ** ((i - center) * 0.5)), minimum), maximum), 3) for i in range(numValues)]
+        roughnesses = [round(i / (numValues - 1), 2) for i in range(numValues)]
+
+        # Each thumbnail spans the same time as the noise graph so they read alike!
+        #
+        self.noiseSweep.seed = shake.getAttr('seed')
+        self.noiseSweep.duration = self.noiseGraph.width() / self.noiseGraph.timeScale
+        self.noiseSweep.frequencies = sorted(set(frequencies))
+        self.noiseSweep.roughnesses = roughnesses
+
+        self.noiseSweep.show()
+        self.noiseSweep.raise_()
+
+    @undoutils.Diff(name='applySweep')
+    def applySweep(self, frequency, roughness, id=-1):
+        """
+        Applies the supplied frequency and roughness to the selected controls.
+        Fractal noise is enabled whenever roughness is used, so the shake matches its thumbnail!
+
+        :type frequency: float
+        :type roughness: float
+        :type id: int
+        :rtype: None
+        """
+
+        # Evaluate supplied ID
+        #
+        if not self.isValidId(id):
+
+            return
+
+        # Iterate through shake nodes
+        #
+        self._pushingNoise = True
+
+        try:
+
+            for noiseItem in self.iterShakes(fromSelection=True):
+
+                if noiseItem[id] is None:
+
+                    continue
+
+                undoutils.setAttr(noiseItem[id], 'frequency', frequency)
+                undoutils.setAttr(noiseItem[id], 'roughness', roughness)
+
+                if roughness > 0.0:
+
+                    undoutils.setAttr(noiseItem[id], 'fractal', True)
+
+        finally:
+
+            self._pushingNoise = False
+
+        # Invalidate noise properties
+        #
+        self.updateNoiseProperties()
+
+    @undoutils.Diff(name='bakeNoise')
+    def bakeNoise(self):
+        """
+        Bakes any controllers with shake node(s) from the active selection.
+        If a chunk size is specified then the frame range is streamed one chunk at a time, otherwise each control is baked in a single chunk!
+
+        :rtype: Union[Dict[str, Any], None]
+        """
+
+        # Replace any pending bake
+        # If the step is automatic then each noise item is sampled at a rate derived from its bandwidth!
+        #
+        self.discardBake()
+
+        noiseItems = list(self.iterShakes(fromSelection=True))
+        self._baker = bakeutils.NoiseBaker(
+            noiseItems,
+            self.startTime,
+            self.endTime,
+            step=self.step or None,
+            chunkSize=self.chunkSize,
+            tolerance=self.tolerance,
+            subFrames=self.subFrames,
+            loop=self.loop
+        )
+
+        return self.continueBake()
+
+    def bakeNoiseToCache(self, path):
+        """
+        Writes the noise offsets from the active selection into a cache file without keying any controls.
+        The cache uses the bake range and step, an automatic step falls back on one key per frame!
+
+        :type path: str
+        :rtype: Union[Dict[str, Any], None]
+        """
+
+        profiler = profileutils.createProfiler('bakeNoiseToCache')
+
+        with profiler:
+
+            noiseItems = list(self.iterShakes(fromSelection=True))
+            chunkSize = self.chunkSize if self.chunkSize > 0 else bakeutils.DEFAULT_CHUNK_SIZE
+
+            cacheutils.writeNoiseCache(
+                noiseItems,
+                path,
+                self.startTime,
+                self.endTime,
+                step=self.step or 1,
+                chunkSize=chunkSize,
+                loop=self.loop,
+                profiler=profiler
+            )
+
+        return self.collectProfile(profiler)
+
+    @undoutils.Diff(name='bakeNoiseToLayer')
+    def bakeNoiseToLayer(self):
+        """
+        Bakes the noise offsets from the active selection onto an additive animation layer.
+        The layer uses the bake range and step, an automatic step falls back on one key per frame!
+
+        :rtype: Union[Dict[str, Any], None]
+        """
+
+        profiler = profileutils.createProfiler('bakeNoiseToLayer')
+
+        with profiler, animate.Animate(state=False):
+
+            noiseItems = list(self.iterShakes(fromSelection=True))
+
+            reduction = bakeutils.bakeNoiseLayer(
+                noiseItems,
+                self.startTime,
+                self.endTime,
+                step=self.step or 1,
+                tolerance=self.tolerance,
+                loop=self.loop,
+                profiler=profiler
+            )
+
+            self.reportReduction(reduction)
+
+            # Invalidate noise properties
+            #
+            with profiler.phase('updateNoiseProperties'):
+
+                self.updateNoiseProperties()
+
+        return self.collectProfile(profiler)
+
+    def exportNoise(self, path):
+        """
+        Streams the noise offsets from the active selection into track files without keying any controls or changing the time.
+        The tracks use the bake range and step, an automatic step falls back on one key per frame!
+
+        :type path: str
+        :rtype: Union[Dict[str, Any], None]
+        """
 
-                    noiseItem.rotation.delete()
-                    noiseItem.transform.resetAttr('inputRotate')
+        profiler = profileutils.createProfiler('exportNoise')
 
-                # Check if scale requires deleting
-                #
-                if self.scaleCheckBox.isChecked() and noiseItem.scale is not None:
+        with profiler:
 
-                    noiseItem.scale.delete()
-                    noiseItem.transform.resetAttr('inputScale')
+            noiseItems = list(self.iterShakes(fromSelection=True))
+            chunkSize = self.chunkSize if self.chunkSize > 0 else bakeutils.DEFAULT_CHUNK_SIZE
 
-                # Check if compose transform requires deleting
-                #
-                hasPosition = any([plug.isDestination for plug in plugutils.iterChildren(noiseItem.transform['inputTranslate'])])
-                hasRotation = any([plug.isDestination for plug in plugutils.iterChildren(noiseItem.transform['inputRotate'])])
-                hasScale = any([plug.isDestination for plug in plugutils.iterChildren(noiseItem.transform['inputScale'])])
+            exportutils.exportNoise(
+                noiseItems,
+                path,
+                self.startTime,
+                self.endTime,
+                step=self.step or 1,
+                chunkSize=chunkSize,
+                loop=self.loop,
+                profiler=profiler
+            )
 
-                if not any([hasPosition, hasRotation, hasScale]):
+        return self.collectProfile(profiler)
 
-                    offsetParentMatrix = noiseItem.transform.getAttr('inputOffsetParentMatrix')
-                    noiseItem.transform.delete()
+    def requestExportPath(self):
+        """
+        Prompts the user for a track file path.
+        If the dialog is cancelled then none is returned!
 
-                    if noiseItem.node.isFromReferencedFile:
+        :rtype: Union[str, None]
+        """
 
-                        referenceNode = noiseItem.node.getAssociatedReferenceNode()
-                        referenceNode.removeEdits(noiseItem.node['offsetParentMatrix'])
+        path, selectedFilter = QtWidgets.QFileDialog.getSaveFileName(
+            self,
+            'Export Noise Tracks',
+            os.path.join(os.path.expanduser('~'), f'noise.{exportutils.TRACKS_EXTENSION}'),
+            f'Noise Tracks (*.{exportutils.TRACKS_EXTENSION});;Binary Noise Tracks (*.{cacheutils.CACHE_EXTENSION})'
+        )
 
-                    else:
+        return path if path else None
 
-                        noiseItem.node.setAttr('offsetParentMatrix', offsetParentMatrix)
+    def requestCachePath(self):
+        """
+        Prompts the user for a cache file path.
+        If the dialog is cancelled then none is returned!
+
+        :rtype: Union[str, None]
+        """
+
+        path, selectedFilter = QtWidgets.QFileDialog.getSaveFileName(
+            self,
+            'Save Noise Cache',
+            os.path.join(os.path.expanduser('~'), f'noise.{cacheutils.CACHE_EXTENSION}'),
+            f'Noise Cache (*.{cacheutils.CACHE_EXTENSION})'
+        )
+
+        return path if path else None
+
+    @undoutils.Diff(name='continueBake')
+    def continueBake(self, callback=None):
+        """
+        Streams any remaining chunks from the pending bake, restarting the control that was cancelled part way through.
+        The optional callback is invoked after each chunk and may cancel the bake, which can then be continued later on!
+
+        :type callback: Union[Callable[[bakeutils.NoiseBaker], None], None]
+        :rtype: Union[Dict[str, Any], None]
+        """
+
+        # Check if there is a pending bake
+        #
+        baker = self._baker
+
+        if baker is None:
+
+            return None
+
+        # Bake remaining chunks
+        #
+        baker.restartItem()
+        isDone = baker.bake(callback=callback)
+
+        if isDone:
+
+            self._baker = None
+            self.reportReduction(baker.reduction)
+
+        else:
+
+            log.warning(f'Bake cancelled at {baker.progress * 100.0:.1f}%, use `continueBake` to bake the remaining controls!')
+
+        # Invalidate noise properties
+        #
+        with baker.profiler.phase('updateNoiseProperties'):
 
-            # Invalidate noise properties
-            #
             self.updateNoiseProperties()
 
-    @undo.Undo(state=False)
-    def pushNoise(self, widget, id=-1):
+        return self.collectProfile(baker.profiler)
+
+    def bakeNoiseInBackground(self):
         """
-        Pushes the supplied widget's value to the active selection.
+        Bakes any controllers with shake node(s) from the active selection in time slices.
+        Progress is reported through an application modal dialog that can cancel the bake without freezing the interface!
 
-        :type widget: Union[QtWidgets.QSpinBox, QtWidgets.QDoubleSpinBox, QtWidgets.QCheckBox]
-        :type id: int
-        :rtype: None
+        :rtype: qbakejob.QBakeJob
         """
 
-        # Evaluate supplied ID
+        # Check if a bake is already running
         #
-        if not self.isValidId(id):
+        if self._bakeJob is not None:
 
-            return
+            return self._bakeJob
 
-        # Iterate through shake nodes
+        # Initialize bake job
         #
-        for noiseItem in self.iterShakes(fromSelection=True):
+        noiseItems = list(self.iterShakes(fromSelection=True))
+        chunkSize = self.chunkSize if self.chunkSize > 0 else qbakejob.DEFAULT_CHUNK_SIZE
+
+        baker = bakeutils.NoiseBaker(
+            noiseItems,
+            self.startTime,
+            self.endTime,
+            step=self.step or None,
+            chunkSize=chunkSize,
+            tolerance=self.tolerance,
+            subFrames=self.subFrames,
+            loop=self.loop
+        )
+
+        self._baker = baker
+        self._bakeJob = qbakejob.QBakeJob(baker, parent=self)
+        self._bakeJob.finished.connect(self.on_bakeJob_finished)
+
+        # Initialize progress dialog
+        # The dialog is application modal so no edits can slip in between slices and escape the bake's undo step!
+        #
+        self._bakeProgressDialog = QtWidgets.QProgressDialog('Baking noise...', 'Cancel', 0, 100, parent=self)
+        self._bakeProgressDialog.setWindowTitle('Noise Editor')
+        self._bakeProgressDialog.setWindowModality(QtCore.Qt.ApplicationModal)
+        self._bakeProgressDialog.setMinimumDuration(0)
+        self._bakeProgressDialog.setAutoClose(False)
+        self._bakeProgressDialog.setAutoReset(False)
+        self._bakeProgressDialog.canceled.connect(self._bakeJob.cancel)
 
-            # Check if noise item is valid
-            #
-            if noiseItem[id] is None:
+        self._bakeJob.progressChanged.connect(self._bakeProgressDialog.setValue)
 
-                continue
+        # Start baking
+        #
+        self.bakePushButton.setEnabled(False)
+        self._bakeProgressDialog.show()
+        self._bakeJob.start()
 
-            # Update associated node attribute
-            #
-            attribute = widget.whatsThis()
+        return self._bakeJob
 
-            if isinstance(widget, (QtWidgets.QSpinBox, QtWidgets.QDoubleSpinBox)):
+    def cancelBake(self):
+        """
+        Cancels the pending bake and reverts the control that was still in progress.
+        If a background bake is running then it's stopped as well!
 
-                noiseItem[id].setAttr(attribute, widget.value())
+        :rtype: None
+        """
 
-            elif isinstance(widget, QtWidgets.QCheckBox):
+        if self._bakeJob is not None:
 
-                noiseItem[id].setAttr(attribute, widget.isChecked())
+            self._bakeJob.cancel()
 
-            else:
+        elif self._baker is not None:
 
-                continue
+            self._baker.cancel()
 
-    @undo.Undo(state=False)
-    def randomizeSeed(self, id=-1):
+    def discardBake(self):
         """
-        Randomizes the seed value on the selected controls.
+        Abandons any remaining chunks from the pending bake.
 
-        :type id: int
         :rtype: None
         """
 
-        # Evaluate supplied ID
-        #
-        if not self.isValidId(id):
+        if self._baker is not None:
 
-            return
+            self._baker.discard()
+            self._baker = None
 
-        # Iterate through shake nodes
-        #
-        for noiseItem in self.iterShakes(fromSelection=True):
+    def reportReduction(self, reduction):
+        """
+        Stores and logs the results from the supplied key reduction.
+
+        :type reduction: keyutils.KeyReduction
+        :rtype: None
+        """
 
-            noiseItem[id].setAttr('seed', random.randint(0, 99))
+        if reduction.tolerance <= 0.0:
 
-        # Invalidate noise properties
-        #
-        self.updateNoiseProperties()
+            self._reduction = None
+            return
 
-    @undo.Undo(state=False)
-    def bakeNoise(self):
+        self._reduction = reduction
+        log.info(reduction.report())
+
+    def reportEdits(self, editReport):
         """
-        Bakes any controllers with shake node(s) from the active selection.
+        Stores and logs the supplied reference edit counts.
+        Operations that did not touch any references are not reported!
 
+        :type editReport: referenceutils.EditReport
         :rtype: None
         """
 
-        # Iterate through selected nodes
-        #
-        for noiseItem in self.iterShakes(fromSelection=True):
+        if len(editReport.before) == 0:
 
-            # Check if any shake nodes exist
-            #
-            shakes = list(filter(None, (noiseItem.position, noiseItem.rotation, noiseItem.scale)))
-            numShakes = len(shakes)
+            self._editReport = None
+            return
 
-            if numShakes == 0:
+        editReport.update()
 
-                noiseItem.transform.delete()
-                noiseItem.node.setAttr('offsetParentMatrix', om.MMatrix.kIdentity)
+        self._editReport = editReport
+        log.info(editReport.report())
 
-                continue
+    def collectProfile(self, profiler):
+        """
+        Stores and logs the timings from the supplied profiler.
+        If profiling is disabled then none is returned!
 
-            # Enable auto-key and iterate through time-range
-            #
-            positionEnabled = noiseItem.position is not None
-            rotationEnabled = noiseItem.rotation is not None
-            scaleEnabled = noiseItem.scale is not None
+        :type profiler: profileutils.Profiler
+        :rtype: Union[Dict[str, Any], None]
+        """
 
-            with animate.Animate(state=True):
+        if not profileutils.isEnabled():
 
-                # Collect baked data
-                #
-                cache = {}
+            return None
+
+        profile = profiler.asDict()
+        self._profiles[profiler.name] = profile
+
+        profiler.log()
 
-                if positionEnabled:
+        return profile
+    # endregion
 
-                    translateXAnimCurve = noiseItem.node.findAnimCurve('translateX', create=True)
-                    translateYAnimCurve = noiseItem.node.findAnimCurve('translateY', create=True)
-                    translateZAnimCurve = noiseItem.node.findAnimCurve('translateZ', create=True)
+    # region Slots
+    @QtCore.Slot()
+    def on_refreshTimer_timeout(self):
+        """
+        Slot method for the `refreshTimer` timer's `timeout` signal.
 
-                    cache['translateX'] = {frame: translateXAnimCurve.evaluate(om.MTime(frame, unit=om.MTime.uiUnit())) for frame in inclusiveRange(self.startTime, self.endTime, self.step)}
-                    cache['translateY'] = {frame: translateYAnimCurve.evaluate(om.MTime(frame, unit=om.MTime.uiUnit())) for frame in inclusiveRange(self.startTime, self.endTime, self.step)}
-                    cache['translateZ'] = {frame: translateZAnimCurve.evaluate(om.MTime(frame, unit=om.MTime.uiUnit())) for frame in inclusiveRange(self.startTime, self.endTime, self.step)}
+        :rtype: None
+        """
 
-                if rotationEnabled:
+        # Consume pending attributes
+        #
+        attributes = set(self._pendingAttributes)
+        self._pendingAttributes.clear()
 
-                    rotateXAnimCurve = noiseItem.node.findAnimCurve('rotateX', create=True)
-                    rotateYAnimCurve = noiseItem.node.findAnimCurve('rotateY', create=True)
-                    rotateZAnimCurve = noiseItem.node.findAnimCurve('rotateZ', create=True)
+        # Check if any cached shake nodes have been deleted
+        # If so, then fallback on a full refresh!
+        #
+        isStale = any(not om.MObjectHandle(shake.object()).isAlive() for noiseItem in self._noiseItems for shake in noiseItem[2:] if shake is not None)
 
-                    cache['rotateX'] = {frame: math.degrees(rotateXAnimCurve.evaluate(om.MTime(frame, unit=om.MTime.uiUnit()))) for frame in inclusiveRange(self.startTime, self.endTime, self.step)}
-                    cache['rotateY'] = {frame: math.degrees(rotateYAnimCurve.evaluate(om.MTime(frame, unit=om.MTime.uiUnit()))) for frame in inclusiveRange(self.startTime, self.endTime, self.step)}
-                    cache['rotateZ'] = {frame: math.degrees(rotateZAnimCurve.evaluate(om.MTime(frame, unit=om.MTime.uiUnit()))) for frame in inclusiveRange(self.startTime, self.endTime, self.step)}
+        if isStale:
 
-                if scaleEnabled:
+            self.updateNoiseProperties()
 
-                    scaleXAnimCurve = noiseItem.node.findAnimCurve('scaleX', create=True)
-                    scaleYAnimCurve = noiseItem.node.findAnimCurve('scaleY', create=True)
-                    scaleZAnimCurve = noiseItem.node.findAnimCurve('scaleZ', create=True)
+        else:
 
-                    cache['scaleX'] = {frame: scaleXAnimCurve.evaluate(om.MTime(frame, unit=om.MTime.uiUnit())) for frame in inclusiveRange(self.startTime, self.endTime, self.step)}
-                    cache['scaleY'] = {frame: scaleYAnimCurve.evaluate(om.MTime(frame, unit=om.MTime.uiUnit())) for frame in inclusiveRange(self.startTime, self.endTime, self.step)}
-                    cache['scaleZ'] = {frame: scaleZAnimCurve.evaluate(om.MTime(frame, unit=om.MTime.uiUnit())) for frame in inclusiveRange(self.startTime, self.endTime, self.step)}
+            self.updateNoiseProperties(attributes=attributes)
 
-                # Iterate through time-range
-                #
-                for time in inclusiveRange(self.startTime, self.endTime, self.step):
+    @QtCore.Slot()
+    def on_downloadTimer_timeout(self):
+        """
+        Slot method for the `downloadTimer` timer's `timeout` signal.
 
-                    # Go to next frame
-                    #
-                    self.scene.time = time
+        :rtype: None
+        """
 
-                    for (attributeName, initialValues) in cache.items():
+        # Collect finished downloads
+        #
+        downloader = self._pluginDownloader
 
-                        inputAttributeName = f'input{stringutils.pascalize(attributeName)}'
-                        inputValue = noiseItem.transform.getAttr(inputAttributeName)
-                        noiseValue = initialValues[time] + inputValue
+        if downloader is None:
 
-                        noiseItem.node.setAttr(attributeName, noiseValue)
+            self._downloadTimer.stop()
+            return
 
-                # Cleanup shake nodes
-                #
-                if positionEnabled:
+        for (plugin, pluginPath) in downloader.poll():
 
-                    noiseItem.position.delete()  # Deleting position shake after baking
+            if pluginPath is not None:
 
-                if rotationEnabled:
+                self._pluginPaths[plugin] = pluginPath
 
-                    noiseItem.rotation.delete()  # Deleting rotation shake after baking
+            if self._pluginProgressDialog is not None:
 
-                if scaleEnabled:
+                self._pluginProgressDialog.setValue(self._pluginProgressDialog.value() + 1)
 
-                    noiseItem.scale.delete()  # Deleting scale shake after baking
+        # Check if every download has finished
+        #
+        if not downloader.isDone:
 
-                # Cleanup compose transform node and reset `offsetParentMatrix` plug
-                #
-                offsetParentMatrix = noiseItem.transform.getAttr('inputOffsetParentMatrix')
-                noiseItem.transform.delete()
+            return
 
-                noiseItem.node.setAttr('offsetParentMatrix', offsetParentMatrix)
+        self._downloadTimer.stop()
+        self._pluginDownloader = None
 
-        # Invalidate noise properties
+        self.finishLoadingPlugins()
+
+    @QtCore.Slot()
+    def on_thawTimer_timeout(self):
+        """
+        Slot method for the `thawTimer` timer's `timeout` signal.
+
+        :rtype: None
+        """
+
+        # Consume pending thaws
+        # Shakes may have been deleted since their change was queued!
         #
-        self.updateNoiseProperties()
-    # endregion
+        shakes = [shake for shake in self._pendingThaws.values() if om.MObjectHandle(shake.object()).isAlive()]
+        self._pendingThaws.clear()
+
+        thawed = self.thawNoise(shakes)
+
+        if len(thawed) > 0:
+
+            log.info(f'Thawed {len(thawed)} shake(s) after a parameter change.')
 
-    # region Slots
     @QtCore.Slot(int)
     def on_radioButtonGroup_idClicked(self, id):
         """
@@ -1451,6 +3357,149 @@ class QNoiseEditor(qsingletonwindow.QSingletonWindow):
 
         self.deleteNoise(fromSelection=True)
 
+    @QtCore.Slot(bool)
+    def on_freezePushButton_clicked(self, checked=False):
+        """
+        Slot method for the `freezePushButton` widget's `clicked` signal.
+
+        :type checked: bool
+        :rtype: None
+        """
+
+        self.freezeNoise()
+
+    @QtCore.Slot(bool)
+    def on_thawPushButton_clicked(self, checked=False):
+        """
+        Slot method for the `thawPushButton` widget's `clicked` signal.
+
+        :type checked: bool
+        :rtype: None
+        """
+
+        self.thawNoise()
+
+    @QtCore.Slot(bool)
+    def on_copyPushButton_clicked(self, checked=False):
+        """
+        Slot method for the `copyPushButton` widget's `clicked` signal.
+
+        :type checked: bool
+        :rtype: None
+        """
+
+        self.copyNoise()
+
+    @QtCore.Slot(bool)
+    def on_pastePushButton_clicked(self, checked=False):
+        """
+        Slot method for the `pastePushButton` widget's `clicked` signal.
+        Holding shift matches the selection to its first control instead!
+
+        :type checked: bool
+        :rtype: None
+        """
+
+        modifiers = QtWidgets.QApplication.keyboardModifiers()
+
+        if modifiers & QtCore.Qt.ShiftModifier:
+
+            self.matchNoise()
+
+        else:
+
+            self.pasteNoise()
+
+    @QtCore.Slot(bool)
+    def on_applyPresetPushButton_clicked(self, checked=False):
+        """
+        Slot method for the `applyPresetPushButton` widget's `clicked` signal.
+
+        :type checked: bool
+        :rtype: None
+        """
+
+        name = self.presetComboBox.currentText()
+
+        if name:
+
+            self.applyPreset(name)
+
+    @QtCore.Slot(bool)
+    def on_savePresetPushButton_clicked(self, checked=False):
+        """
+        Slot method for the `savePresetPushButton` widget's `clicked` signal.
+
+        :type checked: bool
+        :rtype: None
+        """
+
+        # Prompt user for preset name
+        #
+        name, accepted = QtWidgets.QInputDialog.getText(self, 'Save Preset', 'Preset name:', text=self.presetComboBox.currentText())
+        name = name.strip()
+
+        if not accepted or not name:
+
+            return
+
+        # Check if preset should be overwritten
+        #
+        overwrite = presetutils.hasPreset(name)
+
+        if overwrite:
+
+            response = QtWidgets.QMessageBox.question(
+                self,
+                'Noise Editor',
+                f'The "{name}" preset already exists, do you want to overwrite it?',
+                QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No
+            )
+
+            if response == QtWidgets.QMessageBox.No:
+
+                return
+
+        self.savePreset(name, overwrite=overwrite)
+
+    @QtCore.Slot(bool)
+    def on_deletePresetPushButton_clicked(self, checked=False):
+        """
+        Slot method for the `deletePresetPushButton` widget's `clicked` signal.
+
+        :type checked: bool
+        :rtype: None
+        """
+
+        name = self.presetComboBox.currentText()
+
+        if name:
+
+            self.deletePreset(name)
+
+    @QtCore.Slot(bool)
+    def on_sweepPushButton_clicked(self, checked=False):
+        """
+        Slot method for the `sweepPushButton` widget's `clicked` signal.
+
+        :type checked: bool
+        :rtype: None
+        """
+
+        self.showNoiseSweep(id=self.radioButtonGroup.checkedId())
+
+    @QtCore.Slot(float, float)
+    def on_noiseSweep_parametersClicked(self, frequency, roughness):
+        """
+        Slot method for the `noiseSweep` widget's `parametersClicked` signal.
+
+        :type frequency: float
+        :type roughness: float
+        :rtype: None
+        """
+
+        self.applySweep(frequency, roughness, id=self.radioButtonGroup.checkedId())
+
     @QtCore.Slot(bool)
     def on_bakePushButton_clicked(self, checked=False):
         """
@@ -1460,7 +3509,88 @@ class QNoiseEditor(qsingletonwindow.QSingletonWindow):
         :rtype: None
         """
 
-        self.bakeNoise()
+        # Check if noise offsets should be cached
+        #
+        bakeTarget = self.bakeTarget
+
+        if bakeTarget in (bakeutils.BakeTarget.CACHE, bakeutils.BakeTarget.CACHE_AND_KEYS):
+
+            path = self.requestCachePath()
+
+            if path is None:
+
+                return
+
+            self.bakeNoiseToCache(path)
+
+        # Check if noise should be keyed
+        #
+        if bakeTarget in (bakeutils.BakeTarget.KEYS, bakeutils.BakeTarget.CACHE_AND_KEYS):
+
+            self.bakeNoiseInBackground()
+
+        # Check if noise should be layered
+        #
+        if bakeTarget == bakeutils.BakeTarget.LAYER:
+
+            self.bakeNoiseToLayer()
+
+        # Check if noise should be exported
+        #
+        if bakeTarget == bakeutils.BakeTarget.TRACKS:
+
+            path = self.requestExportPath()
+
+            if path is not None:
+
+                self.exportNoise(path)
+
+    @QtCore.Slot(bool)
+    def on_bakeJob_finished(self, isDone):
+        """
+        Slot method for the `bakeJob` object's `finished` signal.
+
+        :type isDone: bool
+        :rtype: None
+        """
+
+        # Cleanup progress dialog
+        #
+        bakeJob, self._bakeJob = self._bakeJob, None
+        progressDialog, self._bakeProgressDialog = self._bakeProgressDialog, None
+
+        if progressDialog is not None:
+
+            progressDialog.canceled.disconnect(bakeJob.cancel)
+            progressDialog.close()
+            progressDialog.deleteLater()
+
+        bakeJob.deleteLater()
+        self.bakePushButton.setEnabled(True)
+
+        # Push recorded diff as a single undo step
+        # Cancelled bakes are pushed too so the controls that were completed can still be undone!
+        #
+        if bakeJob.diff is not None:
+
+            undoutils.pushDiff(bakeJob.diff)
+
+        # Check if bake was completed
+        # Cancelled bakes are rolled back to the last completed control and can be resumed later on!
+        #
+        if isDone:
+
+            self._baker = None
+            self.reportReduction(bakeJob.baker.reduction)
+
+        else:
+
+            log.warning(f'Bake cancelled at {bakeJob.baker.progress * 100.0:.1f}%, use `continueBake` to bake the remaining controls!')
+
+        # Invalidate noise properties
+        #
+        self.updateNoiseProperties()
+        self.collectProfile(bakeJob.baker.profiler)
 
     @QtCore.Slot(int)
     def on_seedSpinBox_valueChanged(self, value):
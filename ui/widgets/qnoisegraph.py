@@ -1,6 +1,6 @@
-from maya import cmds as mc
 from mpy import mpyscene
 from dcc.vendor.Qt import QtCore, QtWidgets, QtGui
+from ...libs import noiseutils, traceutils
 
 import logging
 logging.basicConfig()
@@ -11,9 +11,12 @@ log.setLevel(logging.INFO)
 class QNoiseGraph(QtWidgets.QWidget):
     """
     Overload of `QWidget` that displays a noise graph.
+    The shake command only outputs a single curve, so only the X axis is drawn, using its own strength and positive flag!
     """
 
     # region Dunderscores
+    __axis_color__ = (217, 67, 67)
+
     def __init__(self, *args, **kwargs):
         """
         Private method called after a new instance has been created.
@@ -39,6 +42,9 @@ class QNoiseGraph(QtWidgets.QWidget):
         self._fractal = kwargs.get('fractal', True)
         self._rampIn = kwargs.get('rampIn', 0.0)
         self._rampOut = kwargs.get('rampOut', 0.0)
+        self._envelope = kwargs.get('envelope', 1.0)
+        self._strength = tuple(kwargs.get('strength', (1.0, 1.0, 1.0)))
+        self._positive = tuple(kwargs.get('positive', (False, False, False)))
         self._step = kwargs.get('step', 4)
         self._timeScale = kwargs.get('timeScale', 20)
     # endregion
@@ -74,7 +80,7 @@ class QNoiseGraph(QtWidgets.QWidget):
         """
 
         self._seed = seed
-        self.repaint()
+        self.update()
 
     @property
     def frequency(self):
@@ -96,7 +102,7 @@ class QNoiseGraph(QtWidgets.QWidget):
         """
 
         self._frequency = frequency
-        self.repaint()
+        self.update()
 
     @property
     def roughness(self):
@@ -118,7 +124,7 @@ class QNoiseGraph(QtWidgets.QWidget):
         """
 
         self._roughness = roughness
-        self.repaint()
+        self.update()
 
     @property
     def fractal(self):
@@ -140,7 +146,7 @@ class QNoiseGraph(QtWidgets.QWidget):
         """
 
         self._fractal = fractal
-        self.repaint()
+        self.update()
 
     @property
     def rampIn(self):
@@ -162,7 +168,7 @@ class QNoiseGraph(QtWidgets.QWidget):
         """
 
         self._rampIn = rampIn
-        self.repaint()
+        self.update()
 
     @property
     def rampOut(self):
@@ -184,7 +190,73 @@ class QNoiseGraph(QtWidgets.QWidget):
         """
 
         self._rampOut = rampOut
-        self.repaint()
+        self.update()
+
+    @property
+    def envelope(self):
+        """
+        Getter method that returns the envelope value.
+
+        :rtype: float
+        """
+
+        return self._envelope
+
+    @envelope.setter
+    def envelope(self, envelope):
+        """
+        Setter method that updates the envelope value.
+
+        :type envelope: float
+        :rtype: None
+        """
+
+        self._envelope = envelope
+        self.update()
+
+    @property
+    def strength(self):
+        """
+        Getter method that returns the XYZ strength values.
+
+        :rtype: Tuple[float, float, float]
+        """
+
+        return self._strength
+
+    @strength.setter
+    def strength(self, strength):
+        """
+        Setter method that updates the XYZ strength values.
+
+        :type strength: Tuple[float, float, float]
+        :rtype: None
+        """
+
+        self._strength = tuple(strength)
+        self.update()
+
+    @property
+    def positive(self):
+        """
+        Getter method that returns the XYZ positive flags.
+
+        :rtype: Tuple[bool, bool, bool]
+        """
+
+        return self._positive
+
+    @positive.setter
+    def positive(self, positive):
+        """
+        Setter method that updates the XYZ positive flags.
+
+        :type positive: Tuple[bool, bool, bool]
+        :rtype: None
+        """
+
+        self._positive = tuple(positive)
+        self.update()
 
     @property
     def step(self):
@@ -206,7 +278,7 @@ class QNoiseGraph(QtWidgets.QWidget):
         """
 
         self._step = step
-        self.repaint()
+        self.update()
 
     @property
     def timeScale(self):
@@ -228,10 +300,36 @@ class QNoiseGraph(QtWidgets.QWidget):
         """
 
         self._timeScale = timeScale
-        self.repaint()
+        self.update()
+    # endregion
+
+    # region Methods
+    def samples(self, size):
+        """
+        Returns the shake command's X axis samples, across the specified width, including the command's own ramps and positive flag.
+        Samples are shared through `noiseutils.sampleShake`, so strength and envelope edits never re-sample the command!
+
+        :type size: int
+        :rtype: Tuple[float]
+        """
+
+        return noiseutils.sampleShake(
+            seed=self.seed,
+            frequency=self.frequency,
+            roughness=self.roughness,
+            fractal=self.fractal,
+            rampIn=self.rampIn,
+            rampOut=self.rampOut,
+            size=size,
+            step=max(1, self.step),
+            timeScale=self.timeScale,
+            positive=self.positive[0]
+        )
+
     # endregion
 
     # region Events
+    @traceutils.traced(name='QNoiseGraph.paintEvent', category='paint')
     def paintEvent(self, event):
         """
         The event for any paint requests made to this widget.
@@ -251,6 +349,8 @@ class QNoiseGraph(QtWidgets.QWidget):
         size = rect.width()
         palette = self.palette()
 
+        traceutils.count('width', size)
+
         pen = QtGui.QPen(palette.alternateBase(), 1)
         brush = palette.base()
 
@@ -282,29 +382,22 @@ class QNoiseGraph(QtWidgets.QWidget):
         painter.drawLine(QtCore.QPointF(rampOut, top), QtCore.QPointF(rampOut, bottom))
 
         # Paint noise line
+        # The curve fills the graph at full envelope, and a negative X strength flips it!
         #
-        if self.isEnabled():
+        strength = self.strength[0]
+
+        if self.isEnabled() and strength != 0.0:
 
-            values = mc.shake(
-                seed=self.seed,
-                frequency=self.frequency,
-                roughness=self.roughness,
-                fractal=self.fractal,
-                rampIn=self.rampIn,
-                rampOut=self.rampOut,
-                size=size,
-                step=self.step,
-                timeScale=self.timeScale
-            )
+            scale = rect.height() * self.envelope * (1.0 if strength > 0.0 else -1.0)
+            xs = range(rect.left(), rect.right(), max(1, self.step))
 
-            path = QtGui.QPainterPath(QtCore.QPointF(0, mid))
+            path = QtGui.QPainterPath(QtCore.QPointF(left, mid))
 
-            for (i, x) in enumerate(range(rect.left(), rect.right(), self.step)):
+            for (x, value) in zip(xs, self.samples(size)):
 
-                y = mid + int(rect.height() * values[i])
-                path.lineTo(QtCore.QPointF(x, y))
+                path.lineTo(QtCore.QPointF(x, mid - (value * scale)))
 
-            pen = QtGui.QPen(palette.highlightedText(), 1)
+            pen = QtGui.QPen(QtGui.QColor(*self.__axis_color__), 1)
             pen.setStyle(QtCore.Qt.SolidLine)
 
             painter.setPen(pen)
@@ -0,0 +1,456 @@
+from collections import OrderedDict
+from dcc.vendor.Qt import QtCore, QtWidgets, QtGui
+from ...libs import noiseutils
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+
+class QNoiseSweep(QtWidgets.QWidget):
+    """
+    Overload of `QWidget` that previews a grid of noise thumbnails across a frequency and roughness sweep.
+    Columns sweep frequency and rows sweep roughness, clicking a cell emits its parameters!
+    Every thumbnail is sampled from the shake command so it matches the shake once the parameters are applied.
+    """
+
+    # region Signals
+    parametersClicked = QtCore.Signal(float, float)
+    # endregion
+
+    # region Dunderscores
+    __cache_size__ = 256
+    __cell_spacing__ = 2
+    __line_color__ = (101, 191, 73)
+
+    def __init__(self, *args, **kwargs):
+        """
+        Private method called after a new instance has been created.
+
+        :key parent: QtWidgets.QWidget
+        :key f: QtCore.Qt.WindowFlags
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        parent = kwargs.pop('parent', None)
+        f = kwargs.pop('f', QtCore.Qt.WindowFlags())
+
+        super(QNoiseSweep, self).__init__(parent=parent, f=f)
+
+        # Declare private variables
+        #
+        self._seed = kwargs.get('seed', 0)
+        self._frequencies = tuple(kwargs.get('frequencies', (0.5,)))
+        self._roughnesses = tuple(kwargs.get('roughnesses', (0.0,)))
+        self._duration = kwargs.get('duration', 10.0)
+        self._step = kwargs.get('step', 2)
+        self._hoverCell = None
+        self._pixmaps = OrderedDict()
+
+        # Initialize widget
+        #
+        self.setMouseTracking(True)
+        self.setMinimumSize(QtCore.QSize(320, 240))
+    # endregion
+
+    # region Properties
+    @property
+    def seed(self):
+        """
+        Getter method that returns the seed value.
+
+        :rtype: int
+        """
+
+        return self._seed
+
+    @seed.setter
+    def seed(self, seed):
+        """
+        Setter method that updates the seed value.
+
+        :type seed: int
+        :rtype: None
+        """
+
+        self._seed = seed
+        self.update()
+
+    @property
+    def frequencies(self):
+        """
+        Getter method that returns the swept frequency values, one per column.
+
+        :rtype: Tuple[float]
+        """
+
+        return self._frequencies
+
+    @frequencies.setter
+    def frequencies(self, frequencies):
+        """
+        Setter method that updates the swept frequency values.
+
+        :type frequencies: Sequence[float]
+        :rtype: None
+        """
+
+        self._frequencies = tuple(frequencies)
+        self.update()
+
+    @property
+    def roughnesses(self):
+        """
+        Getter method that returns the swept roughness values, one per row.
+
+        :rtype: Tuple[float]
+        """
+
+        return self._roughnesses
+
+    @roughnesses.setter
+    def roughnesses(self, roughnesses):
+        """
+        Setter method that updates the swept roughness values.
+
+        :type roughnesses: Sequence[float]
+        :rtype: None
+        """
+
+        self._roughnesses = tuple(roughnesses)
+        self.update()
+
+    @property
+    def duration(self):
+        """
+        Getter method that returns the time, in seconds, displayed by each thumbnail.
+
+        :rtype: float
+        """
+
+        return self._duration
+
+    @duration.setter
+    def duration(self, duration):
+        """
+        Setter method that updates the time, in seconds, displayed by each thumbnail.
+
+        :type duration: float
+        :rtype: None
+        """
+
+        self._duration = duration
+        self.update()
+
+    @property
+    def step(self):
+        """
+        Getter method that returns the draw step in pixels.
+
+        :rtype: int
+        """
+
+        return self._step
+
+    @step.setter
+    def step(self, step):
+        """
+        Setter method that updates the draw step in pixels.
+
+        :type step: int
+        :rtype: None
+        """
+
+        self._step = step
+        self.update()
+    # endregion
+
+    # region Methods
+    def cellSize(self):
+        """
+        Returns the size of a single cell.
+
+        :rtype: QtCore.QSize
+        """
+
+        numColumns, numRows = max(1, len(self.frequencies)), max(1, len(self.roughnesses))
+        spacing = self.__cell_spacing__
+
+        width = (self.width() - (spacing * (numColumns - 1))) // numColumns
+        height = (self.height() - (spacing * (numRows - 1))) // numRows
+
+        return QtCore.QSize(max(1, width), max(1, height))
+
+    def cellRect(self, column, row):
+        """
+        Returns the rectangle of the cell at the supplied column and row.
+
+        :type column: int
+        :type row: int
+        :rtype: QtCore.QRect
+        """
+
+        size = self.cellSize()
+        spacing = self.__cell_spacing__
+
+        return QtCore.QRect(column * (size.width() + spacing), row * (size.height() + spacing), size.width(), size.height())
+
+    def cellAt(self, point):
+        """
+        Returns the column and row of the cell under the supplied point.
+        If there is no cell under the point then none is returned!
+
+        :type point: QtCore.QPoint
+        :rtype: Union[Tuple[int, int], None]
+        """
+
+        size = self.cellSize()
+        spacing = self.__cell_spacing__
+
+        column, row = point.x() // (size.width() + spacing), point.y() // (size.height() + spacing)
+
+        if 0 <= column < len(self.frequencies) and 0 <= row < len(self.roughnesses) and self.cellRect(column, row).contains(point):
+
+            return column, row
+
+        else:
+
+            return None
+
+    def cacheKey(self, frequency, roughness, size):
+        """
+        Returns the thumbnail cache key for the supplied parameters.
+
+        :type frequency: float
+        :type roughness: float
+        :type size: QtCore.QSize
+        :rtype: Tuple[Any, ...]
+        """
+
+        return self.seed, frequency, roughness, self.duration, max(1, self.step), size.width(), size.height(), self.devicePixelRatioF()
+
+    def thumbnails(self):
+        """
+        Returns the thumbnail pixmap of every cell, indexed by column then row.
+        Only rows with missing thumbnails are sampled, the least recently used thumbnails are evicted once the cache is full!
+
+        :rtype: List[List[QtGui.QPixmap]]
+        """
+
+        # Sample rows with missing thumbnails from the shake command
+        # Each row is sampled by a single command call across every frequency!
+        #
+        size = self.cellSize()
+        step = max(1, self.step)
+        timeScale = size.width() / max(self.duration, 1e-3)
+
+        thumbnails = [[None] * len(self.roughnesses) for frequency in self.frequencies]
+
+        for (row, roughness) in enumerate(self.roughnesses):
+
+            keys = [self.cacheKey(frequency, roughness, size) for frequency in self.frequencies]
+            isMissing = any(key not in self._pixmaps for key in keys)
+
+            sweep = noiseutils.sampleShakeSweep(
+                seed=self.seed,
+                frequencies=self.frequencies,
+                roughness=roughness,
+                fractal=True,
+                size=size.width(),
+                step=step,
+                timeScale=timeScale
+            ) if isMissing else None
+
+            for (column, (frequency, key)) in enumerate(zip(self.frequencies, keys)):
+
+                pixmap = self._pixmaps.get(key, None)
+
+                if pixmap is None:
+
+                    pixmap = self.renderThumbnail(sweep[column], size, frequency, roughness)
+                    self._pixmaps[key] = pixmap
+
+                else:
+
+                    self._pixmaps.move_to_end(key)
+
+                thumbnails[column][row] = pixmap
+
+        # Evict least recently used thumbnails
+        #
+        while len(self._pixmaps) > max(self.__cache_size__, len(self.frequencies) * len(self.roughnesses)):
+
+            self._pixmaps.popitem(last=False)
+
+        return thumbnails
+
+    def renderThumbnail(self, samples, size, frequency, roughness):
+        """
+        Returns a thumbnail pixmap for the supplied noise samples.
+
+        :type samples: List[float]
+        :type size: QtCore.QSize
+        :type frequency: float
+        :type roughness: float
+        :rtype: QtGui.QPixmap
+        """
+
+        # Initialize pixmap
+        #
+        ratio = self.devicePixelRatioF()
+
+        pixmap = QtGui.QPixmap(size * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+
+        palette = self.palette()
+        pixmap.fill(palette.base().color())
+
+        painter = QtGui.QPainter(pixmap)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+
+        # Paint axis line
+        #
+        width, height = size.width(), size.height()
+        mid = height * 0.5
+
+        pen = QtGui.QPen(palette.alternateBase(), 1)
+        pen.setStyle(QtCore.Qt.DashLine)
+
+        painter.setPen(pen)
+        painter.drawLine(QtCore.QPointF(0.0, mid), QtCore.QPointF(width, mid))
+
+        # Paint noise line
+        # Samples stay within half a unit so they are scaled to the full cell height!
+        #
+        step = max(1, self.step)
+        path = QtGui.QPainterPath()
+
+        for (i, value) in enumerate(samples):
+
+            point = QtCore.QPointF(i * step, mid - (value * height))
+
+            if i == 0:
+
+                path.moveTo(point)
+
+            else:
+
+                path.lineTo(point)
+
+        painter.setPen(QtGui.QPen(QtGui.QColor(*self.__line_color__), 1))
+        painter.drawPath(path)
+
+        # Paint parameter label
+        #
+        painter.setPen(QtGui.QPen(palette.text(), 1))
+        painter.drawText(QtCore.QRectF(3.0, 1.0, width - 6.0, height - 2.0), QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop, f'{frequency:.3g} / {roughness:.3g}')
+
+        painter.end()
+
+        return pixmap
+
+    def clearCache(self):
+        """
+        Removes every cached thumbnail.
+
+        :rtype: None
+        """
+
+        self._pixmaps.clear()
+        self.update()
+    # endregion
+
+    # region Events
+    def paintEvent(self, event):
+        """
+        The event for any paint requests made to this widget.
+
+        :type event: QtGui.QPaintEvent
+        :rtype: None
+        """
+
+        # Initialize painter
+        #
+        painter = QtGui.QPainter(self)
+        self.initPainter(painter)
+
+        painter.fillRect(self.rect(), self.palette().window())
+
+        # Paint thumbnails
+        #
+        for (column, pixmaps) in enumerate(self.thumbnails()):
+
+            for (row, pixmap) in enumerate(pixmaps):
+
+                painter.drawPixmap(self.cellRect(column, row).topLeft(), pixmap)
+
+        # Paint hovered cell
+        #
+        if self._hoverCell is not None:
+
+            pen = QtGui.QPen(self.palette().highlight(), 2)
+
+            painter.setPen(pen)
+            painter.setBrush(QtCore.Qt.NoBrush)
+            painter.drawRect(self.cellRect(*self._hoverCell).adjusted(1, 1, -1, -1))
+
+    def mouseMoveEvent(self, event):
+        """
+        The event for any mouse move events made to this widget.
+
+        :type event: QtGui.QMouseEvent
+        :rtype: None
+        """
+
+        cell = self.cellAt(event.pos())
+
+        if cell != self._hoverCell:
+
+            self._hoverCell = cell
+
+            if cell is not None:
+
+                column, row = cell
+                self.setToolTip(f'Frequency: {self.frequencies[column]:.3g}\nRoughness: {self.roughnesses[row]:.3g}')
+
+            else:
+
+                self.setToolTip('')
+
+            self.update()
+
+        super(QNoiseSweep, self).mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        """
+        The event for when the mouse leaves this widget.
+
+        :type event: QtCore.QEvent
+        :rtype: None
+        """
+
+        self._hoverCell = None
+        self.update()
+
+        super(QNoiseSweep, self).leaveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        """
+        The event for any mouse release events made to this widget.
+
+        :type event: QtGui.QMouseEvent
+        :rtype: None
+        """
+
+        cell = self.cellAt(event.pos())
+
+        if event.button() == QtCore.Qt.LeftButton and cell is not None:
+
+            column, row = cell
+            self.parametersClicked.emit(self.frequencies[column], self.roughnesses[row])
+
+        super(QNoiseSweep, self).mouseReleaseEvent(event)
+    # endregion